@@ -2,6 +2,8 @@ import time
 
 import jwt
 import pytest
+import requests
+from furl import furl
 
 
 @pytest.fixture
@@ -57,3 +59,16 @@ HEADERS_NON_SUPERUSER_MANY_TYPES = {
     "Authorization": f"Bearer {TOKEN_NON_SUPERUSER_MANY_TYPES}",
     "Accept-Crs": "EPSG:4326",
 }
+
+
+def walk_cursor(url: furl, pages: int, headers: dict) -> str:
+    """
+    Follow the ``next`` links of the cursor pagination and return the link to the
+    requested page, so the benchmark itself only measures fetching that page.
+    """
+    next_url = url.url
+    for _ in range(pages - 1):
+        response = requests.get(next_url, headers=headers)
+        assert response.status_code == 200
+        next_url = response.json()["next"]
+    return next_url
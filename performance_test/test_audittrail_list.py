@@ -0,0 +1,45 @@
+"""
+Audit trail lookups of a single zaak in a large audit trail table.
+
+These benchmarks require a few million audit trails, e.g.::
+
+    src/manage.py generate_data --zaken=10000 --audittrails=300 ...
+
+and are only run if ``BENCHMARK_AUDITTRAILS`` is set.
+"""
+
+import os
+
+import pytest
+import requests
+from conftest import HEADERS
+from furl import furl
+
+BASE_URL = furl("http://localhost:8000/zaken/api/v1/")
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("BENCHMARK_AUDITTRAILS"),
+    reason="requires a few million generated audit trails",
+)
+
+
+@pytest.fixture(scope="module")
+def zaak_url():
+    response = requests.get(
+        (BASE_URL / "zaken").set({"pageSize": 1, "page": 2}), headers=HEADERS
+    )
+    assert response.status_code == 200
+    return response.json()["results"][0]["url"]
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaak_audittrail_list(benchmark, benchmark_assertions, zaak_url):
+    def make_request():
+        return requests.get(f"{zaak_url}/audittrail", headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    assert all(audit["hoofdObject"] == zaak_url for audit in result.json())
+
+    benchmark_assertions(mean=1, median=1)
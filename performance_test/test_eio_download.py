@@ -0,0 +1,131 @@
+"""
+Worker occupancy during concurrent large document downloads.
+
+These benchmarks require Open Zaak to be configured with the S3 documenten backend,
+e.g. against a local MinIO instance::
+
+    docker run -p 9000:9000 minio/minio server /data
+    DOCUMENTEN_API_BACKEND=s3_storage S3_ENDPOINT_URL=http://localhost:9000 ...
+
+and are only run if ``BENCHMARK_DOCUMENTEN_DOWNLOADS`` is set. Compare the results
+for the different values of ``DOCUMENTEN_API_DOWNLOAD_MODE``.
+"""
+
+import base64
+import os
+import threading
+import time
+
+import pytest
+import requests
+from conftest import HEADERS
+from furl import furl
+
+CATALOGI_URL = furl("http://localhost:8000/catalogi/api/v1/")
+DOCUMENTEN_URL = furl("http://localhost:8000/documenten/api/v1/")
+
+DOCUMENT_SIZE = 64 * 1024 * 1024
+# more than the amount of uWSGI workers (processes * threads) in the CI setup
+CONCURRENT_DOWNLOADS = 20
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("BENCHMARK_DOCUMENTEN_DOWNLOADS"),
+    reason="requires Open Zaak with the S3 documenten backend",
+)
+
+
+@pytest.fixture(scope="module")
+def download_url():
+    response = requests.get(
+        (CATALOGI_URL / "informatieobjecttypen").set({"status": "definitief"}),
+        headers=HEADERS,
+    )
+    assert response.status_code == 200
+    informatieobjecttype = response.json()["results"][0]["url"]
+
+    response = requests.post(
+        DOCUMENTEN_URL / "enkelvoudiginformatieobjecten",
+        json={
+            "bronorganisatie": "517439943",
+            "creatiedatum": "2026-01-01",
+            "titel": "benchmark",
+            "auteur": "benchmark",
+            "taal": "nld",
+            "bestandsnaam": "benchmark.bin",
+            "informatieobjecttype": informatieobjecttype,
+            "inhoud": base64.b64encode(os.urandom(DOCUMENT_SIZE)).decode("ascii"),
+        },
+        headers=HEADERS,
+    )
+    assert response.status_code == 201, response.text
+    eio_url = response.json()["url"]
+
+    yield f"{eio_url}/download"
+
+    requests.delete(eio_url, headers=HEADERS)
+
+
+@pytest.fixture
+def concurrent_downloads(download_url):
+    """
+    Keep slow clients downloading the document in the background.
+    """
+    stop = threading.Event()
+
+    def download():
+        while not stop.is_set():
+            with requests.get(download_url, headers=HEADERS, stream=True) as response:
+                assert response.status_code == 200
+                for _chunk in response.iter_content(chunk_size=256 * 1024):
+                    if stop.is_set():
+                        break
+                    time.sleep(0.01)
+
+    threads = [threading.Thread(target=download) for _ in range(CONCURRENT_DOWNLOADS)]
+    for thread in threads:
+        thread.start()
+    # give the downloads time to occupy the workers
+    time.sleep(2)
+
+    yield
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_api_request_during_concurrent_downloads(
+    benchmark, benchmark_assertions, concurrent_downloads
+):
+    """
+    Measure the latency of a regular API call while large downloads are in progress,
+    which is dominated by waiting for a free worker.
+    """
+
+    def make_request():
+        return requests.get(
+            (DOCUMENTEN_URL / "enkelvoudiginformatieobjecten").set({"pageSize": 1}),
+            headers=HEADERS,
+        )
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+
+    benchmark_assertions(mean=5, median=5)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_eio_download_range(benchmark, benchmark_assertions, download_url):
+    def make_request():
+        return requests.get(
+            download_url, headers={**HEADERS, "Range": "bytes=-1048576"}
+        )
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 206
+    assert len(result.content) == 1024 * 1024
+
+    benchmark_assertions(mean=1, median=1)
@@ -1,6 +1,6 @@
 import pytest
 import requests
-from conftest import HEADERS
+from conftest import HEADERS, walk_cursor
 from furl import furl
 
 BASE_URL = furl("http://localhost:8000/documenten/api/v1/")
@@ -42,3 +42,45 @@ def test_eio_list_with_ordering(benchmark, benchmark_assertions):
     assert len(data["results"]) == 100
 
     benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_eio_list_cursor_first_page(benchmark, benchmark_assertions):
+    params = {"pageSize": 100, "cursor": ""}
+
+    def make_request():
+        return requests.get(
+            (BASE_URL / "enkelvoudiginformatieobjecten").set(params), headers=HEADERS
+        )
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert data["next"] is not None
+    assert len(data["results"]) == 100
+
+    benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_eio_list_cursor_deep_page(benchmark, benchmark_assertions):
+    # same page as `test_eio_list`, to compare it with page number pagination
+    url = walk_cursor(
+        (BASE_URL / "enkelvoudiginformatieobjecten").set(
+            {"pageSize": 100, "cursor": ""}
+        ),
+        34,
+        HEADERS,
+    )
+
+    def make_request():
+        return requests.get(url, headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert len(data["results"]) == 100
+
+    benchmark_assertions(mean=1, median=1)
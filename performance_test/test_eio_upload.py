@@ -0,0 +1,110 @@
+"""
+Chunked uploads (bestandsdelen) of large documents.
+
+These benchmarks require Open Zaak to be configured with the S3 or Azure documenten
+backend and a chunk size of at least 5 MiB, e.g. against a local MinIO or Azurite
+instance::
+
+    docker run -p 9000:9000 minio/minio server /data
+    DOCUMENTEN_API_BACKEND=s3_storage S3_ENDPOINT_URL=http://localhost:9000 \\
+        DOCUMENTEN_UPLOAD_CHUNK_SIZE=8388608 ...
+
+    docker run -p 10000:10000 mcr.microsoft.com/azure-storage/azurite azurite-blob \\
+        --blobHost 0.0.0.0
+    DOCUMENTEN_API_BACKEND=azure_blob_storage DOCUMENTEN_UPLOAD_CHUNK_SIZE=8388608 ...
+
+and are only run if ``BENCHMARK_DOCUMENTEN_UPLOADS`` is set. Compare the results for
+the different values of ``DOCUMENTEN_NATIVE_MULTIPART_UPLOAD``.
+"""
+
+import os
+
+import pytest
+import requests
+from conftest import HEADERS
+from furl import furl
+
+CATALOGI_URL = furl("http://localhost:8000/catalogi/api/v1/")
+DOCUMENTEN_URL = furl("http://localhost:8000/documenten/api/v1/")
+
+DOCUMENT_SIZE = 64 * 1024 * 1024
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("BENCHMARK_DOCUMENTEN_UPLOADS"),
+    reason="requires Open Zaak with the S3 or Azure documenten backend",
+)
+
+
+@pytest.fixture(scope="module")
+def informatieobjecttype():
+    response = requests.get(
+        (CATALOGI_URL / "informatieobjecttypen").set({"status": "definitief"}),
+        headers=HEADERS,
+    )
+    assert response.status_code == 200
+    return response.json()["results"][0]["url"]
+
+
+@pytest.fixture(scope="module")
+def content():
+    return os.urandom(DOCUMENT_SIZE)
+
+
+@pytest.fixture
+def created_documents():
+    urls = []
+    yield urls
+
+    for url in urls:
+        requests.delete(url, headers=HEADERS)
+
+
+@pytest.mark.benchmark(max_time=120, min_rounds=5)
+def test_eio_chunked_upload(
+    benchmark, benchmark_assertions, informatieobjecttype, content, created_documents
+):
+    """
+    Measure creating a document, uploading all its bestandsdelen and completing the
+    upload by unlocking the document.
+    """
+
+    def upload():
+        response = requests.post(
+            DOCUMENTEN_URL / "enkelvoudiginformatieobjecten",
+            json={
+                "bronorganisatie": "517439943",
+                "creatiedatum": "2026-01-01",
+                "titel": "benchmark",
+                "auteur": "benchmark",
+                "taal": "nld",
+                "bestandsnaam": "benchmark.bin",
+                "bestandsomvang": DOCUMENT_SIZE,
+                "informatieobjecttype": informatieobjecttype,
+            },
+            headers=HEADERS,
+        )
+        assert response.status_code == 201, response.text
+        eio = response.json()
+        created_documents.append(eio["url"])
+
+        offset = 0
+        for bestandsdeel in eio["bestandsdelen"]:
+            part = content[offset : offset + bestandsdeel["omvang"]]
+            offset += bestandsdeel["omvang"]
+            response = requests.put(
+                bestandsdeel["url"],
+                data={"lock": eio["lock"]},
+                files={"inhoud": ("part.bin", part)},
+                headers=HEADERS,
+            )
+            assert response.status_code == 200, response.text
+
+        return requests.post(
+            f"{eio['url']}/unlock", json={"lock": eio["lock"]}, headers=HEADERS
+        )
+
+    result = benchmark(upload)
+
+    assert result.status_code == 204, result.text
+
+    benchmark_assertions(mean=30, median=30)
@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+import requests
+from conftest import HEADERS
+from furl import furl
+
+BASE_URL = furl("http://localhost:8000/zaken/api/v1/")
+
+CLIENTS = 8
+ZAKEN_PER_CLIENT = 10
+
+CREATE_HEADERS = {**HEADERS, "Content-Crs": "EPSG:4326"}
+
+
+@pytest.fixture
+def zaak_data():
+    response = requests.get((BASE_URL / "zaken").set({"pageSize": 1}), headers=HEADERS)
+    assert response.status_code == 200
+    zaak = response.json()["results"][0]
+    return {
+        "zaaktype": zaak["zaaktype"],
+        "bronorganisatie": zaak["bronorganisatie"],
+        "verantwoordelijkeOrganisatie": zaak["verantwoordelijkeOrganisatie"],
+        "registratiedatum": date.today().isoformat(),
+        "startdatum": date.today().isoformat(),
+    }
+
+
+@pytest.fixture
+def created_zaken():
+    urls = []
+    yield urls
+
+    # keep the number of zaken stable for the other benchmarks
+    with ThreadPoolExecutor(max_workers=CLIENTS) as executor:
+        list(executor.map(lambda url: requests.delete(url, headers=HEADERS), urls))
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_create_concurrent(
+    benchmark, benchmark_assertions, zaak_data, created_zaken
+):
+    def create_zaken():
+        with requests.Session() as session:
+            responses = [
+                session.post(BASE_URL / "zaken", json=zaak_data, headers=CREATE_HEADERS)
+                for _ in range(ZAKEN_PER_CLIENT)
+            ]
+        return responses
+
+    def make_requests():
+        with ThreadPoolExecutor(max_workers=CLIENTS) as executor:
+            futures = [executor.submit(create_zaken) for _ in range(CLIENTS)]
+            responses = [response for future in futures for response in future.result()]
+        created_zaken.extend(
+            response.json()["url"]
+            for response in responses
+            if response.status_code == 201
+        )
+        return responses
+
+    responses = benchmark(make_requests)
+
+    assert all(response.status_code == 201 for response in responses)
+    identificaties = [response.json()["identificatie"] for response in responses]
+    assert len(set(identificaties)) == len(identificaties)
+
+    benchmark.extra_info["zaken_per_second"] = (
+        CLIENTS * ZAKEN_PER_CLIENT / benchmark.stats["stats"].mean
+    )
+    benchmark_assertions(mean=10, median=10)
@@ -1,6 +1,11 @@
 import pytest
 import requests
-from conftest import HEADERS, HEADERS_NON_SUPERUSER, HEADERS_NON_SUPERUSER_MANY_TYPES
+from conftest import (
+    HEADERS,
+    HEADERS_NON_SUPERUSER,
+    HEADERS_NON_SUPERUSER_MANY_TYPES,
+    walk_cursor,
+)
 from furl import furl
 
 BASE_URL = furl("http://localhost:8000/zaken/api/v1/")
@@ -61,3 +66,112 @@ def test_zaken_list_non_superuser_many_authorized_types(
     assert len(data["results"]) == 100
 
     benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_list_first_page(benchmark, benchmark_assertions):
+    params = {"pageSize": 100, "page": 1}
+
+    def make_request():
+        return requests.get((BASE_URL / "zaken").set(params), headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert data["count"] == 3500
+    assert len(data["results"]) == 100
+
+    benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_list_cursor_first_page(benchmark, benchmark_assertions):
+    params = {"pageSize": 100, "cursor": ""}
+
+    def make_request():
+        return requests.get((BASE_URL / "zaken").set(params), headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert data["next"] is not None
+    assert len(data["results"]) == 100
+
+    benchmark_assertions(mean=1, median=1)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_list_cursor_deep_page(benchmark, benchmark_assertions):
+    # same page as `test_zaken_list`, to compare it with page number pagination
+    url = walk_cursor(
+        (BASE_URL / "zaken").set({"pageSize": 100, "cursor": ""}), 34, HEADERS
+    )
+
+    def make_request():
+        return requests.get(url, headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert len(data["results"]) == 100
+
+    benchmark_assertions(mean=1, median=1)
+
+
+DEEP_EXPAND = ",".join(
+    [
+        "zaaktype",
+        "status",
+        "status.statustype",
+        "resultaat",
+        "resultaat.resultaattype",
+        "rollen",
+        "rollen.roltype",
+        "eigenschappen",
+        "eigenschappen.eigenschap",
+    ]
+)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_list_deep_expand(benchmark, benchmark_assertions):
+    params = {"pageSize": 100, "page": 34, "expand": DEEP_EXPAND}
+
+    def make_request():
+        return requests.get((BASE_URL / "zaken").set(params), headers=HEADERS)
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert data["count"] == 3500
+    assert len(data["results"]) == 100
+    assert all("zaaktype" in zaak["_expand"] for zaak in data["results"])
+
+    benchmark_assertions(mean=2, median=2)
+
+
+@pytest.mark.benchmark(max_time=60, min_rounds=5)
+def test_zaken_zoek_deep_expand(benchmark, benchmark_assertions):
+    params = {"pageSize": 100, "page": 34}
+    body = {"expand": DEEP_EXPAND.split(",")}
+
+    def make_request():
+        return requests.post(
+            (BASE_URL / "zaken" / "_zoek").set(params),
+            json=body,
+            headers={**HEADERS, "Content-Crs": "EPSG:4326"},
+        )
+
+    result = benchmark(make_request)
+
+    assert result.status_code == 200
+    data = result.json()
+    assert data["count"] == 3500
+    assert len(data["results"]) == 100
+    assert all("zaaktype" in zaak["_expand"] for zaak in data["results"])
+
+    benchmark_assertions(mean=2, median=2)
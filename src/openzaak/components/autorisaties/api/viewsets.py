@@ -4,7 +4,6 @@ from django.db.models import Prefetch, Q
 
 import structlog
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
@@ -16,6 +15,8 @@ from openzaak.components.catalogi.models import (
     InformatieObjectType,
     ZaakType,
 )
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.mixins import SerializerMetricsMixin
 from openzaak.utils.pagination import ExactPagination
 from openzaak.utils.schema import COMMON_ERROR_RESPONSES
 
@@ -107,7 +108,10 @@ logger = structlog.stdlib.get_logger(__name__)
     ),
 )
 class ApplicatieViewSet(
-    CheckQueryParamsMixin, NotificationViewSetMixin, viewsets.ModelViewSet
+    SerializerMetricsMixin,
+    CheckQueryParamsMixin,
+    NotificationViewSetMixin,
+    viewsets.ModelViewSet,
 ):
     """
     Uitlezen en configureren van autorisaties voor applicaties.
@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Versioning of cached, derived authorization data.
+
+Anything derived from the configured (catalogus) autorisaties that is stored in the
+cache must include :func:`get_authorizations_version` in its cache key. Bumping the
+version makes all those cache entries unreachable at once, so they don't need to be
+tracked individually.
+"""
+
+from typing import Callable, TypeVar
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+
+AUTHORIZATIONS_VERSION_KEY = "autorisaties:version"
+
+# process local cache, see ``CACHES`` in the settings
+AUTHORIZATIONS_LOCAL_CACHE = "autorisaties"
+
+T = TypeVar("T")
+
+
+def get_authorizations_version() -> str:
+    # a random token rather than a counter, so an evicted version key can never
+    # resurrect stale cache entries
+    return cache.get_or_set(
+        AUTHORIZATIONS_VERSION_KEY, lambda: uuid4().hex, timeout=None
+    )
+
+
+def _bump_authorizations_version() -> None:
+    cache.set(AUTHORIZATIONS_VERSION_KEY, uuid4().hex, timeout=None)
+
+
+def invalidate_authorizations_cache() -> None:
+    """
+    Invalidate all cached, derived authorization data.
+
+    The version is bumped immediately and again after the current transaction
+    commits, so that concurrent requests cannot cache data they read before the
+    changes were committed.
+    """
+    _bump_authorizations_version()
+    transaction.on_commit(_bump_authorizations_version)
+
+
+def get_or_set_authorizations(key: str, default: Callable[[], T]) -> T:
+    """
+    Retrieve derived authorization data from the cache, or compute and cache it.
+
+    The process local cache is checked first and the shared cache second, so that
+    the data is computed only once for all processes. The entries of both caches are
+    keyed on the authorizations version, so invalidating the authorizations cache
+    invalidates them in every process.
+    """
+    timeout = settings.AUTHORIZATIONS_CONTEXT_CACHE_TIMEOUT
+    if not timeout:
+        return default()
+
+    versioned_key = f"autorisaties:{get_authorizations_version()}:{key}"
+    local_cache = caches[AUTHORIZATIONS_LOCAL_CACHE]
+    value = local_cache.get(versioned_key)
+    if value is None:
+        value = cache.get_or_set(versioned_key, default, timeout=timeout)
+        local_cache.set(versioned_key, value, timeout=timeout)
+    return value
@@ -31,6 +31,7 @@ from openzaak.utils.auth import get_auth
 from openzaak.utils.middleware import override_request_host
 from openzaak.utils.validators import ResourceValidator
 
+from .caching import invalidate_authorizations_cache
 from .constants import RelatedTypeSelectionMethods
 from .utils import (
     get_applicatie_serializer,
@@ -484,6 +485,8 @@ class AutorisatieBaseFormSet(forms.BaseFormSet):
         self.applicatie.catalogusautorisatie_set.all().delete()
         for form in self.forms:
             form.save(applicatie=self.applicatie, request=self.request, commit=commit)
+        # autorisaties are bulk created, which does not send any signals
+        invalidate_authorizations_cache()
 
         new_version = get_applicatie_serializer(
             self.applicatie, request=self.request
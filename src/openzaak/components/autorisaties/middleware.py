@@ -1,5 +1,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import hashlib
+from dataclasses import dataclass, field
 from typing import List, Union
 from urllib.parse import urlparse
 
@@ -11,23 +13,70 @@ from vng_api_common.authorizations.middleware import (
     AuthMiddleware as _AuthMiddleware,
     JWTAuth as _JWTAuth,
 )
-from vng_api_common.authorizations.models import Autorisatie
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
 
 from openzaak.components.autorisaties.models import CatalogusAutorisatie
 from openzaak.utils.constants import COMPONENT_MAPPING
 
+from .caching import get_or_set_authorizations
+
 loader = get_loader_class()()
 
+AnyAutorisatie = Union[Autorisatie, CatalogusAutorisatie]
+
+
+@dataclass
+class AuthorizationContext:
+    """
+    The applicaties of a client and their (catalogus) autorisaties.
+
+    The autorisaties are not loaded for applicaties that have all authorizations.
+    """
+
+    applicaties: list[Applicatie]
+    autorisaties: list[Autorisatie] = field(default_factory=list)
+    catalogus_autorisaties: list[CatalogusAutorisatie] = field(default_factory=list)
+
 
 class JWTAuth(_JWTAuth):
     component = None
 
+    @property
+    def context(self) -> AuthorizationContext:
+        """
+        Resolve the authorizations of the client, which are cached across requests.
+
+        Only the resolved authorizations are cached, the JWT itself is validated for
+        every request.
+        """
+        if not hasattr(self, "_context"):
+            if self.client_id is None:
+                self._context = AuthorizationContext(applicaties=[])
+            else:
+                digest = hashlib.sha256(self.client_id.encode()).hexdigest()
+                self._context = get_or_set_authorizations(
+                    f"context:{digest}", self._load_context
+                )
+        return self._context
+
+    def _load_context(self) -> AuthorizationContext:
+        applicaties = list(super().applicaties)
+        if any(app.heeft_alle_autorisaties for app in applicaties):
+            return AuthorizationContext(applicaties=applicaties)
+
+        app_ids = [app.id for app in applicaties]
+        return AuthorizationContext(
+            applicaties=applicaties,
+            autorisaties=list(Autorisatie.objects.filter(applicatie_id__in=app_ids)),
+            catalogus_autorisaties=list(
+                CatalogusAutorisatie.objects.filter(applicatie_id__in=app_ids)
+            ),
+        )
+
     @property
     def applicaties(self) -> Union[models.QuerySet, List, None]:
-        # Add caching, compared to base class since we do a lot of self.applicaties calls
-        if not hasattr(self, "_applicaties_qs"):
-            self._applicaties_qs = super().applicaties
-        return self._applicaties_qs
+        return self.context.applicaties
 
     def _request_auth(self) -> list:
         return []
@@ -75,9 +124,46 @@ class JWTAuth(_JWTAuth):
 
         return self._catalogus_cache[init_component]
 
+    def match_vertrouwelijkheidaanduiding(
+        self, autorisatie: AnyAutorisatie, value
+    ) -> bool:
+        if value is None:
+            return True
+
+        order_provided = VertrouwelijkheidsAanduiding.get_choice_order(value)
+        order_granted = VertrouwelijkheidsAanduiding.get_choice_order(
+            autorisatie.max_vertrouwelijkheidaanduiding
+        )
+        # an unknown vertrouwelijkheidaanduiding is never authorized
+        if order_provided is None or order_granted is None:
+            return False
+        return order_granted >= order_provided
+
+    def match_default(self, autorisatie: AnyAutorisatie, name: str, value) -> bool:
+        if value is None:
+            return True
+
+        return getattr(autorisatie, name) == value
+
+    def _get_catalogus_id(self, url: str) -> int:
+        if not hasattr(self, "_catalogus_ids"):
+            self._catalogus_ids = {}
+
+        if url not in self._catalogus_ids:
+            resolved = get_resource_for_path(urlparse(url).path)
+            self._catalogus_ids[url] = resolved.catalogus_id
+        return self._catalogus_ids[url]
+
     def has_auth(
         self, scopes: List[str], component: str | None = None, **fields
     ) -> bool:
+        """
+        Check the scopes against the autorisaties of the client.
+
+        The (cached) autorisaties are filtered in Python, in the same way as
+        :meth:`filter_vertrouwelijkheidaanduiding` and :meth:`filter_default` filter
+        them in the database.
+        """
         if scopes is None:
             return False
 
@@ -91,34 +177,50 @@ class JWTAuth(_JWTAuth):
         if not component:
             return False
 
-        autorisaties = self.get_autorisaties(component)
-        catalogus_autorisaties = self.get_catalogus_autorisaties(component)
-        has_catalogus_autorisaties = catalogus_autorisaties.exists()
+        component = COMPONENT_MAPPING.get(component, component)
+        autorisaties = [
+            autorisatie
+            for autorisatie in self.context.autorisaties
+            if autorisatie.component == component
+        ]
+        catalogus_autorisaties = [
+            catalogus_autorisatie
+            for catalogus_autorisatie in self.context.catalogus_autorisaties
+            if catalogus_autorisatie.component == component
+        ]
         scopes_provided = set()
 
         # filter on all additional components
         for field_name, field_value in fields.items():
-            if hasattr(self, f"filter_{field_name}"):
-                autorisaties = getattr(self, f"filter_{field_name}")(
-                    autorisaties, field_value
-                )
-                if has_catalogus_autorisaties:
-                    catalogus_autorisaties = getattr(self, f"filter_{field_name}")(
-                        catalogus_autorisaties, field_value
-                    )
+            if hasattr(self, f"match_{field_name}"):
+                match = getattr(self, f"match_{field_name}")
+                autorisaties = [
+                    autorisatie
+                    for autorisatie in autorisaties
+                    if match(autorisatie, field_value)
+                ]
+                catalogus_autorisaties = [
+                    catalogus_autorisatie
+                    for catalogus_autorisatie in catalogus_autorisaties
+                    if match(catalogus_autorisatie, field_value)
+                ]
             else:
-                autorisaties = self.filter_default(
-                    autorisaties, field_name, field_value
-                )
+                autorisaties = [
+                    autorisatie
+                    for autorisatie in autorisaties
+                    if self.match_default(autorisatie, field_name, field_value)
+                ]
                 if (
-                    has_catalogus_autorisaties
+                    catalogus_autorisaties
                     and field_value
                     and loader.is_local_url(field_value)
                 ):
-                    resolved = get_resource_for_path(urlparse(field_value).path)
-                    catalogus_autorisaties = self.filter_default(
-                        catalogus_autorisaties, "catalogus", resolved.catalogus
-                    )
+                    catalogus_id = self._get_catalogus_id(field_value)
+                    catalogus_autorisaties = [
+                        catalogus_autorisatie
+                        for catalogus_autorisatie in catalogus_autorisaties
+                        if catalogus_autorisatie.catalogus_id == catalogus_id
+                    ]
 
         for autorisatie in autorisaties:
             scopes_provided.update(autorisatie.scopes)
@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.db.models.signals import post_delete, post_save
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+
+from openzaak.components.catalogi.models import (
+    BesluitType,
+    InformatieObjectType,
+    ZaakType,
+)
+
+from .caching import invalidate_authorizations_cache
+from .models import CatalogusAutorisatie
+
+SENDERS = (
+    Applicatie,
+    Autorisatie,
+    CatalogusAutorisatie,
+    ZaakType,
+    InformatieObjectType,
+    BesluitType,
+)
+
+
+def invalidate_cache(sender, **kwargs) -> None:
+    invalidate_authorizations_cache()
+
+
+# (catalogus) autorisaties determine which types an application has access to, and
+# the types in a catalogus determine what a ``CatalogusAutorisatie`` covers
+for sender in SENDERS:
+    dispatch_uid = f"autorisaties.invalidate_cache_{sender._meta.label_lower}"
+    post_save.connect(invalidate_cache, sender=sender, dispatch_uid=dispatch_uid)
+    post_delete.connect(invalidate_cache, sender=sender, dispatch_uid=dispatch_uid)
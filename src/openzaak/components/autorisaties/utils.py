@@ -22,6 +22,7 @@ from openzaak.components.catalogi.models import (
 from openzaak.utils import build_absolute_url
 
 from .api.viewsets import ApplicatieViewSet
+from .caching import invalidate_authorizations_cache
 
 RelatedTypeObject = Union[ZaakType, InformatieObjectType, BesluitType]
 
@@ -101,6 +102,9 @@ def send_applicatie_changed_notification(
 ):
     from openzaak.utils import build_fake_request
 
+    # the applicatie changed, so the cached authorizations of its clients are stale
+    invalidate_authorizations_cache()
+
     viewset = ApplicatieViewSet()
     viewset.action = "update"
     if new_version is None:
@@ -11,11 +11,6 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
-from notifications_api_common.viewsets import (
-    NotificationCreateMixin,
-    NotificationDestroyMixin,
-    NotificationViewSetMixin,
-)
 from rest_framework import mixins, status, viewsets
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
@@ -32,12 +27,17 @@ from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.components.zaken.api.mixins import ClosedZaakMixin
 from openzaak.components.zaken.api.utils import delete_remote_zaakbesluit
-from openzaak.notifications.viewsets import MultipleNotificationMixin
+from openzaak.notifications.viewsets import (
+    MultipleNotificationMixin,
+    NotificationCreateMixin,
+    NotificationDestroyMixin,
+    NotificationViewSetMixin,
+)
 from openzaak.utils.api import delete_remote_oio
 from openzaak.utils.cloudevents import get_url, process_cloudevent
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.help_text import mark_experimental
-from openzaak.utils.mixins import CacheQuerysetMixin
+from openzaak.utils.mixins import CacheQuerysetMixin, SerializerMetricsMixin
 from openzaak.utils.pagination import ExactPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.views import AuditTrailViewSet
@@ -128,6 +128,7 @@ logger = structlog.stdlib.get_logger(__name__)
 )
 @conditional_retrieve()
 class BesluitViewSet(
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
     NotificationViewSetMixin,
     AuditTrailViewsetMixin,
@@ -245,6 +246,7 @@ class BesluitViewSet(
 @conditional_retrieve()
 class BesluitInformatieObjectViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     NotificationCreateMixin,
     NotificationDestroyMixin,
     AuditTrailCreateMixin,
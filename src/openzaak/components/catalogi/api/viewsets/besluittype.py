@@ -4,13 +4,13 @@ from django.db import DatabaseError, transaction
 
 import structlog
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
-from openzaak.utils.mixins import CacheQuerysetMixin
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.mixins import CacheQuerysetMixin, SerializerMetricsMixin
 from openzaak.utils.pagination import ExactPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import COMMON_ERROR_RESPONSES, VALIDATION_ERROR_RESPONSES
@@ -25,7 +25,7 @@ from ..scopes import (
     SCOPE_CATALOGI_WRITE,
 )
 from ..serializers import BesluitTypePublishSerializer, BesluitTypeSerializer
-from .mixins import ConceptMixin, M2MConceptDestroyMixin
+from .mixins import ConceptMixin, M2MConceptDestroyMixin, PublishedResponseCacheMixin
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -61,7 +61,9 @@ logger = structlog.stdlib.get_logger(__name__)
 @conditional_retrieve()
 class BesluitTypeViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
+    PublishedResponseCacheMixin,
     ConceptMixin,
     M2MConceptDestroyMixin,
     NotificationViewSetMixin,
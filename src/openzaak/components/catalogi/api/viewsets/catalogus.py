@@ -6,7 +6,7 @@ from rest_framework import mixins, viewsets
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
-from openzaak.utils.mixins import CacheQuerysetMixin
+from openzaak.utils.mixins import CacheQuerysetMixin, SerializerMetricsMixin
 from openzaak.utils.pagination import ExactPagination
 from openzaak.utils.permissions import AuthRequired
 
@@ -34,6 +34,7 @@ logger = structlog.stdlib.get_logger(__name__)
 @conditional_retrieve()
 class CatalogusViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
     mixins.CreateModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -9,7 +9,7 @@ from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.components.catalogi.models import Eigenschap
-from openzaak.utils.mixins import CacheQuerysetMixin
+from openzaak.utils.mixins import CacheQuerysetMixin, SerializerMetricsMixin
 from openzaak.utils.pagination import ExactPagination
 from openzaak.utils.permissions import AuthRequired
 
@@ -67,6 +67,7 @@ logger = structlog.stdlib.get_logger(__name__)
 @conditional_retrieve()
 class EigenschapViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
     ZaakTypeConceptMixin,
     viewsets.ModelViewSet,
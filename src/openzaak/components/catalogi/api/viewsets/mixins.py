@@ -2,12 +2,16 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from typing import Union
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 
+from ...caching import get_response_cache_key
+from ...metrics import response_cache_hits_counter, response_cache_misses_counter
 from ..scopes import SCOPE_CATALOGI_FORCED_DELETE
 
 
@@ -120,3 +124,58 @@ class M2MConceptDestroyMixin:
                     )
 
         super().perform_destroy(instance)
+
+
+class PublishedResponseCacheMixin:
+    """
+    Cache the responses of published resources.
+
+    Detail responses are cached if the resource is not a concept, keyed on its ETag.
+    List responses are cached if they only contain published resources, i.e. unless
+    concepts are requested with the ``status`` query parameter.
+
+    NOTE: the viewset must implement ``get_concept``, see :class:`ConceptDestroyMixin`.
+    """
+
+    def _get_cached_data(self, key: str):
+        attributes = {"resource": self.basename}
+        data = cache.get(key)
+        if data is None:
+            response_cache_misses_counter.add(1, attributes)
+        else:
+            response_cache_hits_counter.add(1, attributes)
+        return data
+
+    def list(self, request, *args, **kwargs):
+        timeout = settings.CATALOGI_RESPONSE_CACHE_TIMEOUT
+        if (
+            not timeout
+            or request.query_params.get("status", "definitief") != "definitief"
+        ):
+            return super().list(request, *args, **kwargs)
+
+        key = get_response_cache_key(request, self.basename)
+        data = self._get_cached_data(key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, timeout=timeout)
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        timeout = settings.CATALOGI_RESPONSE_CACHE_TIMEOUT
+        if not timeout:
+            return super().retrieve(request, *args, **kwargs)
+
+        instance = self.get_object()
+        if self.get_concept(instance) or not instance._etag:
+            return Response(self.get_serializer(instance).data)
+
+        key = get_response_cache_key(request, self.basename, etag=instance._etag)
+        data = self._get_cached_data(key)
+        if data is None:
+            data = self.get_serializer(instance).data
+            cache.set(key, data, timeout=timeout)
+        return Response(data)
@@ -11,7 +11,7 @@ from rest_framework.exceptions import ValidationError
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
-from openzaak.utils.mixins import CacheQuerysetMixin
+from openzaak.utils.mixins import CacheQuerysetMixin, SerializerMetricsMixin
 from openzaak.utils.pagination import ExactPagination
 from openzaak.utils.permissions import AuthRequired
 
@@ -82,6 +82,7 @@ logger = structlog.stdlib.get_logger(__name__)
 @conditional_retrieve()
 class ZaakTypeInformatieObjectTypeViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
     ConceptFilterMixin,
     ConceptDestroyMixin,
@@ -6,7 +6,7 @@ from rest_framework import viewsets
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
-from openzaak.utils.mixins import CacheQuerysetMixin
+from openzaak.utils.mixins import CacheQuerysetMixin, SerializerMetricsMixin
 from openzaak.utils.pagination import ExactPagination
 from openzaak.utils.permissions import AuthRequired
 
@@ -19,7 +19,7 @@ from ..scopes import (
     SCOPE_CATALOGI_WRITE,
 )
 from ..serializers import ResultaatTypeSerializer
-from .mixins import ZaakTypeConceptMixin
+from .mixins import PublishedResponseCacheMixin, ZaakTypeConceptMixin
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -65,7 +65,9 @@ logger = structlog.stdlib.get_logger(__name__)
 @conditional_retrieve()
 class ResultaatTypeViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
+    PublishedResponseCacheMixin,
     ZaakTypeConceptMixin,
     viewsets.ModelViewSet,
 ):
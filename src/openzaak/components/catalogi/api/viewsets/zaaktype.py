@@ -2,13 +2,13 @@
 # Copyright (C) 2019 - 2020 Dimpact
 import structlog
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
-from openzaak.utils.mixins import CacheQuerysetMixin
+from openzaak.notifications.viewsets import NotificationViewSetMixin
+from openzaak.utils.mixins import CacheQuerysetMixin, SerializerMetricsMixin
 from openzaak.utils.pagination import ExactPagination
 from openzaak.utils.permissions import AuthRequired
 from openzaak.utils.schema import COMMON_ERROR_RESPONSES, VALIDATION_ERROR_RESPONSES
@@ -28,6 +28,7 @@ from .mixins import (
     ConceptFilterMixin,
     ConceptPublishMixin,
     M2MConceptDestroyMixin,
+    PublishedResponseCacheMixin,
 )
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -82,7 +83,9 @@ logger = structlog.stdlib.get_logger(__name__)
 @conditional_retrieve()
 class ZaakTypeViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
+    PublishedResponseCacheMixin,
     ConceptPublishMixin,
     ConceptDestroyMixin,
     ConceptFilterMixin,
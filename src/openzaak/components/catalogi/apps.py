@@ -11,3 +11,4 @@ class CatalogiConfig(AppConfig):
     def ready(self):
         # load the signal receivers
         from . import signals  # noqa
+        from . import metrics  # noqa
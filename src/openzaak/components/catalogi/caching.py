@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Cache the API representations of published catalogi resources.
+
+Published types are (mostly) immutable, so their serialized representation can be
+reused between requests. All cached responses are keyed on a version token that is
+bumped whenever catalogi data changes, which makes them unreachable at once. Detail
+responses are additionally keyed on the ETag of the resource, which changes whenever
+its representation changes.
+"""
+
+from hashlib import sha256
+from typing import Optional
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+from rest_framework.request import Request
+
+RESPONSES_VERSION_KEY = "catalogi:responses:version"
+
+
+def get_responses_version() -> str:
+    # a random token rather than a counter, so an evicted version key can never
+    # resurrect stale cache entries
+    return cache.get_or_set(RESPONSES_VERSION_KEY, lambda: uuid4().hex, timeout=None)
+
+
+def _bump_responses_version() -> None:
+    cache.set(RESPONSES_VERSION_KEY, uuid4().hex, timeout=None)
+
+
+def invalidate_responses_cache() -> None:
+    """
+    Invalidate all cached responses.
+
+    The version is bumped immediately and again after the current transaction
+    commits, so that concurrent requests cannot cache data they read before the
+    changes were committed.
+    """
+    _bump_responses_version()
+    transaction.on_commit(_bump_responses_version)
+
+
+def get_response_cache_key(
+    request: Request, resource: str, etag: Optional[str] = None
+) -> str:
+    """
+    Build the cache key for the response to ``request``.
+
+    The absolute URI includes the host (the representation contains absolute URLs)
+    and the query string (filters and pagination).
+    """
+    version = get_responses_version()
+    uri_hash = sha256(request.build_absolute_uri().encode("utf-8")).hexdigest()
+    return f"catalogi:responses:{resource}:{version}:{etag or ''}:{uri_hash}"
@@ -0,0 +1,16 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from opentelemetry import metrics
+
+meter = metrics.get_meter("openzaak.components.catalogi")
+
+response_cache_hits_counter = meter.create_counter(
+    "openzaak.catalogi.response_cache.hits",
+    description="Amount of catalogi API responses served from the cache.",
+    unit="1",
+)
+response_cache_misses_counter = meter.create_counter(
+    "openzaak.catalogi.response_cache.misses",
+    description="Amount of cacheable catalogi API responses not found in the cache.",
+    unit="1",
+)
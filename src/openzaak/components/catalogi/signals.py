@@ -3,7 +3,7 @@
 from typing import Union
 
 from django.db.models.base import ModelBase
-from django.db.models.signals import ModelSignal, post_delete
+from django.db.models.signals import ModelSignal, m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 import structlog
@@ -11,6 +11,7 @@ from vng_api_common.authorizations.models import Applicatie, Autorisatie
 
 from openzaak.utils import build_absolute_url
 
+from .caching import invalidate_responses_cache
 from .models import BesluitType, InformatieObjectType, ZaakType
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -83,3 +84,29 @@ def sync_autorisaties(
         apps_to_delete=app_ids_to_delete,
     )
     apps_to_delete.delete()
+
+
+@receiver(
+    [post_save, post_delete, m2m_changed],
+    dispatch_uid="catalogi.invalidate_responses_cache",
+)
+def invalidate_cached_responses(
+    sender: ModelBase, signal: ModelSignal, **kwargs
+) -> None:
+    """
+    Invalidate the cached API responses when a type is published, ended or deleted.
+
+    Representations of types include (the URLs of) related objects, so any change in
+    the catalogi data invalidates the cached responses.
+    """
+    if sender._meta.app_label != "catalogi":
+        return
+
+    # the ETag value is derived from the representation itself
+    if kwargs.get("update_fields") == {"_etag"}:
+        return
+
+    if signal is m2m_changed and not kwargs["action"].startswith("post_"):
+        return
+
+    invalidate_responses_cache()
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..metrics import response_cache_hits_counter, response_cache_misses_counter
+from .factories import StatusTypeFactory, ZaakTypeFactory
+
+
+@override_settings(CATALOGI_RESPONSE_CACHE_TIMEOUT=300)
+class PublishedResponseCacheTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    @patch.object(
+        response_cache_hits_counter, "add", wraps=response_cache_hits_counter.add
+    )
+    def test_retrieve_published_is_cached(self, mock_hits: MagicMock):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        url = reverse(zaaktype)
+
+        with CaptureQueriesContext(connection) as uncached:
+            response1 = self.client.get(url)
+        with CaptureQueriesContext(connection) as cached:
+            response2 = self.client.get(url)
+
+        self.assertEqual(response2.status_code, status.HTTP_200_OK)
+        self.assertEqual(response1.json(), response2.json())
+        self.assertLess(len(cached), len(uncached))
+        mock_hits.assert_called_once_with(1, {"resource": "zaaktype"})
+
+    @patch.object(
+        response_cache_misses_counter, "add", wraps=response_cache_misses_counter.add
+    )
+    def test_retrieve_concept_is_not_cached(self, mock_misses: MagicMock):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+
+        response = self.client.get(reverse(zaaktype))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_misses.assert_not_called()
+
+    def test_retrieve_invalidated_on_change(self):
+        statustype = StatusTypeFactory.create(
+            zaaktype__concept=False, statustype_omschrijving="old"
+        )
+        url = reverse(statustype)
+        self.client.get(url)
+
+        statustype.statustype_omschrijving = "new"
+        statustype.save()
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.json()["omschrijving"], "new")
+
+    @patch.object(
+        response_cache_hits_counter, "add", wraps=response_cache_hits_counter.add
+    )
+    def test_list_invalidated_when_published(self, mock_hits: MagicMock):
+        zaaktype1 = ZaakTypeFactory.create(concept=False)
+        zaaktype2 = ZaakTypeFactory.create(concept=True)
+        url = reverse("zaaktype-list")
+
+        response = self.client.get(url)
+        self.assertEqual(response.json()["count"], 1)
+
+        response = self.client.get(url)
+        self.assertEqual(response.json()["count"], 1)
+        mock_hits.assert_called_once()
+
+        zaaktype2.concept = False
+        zaaktype2.save()
+
+        response = self.client.get(url)
+
+        self.assertEqual(
+            {item["url"] for item in response.json()["results"]},
+            {
+                f"http://testserver{reverse(zaaktype1)}",
+                f"http://testserver{reverse(zaaktype2)}",
+            },
+        )
+
+    @patch.object(
+        response_cache_misses_counter, "add", wraps=response_cache_misses_counter.add
+    )
+    def test_list_with_concepts_is_not_cached(self, mock_misses: MagicMock):
+        ZaakTypeFactory.create(concept=True)
+
+        response = self.client.get(reverse("zaaktype-list"), {"status": "alles"})
+
+        self.assertEqual(response.json()["count"], 1)
+        mock_misses.assert_not_called()
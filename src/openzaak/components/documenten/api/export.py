@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from openzaak.export_data.exporters import Exporter
+
+from ..models import EnkelvoudigInformatieObject
+from .filters import EnkelvoudigInformatieObjectListFilter
+
+
+class EnkelvoudigInformatieObjectExporter(Exporter):
+    model = EnkelvoudigInformatieObject
+    filterset_class = EnkelvoudigInformatieObjectListFilter
+
+    def get_base_queryset(self):
+        # only the latest version of every document, like the documenten endpoint
+        return super().get_base_queryset().filter(latest_version_of__isnull=False)
+
+    def get_columns(self):
+        return {
+            "url": self.get_url_expression("enkelvoudiginformatieobject-detail"),
+            "uuid": "uuid",
+            "identificatie": "identificatie",
+            "bronorganisatie": "bronorganisatie",
+            "creatiedatum": "creatiedatum",
+            "titel": "titel",
+            "vertrouwelijkheidaanduiding": "vertrouwelijkheidaanduiding",
+            "auteur": "auteur",
+            "status": "status",
+            "formaat": "formaat",
+            "taal": "taal",
+            "versie": "versie",
+            "beginRegistratie": "begin_registratie",
+            "bestandsnaam": "bestandsnaam",
+            "bestandsomvang": "bestandsomvang",
+            "link": "link",
+            "beschrijving": "beschrijving",
+            "ontvangstdatum": "ontvangstdatum",
+            "verzenddatum": "verzenddatum",
+            "indicatieGebruiksrecht": "indicatie_gebruiksrecht",
+            "informatieobjecttype": self.get_fk_or_url_expression(
+                "informatieobjecttype-detail", "informatieobjecttype"
+            ),
+        }
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from django.db.models import OuterRef, Subquery
 from django.utils.translation import gettext_lazy as _
 
 import structlog
@@ -11,7 +12,11 @@ from vng_api_common.filtersets import FilterSet
 from vng_api_common.utils import get_help_text
 
 from openzaak.components.documenten.constants import ObjectInformatieObjectTypes
-from openzaak.utils.filters import CharArrayFilter, ExpandFilter
+from openzaak.utils.filters import (
+    CharArrayFilter,
+    ExpandFilter,
+    FullTextSearchFilter,
+)
 from openzaak.utils.filterset import OrderingFilter
 from openzaak.utils.help_text import mark_experimental
 
@@ -146,6 +151,15 @@ class EnkelvoudigInformatieObjectListFilter(FilterSet):
         queryset=EnkelvoudigInformatieObject.objects.all(),
     )
 
+    zoekterm = FullTextSearchFilter(
+        search_fields=("titel", "beschrijving"),
+        help_text=mark_experimental(
+            "Zoekterm(en) waarop de titel en beschrijving van het informatie object "
+            "doorzocht worden. De resultaten worden gesorteerd op relevantie, tenzij "
+            "`ordering` opgegeven is."
+        ),
+    )
+
     ordering = OrderingFilter(
         help_text=mark_experimental("Sorteer op."),
         fields=(
@@ -179,6 +193,7 @@ class EnkelvoudigInformatieObjectListFilter(FilterSet):
             "vertrouwelijkheidaanduiding",
             "objectinformatieobjecten__object",
             "objectinformatieobjecten__object_type",
+            "zoekterm",
         )
 
     def locked_filter(self, queryset, name, value):
@@ -201,10 +216,29 @@ class EnkelvoudigInformatieObjectZoekFilter(FilterSet):
 class EnkelvoudigInformatieObjectDetailFilter(FilterSet):
     versie = filters.NumberFilter(field_name="versie")
     registratie_op = filters.IsoDateTimeFilter(
-        field_name="begin_registratie", lookup_expr="lte", label="begin_registratie"
+        field_name="begin_registratie",
+        lookup_expr="lte",
+        label="begin_registratie",
+        method="registratie_op_filter",
     )
     expand = ExpandFilter(serializer_class=EnkelvoudigInformatieObjectSerializer)
 
+    def registratie_op_filter(self, queryset, name, value):
+        queryset = queryset.filter(begin_registratie__lte=value)
+        # a (uuid, versie) combination is unique
+        if self.form.cleaned_data.get("versie") is not None:
+            return queryset
+
+        # select the most recent version registered at the given moment
+        version = (
+            EnkelvoudigInformatieObject.objects.filter(
+                canonical=OuterRef("canonical"), begin_registratie__lte=value
+            )
+            .order_by("-versie")
+            .values("pk")[:1]
+        )
+        return queryset.filter(pk=Subquery(version))
+
 
 class GebruiksrechtenFilter(FilterSet):
     informatieobject = URLModelChoiceFilter(
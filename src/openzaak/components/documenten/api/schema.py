@@ -71,5 +71,6 @@ custom_settings = {
         {"name": "objectinformatieobjecten"},
         {"name": "verzendingen"},
         {"name": "import"},
+        {"name": "export"},
     ],
 }
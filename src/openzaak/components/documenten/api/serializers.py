@@ -34,9 +34,11 @@ from vng_api_common.serializers import (
 from vng_api_common.utils import get_help_text
 
 from openzaak.contrib.verzoeken.validators import verzoek_validator
+from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.serializer_fields import (
     FKOrServiceUrlField,
     LengthHyperlinkedRelatedField,
+    ResourceUUIDField,
 )
 from openzaak.utils.serializers import (
     ConvenienceSerializer,
@@ -68,7 +70,7 @@ from ..models import (
     ReservedDocument,
     Verzending,
 )
-from ..storage import get_private_media_storage
+from ..storage import documenten_storage, get_private_media_storage
 from .fields import OnlyRemoteOrFKOrURLField
 from .utils import create_filename, merge_files
 from .validators import (
@@ -279,6 +281,15 @@ class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
 
         return valid_attrs
 
+    def update(self, instance, validated_data):
+        inhoud = validated_data.get("inhoud")
+        canonical = instance.informatieobject
+        if inhoud is None or canonical is None or not canonical.has_multipart_upload:
+            return super().update(instance, validated_data)
+
+        instance.upload_part(inhoud)
+        return instance
+
 
 class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
     """
@@ -516,6 +527,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
         full_size,
         canonical: Optional[EnkelvoudigInformatieObjectCanonical] = None,
         eio_uuid: Optional[str] = None,
+        eio: Optional[EnkelvoudigInformatieObject] = None,
     ):
         """add chunk urls"""
         kwargs = (
@@ -523,6 +535,20 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             if canonical
             else {"informatieobject_uuid": eio_uuid}
         )
+        # upload the bestandsdelen directly as the parts of the file, so the upload
+        # is completed without copying the data
+        if (
+            canonical
+            and eio
+            and documenten_storage.supports_multipart_upload(
+                full_size, settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE
+            )
+        ):
+            file_field = eio._meta.get_field("inhoud")
+            canonical.start_multipart_upload(
+                file_field.generate_filename(eio, create_filename(eio.bestandsnaam))
+            )
+
         parts = math.ceil(full_size / settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE)
         for i in range(parts):
             chunk_size = min(settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE, full_size)
@@ -569,7 +595,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
         # large file process
         if not eio.inhoud and eio.bestandsomvang and eio.bestandsomvang > 0:
             self._create_bestandsdeel(
-                validated_data["bestandsomvang"], **create_bestandsdeel_kwargs
+                validated_data["bestandsomvang"], eio=eio, **create_bestandsdeel_kwargs
             )
         eio.canonical.refresh_from_db(fields=["latest_version"])
         return eio
@@ -638,6 +664,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
 
         bestandsdelen = instance.canonical.bestandsdelen.all()
 
+        instance.canonical.abort_multipart_upload()
         bestandsdelen.wipe()
 
         # large file process
@@ -649,6 +676,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             self._create_bestandsdeel(
                 instance.bestandsomvang,
                 canonical=instance.canonical,
+                eio=instance,
             )
 
         # create empty file if size == 0
@@ -843,7 +871,13 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
         if empty_bestandsdelen:
             return self.instance
 
-        if complete_upload:
+        if complete_upload and self.instance.canonical.has_multipart_upload:
+            # the parts are already in the storage backend, no data is copied
+            self.instance.inhoud.name = (
+                self.instance.canonical.complete_multipart_upload(bestandsdelen)
+            )
+            self.instance.save()
+        elif complete_upload:
             part_files = [p.inhoud.file for p in bestandsdelen]
             # create the name of target file using the storage backend to the serializer
             name = create_filename(self.instance.bestandsnaam)
@@ -863,6 +897,7 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
         else:
             self.instance.bestandsomvang = None
             self.instance.save()
+            self.instance.canonical.abort_multipart_upload()
 
         # delete part files
         bestandsdelen.wipe()
@@ -873,8 +908,31 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
 class EIOZoekSerializer(serializers.Serializer):
     uuid__in = serializers.ListField(
         child=serializers.UUIDField(),
+        required=False,
         help_text=_("Array of unieke resource identifiers (UUID4)"),
     )
+    url__in = serializers.ListField(
+        child=ResourceUUIDField(view_name="enkelvoudiginformatieobject-detail"),
+        required=False,
+        help_text=mark_experimental(
+            "Array van URL-referenties naar (ENKELVOUDIG) INFORMATIEOBJECTen. Kan "
+            "in plaats van `uuid__in` gebruikt worden."
+        ),
+    )
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        # one of both lists is required to select the informatieobjecten
+        if "uuid__in" not in attrs and "url__in" not in attrs:
+            raise serializers.ValidationError(
+                {
+                    "uuid__in": serializers.ErrorDetail(
+                        self.fields["uuid__in"].error_messages["required"],
+                        code="required",
+                    )
+                }
+            )
+        return attrs
 
 
 class GebruiksrechtenSerializer(serializers.HyperlinkedModelSerializer):
@@ -17,6 +17,8 @@ from .viewsets import (
     BestandsDeelViewSet,
     DocumentRegistrerenViewSet,
     EnkelvoudigInformatieObjectAuditTrailViewSet,
+    EnkelvoudigInformatieObjectExportDownloadView,
+    EnkelvoudigInformatieObjectExportStatusView,
     EnkelvoudigInformatieObjectImportDestroyView,
     EnkelvoudigInformatieObjectImportReportView,
     EnkelvoudigInformatieObjectImportStatusView,
@@ -83,6 +85,23 @@ import_patterns = [
     ),
 ]
 
+export_patterns = [
+    path(
+        "<uuid:uuid>/status",
+        EnkelvoudigInformatieObjectExportStatusView.as_view(
+            {"get": "retrieve"}, name="status"
+        ),
+        name="status",
+    ),
+    path(
+        "<uuid:uuid>/download",
+        EnkelvoudigInformatieObjectExportDownloadView.as_view(
+            {"get": "retrieve"}, name="download"
+        ),
+        name="download",
+    ),
+]
+
 urlpatterns = [
     re_path(
         r"^v(?P<version>\d+)/",
@@ -135,6 +154,13 @@ urlpatterns = [
                         namespace="documenten-import",
                     ),
                 ),
+                path(
+                    "export/",
+                    include(
+                        (export_patterns, "openzaak.components.documenten"),
+                        namespace="documenten-export",
+                    ),
+                ),
                 path("", router.APIRootView.as_view(), name="api-root-documenten"),
                 path("", include("vng_api_common.notifications.api.urls")),
             ]
@@ -5,11 +5,19 @@ import shutil
 import uuid
 from datetime import date
 from pathlib import Path, PurePath
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 from django.conf import settings
 from django.db.models import Max
 
+from openzaak.utils.db import pg_advisory_lock
+
+if TYPE_CHECKING:
+    from openzaak.components.documenten.models import ReservedDocument
+
+LOCK_ID_DOCUMENT_IDENTIFICATION = "generate-document-identification"
+
 
 def merge_files(part_files, file_dir, file_name) -> str:
     file_dir_path = Path(file_dir)
@@ -89,3 +97,29 @@ def generate_document_identificatie(
     ]
 
     return identificaties[0] if aantal == 1 else identificaties
+
+
+def reserve_document_identificaties(
+    bronorganisatie: str, date_value: date, aantal: int = 1
+) -> list["ReservedDocument"]:
+    """
+    Reserve the next identificaties of the bronorganisatie.
+
+    The generation is locked until the reservations are committed, so concurrent
+    reservations never get the same identificaties.
+    """
+    from openzaak.components.documenten.models import ReservedDocument
+
+    with pg_advisory_lock(LOCK_ID_DOCUMENT_IDENTIFICATION):
+        identificaties = generate_document_identificatie(
+            bronorganisatie=bronorganisatie, date_value=date_value, aantal=aantal
+        )
+        if aantal == 1:
+            identificaties = [identificaties]
+
+        return ReservedDocument.objects.bulk_create(
+            ReservedDocument(
+                identificatie=identificatie, bronorganisatie=bronorganisatie
+            )
+            for identificatie in identificaties
+        )
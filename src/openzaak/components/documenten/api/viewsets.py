@@ -4,8 +4,7 @@ from datetime import date
 from pathlib import Path
 
 from django.conf import settings
-from django.db import transaction
-from django.http import FileResponse
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
 import structlog
@@ -19,7 +18,6 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
-from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.parsers import FormParser, MultiPartParser
@@ -34,12 +32,19 @@ from vng_api_common.caching import conditional_retrieve
 from vng_api_common.constants import CommonResourceAction
 from vng_api_common.filters_backend import Backend
 from vng_api_common.search import SearchMixin, is_search_view
-from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from openzaak.components.documenten.constants import DocumentenBackendTypes
+from openzaak.components.documenten.download import get_download_response
 from openzaak.components.documenten.exceptions import DocumentBackendNotImplementedError
 from openzaak.components.documenten.import_utils import DocumentRow
 from openzaak.components.documenten.tasks import import_documents
+from openzaak.export_data.models import ExportTypeChoices
+from openzaak.export_data.serializers import ExportCreateSerializer, ExportSerializer
+from openzaak.export_data.views import (
+    ExportDownloadView,
+    ExportMixin,
+    ExportStatusView,
+)
 from openzaak.import_data.models import ImportStatusChoices, ImportTypeChoices
 from openzaak.import_data.views import (
     ImportCreateview,
@@ -50,16 +55,21 @@ from openzaak.import_data.views import (
 )
 from openzaak.notifications.viewsets import (
     MultipleNotificationMixin,
+    NotificationViewSetMixin,
 )
 from openzaak.utils.cloudevents import get_url, process_cloudevent
 from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.mixins import (
     CacheQuerysetMixin,
+    CheckQueryParamsMixin,
     ExpandMixin,
+    SerializerMetricsMixin,
+    StreamingListMixin,
 )
-from openzaak.utils.pagination import ExactPagination
+from openzaak.utils.pagination import CursorPagination, ExactPagination
 from openzaak.utils.permissions import AuthRequired
+from openzaak.utils.query import any_of
 from openzaak.utils.schema import (
     COMMON_ERROR_RESPONSES,
     FILE_ERROR_RESPONSES,
@@ -125,7 +135,7 @@ from .serializers import (
     UnlockEnkelvoudigInformatieObjectSerializer,
     VerzendingSerializer,
 )
-from .utils import generate_document_identificatie
+from .utils import reserve_document_identificaties
 from .validators import CreateRemoteRelationValidator, RemoteRelationValidator
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -240,12 +250,15 @@ REGISTRATIE_QUERY_PARAM = OpenApiParameter(
 @conditional_retrieve()
 class EnkelvoudigInformatieObjectViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
-    SearchMixin,
     ExpandMixin,
     NotificationViewSetMixin,
     ListFilterByAuthorizationsMixin,
     AuditTrailViewsetMixin,
+    StreamingListMixin,
+    SearchMixin,
+    ExportMixin,
     viewsets.ModelViewSet,
 ):
     """
@@ -258,6 +271,7 @@ class EnkelvoudigInformatieObjectViewSet(
     lookup_field = "uuid"
     serializer_class = EnkelvoudigInformatieObjectSerializer
     search_input_serializer_class = EIOZoekSerializer
+    export_type = ExportTypeChoices.documenten
     filter_backends = (Backend,)
     permission_classes = (InformationObjectAuthRequired,)
     required_scopes = {
@@ -271,6 +285,8 @@ class EnkelvoudigInformatieObjectViewSet(
         "lock": SCOPE_DOCUMENTEN_LOCK,
         "unlock": SCOPE_DOCUMENTEN_LOCK | SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK,
         "_zoek": SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        "_export": SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        "_export_async": SCOPE_DOCUMENTEN_ALLES_LEZEN,
     }
     notifications_kanaal = KANAAL_DOCUMENTEN
     audit = AUDIT_DRC
@@ -317,10 +333,16 @@ class EnkelvoudigInformatieObjectViewSet(
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        if (
-            self.detail
-        ):  # detail needs to be able to filter by versie for VERSIE_QUERY_PARAM
-            return queryset.order_by("canonical", "-versie").distinct("canonical")
+        # a specific version is selected by the detail filter, see
+        # EnkelvoudigInformatieObjectDetailFilter. Otherwise only the latest version
+        # is included, which is also relied on when a document is looked up by its
+        # URL (e.g. ``get_resource_for_path``) without filtering the queryset. In that
+        # case the viewset is instantiated without a request
+        request = getattr(self, "request", None)
+        if getattr(self, "detail", False) and request is not None:
+            query_params = request.GET
+            if query_params.get("versie") or query_params.get("registratieOp"):
+                return queryset
         return queryset.filter(latest_version_of__isnull=False)
 
     def get_serializer_class(self):
@@ -336,7 +358,7 @@ class EnkelvoudigInformatieObjectViewSet(
 
     @property
     def pagination_class(self):
-        return ExactPagination
+        return CursorPagination
 
     @extend_schema(
         "enkelvoudiginformatieobject_download",
@@ -363,7 +385,7 @@ class EnkelvoudigInformatieObjectViewSet(
                 DocumentenBackendTypes.azure_blob_storage
                 | DocumentenBackendTypes.s3_storage
             ):
-                return FileResponse(eio.inhoud.file, as_attachment=True)
+                return get_download_response(request, eio.inhoud)
             case DocumentenBackendTypes.filesystem:
                 return sendfile(
                     request,
@@ -479,12 +501,69 @@ class EnkelvoudigInformatieObjectViewSet(
         queryset = self.filter_queryset(self.get_queryset())
 
         for name, value in search_input.items():
-            queryset = queryset.filter(**{name: value})
+            if name in ("uuid__in", "url__in"):
+                # ⚡️ the UUIDs are sent as a single parameter, however many there are
+                queryset = queryset.filter(uuid=any_of(value, models.UUIDField()))
+            else:
+                queryset = queryset.filter(**{name: value})
 
         return self.get_search_output(queryset)
 
     _zoek.is_search_action = True
 
+    @extend_schema(
+        "enkelvoudiginformatieobject__export",
+        summary="Exporteer alle (ENKELVOUDIG) INFORMATIEOBJECTen.",
+        description=mark_experimental(
+            "Exporteer de laatste versie van alle (ENKELVOUDIG) INFORMATIEOBJECTen "
+            "die voldoen aan de query-string parameters, zonder paginering. "
+            "Afhankelijk van de `Accept` header worden de INFORMATIEOBJECTen als "
+            "NDJSON (één INFORMATIEOBJECT per regel) of als CSV teruggegeven. De "
+            "inhoud van de documenten maakt geen deel uit van de export.\n"
+            "\n"
+            "**Opmerking**\n"
+            "- er worden enkel documenten geëxporteerd van de informatieobjecttypes "
+            "waar u toe geautoriseerd bent."
+        ),
+        parameters=[OpenApiParameter("expand", exclude=True)],
+        responses={
+            (status.HTTP_200_OK, "application/x-ndjson"): OpenApiTypes.STR,
+            (status.HTTP_200_OK, "text/csv"): OpenApiTypes.STR,
+            **VALIDATION_ERROR_RESPONSES,
+            **COMMON_ERROR_RESPONSES,
+        },
+    )
+    @action(methods=["get"], detail=False, name="enkelvoudiginformatieobject__export")
+    def _export(self, request, *args, **kwargs):
+        return self.get_export_response(request)
+
+    @extend_schema(
+        "enkelvoudiginformatieobject__export_async",
+        summary="Start een export van alle (ENKELVOUDIG) INFORMATIEOBJECTen op de "
+        "achtergrond.",
+        description=mark_experimental(
+            "Start een export van de laatste versie van alle (ENKELVOUDIG) "
+            "INFORMATIEOBJECTen die voldoen aan de query-string parameters. De "
+            "export wordt op de achtergrond aangemaakt, de status ervan kan "
+            "opgevraagd worden via de `statusUrl`. Zodra de export voltooid is, kan "
+            "het bestand gedownload worden via de `downloadUrl`.\n"
+            "\n"
+            "**Opmerking**\n"
+            "- er worden enkel documenten geëxporteerd van de informatieobjecttypes "
+            "waar u toe geautoriseerd bent op het moment dat de export gestart wordt."
+        ),
+        parameters=[OpenApiParameter("expand", exclude=True)],
+        request=ExportCreateSerializer,
+        responses={
+            status.HTTP_202_ACCEPTED: ExportSerializer,
+            **VALIDATION_ERROR_RESPONSES,
+            **COMMON_ERROR_RESPONSES,
+        },
+    )
+    @_export.mapping.post
+    def _export_async(self, request, *args, **kwargs):
+        return self.create_export(request)
+
     def perform_create(self, serializer):
         super().perform_create(serializer)
         instance = serializer.instance
@@ -658,6 +737,46 @@ class EnkelvoudigInformatieObjectImportDestroyView(ImportDestroyView):
     required_scopes = {}
 
 
+@extend_schema_view(
+    retrieve=extend_schema(
+        operation_id="enkelvoudiginformatieobject_export_status",
+        summary=_("De status van een EXPORT opvragen."),
+        description=mark_experimental(
+            "Het opvragen van de status van een EXPORT van (ENKELVOUDIG) "
+            "INFORMATIEOBJECTen. Alleen de APPLICATIE die de EXPORT gestart heeft "
+            "kan de status opvragen."
+        ),
+    )
+)
+class EnkelvoudigInformatieObjectExportStatusView(ExportStatusView):
+    export_type = ExportTypeChoices.documenten
+
+    required_scopes = {"retrieve": SCOPE_DOCUMENTEN_ALLES_LEZEN}
+
+
+@extend_schema_view(
+    retrieve=extend_schema(
+        operation_id="enkelvoudiginformatieobject_export_download",
+        summary=_("Het bestand van een EXPORT downloaden."),
+        description=mark_experimental(
+            "Het bestand van een EXPORT van (ENKELVOUDIG) INFORMATIEOBJECTen "
+            "downloaden. Dit bestand is alleen beschikbaar indien de EXPORT is "
+            "voltooid, en wordt na `EXPORT_RETENTION_DAYS` dagen verwijderd. Alleen "
+            "de APPLICATIE die de EXPORT gestart heeft kan het bestand downloaden."
+        ),
+        responses={
+            (status.HTTP_200_OK, "application/x-ndjson"): OpenApiTypes.STR,
+            (status.HTTP_200_OK, "text/csv"): OpenApiTypes.STR,
+            **COMMON_ERROR_RESPONSES,
+        },
+    )
+)
+class EnkelvoudigInformatieObjectExportDownloadView(ExportDownloadView):
+    export_type = ExportTypeChoices.documenten
+
+    required_scopes = {"retrieve": SCOPE_DOCUMENTEN_ALLES_LEZEN}
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="Alle GEBRUIKSRECHTen opvragen.",
@@ -698,6 +817,7 @@ class EnkelvoudigInformatieObjectImportDestroyView(ImportDestroyView):
 @conditional_retrieve()
 class GebruiksrechtenViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
     ExpandMixin,
     NotificationViewSetMixin,
@@ -836,6 +956,7 @@ class EnkelvoudigInformatieObjectAuditTrailViewSet(AuditTrailViewSet):
 @conditional_retrieve()
 class ObjectInformatieObjectViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
     ListFilterByAuthorizationsMixin,
     mixins.CreateModelMixin,
@@ -940,7 +1061,9 @@ class ObjectInformatieObjectViewSet(
 
 
 @extend_schema_view(update=extend_schema(summary="Upload een bestandsdeel"))
-class BestandsDeelViewSet(UpdateWithoutPartialMixin, viewsets.GenericViewSet):
+class BestandsDeelViewSet(
+    SerializerMetricsMixin, UpdateWithoutPartialMixin, viewsets.GenericViewSet
+):
     queryset = BestandsDeel.objects.all()
     serializer_class = BestandsDeelSerializer
     lookup_field = "uuid"
@@ -989,6 +1112,7 @@ class BestandsDeelViewSet(UpdateWithoutPartialMixin, viewsets.GenericViewSet):
 @conditional_retrieve()
 class VerzendingViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
     ExpandMixin,
     NotificationViewSetMixin,
@@ -1101,25 +1225,21 @@ class ReservedDocumentViewSet(viewsets.ViewSet):
         bronorganisatie = serializer.validated_data["bronorganisatie"]
         aantal = serializer.validated_data.get("aantal", 1)
 
-        today = date.today()
-        identificaties = generate_document_identificatie(
+        instances = reserve_document_identificaties(
             bronorganisatie=bronorganisatie,
-            date_value=today,
+            date_value=date.today(),
             aantal=aantal,
         )
 
-        output_data = self.create_reserved_documents(
-            bronorganisatie, identificaties, aantal
+        output_data = self.get_reserved_documents_data(
+            bronorganisatie, instances, aantal
         )
 
         return Response(output_data, status=status.HTTP_201_CREATED)
 
-    def create_reserved_documents(self, bronorganisatie, identificaties, aantal):
+    def get_reserved_documents_data(self, bronorganisatie, instances, aantal):
         if aantal == 1:
-            instance = ReservedDocument.objects.create(
-                identificatie=identificaties,
-                bronorganisatie=bronorganisatie,
-            )
+            instance = instances[0]
             logger.info(
                 "reserved_document_created",
                 client_id=self.request.jwt_auth.client_id,
@@ -1130,11 +1250,6 @@ class ReservedDocumentViewSet(viewsets.ViewSet):
             output_serializer = self.serializer_class(instance)
             return output_serializer.data
         else:
-            instances = [
-                ReservedDocument(identificatie=ident, bronorganisatie=bronorganisatie)
-                for ident in identificaties
-            ]
-            ReservedDocument.objects.bulk_create(instances)
             logger.info(
                 "reserved_document_created_bulk",
                 client_id=self.request.jwt_auth.client_id,
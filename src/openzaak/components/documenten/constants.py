@@ -78,3 +78,9 @@ class DocumentenBackendTypes(models.TextChoices):
     filesystem = "filesystem", _("Filesystem storage")
     azure_blob_storage = "azure_blob_storage", _("Azure Blob Storage")
     s3_storage = "s3_storage", _("S3 Storage")
+
+
+class DocumentenDownloadModes(models.TextChoices):
+    proxy = "proxy", _("Stream the file through Open Zaak")
+    redirect = "redirect", _("Redirect to a short-lived presigned URL")
+    offload = "offload", _("Offload to the reverse proxy with X-Accel-Redirect")
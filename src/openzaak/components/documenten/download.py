@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Serve the contents of documents stored in S3 or Azure Blob Storage.
+
+Depending on ``DOCUMENTEN_API_DOWNLOAD_MODE``, the client is redirected to a
+short-lived presigned URL, the transfer is offloaded to the reverse proxy or, as a
+last resort, the file is streamed through Open Zaak in chunks.
+"""
+
+import mimetypes
+import os
+import re
+from typing import Optional
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db.models.fields.files import FieldFile
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseRedirect,
+    StreamingHttpResponse,
+)
+from django.http.response import HttpResponseBase
+from django.utils.http import content_disposition_header
+
+from .constants import DocumentenDownloadModes
+
+RANGE_RE = re.compile(r"^bytes=(?P<start>\d*)-(?P<end>\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range_header(header: str, size: int) -> Optional[tuple[int, int]]:
+    """
+    Parse a single byte range of a ``Range`` header into inclusive offsets.
+
+    Malformed headers and multiple ranges are ignored (``None``), in which case the
+    complete file is served, as allowed by RFC 9110.
+
+    :raises RangeNotSatisfiable: if the range lies outside of the file.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or (not match["start"] and not match["end"]):
+        return None
+
+    if not match["start"]:
+        # suffix range: the last N bytes
+        suffix_length = int(match["end"])
+        if suffix_length == 0:
+            raise RangeNotSatisfiable
+        return max(size - suffix_length, 0), size - 1
+
+    start = int(match["start"])
+    end = int(match["end"]) if match["end"] else size - 1
+    if end < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable
+    return start, min(end, size - 1)
+
+
+def get_offload_path(url: str) -> str:
+    """
+    Map the presigned URL to the internal location of the reverse proxy.
+
+    ``https://bucket.example.com/some/file?signature`` becomes
+    ``<location>https/bucket.example.com/some/file?signature``.
+    """
+    parts = urlsplit(url)
+    location = settings.DOCUMENTEN_API_DOWNLOAD_OFFLOAD_LOCATION.rstrip("/")
+    path = f"{location}/{parts.scheme}/{parts.netloc}{parts.path}"
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+def get_proxy_response(request: HttpRequest, file: FieldFile) -> HttpResponseBase:
+    """
+    Stream the file through Open Zaak, honouring a (single) ``Range`` request.
+    """
+    storage = file.storage
+    filename = os.path.basename(file.name)
+
+    byte_range = None
+    # a conditional range request is served completely, since the validator of the
+    # file is not known
+    range_header = request.headers.get("Range")
+    if range_header and "If-Range" not in request.headers:
+        size = storage.size(file.name)
+        try:
+            byte_range = parse_range_header(range_header, size)
+        except RangeNotSatisfiable:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    content_type, _encoding = mimetypes.guess_type(filename)
+    if byte_range is None:
+        chunks, length = storage.stream(file.name)
+        response = StreamingHttpResponse(chunks)
+    else:
+        start, end = byte_range
+        chunks, length = storage.stream(file.name, start=start, end=end)
+        response = StreamingHttpResponse(chunks, status=206)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    response["Content-Type"] = content_type or "application/octet-stream"
+    response["Content-Length"] = str(length)
+    response["Content-Disposition"] = content_disposition_header(True, filename)
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def get_download_response(request: HttpRequest, file: FieldFile) -> HttpResponseBase:
+    match settings.DOCUMENTEN_API_DOWNLOAD_MODE:
+        case DocumentenDownloadModes.redirect:
+            url = file.storage.download_url(file.name, os.path.basename(file.name))
+            return HttpResponseRedirect(url)
+        case DocumentenDownloadModes.offload:
+            url = file.storage.download_url(file.name, os.path.basename(file.name))
+            response = HttpResponse()
+            # let the reverse proxy determine the content type from the upstream
+            del response["Content-Type"]
+            response["X-Accel-Redirect"] = get_offload_path(url)
+            return response
+        case _:
+            return get_proxy_response(request, file)
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2024 Dimpact
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
 from django.utils.functional import classproperty
@@ -48,6 +49,7 @@ class DocumentRow:
 
     comment: Optional[str] = None
     instance: Optional[EnkelvoudigInformatieObject] = None
+    source_path: Optional[Path] = None
 
     _processed: bool = False
     _succeeded: bool = False
@@ -1,12 +1,43 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
-from typing import List
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from itertools import batched
+from typing import Iterable, Iterator, NamedTuple, TextIO
 
 from django.core.management import BaseCommand, CommandError
 from django.db import transaction
+from django.db.models import F, QuerySet, Window
+from django.db.models.functions import FirstValue, RowNumber
+from django.db.models.signals import post_delete
 from django.utils.translation import gettext_lazy as _
 
 from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.documenten.signals import delete_eio_file
+from openzaak.components.documenten.storage import documenten_storage
+
+REPORT_FIELDS = (
+    "uuid",
+    "bronorganisatie",
+    "identificatie",
+    "versie",
+    "creatiedatum",
+    "inhoud",
+    "kept_uuid",
+)
+
+
+class Duplicate(NamedTuple):
+    pk: int
+    uuid: str
+    bronorganisatie: str
+    identificatie: str
+    versie: int
+    creatiedatum: date
+    inhoud: str
+    kept_uuid: str
 
 
 class Command(BaseCommand):
@@ -20,25 +51,56 @@ class Command(BaseCommand):
             dest="interactive",
             help=_("Delete automatically any duplicates"),
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help=_("Only report the duplicates, nothing is deleted"),
+        )
+        parser.add_argument(
+            "--report",
+            type=str,
+            help=_("Path of the CSV file the duplicates are written to"),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help=_("Number of duplicates deleted per transaction"),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help=_("Number of threads deleting the files of the duplicates"),
+        )
 
     def handle(self, *args, **options):
-        msg = _("Checking {count} records ...").format(
-            count=EnkelvoudigInformatieObject.objects.count()
-        )
-        self.stdout.write(msg)
+        if options["batch_size"] < 1 or options["workers"] < 1:
+            raise CommandError(_("The batch size and workers must be at least 1."))
 
-        duplicates = find_duplicate_eios()
+        self.stdout.write(_("Checking for duplicate records ..."))
 
-        if len(duplicates) == 0:
-            self.stdout.write(_("Found no duplicate records."))
-            return
+        if options["report"]:
+            with open(options["report"], "w", newline="") as report:
+                count = write_report(iter_duplicates(options["batch_size"]), report)
+            self.stdout.write(
+                _("Written {count} duplicate records to {path}.").format(
+                    count=count, path=options["report"]
+                )
+            )
 
-        msg = _("Found {count} duplicate records.").format(count=len(duplicates))
-        self.stdout.write(msg)
+        if options["dry_run"]:
+            if not options["report"]:
+                self.show_duplicates(options["batch_size"])
+            return
 
         if not options["interactive"]:
-            delete_duplicates(duplicates)
-            self.stdout.write(self.style.SUCCESS(_("Deleted all the duplicates.")))
+            if not self.delete_duplicates(options):
+                self.stdout.write(_("Found no duplicate records."))
+            return
+
+        if not find_duplicate_eios().exists():
+            self.stdout.write(_("Found no duplicate records."))
             return
 
         while True:
@@ -48,35 +110,60 @@ class Command(BaseCommand):
                 self.stdout.write(_("Exiting."))
                 return
             elif option == 2:
-                try:
-                    delete_duplicates(duplicates)
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            _("Deleted {count} duplicate document(s).").format(
-                                count=len(duplicates)
-                            )
-                        )
-                    )
-                    return
-                except Exception as e:
-                    self.stderr.write(
-                        _("An error occurred. No documents were deleted.")
-                    )
-                    raise e
+                self.delete_duplicates(options)
+                return
             elif option == 1:
-                for document in duplicates:
-                    self.stdout.write(
-                        f"* RSIN: {document.bronorganisatie}, "
-                        f"Identificatie: {document.identificatie}, "
-                        f"UUID: {document.uuid}"
-                    )
+                self.show_duplicates(options["batch_size"])
             else:
                 raise CommandError(_("Invalid option chosen."))
 
+    def show_duplicates(self, chunk_size: int) -> None:
+        count = 0
+        for count, document in enumerate(iter_duplicates(chunk_size), start=1):
+            self.stdout.write(
+                f"* RSIN: {document.bronorganisatie}, "
+                f"Identificatie: {document.identificatie}, "
+                f"UUID: {document.uuid}"
+            )
+
+        self.stdout.write(_("Found {count} duplicate records.").format(count=count))
+
+    def delete_duplicates(self, options) -> int:
+        def log_batch(deleted: int, last_pk: int) -> None:
+            self.stdout.write(
+                _(
+                    "Deleted {count} duplicate document(s), last primary key: {pk}"
+                ).format(count=deleted, pk=last_pk)
+            )
+
+        try:
+            count = delete_duplicates(
+                iter_duplicates(options["batch_size"]),
+                batch_size=options["batch_size"],
+                workers=options["workers"],
+                log_func=log_batch,
+            )
+        except Exception:
+            self.stderr.write(
+                _(
+                    "An error occurred. The batches that were already deleted are "
+                    "committed, run the command again to resume."
+                )
+            )
+            raise
+
+        if count:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    _("Deleted {count} duplicate document(s).").format(count=count)
+                )
+            )
+        return count
+
     def get_option(self) -> int:
         message = _(
             "\n1) Show duplicate records\n"
-            "2) Delete duplicate records (the oldest record(s) will be deleted).\n"
+            "2) Delete duplicate records (the oldest record will be kept).\n"
             "3) Quit\n\n"
             "Choose your action [1-3]:\n"
         )
@@ -90,27 +177,119 @@ class Command(BaseCommand):
         return value
 
 
-def find_duplicate_eios() -> List[EnkelvoudigInformatieObject]:
-    all_documents = EnkelvoudigInformatieObject.objects.order_by("creatiedatum")
+def find_duplicate_eios() -> QuerySet:
+    """
+    Select the duplicate documents with a single window query.
+
+    Of all the documents with the same bronorganisatie, identificatie and versie the
+    oldest one is kept, the others are duplicates. The (deterministic) ordering on
+    the primary key makes it possible to resume an interrupted cleanup.
+    """
+    partition = {
+        "partition_by": [F("bronorganisatie"), F("identificatie"), F("versie")],
+        "order_by": [F("creatiedatum").asc(), F("pk").asc()],
+    }
+    return (
+        EnkelvoudigInformatieObject.objects.annotate(
+            row_number=Window(RowNumber(), **partition),
+            kept_uuid=Window(FirstValue("uuid"), **partition),
+        )
+        .filter(row_number__gt=1)
+        .order_by("pk")
+    )
+
+
+def iter_duplicates(chunk_size: int) -> Iterator[Duplicate]:
+    """
+    Stream the duplicate documents, using a server side cursor if enabled.
+    """
+    rows = find_duplicate_eios().values_list(*Duplicate._fields)
+    for row in rows.iterator(chunk_size=chunk_size):
+        yield Duplicate(*row)
+
+
+def write_report(duplicates: Iterable[Duplicate], file: TextIO) -> int:
+    writer = csv.writer(file)
+    writer.writerow(REPORT_FIELDS)
+
+    count = 0
+    for count, duplicate in enumerate(duplicates, start=1):
+        writer.writerow(getattr(duplicate, field) for field in REPORT_FIELDS)
+    return count
+
 
-    already_seen = set()
-    duplicates = []
-    for document in all_documents:
-        unique_data = (
-            document.identificatie,
-            document.bronorganisatie,
-            document.versie,
+@contextmanager
+def defer_file_deletion():
+    """
+    Don't delete the file of every deleted document separately, the files of a batch
+    are deleted after it is committed.
+    """
+    post_delete.disconnect(
+        delete_eio_file,
+        sender=EnkelvoudigInformatieObject,
+        dispatch_uid="documenten.delete_eio_file",
+    )
+    try:
+        yield
+    finally:
+        post_delete.connect(
+            delete_eio_file,
+            sender=EnkelvoudigInformatieObject,
+            dispatch_uid="documenten.delete_eio_file",
         )
-        if unique_data in already_seen:
-            duplicates.append(document)
-        else:
-            already_seen.add(unique_data)
 
-    return duplicates
 
+def delete_files(names: Iterable[str], workers: int) -> None:
+    """
+    Delete the files of the deleted documents, using a pool of threads since
+    deleting is mostly waiting on I/O.
+
+    Files that are still referred to by another document (e.g. the document that was
+    kept) are not deleted.
+    """
+    names = set(filter(None, names))
+    if not names:
+        return
+
+    names -= set(
+        EnkelvoudigInformatieObject.objects.filter(inhoud__in=names).values_list(
+            "inhoud", flat=True
+        )
+    )
+
+    if workers <= 1:
+        for name in names:
+            documenten_storage.delete(name)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(documenten_storage.delete, n) for n in names]:
+            future.result()
+
+
+def delete_duplicates(
+    duplicates: Iterable[Duplicate],
+    batch_size: int = 1000,
+    workers: int = 1,
+    log_func=None,
+) -> int:
+    """
+    Delete the duplicate documents in batches, each in its own transaction.
+
+    :return: the number of deleted documents.
+    """
+    count = 0
+    with defer_file_deletion():
+        for batch in batched(duplicates, batch_size):
+            with transaction.atomic():
+                EnkelvoudigInformatieObject.objects.filter(
+                    pk__in=[duplicate.pk for duplicate in batch]
+                ).delete()
+
+            delete_files((duplicate.inhoud for duplicate in batch), workers)
+
+            count += len(batch)
+            if log_func:
+                log_func(count, batch[-1].pk)
 
-@transaction.atomic
-def delete_duplicates(duplicates: List) -> None:
-    for document in duplicates:
-        document.delete()
-    return
+    return count
@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documenten", "0038_alter_bestandsdeel_inhoud"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="_upload_name",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="_upload_id",
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name="bestandsdeel",
+            name="_upload_token",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+    ]
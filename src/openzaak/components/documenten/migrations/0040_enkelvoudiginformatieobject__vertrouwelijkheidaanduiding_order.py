@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("documenten", "0039_multipart_upload"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="_vertrouwelijkheidaanduiding_order",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        vertrouwelijkheidaanduiding="openbaar", then=models.Value(0)
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="beperkt_openbaar",
+                        then=models.Value(1),
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="intern", then=models.Value(2)
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="zaakvertrouwelijk",
+                        then=models.Value(3),
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="vertrouwelijk",
+                        then=models.Value(4),
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="confidentieel",
+                        then=models.Value(5),
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="geheim", then=models.Value(6)
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="zeer_geheim", then=models.Value(7)
+                    ),
+                    output_field=models.IntegerField(),
+                ),
+                output_field=models.SmallIntegerField(),
+                verbose_name="vertrouwelijkheidaanduiding volgorde",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=["_informatieobjecttype", "_vertrouwelijkheidaanduiding_order"],
+                name="documenten___inform_7ed147_idx",
+            ),
+        ),
+    ]
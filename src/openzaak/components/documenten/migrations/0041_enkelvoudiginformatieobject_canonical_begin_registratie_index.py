@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "documenten",
+            "0040_enkelvoudiginformatieobject__vertrouwelijkheidaanduiding_order",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=["canonical", "begin_registratie"],
+                name="documenten__canonic_14a3b0_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "documenten",
+            "0041_enkelvoudiginformatieobject_canonical_begin_registratie_index",
+        ),
+    ]
+
+    operations = [
+        TrigramExtension(),
+    ]
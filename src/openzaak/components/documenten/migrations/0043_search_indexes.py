@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("documenten", "0042_trigram_extension"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast(
+                            "identificatie", output_field=models.TextField()
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="eio_identificatie_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast(
+                            "uuid", output_field=models.TextField()
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="eio_uuid_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast(
+                            "titel", output_field=models.TextField()
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="eio_titel_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast(
+                            "beschrijving", output_field=models.TextField()
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="eio_beschrijving_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast(
+                            "auteur", output_field=models.TextField()
+                        )
+                    ),
+                    name="gin_trgm_ops",
+                ),
+                name="eio_auteur_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector(
+                    "titel", "beschrijving", config="dutch"
+                ),
+                name="eio_search_idx",
+            ),
+        ),
+    ]
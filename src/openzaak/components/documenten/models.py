@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import os
 import uuid as _uuid
 from urllib.parse import urlparse
 
@@ -11,6 +12,7 @@ from django.utils.translation import gettext_lazy as _
 
 from privates.fields import PrivateMediaFileField
 from rest_framework.reverse import reverse
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.descriptors import GegevensGroepType
 from vng_api_common.fields import RSINField, VertrouwelijkheidsAanduidingField
 from zgw_consumers.models import ServiceUrlField
@@ -24,6 +26,7 @@ from openzaak.utils.fields import (
     ServiceFkField,
 )
 from openzaak.utils.mixins import APIMixin, AuditTrailMixin
+from openzaak.utils.search import search_vector_index, trigram_index
 
 from ..besluiten.models import BesluitInformatieObject
 from ..zaken.models import ZaakInformatieObject
@@ -90,6 +93,15 @@ class InformatieObject(models.Model):
         help_text="Aanduiding van de mate waarin het INFORMATIEOBJECT voor de "
         "openbaarheid bestemd is.",
     )
+    # stored, so the authorizations can be checked using an index
+    _vertrouwelijkheidaanduiding_order = models.GeneratedField(
+        expression=VertrouwelijkheidsAanduiding.get_order_expression(
+            "vertrouwelijkheidaanduiding"
+        ),
+        output_field=models.SmallIntegerField(),
+        db_persist=True,
+        verbose_name=_("vertrouwelijkheidaanduiding volgorde"),
+    )
     auteur = models.CharField(
         max_length=200,
         help_text="De persoon of organisatie die in de eerste plaats "
@@ -277,6 +289,10 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
         editable=False,
     )
 
+    # the pending native multipart upload of the bestandsdelen, if any
+    _upload_name = models.CharField(max_length=100, blank=True)
+    _upload_id = models.TextField(blank=True)
+
     def __str__(self):
         try:
             return str(self.latest_version)
@@ -292,6 +308,50 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
     def unlock_document(self, doc_uuid, lock, force_unlock=False):
         self.lock = ""
 
+    @property
+    def has_multipart_upload(self) -> bool:
+        return bool(self._upload_name)
+
+    def start_multipart_upload(self, name: str) -> None:
+        """
+        Upload the bestandsdelen directly to the storage backend as the parts of
+        the file ``name``.
+
+        The name is made unique up front with a random suffix, checking whether it
+        is available doesn't work as the file only exists once the upload is
+        completed, so concurrent uploads would get the same name.
+        """
+        max_length = self._meta.get_field("_upload_name").max_length
+        root, ext = os.path.splitext(name)
+        suffix = f"_{_uuid.uuid4().hex}{ext}"
+        self._upload_name = f"{root[: max_length - len(suffix)]}{suffix}"
+        self._upload_id = documenten_storage.start_multipart_upload(self._upload_name)
+        self.save(update_fields=["_upload_name", "_upload_id"])
+
+    def complete_multipart_upload(self, bestandsdelen: models.QuerySet) -> str:
+        """
+        Commit the uploaded bestandsdelen as the file.
+
+        :return: the name of the file in the storage backend
+        """
+        name = self._upload_name
+        documenten_storage.complete_multipart_upload(
+            name,
+            self._upload_id,
+            [(part.volgnummer, part._upload_token) for part in bestandsdelen],
+        )
+        self._upload_name = self._upload_id = ""
+        self.save(update_fields=["_upload_name", "_upload_id"])
+        return name
+
+    def abort_multipart_upload(self) -> None:
+        if not self.has_multipart_upload:
+            return
+
+        documenten_storage.abort_multipart_upload(self._upload_name, self._upload_id)
+        self._upload_name = self._upload_id = ""
+        self.save(update_fields=["_upload_name", "_upload_id"])
+
 
 class EnkelvoudigInformatieObject(
     DocumentETagMixin, AuditTrailMixin, APIMixin, InformatieObject
@@ -425,7 +485,19 @@ class EnkelvoudigInformatieObject(
         unique_together = [("uuid", "versie")]
         verbose_name = _("Document")
         verbose_name_plural = _("Documenten")
-        indexes = [models.Index(fields=["canonical", "-versie"])]
+        indexes = [
+            models.Index(fields=["canonical", "-versie"]),
+            models.Index(fields=["canonical", "begin_registratie"]),
+            trigram_index("identificatie", name="eio_identificatie_trgm_idx"),
+            trigram_index("uuid", name="eio_uuid_trgm_idx"),
+            trigram_index("titel", name="eio_titel_trgm_idx"),
+            trigram_index("beschrijving", name="eio_beschrijving_trgm_idx"),
+            trigram_index("auteur", name="eio_auteur_trgm_idx"),
+            search_vector_index("titel", "beschrijving", name="eio_search_idx"),
+            models.Index(
+                fields=["_informatieobjecttype", "_vertrouwelijkheidaanduiding_order"]
+            ),
+        ]
         ordering = ["canonical", "-versie"]
 
     def __init__(self, *args, **kwargs):
@@ -509,6 +581,8 @@ class BestandsDeel(models.Model):
         help_text=_("De (binaire) bestandsinhoud van dit specifieke bestandsdeel."),
     )
     _voltooid = models.BooleanField(default=False)
+    # identifies the part of a native multipart upload, instead of ``inhoud``
+    _upload_token = models.CharField(max_length=255, blank=True)
     datetime_created = models.DateTimeField(_("datetime created"), auto_now_add=True)
 
     objects = BestandsDeelQuerySet.as_manager()
@@ -556,6 +630,19 @@ class BestandsDeel(models.Model):
             self._voltooid = self.inhoud.size == self.omvang
         return super().save(*args, **kwargs)
 
+    def upload_part(self, content) -> None:
+        """
+        Upload the content directly to the storage backend, as part of the native
+        multipart upload of the informatieobject.
+        """
+        canonical = self.informatieobject
+        self._upload_token = documenten_storage.upload_part(
+            canonical._upload_name, canonical._upload_id, self.volgnummer, content
+        )
+        # the size is validated by the serializer
+        self._voltooid = True
+        self.save(update_fields=["_upload_token", "_voltooid"])
+
     @property
     def voltooid(self) -> bool:
         if self._voltooid is not None:
@@ -678,8 +765,9 @@ class ObjectInformatieObject(DocumentETagMixin, models.Model):
     )
     verzoek = AliasServiceUrlField(
         source_field=_object_url,
-        allow_write_when=lambda instance: instance.object_type
-        == ObjectInformatieObjectTypes.verzoek,
+        allow_write_when=lambda instance: (
+            instance.object_type == ObjectInformatieObjectTypes.verzoek
+        ),
         blank=True,
     )
 
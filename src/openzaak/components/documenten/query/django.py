@@ -6,7 +6,6 @@ from django.apps import apps
 from django.db import models
 
 from django_loose_fk.virtual_models import ProxyMixin
-from vng_api_common.constants import VertrouwelijkheidsAanduiding
 
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
@@ -50,11 +49,6 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
         return ""
 
     def build_queryset(self, local_filters, external_filters) -> models.QuerySet:
-        order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-            "vertrouwelijkheidaanduiding"
-        )
-        annotations = {"_va_order": order_case}
-
         if self.authorizations_lookup:
             # If the current queryset is not an InformatieObjectQuerySet, first
             # retrieve the canonical IDs of EnkelvoudigInformatieObjects
@@ -62,17 +56,13 @@ class InformatieobjectAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin
             # related to those EnkelvoudigInformatieObjectCanonicals
             model = apps.get_model("documenten", "EnkelvoudigInformatieObject")
 
-            filtered = (
-                model.objects.annotate(**annotations)
-                .filter(local_filters | external_filters)
-                .values("canonical")
+            filtered = model.objects.filter(local_filters | external_filters).values(
+                "canonical"
             )
             queryset = self.filter(informatieobject__in=filtered)
             # bring it all together now to build the resulting queryset
         else:
-            queryset = self.annotate(**annotations).filter(
-                local_filters | external_filters
-            )
+            queryset = self.filter(local_filters | external_filters)
 
         return queryset
 
@@ -139,10 +129,10 @@ class BestandsDeelQuerySet(models.QuerySet):
 
     @property
     def complete_upload(self) -> bool:
-        empty_parts = self.filter(inhoud="")
+        empty_parts = self.filter(inhoud="", _upload_token="")
         return not empty_parts.exists()
 
     @property
     def empty_bestandsdelen(self) -> bool:
-        empty_parts = self.filter(inhoud="")
+        empty_parts = self.filter(inhoud="", _upload_token="")
         return empty_parts.count() == self.count()
@@ -7,7 +7,12 @@ from django.dispatch import receiver
 from openzaak.components.besluiten.models import BesluitInformatieObject
 from openzaak.components.zaken.models import ZaakInformatieObject
 
-from .models import EnkelvoudigInformatieObject, ObjectInformatieObject
+from .models import (
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+    ObjectInformatieObject,
+)
+from .storage import documenten_storage
 from .typing import IORelation
 
 
@@ -56,3 +61,15 @@ def sync_oio(
 def delete_eio_file(sender, instance, **kwargs):
     if instance.inhoud:
         instance.inhoud.delete(save=False)
+
+
+@receiver(
+    post_delete,
+    sender=EnkelvoudigInformatieObjectCanonical,
+    dispatch_uid="documenten.abort_multipart_upload",
+)
+def abort_multipart_upload(sender, instance, **kwargs):
+    if instance.has_multipart_upload:
+        documenten_storage.abort_multipart_upload(
+            instance._upload_name, instance._upload_id
+        )
@@ -1,19 +1,24 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
-
-from typing import cast
+import math
+from abc import ABC, abstractmethod
+from base64 import b64encode
+from typing import Iterator, Optional, cast
 
 from django.conf import settings
+from django.core.files import File
 from django.core.files.storage import Storage, storages
-from django.utils.functional import LazyObject
+from django.utils.functional import LazyObject, empty
+from django.utils.http import content_disposition_header
 
 import structlog
 from azure.core.exceptions import AzureError
 from azure.identity import ClientSecretCredential
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobBlock, BlobServiceClient, ContentSettings
 from privates.storages import STORAGE_ALIAS as PRIVATE_MEDIA_STORAGE_ALIAS
 from storages.backends.azure_storage import AzureStorage as _AzureStorage
 from storages.backends.s3 import S3Storage as _S3Storage
+from storages.utils import clean_name
 
 from openzaak.components.documenten.constants import DocumentenBackendTypes
 
@@ -21,8 +26,57 @@ from .exceptions import DocumentBackendNotImplementedError
 
 logger = structlog.stdlib.get_logger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class MultipartUploadMixin(ABC):
+    """
+    Upload a file in parts, which are combined by the storage backend itself.
+
+    Completing the upload doesn't copy any data, the uploaded parts are committed as
+    the file.
+    """
+
+    multipart_min_part_size = 0
+    multipart_max_parts = 10_000
+
+    def supports_multipart_upload(self, size: int, part_size: int) -> bool:
+        parts = math.ceil(size / part_size)
+        # only the last part may be smaller than the minimum part size
+        return parts <= self.multipart_max_parts and (
+            parts == 1 or part_size >= self.multipart_min_part_size
+        )
+
+    @abstractmethod
+    def start_multipart_upload(self, name: str) -> str:
+        """
+        :return: the identifier of the upload
+        """
+
+    @abstractmethod
+    def upload_part(
+        self, name: str, upload_id: str, part_number: int, content: File
+    ) -> str:
+        """
+        :return: the token that identifies the uploaded part when completing the upload
+        """
+
+    @abstractmethod
+    def complete_multipart_upload(
+        self, name: str, upload_id: str, parts: list[tuple[int, str]]
+    ) -> None:
+        """
+        :param parts: the part numbers and tokens of all uploaded parts, in order
+        """
+
+    @abstractmethod
+    def abort_multipart_upload(self, name: str, upload_id: str) -> None:
+        pass
+
+
+class S3Storage(MultipartUploadMixin, _S3Storage):
+    multipart_min_part_size = 5 * 2**20
 
-class S3Storage(_S3Storage):
     def connection_check(self) -> bool:
         """
         Checks if the storage backend is reachable and credentials are valid.
@@ -37,8 +91,92 @@ class S3Storage(_S3Storage):
     def path(self, name: str) -> str:
         return self.get_available_name(name)
 
+    def download_url(self, name: str, filename: str) -> str:
+        """
+        Return a presigned URL (valid for ``S3_QUERYSTRING_EXPIRE`` seconds) that
+        downloads the file as attachment.
+        """
+        return self.url(
+            name,
+            parameters={
+                "ResponseContentDisposition": content_disposition_header(
+                    True, filename
+                ),
+                "ResponseContentType": "application/octet-stream",
+            },
+        )
+
+    def stream(
+        self, name: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> tuple[Iterator[bytes], int]:
+        """
+        Stream (the byte range ``start``-``end`` of) the file in chunks, without
+        buffering the complete file.
+
+        :return: the chunks and the amount of bytes that will be streamed
+        """
+        params = {}
+        if start is not None:
+            params["Range"] = f"bytes={start}-{'' if end is None else end}"
+
+        obj = self.bucket.Object(self._normalize_name(clean_name(name)))
+        response = obj.get(**params)
+        body = response["Body"]
+
+        def chunks():
+            try:
+                yield from body.iter_chunks(DOWNLOAD_CHUNK_SIZE)
+            finally:
+                body.close()
+
+        return chunks(), response["ContentLength"]
+
+    def start_multipart_upload(self, name: str) -> str:
+        key = self._normalize_name(clean_name(name))
+        response = self.bucket.meta.client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=key, **self._get_write_parameters(key)
+        )
+        return response["UploadId"]
+
+    def upload_part(
+        self, name: str, upload_id: str, part_number: int, content: File
+    ) -> str:
+        content.seek(0)
+        response = self.bucket.meta.client.upload_part(
+            Bucket=self.bucket_name,
+            Key=self._normalize_name(clean_name(name)),
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=content,
+        )
+        return response["ETag"]
+
+    def complete_multipart_upload(
+        self, name: str, upload_id: str, parts: list[tuple[int, str]]
+    ) -> None:
+        self.bucket.meta.client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self._normalize_name(clean_name(name)),
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": part_number, "ETag": etag}
+                    for part_number, etag in parts
+                ]
+            },
+        )
+
+    def abort_multipart_upload(self, name: str, upload_id: str) -> None:
+        self.bucket.meta.client.abort_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=self._normalize_name(clean_name(name)),
+            UploadId=upload_id,
+        )
+
+
+class AzureStorage(MultipartUploadMixin, _AzureStorage):
+    multipart_max_parts = 50_000
 
-class AzureStorage(_AzureStorage):
     def get_default_settings(self):
         _settings = super().get_default_settings()
         _settings.setdefault("client_options", {})
@@ -79,6 +217,70 @@ class AzureStorage(_AzureStorage):
     def path(self, name: str) -> str:
         return self._get_valid_path(name)
 
+    def download_url(self, name: str, filename: str) -> str:
+        """
+        Return a URL with a SAS token (valid for ``AZURE_URL_EXPIRATION_SECS``
+        seconds) that downloads the file as attachment.
+        """
+        return self.url(
+            name,
+            parameters={
+                "content_disposition": content_disposition_header(True, filename),
+                "content_type": "application/octet-stream",
+            },
+        )
+
+    def stream(
+        self, name: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> tuple[Iterator[bytes], int]:
+        """
+        Stream (the byte range ``start``-``end`` of) the file in chunks, without
+        buffering the complete file.
+
+        :return: the chunks and the amount of bytes that will be streamed
+        """
+        length = None if start is None or end is None else end - start + 1
+        downloader = self.client.download_blob(
+            self._get_valid_path(name),
+            offset=start,
+            length=length,
+            timeout=self.timeout,
+        )
+        return downloader.chunks(), downloader.size
+
+    def start_multipart_upload(self, name: str) -> str:
+        # the blocks are staged on the blob itself
+        return ""
+
+    def upload_part(
+        self, name: str, upload_id: str, part_number: int, content: File
+    ) -> str:
+        # all block IDs of a blob must have the same length
+        block_id = b64encode(f"{part_number:010}".encode()).decode()
+        blob_client = self.client.get_blob_client(self._get_valid_path(name))
+        content.seek(0)
+        blob_client.stage_block(
+            block_id, content, length=content.size, timeout=self.timeout
+        )
+        return block_id
+
+    def complete_multipart_upload(
+        self, name: str, upload_id: str, parts: list[tuple[int, str]]
+    ) -> None:
+        name = self._get_valid_path(name)
+        blob_client = self.client.get_blob_client(name)
+        blob_client.commit_block_list(
+            [BlobBlock(block_id=block_id) for _, block_id in parts],
+            content_settings=ContentSettings(
+                **self._get_content_settings_parameters(name)
+            ),
+            timeout=self.timeout,
+        )
+
+    def abort_multipart_upload(self, name: str, upload_id: str) -> None:
+        # uncommitted blocks can't be deleted, Azure discards them after a week
+        pass
+
     def connection_check(self) -> bool:
         """
         Method to validate that connection can be made with Azure blob storage
@@ -110,6 +312,20 @@ class DocumentenStorage(LazyObject):
             return self._wrapped.connection_check()
         return True  # PrivateMediaStorage
 
+    def supports_multipart_upload(self, size: int, part_size: int) -> bool:
+        """
+        Check if a file of ``size`` bytes can be uploaded in parts of ``part_size``
+        bytes with a native multipart upload of the storage backend.
+        """
+        if not settings.DOCUMENTEN_NATIVE_MULTIPART_UPLOAD:
+            return False
+
+        if self._wrapped is empty:
+            self._setup()
+        if not isinstance(self._wrapped, MultipartUploadMixin):
+            return False  # PrivateMediaStorage
+        return self._wrapped.supports_multipart_upload(size, part_size)
+
 
 def get_private_media_storage() -> Storage:
     return storages[PRIVATE_MEDIA_STORAGE_ALIAS]
@@ -1,7 +1,12 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2024 Dimpact
+import itertools
 import shutil
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from pathlib import Path
+from typing import Collection
 from uuid import UUID, uuid4
 
 from django.conf import settings
@@ -11,19 +16,21 @@ from django.http import HttpRequest
 from django.utils import timezone
 
 import structlog
+from celery import chord
 from structlog.contextvars import bind_contextvars
 from vng_api_common.constants import RelatieAarden
-from vng_api_common.utils import generate_unique_identification
 
 from openzaak import celery_app
 from openzaak.components.documenten.api.serializers import (
     EnkelvoudigInformatieObjectSerializer,
 )
+from openzaak.components.documenten.api.utils import reserve_document_identificaties
 from openzaak.components.documenten.constants import DocumentenBackendTypes
 from openzaak.components.documenten.import_utils import DocumentRow
 from openzaak.components.documenten.models import (
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
+    ReservedDocument,
 )
 from openzaak.components.zaken.models.zaken import Zaak, ZaakInformatieObject
 from openzaak.import_data.models import Import, ImportStatusChoices
@@ -31,7 +38,9 @@ from openzaak.import_data.utils import (
     finish_batch,
     finish_import,
     get_csv_generator,
-    get_total_count,
+    merge_report_files,
+    remove_chunk_files,
+    split_import_file,
     task_locker,
 )
 from openzaak.utils.fields import get_default_path
@@ -57,11 +66,9 @@ def copy_file_to_storage(src: Path, dst: Path) -> str:
     default_dir = get_default_path(EnkelvoudigInformatieObject.inhoud.field)
     storage = EnkelvoudigInformatieObject.inhoud.field.storage
 
-    if (
-        DocumentenBackendTypes.filesystem == settings.DOCUMENTEN_API_BACKEND
-        and not default_dir.exists()
-    ):
-        default_dir.mkdir(parents=True)
+    if DocumentenBackendTypes.filesystem == settings.DOCUMENTEN_API_BACKEND:
+        # files can be copied from multiple threads at the same time
+        default_dir.mkdir(parents=True, exist_ok=True)
 
     match settings.DOCUMENTEN_API_BACKEND:
         case (
@@ -85,9 +92,10 @@ def _import_document_row(
     row: list[str],
     row_index: int,
     identifier: str,
-    existing_uuids: list[str],
+    existing_uuids: Collection[str],
     zaak_uuids: dict[str, int],
     request: HttpRequest,
+    copy_file: bool = True,
 ) -> DocumentRow:
     expected_column_count = len(DocumentRow.import_headers)
 
@@ -289,28 +297,77 @@ def _import_document_row(
 
         return document_row
 
+    document_row.instance = instance
+    document_row.source_path = path
+
+    if copy_file:
+        _copy_row_file(document_row)
+
+    return document_row
+
+
+def _copy_row_file(document_row: DocumentRow) -> None:
     default_dir = get_default_path(EnkelvoudigInformatieObject.inhoud.field)
-    import_path = default_dir / path.name
+    import_path = default_dir / document_row.source_path.name
 
     try:
-        actual_import_path = copy_file_to_storage(path, import_path)
+        actual_import_path = copy_file_to_storage(document_row.source_path, import_path)
     except Exception as e:
-        error_message = f"Unable to copy file for row {row_index}: \n {str(e)}"
+        error_message = (
+            f"Unable to copy file for row {document_row.row_index}: \n {str(e)}"
+        )
 
         logger.warning(
             "unable_to_copy_file",
-            row_index=row_index,
+            row_index=document_row.row_index,
             error=str(e),
         )
         document_row.comment = error_message
         document_row.processed = True
+        document_row.instance = None
 
-        return document_row
+        return
 
-    instance.inhoud.name = actual_import_path
+    document_row.instance.inhoud.name = actual_import_path
 
-    document_row.instance = instance
-    return document_row
+
+def _copy_files(batch: list[DocumentRow]) -> None:
+    """
+    Copy the files of the valid rows in the batch to the storage backend, using a pool
+    of threads since copying is mostly waiting on I/O.
+
+    Rows referring to files with the same name end up at the same destination, these
+    are copied one after another (by the same thread).
+    """
+    rows_by_name: dict[str, list[DocumentRow]] = defaultdict(list)
+
+    for row in batch:
+        if row.instance is None or row.source_path is None:
+            continue
+
+        rows_by_name[row.source_path.name].append(row)
+
+    def copy_rows(rows: list[DocumentRow]) -> None:
+        for row in rows:
+            _copy_row_file(row)
+
+    max_workers = min(settings.IMPORT_DOCUMENTEN_COPY_WORKERS, len(rows_by_name))
+
+    if max_workers <= 1:
+        for rows in rows_by_name.values():
+            copy_rows(rows)
+
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            # every thread needs its own copy of the context (for the log context)
+            executor.submit(copy_context().run, copy_rows, rows)
+            for rows in rows_by_name.values()
+        ]
+
+        for future in futures:
+            future.result()
 
 
 @transaction.atomic()
@@ -395,23 +452,86 @@ def _batch_create_eios(batch: list[DocumentRow], zaak_uuids: dict[str, int]) ->
         row.succeeded = True
 
 
-def _get_identifiers(size: int) -> list[str]:
-    now = timezone.now()
-    dummy_instance = EnkelvoudigInformatieObject(creatiedatum=now.date())
-    first_identifier = generate_unique_identification(dummy_instance, "creatiedatum")
+def _reserve_identifiers(rows: list[list[str]]) -> list[ReservedDocument | None]:
+    """
+    Reserve an identificatie for each row of the batch, for the bronorganisatie of
+    the row.
 
-    _range = size - 1 if size else 0  # don't count the first identifier
+    The identificaties are reserved through the same generator as the reservations
+    made through the API, so chunks which are processed simultaneously and documents
+    created through the API never get the same identificatie. The reservations are
+    removed once the batch is processed, see :func:`_release_identifiers`.
+    """
+    index = DocumentRow.import_headers.index("bronorganisatie")
+    # rows without a valid bronorganisatie fail the validation anyway
+    bronorganisaties = [
+        row[index] if len(row) > index and len(row[index]) == 9 else None
+        for row in rows
+    ]
 
-    model_name, year, number = first_identifier.split("-")
-    number = int(number)
-    identifiers = []
+    today = timezone.now().date()
+    reservations = {
+        bronorganisatie: iter(
+            reserve_document_identificaties(bronorganisatie, today, aantal=amount)
+        )
+        for bronorganisatie, amount in Counter(bronorganisaties).items()
+        if bronorganisatie is not None
+    }
 
-    for i in range(_range):
-        number += 1
+    return [
+        next(reservations[bronorganisatie]) if bronorganisatie is not None else None
+        for bronorganisatie in bronorganisaties
+    ]
 
-        identifiers.append(f"{model_name}-{year}-{str(number).zfill(10)}")
 
-    return [first_identifier, *identifiers]
+def _release_identifiers(reservations: list[ReservedDocument | None]) -> None:
+    """
+    Remove the reservations made for a batch by :func:`_reserve_identifiers`.
+
+    The identificaties of the documents created in the batch are issued, the others
+    can be used again.
+    """
+    ReservedDocument.objects.filter(
+        pk__in=[reservation.pk for reservation in reservations if reservation]
+    ).delete()
+
+
+def _get_batch_lookups(
+    rows: list[list[str]],
+) -> tuple[set[str], dict[str, int]]:
+    """
+    Look up the existing EIO's and the Zaken referenced by the rows of the batch.
+    """
+
+    def get_uuids(column: str) -> set[UUID]:
+        index = DocumentRow.import_headers.index(column)
+        uuids = set()
+
+        for row in rows:
+            if len(row) <= index or not row[index]:
+                continue
+
+            try:
+                uuids.add(UUID(row[index]))
+            except ValueError:
+                continue
+
+        return uuids
+
+    eio_uuids = {
+        str(uuid)
+        for uuid in EnkelvoudigInformatieObject.objects.filter(
+            uuid__in=get_uuids("uuid")
+        ).values_list("uuid", flat=True)
+    }
+    zaak_uuids = {
+        str(uuid): id
+        for uuid, id in Zaak.objects.filter(uuid__in=get_uuids("zaakUuid")).values_list(
+            "uuid", "id"
+        )
+    }
+
+    return eio_uuids, zaak_uuids
 
 
 def _reconstruct_request(headers: dict) -> HttpRequest:
@@ -431,102 +551,205 @@ def _reconstruct_request(headers: dict) -> HttpRequest:
 @celery_app.task(bind=True)
 @task_locker
 def import_documents(self, import_pk: int, request_headers: dict) -> None:
-    import_instance = Import.objects.get(pk=import_pk)
+    """
+    Split the import file into chunks which are processed by `import_documents_chunk`
+    across the available workers, `finish_documents_import` finishes the import once
+    all chunks are processed.
 
-    request = _reconstruct_request(request_headers)
+    The chunks are combined with a Celery chord, which requires a result backend to
+    collect the results of the chunks.
+    """
+    import_instance = Import.objects.get(pk=import_pk)
 
     file_path = import_instance.import_file.path
 
     bind_contextvars(import_id=import_pk, file_path=file_path)
 
-    import_instance.total = get_total_count(file_path)
+    import_instance.total, chunks = split_import_file(
+        import_instance, settings.IMPORT_DOCUMENTEN_CHUNK_SIZE
+    )
     import_instance.started_on = timezone.now()
     import_instance.status = ImportStatusChoices.active
     import_instance.save(update_fields=["total", "started_on", "status"])
 
-    batch: list[DocumentRow] = []
-    batch_size = settings.IMPORT_DOCUMENTEN_BATCH_SIZE
-
-    zaak_uuids = {str(uuid): id for uuid, id in Zaak.objects.values_list("uuid", "id")}
-    eio_uuids = [
-        str(uuid) for uuid in EnkelvoudigInformatieObject.objects.values_list("uuid")
+    tasks = [
+        import_documents_chunk.si(
+            import_pk,
+            request_headers,
+            chunk_number,
+            chunk_path,
+            first_row_index,
+        )
+        for chunk_number, (chunk_path, first_row_index) in enumerate(chunks, start=1)
     ]
 
-    identifiers = []
+    if len(tasks) > 1:
+        logger.info("dispatching_chunks", chunk_count=len(tasks))
+        chord(tasks)(finish_documents_import.s(import_pk))
+        return
 
-    for row_index, row in get_csv_generator(file_path):
-        if row_index == 1:  # skip the header row
-            continue
+    # there is no need to involve other workers for a single chunk
+    results = [task() for task in tasks]
+    finish_documents_import(results, import_pk)
 
-        if len(batch) % batch_size == 0:
-            logger.info(
-                "starting_batch",
-                batch_number=import_instance.get_batch_number(batch_size),
-            )
 
-            identifiers = _get_identifiers(batch_size)
+@celery_app.task()
+def import_documents_chunk(
+    import_pk: int,
+    request_headers: dict,
+    chunk_number: int,
+    chunk_path: str,
+    first_row_index: int,
+) -> dict:
+    """
+    Import the rows of a single chunk file in batches.
 
-        document_row = _import_document_row(
-            row, row_index, identifiers.pop(), eio_uuids, zaak_uuids, request
+    The outcome is returned instead of raised, otherwise the chord would not call
+    `finish_documents_import`.
+    """
+    import_instance = Import.objects.get(pk=import_pk)
+    report_path = str(Path(chunk_path).with_name(f"report-{chunk_number}.csv"))
+
+    bind_contextvars(import_id=import_pk, chunk_number=chunk_number)
+
+    result = {
+        "chunk_number": chunk_number,
+        "files": [chunk_path, report_path],
+        "status": ImportStatusChoices.finished,
+        "comment": "",
+    }
+
+    try:
+        _import_chunk(
+            import_instance,
+            _reconstruct_request(request_headers),
+            chunk_path,
+            report_path,
+            first_row_index,
+            result,
         )
+    except Exception as e:
+        logger.exception("unexpected_error_during_chunk", error=str(e))
+        result.update(status=ImportStatusChoices.error, comment=str(e))
 
-        if document_row.instance and document_row.instance.uuid:
-            eio_uuids.append(str(document_row.instance.uuid))
+    return result
 
-        batch.append(document_row)
 
-        processed = import_instance.processed + len(batch)
-        is_finished = bool(import_instance.total == processed)
+def _import_chunk(
+    import_instance: Import,
+    request: HttpRequest,
+    chunk_path: str,
+    report_path: str,
+    first_row_index: int,
+    result: dict,
+) -> None:
+    batch_size = settings.IMPORT_DOCUMENTEN_BATCH_SIZE
 
-        if len(batch) % batch_size != 0 and not is_finished:
-            continue
+    # the UUID's of existing EIO's are looked up per batch, the ones created earlier
+    # in this chunk are added as well
+    known_uuids: set[str] = set()
+
+    rows = get_csv_generator(chunk_path)
+
+    for batch_number, rows_batch in enumerate(
+        itertools.batched(rows, batch_size), start=1
+    ):
+        logger.info("starting_batch", batch_number=batch_number)
+
+        rows_batch = [row for _index, row in rows_batch]
+        first_index = first_row_index + (batch_number - 1) * batch_size
+        reservations = _reserve_identifiers(rows_batch)
+        existing_uuids, zaak_uuids = _get_batch_lookups(rows_batch)
+        known_uuids.update(existing_uuids)
+
+        batch: list[DocumentRow] = []
+
+        for offset, (row, reservation) in enumerate(zip(rows_batch, reservations)):
+            document_row = _import_document_row(
+                row,
+                first_index + offset,
+                reservation.identificatie if reservation else "",
+                known_uuids,
+                zaak_uuids,
+                request,
+                copy_file=False,
+            )
+
+            if document_row.instance and document_row.instance.uuid:
+                known_uuids.add(str(document_row.instance.uuid))
+
+            batch.append(document_row)
+
+        _copy_files(batch)
 
         try:
             logger.debug(
                 "creating_eios_and_zios_for_batch",
-                batch_number=import_instance.get_batch_number(batch_size),
+                batch_number=batch_number,
             )
             _batch_create_eios(batch, zaak_uuids)
         except IntegrityError as e:
             error_message = (
-                "An Integrity error occured during batch "
-                f"{import_instance.get_batch_number(batch_size)}: \n {str(e)}"
+                f"An Integrity error occured during batch {batch_number} of chunk "
+                f"{result['chunk_number']}: \n {str(e)}"
             )
 
-            import_instance.comment += f"\n\n {error_message}"
-            import_instance.save(update_fields=["comment"])
+            result["comment"] += f"\n\n {error_message}"
 
             logger.warning(
                 "integrity_error_during_batch",
-                batch_number=import_instance.get_batch_number(batch_size),
+                batch_number=batch_number,
                 error=str(e),
-                next_batch=import_instance.get_batch_number(batch_size) + 1,
+                next_batch=batch_number + 1,
             )
 
         except DatabaseError as e:
             logger.critical(
-                "critical_error_during_batch_finishing_import",
-                batch_number=import_instance.get_batch_number(batch_size),
+                "critical_error_during_batch_finishing_chunk",
+                batch_number=batch_number,
                 error=str(e),
             )
             logger.info("trying_to_stop_import_process_gracefully")
 
-            finish_batch(import_instance, batch, DocumentRow.export_headers)
-            finish_import(
-                import_instance,
-                status=ImportStatusChoices.error,
-                comment=str(e),
+            finish_batch(
+                import_instance, batch, DocumentRow.export_headers, report_path
             )
+            _release_identifiers(reservations)
+            result.update(status=ImportStatusChoices.error, comment=str(e))
 
             return
 
-        finish_batch(import_instance, batch, DocumentRow.export_headers)
+        _release_identifiers(reservations)
 
-        remaining_batches = import_instance.get_remaining_batches(batch_size)
-        logger.info(
-            "batches_remaining",
-            remaining_batches=remaining_batches,
-        )
-        batch.clear()
+        finish_batch(import_instance, batch, DocumentRow.export_headers, report_path)
+
+
+@celery_app.task()
+def finish_documents_import(chunk_results: list[dict], import_pk: int) -> None:
+    import_instance = Import.objects.get(pk=import_pk)
+
+    bind_contextvars(import_id=import_pk)
+
+    chunk_results = sorted(chunk_results, key=lambda result: result["chunk_number"])
+    report_paths = [result["files"][1] for result in chunk_results]
+
+    if chunk_results:
+        merge_report_files(import_instance, DocumentRow.export_headers, report_paths)
+
+    remove_chunk_files(
+        import_instance,
+        [file_path for result in chunk_results for file_path in result["files"]],
+    )
 
-    finish_import(import_instance, ImportStatusChoices.finished)
+    failed = any(
+        result["status"] == ImportStatusChoices.error for result in chunk_results
+    )
+    comment = "\n\n".join(
+        result["comment"].strip() for result in chunk_results if result["comment"]
+    )
+
+    finish_import(
+        import_instance,
+        ImportStatusChoices.error if failed else ImportStatusChoices.finished,
+        comment=comment,
+    )
@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 from django.db import IntegrityError, OperationalError
 from django.test import TestCase, override_settings
+from django.utils import timezone
 
 import requests_mock
 from privates.storages import private_media_storage
@@ -15,7 +16,10 @@ from zgw_consumers.test.factories import ServiceFactory
 
 from openzaak.components.documenten.exceptions import DocumentBackendNotImplementedError
 from openzaak.components.documenten.import_utils import DocumentRow
-from openzaak.components.documenten.models import EnkelvoudigInformatieObject
+from openzaak.components.documenten.models import (
+    EnkelvoudigInformatieObject,
+    ReservedDocument,
+)
 from openzaak.components.documenten.tasks import import_documents
 from openzaak.components.documenten.tests.factories import (
     EnkelvoudigInformatieObjectFactory,
@@ -146,6 +150,78 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
         for eio in eios:
             self.assertEqual(eio.canonical.latest_version, eio)
 
+    @override_settings(IMPORT_DOCUMENTEN_CHUNK_SIZE=2)
+    @patch("openzaak.components.documenten.tasks.chord")
+    def test_import_in_chunks(self, mocked_chord):
+        ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
+        ZaakFactory(uuid="b02ee3eb-8e94-4cd9-93e7-f8d1b16a1952")
+
+        import_file_path = self.test_data_path / "import.csv"
+
+        with open(import_file_path) as import_file:
+            import_instance = self.create_import(
+                import_type=ImportTypeChoices.documents,
+                status=ImportStatusChoices.pending,
+                import_file__data=import_file.read(),
+                total=0,
+                report_file=None,
+            )
+
+        import_documents(import_instance.pk, self.request_headers)
+
+        chunk_tasks = mocked_chord.call_args.args[0]
+        callback = mocked_chord.return_value.call_args.args[0]
+
+        self.assertEqual(len(chunk_tasks), 2)
+
+        import_instance.refresh_from_db()
+
+        self.assertEqual(import_instance.total, 4)
+        self.assertEqual(import_instance.status, ImportStatusChoices.active)
+
+        # the chunks can be finished by the workers in any order
+        results = [task() for task in reversed(chunk_tasks)]
+        callback(results)
+
+        import_instance.refresh_from_db()
+
+        eios = EnkelvoudigInformatieObject.objects.all()
+
+        self.assertEqual(eios.count(), 4)
+
+        identifiers = eios.values_list("identificatie", flat=True)
+
+        self.assertTrue(len(identifiers) == len(set(identifiers)))
+
+        self.assertEqual(import_instance.processed, 4)
+        self.assertEqual(import_instance.processed_invalid, 0)
+        self.assertEqual(import_instance.processed_successfully, 4)
+        self.assertEqual(import_instance.status, ImportStatusChoices.finished)
+
+        report_path = Path(import_instance.report_file.path)
+
+        with private_media_storage.open(str(report_path), "r") as report_file:
+            csv_reader = csv.reader(report_file, delimiter=",", quotechar='"')
+            rows = [row for row in csv_reader]
+
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(DocumentRow.export_headers, rows[0])
+
+        # the report follows the order of the import file
+        titel_index = DocumentRow.export_headers.index("titel")
+        with open(import_file_path) as import_file:
+            expected_titels = [row[titel_index] for row in csv.reader(import_file)]
+
+        self.assertEqual([row[titel_index] for row in rows], expected_titels)
+        self.assertTrue(
+            all((row[-1] == ImportRowResultChoices.imported.label) for row in rows[1:])
+        )
+
+        for result in results:
+            for file_path in result["files"]:
+                with self.subTest(file_path=file_path):
+                    self.assertFalse(private_media_storage.exists(file_path))
+
     @override_settings(DOCUMENTEN_API_BACKEND="test")
     def test_simple_import_not_implemented_documenten_api_backend(self):
         ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
@@ -207,6 +283,39 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
         # no comments on all the rows
         self.assertTrue(all((row[-2] == "") for row in rows[1:]))
 
+    @override_settings(IMPORT_DOCUMENTEN_BATCH_SIZE=2)
+    def test_reserved_identificaties_are_skipped(self):
+        ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
+        ZaakFactory(uuid="b02ee3eb-8e94-4cd9-93e7-f8d1b16a1952")
+        # reserved through the API
+        reserved = ReservedDocument.objects.create(
+            bronorganisatie="352604918",
+            identificatie=f"DOCUMENT-{timezone.now().year}-0000000001",
+        )
+
+        import_file_path = self.test_data_path / "import.csv"
+
+        with open(import_file_path) as import_file:
+            import_instance = self.create_import(
+                import_type=ImportTypeChoices.documents,
+                status=ImportStatusChoices.pending,
+                import_file__data=import_file.read(),
+                total=0,
+                report_file=None,
+            )
+
+        import_documents(import_instance.pk, self.request_headers)
+
+        identifiers = EnkelvoudigInformatieObject.objects.values_list(
+            "identificatie", flat=True
+        )
+
+        self.assertEqual(len(identifiers), 4)
+        self.assertEqual(len(identifiers), len(set(identifiers)))
+        self.assertNotIn(reserved.identificatie, identifiers)
+        # only the reservation made through the API remains
+        self.assertEqual(list(ReservedDocument.objects.all()), [reserved])
+
     @override_settings(IMPORT_DOCUMENTEN_BATCH_SIZE=4)
     def test_generate_unique_identificatie(self):
         ZaakFactory(uuid="43f1d8f4-c689-46eb-ae6e-c64d892d5341")
@@ -421,6 +530,7 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
         self.assertEqual(import_instance.processed_invalid, 2)
         self.assertEqual(import_instance.processed_successfully, 2)
         self.assertEqual(import_instance.status, ImportStatusChoices.error)
+        self.assertFalse(ReservedDocument.objects.exists())
 
         report_path = Path(import_instance.report_file.path)
 
@@ -691,6 +801,7 @@ class ImportDocumentTestCase(ImportTestMixin, MockSchemasMixin, TestCase):
         self.assertEqual(import_instance.processed_invalid, 2)
         self.assertEqual(import_instance.processed_successfully, 0)
         self.assertEqual(import_instance.status, ImportStatusChoices.error)
+        self.assertFalse(ReservedDocument.objects.exists())
 
         report_path = Path(import_instance.report_file.path)
 
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import csv
+import tempfile
+from datetime import date
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ...models import EnkelvoudigInformatieObject
+from ...storage import documenten_storage
+from ..factories import EnkelvoudigInformatieObjectFactory
+
+
+class DetectDuplicateEIOTests(TestCase):
+    def _create_duplicates(self):
+        original = EnkelvoudigInformatieObjectFactory.create(
+            bronorganisatie="517439943",
+            identificatie="document-1",
+            creatiedatum=date(2024, 1, 1),
+        )
+        duplicates = [
+            EnkelvoudigInformatieObjectFactory.create(
+                bronorganisatie="517439943",
+                identificatie="document-1",
+                creatiedatum=date(2024, 1, day),
+            )
+            for day in (3, 2)
+        ]
+        return original, duplicates
+
+    def test_no_duplicates(self):
+        EnkelvoudigInformatieObjectFactory.create_batch(2)
+        out = StringIO()
+
+        call_command("detect_duplicate_eio", interactive=False, stdout=out)
+
+        self.assertIn("Found no duplicate records.", out.getvalue())
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 2)
+
+    def test_delete_duplicates_in_batches(self):
+        original, duplicates = self._create_duplicates()
+        other_versie = EnkelvoudigInformatieObjectFactory.create(
+            canonical=original.canonical,
+            bronorganisatie="517439943",
+            identificatie="document-1",
+            versie=2,
+        )
+        names = [duplicate.inhoud.name for duplicate in duplicates]
+        out = StringIO()
+
+        call_command(
+            "detect_duplicate_eio",
+            interactive=False,
+            batch_size=1,
+            workers=2,
+            stdout=out,
+        )
+
+        self.assertEqual(
+            set(EnkelvoudigInformatieObject.objects.values_list("pk", flat=True)),
+            {original.pk, other_versie.pk},
+        )
+        for name in names:
+            self.assertFalse(documenten_storage.exists(name))
+        self.assertTrue(documenten_storage.exists(original.inhoud.name))
+        self.assertIn(
+            f"Deleted 1 duplicate document(s), last primary key: {duplicates[0].pk}",
+            out.getvalue(),
+        )
+        self.assertIn("Deleted 2 duplicate document(s).", out.getvalue())
+
+    def test_shared_file_is_not_deleted(self):
+        original, (duplicate, _) = self._create_duplicates()
+        EnkelvoudigInformatieObject.objects.filter(pk=duplicate.pk).update(
+            inhoud=original.inhoud.name
+        )
+
+        call_command("detect_duplicate_eio", interactive=False, stdout=StringIO())
+
+        self.assertTrue(documenten_storage.exists(original.inhoud.name))
+
+    def test_dry_run_report(self):
+        original, duplicates = self._create_duplicates()
+        out = StringIO()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "duplicates.csv"
+            call_command(
+                "detect_duplicate_eio", dry_run=True, report=str(path), stdout=out
+            )
+
+            with path.open(newline="") as report:
+                rows = list(csv.DictReader(report))
+
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 3)
+        self.assertEqual(
+            [row["uuid"] for row in rows],
+            [str(duplicate.uuid) for duplicate in duplicates],
+        )
+        self.assertEqual(rows[0]["kept_uuid"], str(original.uuid))
+        self.assertEqual(rows[0]["versie"], "1")
+        self.assertEqual(rows[0]["creatiedatum"], "2024-01-03")
+        self.assertIn("Written 2 duplicate records", out.getvalue())
+
+    @patch("builtins.input", side_effect=["1", "3"])
+    def test_interactive_show_and_quit(self, mock_input):
+        _, duplicates = self._create_duplicates()
+        out = StringIO()
+
+        call_command("detect_duplicate_eio", stdout=out)
+
+        self.assertIn(f"UUID: {duplicates[0].uuid}", out.getvalue())
+        self.assertIn("Found 2 duplicate records.", out.getvalue())
+        self.assertIn("Exiting.", out.getvalue())
+        self.assertEqual(EnkelvoudigInformatieObject.objects.count(), 3)
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings, tag
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from openzaak.tests.utils import JWTAuthMixin
+
+from ...constants import DocumentenDownloadModes
+from ...download import RangeNotSatisfiable, get_offload_path, parse_range_header
+from ...storage import S3Storage
+from ..factories import EnkelvoudigInformatieObjectFactory
+from ..utils import get_operation_url
+from .mixins import S3torageMixin
+
+PRESIGNED_URL = (
+    "https://openzaak.s3.example.com/documenten/file.bin?X-Amz-Signature=abc"
+)
+
+
+class ParseRangeHeaderTests(SimpleTestCase):
+    def test_valid_ranges(self):
+        cases = (
+            ("bytes=0-3", (0, 3)),
+            ("bytes=2-", (2, 8)),
+            ("bytes=-4", (5, 8)),
+            ("bytes=-20", (0, 8)),
+            ("bytes=3-100", (3, 8)),
+        )
+        for header, expected in cases:
+            with self.subTest(header=header):
+                self.assertEqual(parse_range_header(header, 9), expected)
+
+    def test_ignored_ranges(self):
+        for header in ("bytes=", "bytes=0-1,4-5", "items=0-1", "bytes=5-2"):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range_header(header, 9))
+
+    def test_unsatisfiable_ranges(self):
+        for header in ("bytes=9-", "bytes=-0"):
+            with self.subTest(header=header):
+                with self.assertRaises(RangeNotSatisfiable):
+                    parse_range_header(header, 9)
+
+    @override_settings(DOCUMENTEN_API_DOWNLOAD_OFFLOAD_LOCATION="/_download/")
+    def test_offload_path(self):
+        self.assertEqual(
+            get_offload_path(PRESIGNED_URL),
+            "/_download/https/openzaak.s3.example.com/documenten/file.bin"
+            "?X-Amz-Signature=abc",
+        )
+
+
+@tag("s3-storage")
+@temp_private_root()
+class S3DownloadTests(S3torageMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        # created with the filesystem backend, the storage calls are mocked
+        cls.eio = EnkelvoudigInformatieObjectFactory.create(inhoud__filename="file.bin")
+        cls.url = get_operation_url(
+            "enkelvoudiginformatieobject_download", uuid=cls.eio.uuid
+        )
+
+    @patch.object(S3Storage, "stream", return_value=(iter([b"some ", b"data"]), 9))
+    def test_proxy(self, mock_stream):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.getvalue(), b"some data")
+        self.assertEqual(response["Content-Length"], "9")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="file.bin"'
+        )
+        mock_stream.assert_called_once_with(self.eio.inhoud.name)
+
+    @patch.object(S3Storage, "size", return_value=9)
+    @patch.object(S3Storage, "stream", return_value=(iter([b"me d"]), 4))
+    def test_proxy_range(self, mock_stream, mock_size):
+        response = self.client.get(self.url, headers={"Range": "bytes=2-5"})
+
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(response.getvalue(), b"me d")
+        self.assertEqual(response["Content-Range"], "bytes 2-5/9")
+        self.assertEqual(response["Content-Length"], "4")
+        mock_stream.assert_called_once_with(self.eio.inhoud.name, start=2, end=5)
+
+    @patch.object(S3Storage, "size", return_value=9)
+    @patch.object(S3Storage, "stream")
+    def test_proxy_range_not_satisfiable(self, mock_stream, mock_size):
+        response = self.client.get(self.url, headers={"Range": "bytes=20-"})
+
+        self.assertEqual(
+            response.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        )
+        self.assertEqual(response["Content-Range"], "bytes */9")
+        mock_stream.assert_not_called()
+
+    @patch.object(S3Storage, "stream", return_value=(iter([b"some data"]), 9))
+    def test_proxy_conditional_range_serves_complete_file(self, mock_stream):
+        response = self.client.get(
+            self.url, headers={"Range": "bytes=2-5", "If-Range": '"abc"'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_stream.assert_called_once_with(self.eio.inhoud.name)
+
+    @override_settings(DOCUMENTEN_API_DOWNLOAD_MODE=DocumentenDownloadModes.redirect)
+    @patch.object(S3Storage, "download_url", return_value=PRESIGNED_URL)
+    def test_redirect(self, mock_download_url):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertEqual(response["Location"], PRESIGNED_URL)
+        mock_download_url.assert_called_once_with(self.eio.inhoud.name, "file.bin")
+
+    @override_settings(
+        DOCUMENTEN_API_DOWNLOAD_MODE=DocumentenDownloadModes.offload,
+        DOCUMENTEN_API_DOWNLOAD_OFFLOAD_LOCATION="/_download/",
+    )
+    @patch.object(S3Storage, "download_url", return_value=PRESIGNED_URL)
+    def test_offload(self, mock_download_url):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["X-Accel-Redirect"],
+            "/_download/https/openzaak.s3.example.com/documenten/file.bin"
+            "?X-Amz-Signature=abc",
+        )
+        self.assertEqual(response.content, b"")
@@ -2,6 +2,9 @@
 # Copyright (C) 2025 Dimpact
 from django.test import TestCase
 
+from django_loose_fk.utils import get_resource_for_path
+from vng_api_common.tests import reverse
+
 from openzaak.components.documenten.tests.factories import (
     EnkelvoudigInformatieObjectCanonicalFactory,
     EnkelvoudigInformatieObjectFactory,
@@ -62,3 +65,12 @@ class TestEnkelvoudigInformatieLatestVersion(TestCase):
         self.assertEqual(canonical.latest_version, eio2)
 
     # def test_bulk_create(self): TODO
+
+    def test_resolve_url_to_latest_version(self):
+        # the viewset is used to resolve the URL, without a request
+        eio1 = EnkelvoudigInformatieObjectFactory.create(versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio1.canonical, uuid=eio1.uuid, versie=2
+        )
+
+        self.assertEqual(get_resource_for_path(reverse(eio1)), eio2)
@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import csv
+import io
+import json
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import tag
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse, reverse_lazy
+
+from openzaak.components.catalogi.tests.factories import InformatieObjectTypeFactory
+from openzaak.export_data.models import Export, ExportTypeChoices
+from openzaak.export_data.tasks import export_data
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..api.scopes import SCOPE_DOCUMENTEN_ALLES_LEZEN
+from .factories import (
+    EnkelvoudigInformatieObjectCanonicalFactory,
+    EnkelvoudigInformatieObjectFactory,
+)
+
+
+@tag("export")
+@temp_private_root()
+class EIOExportTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse_lazy("enkelvoudiginformatieobject--export")
+
+    def test_export_ndjson(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create(
+            latest_version=None
+        )
+        EnkelvoudigInformatieObjectFactory.create(canonical=canonical, versie=1)
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            canonical=canonical, versie=2, identificatie="DOC-1"
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="documenten.ndjson"'
+        )
+
+        lines = response.getvalue().decode(settings.DEFAULT_CHARSET).splitlines()
+
+        # only the latest version is exported
+        self.assertEqual(len(lines), 1)
+
+        record = json.loads(lines[0])
+
+        self.assertEqual(record["url"], f"http://testserver{reverse(eio)}")
+        self.assertEqual(record["uuid"], str(eio.uuid))
+        self.assertEqual(record["identificatie"], "DOC-1")
+        self.assertEqual(record["versie"], 2)
+        self.assertEqual(record["creatiedatum"], eio.creatiedatum.isoformat())
+        self.assertEqual(
+            record["informatieobjecttype"],
+            f"http://testserver{reverse(eio.informatieobjecttype)}",
+        )
+
+    def test_export_csv(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            identificatie="DOC-1", indicatie_gebruiksrecht=False
+        )
+
+        response = self.client.get(self.url, HTTP_ACCEPT="text/csv")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+
+        content = response.getvalue().decode(settings.DEFAULT_CHARSET)
+        rows = list(csv.DictReader(io.StringIO(content)))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["url"], f"http://testserver{reverse(eio)}")
+        self.assertEqual(rows[0]["versie"], "1")
+        # same representation as in the NDJSON export
+        self.assertEqual(rows[0]["indicatieGebruiksrecht"], "false")
+
+    def test_export_filters(self):
+        EnkelvoudigInformatieObjectFactory.create(identificatie="DOC-1")
+        EnkelvoudigInformatieObjectFactory.create(identificatie="DOC-2")
+
+        response = self.client.get(self.url, {"identificatie": "DOC-2"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        lines = response.getvalue().decode(settings.DEFAULT_CHARSET).splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["identificatie"], "DOC-2")
+
+    @patch("openzaak.export_data.views.export_data")
+    def test_export_async(self, export_data_mock):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        response = self.client.post(self.url, {"formaat": "ndjson"})
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        export = Export.objects.get()
+
+        self.assertEqual(export.export_type, ExportTypeChoices.documenten)
+
+        export_data(export.pk)
+
+        response = self.client.get(response.json()["downloadUrl"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        lines = response.getvalue().decode(settings.DEFAULT_CHARSET).splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["uuid"], str(eio.uuid))
+
+
+@tag("export")
+@temp_private_root()
+class EIOExportAuthTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_DOCUMENTEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.drc
+    url = reverse_lazy("enkelvoudiginformatieobject--export")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.informatieobjecttype = InformatieObjectTypeFactory.create()
+        super().setUpTestData()
+
+    def test_export_only_authorized_documenten(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=self.informatieobjecttype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        lines = response.getvalue().decode(settings.DEFAULT_CHARSET).splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["uuid"], str(eio.uuid))
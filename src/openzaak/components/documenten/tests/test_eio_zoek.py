@@ -2,7 +2,9 @@
 # Copyright (C) 2023 Dimpact
 import unittest
 
+from django.db import connection
 from django.test import tag
+from django.test.utils import CaptureQueriesContext
 
 from privates.test import temp_private_root
 from rest_framework import status
@@ -11,7 +13,8 @@ from vng_api_common.tests import get_validation_errors, reverse, reverse_lazy
 
 from openzaak.tests.utils import JWTAuthMixin
 
-from .factories import EnkelvoudigInformatieObjectFactory
+from ...zaken.tests.factories import ZaakFactory
+from .factories import BestandsDeelFactory, EnkelvoudigInformatieObjectFactory
 
 
 @temp_private_root()
@@ -34,6 +37,82 @@ class EIOZoekTests(JWTAuthMixin, APITestCase):
         self.assertEqual(data[0]["url"], f"http://testserver{reverse(eio1)}")
         self.assertEqual(data[1]["url"], f"http://testserver{reverse(eio2)}")
 
+    def test_zoek_url_in(self):
+        eio1, eio2, eio3 = EnkelvoudigInformatieObjectFactory.create_batch(3)
+        data = {
+            "url__in": [
+                f"http://testserver{reverse(eio1)}",
+                f"http://testserver{reverse(eio2)}",
+            ]
+        }
+
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()["results"]
+        data = sorted(data, key=lambda eio: eio["identificatie"])
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(eio1)}")
+        self.assertEqual(data[1]["url"], f"http://testserver{reverse(eio2)}")
+
+    def test_zoek_url_in_and_uuid_in(self):
+        eio1, eio2, eio3 = EnkelvoudigInformatieObjectFactory.create_batch(3)
+        data = {
+            "uuid__in": [eio1.uuid, eio2.uuid],
+            "url__in": [
+                f"http://testserver{reverse(eio2)}",
+                f"http://testserver{reverse(eio3)}",
+            ],
+        }
+
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()["results"]
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(eio2)}")
+
+    def test_zoek_url_in_other_resource(self):
+        zaak = ZaakFactory.create()
+        data = {"url__in": [f"http://testserver{reverse(zaak)}"]}
+
+        response = self.client.post(self.url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        error = get_validation_errors(response, "url__in.0")
+        self.assertEqual(error["code"], "invalid-resource")
+
+    def test_zoek_without_uuid_in_or_url_in(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        response = self.client.post(self.url, {"identificatie": eio.identificatie})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        error = get_validation_errors(response, "uuid__in")
+        self.assertEqual(error["code"], "required")
+
+    def test_zoek_number_of_queries_is_constant(self):
+        def get_queries(eios) -> int:
+            data = {"url__in": [f"http://testserver{reverse(eio)}" for eio in eios]}
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(self.url, data)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(response.json()["results"]), len(eios))
+            return len(context.captured_queries)
+
+        eios = EnkelvoudigInformatieObjectFactory.create_batch(10)
+        for eio in eios:
+            BestandsDeelFactory.create(informatieobject=eio.canonical)
+
+        self.assertEqual(get_queries(eios[:2]), get_queries(eios))
+
     @tag("gh-2406")
     @unittest.expectedFailure
     def test_zoek_with_experimental_params(self):
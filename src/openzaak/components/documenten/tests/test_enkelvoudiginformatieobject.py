@@ -4,7 +4,9 @@ import uuid
 from base64 import b64encode
 from datetime import date
 
+from django.db import connection
 from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 import requests_mock
@@ -932,6 +934,53 @@ class EnkelvoudigInformatieObjectVersionHistoryAPITests(JWTAuthMixin, APITestCas
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["beschrijving"], "beschrijving1")
 
+    def test_eio_detail_filter_by_registratie_op_between_versions(self):
+        with freeze_time("2019-01-01 12:00:00"):
+            eio = EnkelvoudigInformatieObjectFactory.create(
+                beschrijving="beschrijving1"
+            )
+
+        eio_url = reverse(
+            "enkelvoudiginformatieobject-detail", kwargs={"uuid": eio.uuid}
+        )
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+        for hour in (13, 14):
+            with freeze_time(f"2019-01-01 {hour}:00:00"):
+                self.client.patch(
+                    eio_url, {"beschrijving": f"beschrijving{hour}", "lock": lock}
+                )
+
+        response = self.client.get(eio_url, {"registratieOp": "2019-01-01T13:30:00"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["versie"], 2)
+        self.assertEqual(response.data["beschrijving"], "beschrijving13")
+
+        response = self.client.get(
+            eio_url, {"registratieOp": "2019-01-01T13:30:00", "versie": 1}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["beschrijving"], "beschrijving1")
+
+    def test_eio_detail_does_not_sort_versions(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(beschrijving="beschrijving1")
+        eio_url = reverse(
+            "enkelvoudiginformatieobject-detail", kwargs={"uuid": eio.uuid}
+        )
+        lock = self.client.post(f"{eio_url}/lock").data["lock"]
+        self.client.patch(eio_url, {"beschrijving": "beschrijving2", "lock": lock})
+
+        for params in ({}, {"versie": 1}):
+            with (
+                self.subTest(params=params),
+                CaptureQueriesContext(connection) as queries,
+            ):
+                response = self.client.get(eio_url, params)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertFalse(
+                    any("DISTINCT ON" in query["sql"] for query in queries)
+                )
+
     @freeze_time("2019-01-01 12:00:00")
     def test_eio_detail_filter_by_wrong_registratie_op_gives_404(self):
         eio = EnkelvoudigInformatieObjectFactory.create(beschrijving="beschrijving1")
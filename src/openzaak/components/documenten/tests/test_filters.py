@@ -156,6 +156,30 @@ class EnkelvoudigInformatieObjectFilterTests(JWTAuthMixin, APITestCase):
             self.assertEqual(data["results"][0]["titel"], "Lorem")
             self.assertEqual(data["results"][1]["titel"], "Lorem Ipsum")
 
+    def test_zoekterm(self):
+        EnkelvoudigInformatieObjectFactory.create(
+            titel="Vergunning", beschrijving="Aanvraag voor een dakkapel"
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            titel="Dakkapel", beschrijving="Tekeningen van de dakkapellen"
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            titel="Bezwaar", beschrijving="Bezwaar tegen de kapvergunning"
+        )
+
+        response = self.client.get(
+            reverse(EnkelvoudigInformatieObject), {"zoekterm": "dakkapel"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 2)
+        # the most relevant result first
+        self.assertEqual(
+            [result["titel"] for result in data["results"]],
+            ["Dakkapel", "Vergunning"],
+        )
+
     def test_vertrouwelijkheidaanduiding(self):
         choice_names = VertrouwelijkheidsAanduiding.names
         for choice in choice_names:
@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse_lazy
+
+from openzaak.tests.utils import JWTAuthMixin
+
+from .factories import EnkelvoudigInformatieObjectFactory
+
+
+@temp_private_root()
+class EnkelvoudigInformatieObjectCursorPaginationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    list_url = reverse_lazy("enkelvoudiginformatieobject-list")
+
+    def test_walk_pages(self):
+        eio1, eio2, eio3 = EnkelvoudigInformatieObjectFactory.create_batch(3)
+        # only the latest version of a document is listed
+        eio1_v2 = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio1.canonical, identificatie=eio1.identificatie, versie=2
+        )
+
+        response = self.client.get(self.list_url, {"cursor": "", "pageSize": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        page1 = response.json()
+        self.assertIsNone(page1["previous"])
+
+        response = self.client.get(page1["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        page2 = response.json()
+        self.assertIsNone(page2["next"])
+        self.assertIsNotNone(page2["previous"])
+        self.assertEqual(
+            [
+                (eio["identificatie"], eio["versie"])
+                for eio in page1["results"] + page2["results"]
+            ],
+            # the default ordering of the documents is on their canonical
+            [
+                (eio1_v2.identificatie, 2),
+                (eio2.identificatie, 1),
+                (eio3.identificatie, 1),
+            ],
+        )
+
+    def test_cursor_with_ordering(self):
+        EnkelvoudigInformatieObjectFactory.create(auteur="b")
+        EnkelvoudigInformatieObjectFactory.create(auteur="a")
+        EnkelvoudigInformatieObjectFactory.create(auteur="b")
+
+        response = self.client.get(
+            self.list_url, {"cursor": "", "pageSize": 2, "ordering": "auteur"}
+        )
+        page1 = response.json()
+        response = self.client.get(page1["next"])
+        page2 = response.json()
+
+        self.assertEqual(
+            [eio["auteur"] for eio in page1["results"] + page2["results"]],
+            ["a", "b", "b"],
+        )
+
+    def test_cursor_from_other_ordering_is_rejected(self):
+        EnkelvoudigInformatieObjectFactory.create_batch(2)
+        response = self.client.get(self.list_url, {"cursor": "", "pageSize": 1})
+        next_cursor = response.json()["next"].split("cursor=")[1].split("&")[0]
+
+        response = self.client.get(
+            self.list_url, {"cursor": next_cursor, "ordering": "auteur"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -4,8 +4,10 @@ import uuid
 from base64 import b64encode
 
 from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import override_settings
+from django.test import SimpleTestCase, override_settings
 
 from privates.test import temp_private_root
 from rest_framework import status
@@ -25,6 +27,7 @@ from ..api.scopes import (
     SCOPE_DOCUMENTEN_LOCK,
 )
 from ..models import EnkelvoudigInformatieObject
+from ..storage import MultipartUploadMixin, S3Storage, documenten_storage
 from .factories import EnkelvoudigInformatieObjectFactory
 from .utils import get_operation_url, split_file
 
@@ -1106,3 +1109,191 @@ class LargeFileAPITests(JWTAuthMixin, APITestCase):
         self.assertEqual(new_version.bestandsomvang, None)
         self.assertEqual(self.canonical.bestandsdelen.count(), 0)
         self.assertEqual(data["inhoud"], None)
+
+
+class MultipartFileSystemStorage(MultipartUploadMixin, FileSystemStorage):
+    """
+    Stand-in for the multipart upload of the S3 and Azure backends, which keeps
+    the uploaded parts as separate files.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.aborted = []
+
+    def start_multipart_upload(self, name: str) -> str:
+        return uuid.uuid4().hex
+
+    def upload_part(self, name, upload_id, part_number, content) -> str:
+        return self.save(f"multipart/{upload_id}/{part_number}", content)
+
+    def complete_multipart_upload(self, name, upload_id, parts) -> None:
+        content = b"".join(self.open(token).read() for _, token in parts)
+        self._save(name, ContentFile(content))
+
+    def abort_multipart_upload(self, name, upload_id) -> None:
+        self.aborted.append(upload_id)
+
+
+@temp_private_root()
+@override_settings(
+    DOCUMENTEN_UPLOAD_CHUNK_SIZE=10, DOCUMENTEN_NATIVE_MULTIPART_UPLOAD=True
+)
+class NativeMultipartUploadTests(JWTAuthMixin, APITestCase):
+    component = ComponentTypes.drc
+    scopes = [
+        SCOPE_DOCUMENTEN_LOCK,
+        SCOPE_DOCUMENTEN_AANMAKEN,
+        SCOPE_DOCUMENTEN_ALLES_LEZEN,
+        SCOPE_DOCUMENTEN_BIJWERKEN,
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.informatieobjecttype = InformatieObjectTypeFactory.create(concept=False)
+        cls.informatieobjecttype_url = (
+            f"http://testserver{reverse(cls.informatieobjecttype)}"
+        )
+
+        super().setUpTestData()
+
+    def setUp(self):
+        super().setUp()
+
+        self.storage = MultipartFileSystemStorage(location=settings.PRIVATE_MEDIA_ROOT)
+        documenten_storage._wrapped = self.storage
+
+        def reset_storage():
+            documenten_storage._wrapped = None
+            documenten_storage._setup()
+
+        self.addCleanup(reset_storage)
+
+    def _create_metadata(self):
+        self.file_content = SimpleUploadedFile("file.txt", b"filecontentstring")
+        response = self.client.post(
+            reverse(EnkelvoudigInformatieObject),
+            {
+                "bronorganisatie": "159351741",
+                "creatiedatum": "2018-06-27",
+                "titel": "detailed summary",
+                "auteur": "test_auteur",
+                "taal": "eng",
+                "bestandsnaam": "file.txt",
+                "bestandsomvang": self.file_content.size,
+                "informatieobjecttype": self.informatieobjecttype_url,
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        self.eio = EnkelvoudigInformatieObject.objects.get(
+            uuid=response.data["url"].split("/")[-1]
+        )
+        self.canonical = self.eio.canonical
+        self.bestandsdelen = self.canonical.bestandsdelen.order_by("volgnummer")
+
+    def test_create_eio_full_process(self):
+        self._create_metadata()
+
+        self.assertTrue(self.canonical.has_multipart_upload)
+
+        part_files = split_file(
+            self.file_content, settings.DOCUMENTEN_UPLOAD_CHUNK_SIZE
+        )
+        for part, part_file in zip(self.bestandsdelen, part_files):
+            response = self.client.put(
+                get_operation_url("bestandsdeel_update", uuid=part.uuid),
+                {"inhoud": part_file, "lock": self.canonical.lock},
+                format="multipart",
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+            self.assertTrue(response.json()["voltooid"])
+
+            part.refresh_from_db()
+
+            # the part is uploaded to the storage backend directly
+            self.assertEqual(part.inhoud, "")
+            self.assertNotEqual(part._upload_token, "")
+
+        upload_name = self.canonical._upload_name
+        response = self.client.post(
+            get_operation_url("enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid),
+            {"lock": self.canonical.lock},
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_204_NO_CONTENT, response.data
+        )
+
+        self.canonical.refresh_from_db()
+        self.eio.refresh_from_db()
+        self.assertFalse(self.canonical.has_multipart_upload)
+        self.assertEqual(self.canonical.bestandsdelen.count(), 0)
+        self.assertEqual(self.eio.inhoud.name, upload_name)
+        self.assertEqual(self.eio.inhoud.read(), b"filecontentstring")
+        self.assertEqual(self.storage.aborted, [])
+
+    def test_unlock_incomplete_upload(self):
+        self._create_metadata()
+        upload_id = self.canonical._upload_id
+
+        response = self.client.post(
+            get_operation_url("enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid),
+            {"lock": self.canonical.lock},
+        )
+
+        self.assertEqual(
+            response.status_code, status.HTTP_400_BAD_REQUEST, response.data
+        )
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "incomplete-upload")
+        self.assertEqual(self.storage.aborted, [])
+
+        self.canonical.refresh_from_db()
+        self.assertEqual(self.canonical._upload_id, upload_id)
+
+    def test_update_size_aborts_upload(self):
+        self._create_metadata()
+        upload_id = self.canonical._upload_id
+
+        response = self.client.patch(
+            get_operation_url("enkelvoudiginformatieobject_read", uuid=self.eio.uuid),
+            {"bestandsomvang": 45, "lock": self.canonical.lock},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        self.canonical.refresh_from_db()
+        self.assertEqual(self.storage.aborted, [upload_id])
+        self.assertTrue(self.canonical.has_multipart_upload)
+        self.assertNotEqual(self.canonical._upload_id, upload_id)
+        self.assertEqual(self.canonical.bestandsdelen.count(), 5)
+
+    @override_settings(DOCUMENTEN_NATIVE_MULTIPART_UPLOAD=False)
+    def test_disabled(self):
+        self._create_metadata()
+
+        self.assertFalse(self.canonical.has_multipart_upload)
+        self.assertEqual(self.bestandsdelen.count(), 2)
+
+
+class MultipartUploadSupportTests(SimpleTestCase):
+    def test_s3_minimum_part_size(self):
+        storage = S3Storage()
+
+        with self.subTest("parts too small"):
+            self.assertFalse(storage.supports_multipart_upload(20 * 2**20, 2**20))
+
+        with self.subTest("single part"):
+            self.assertTrue(storage.supports_multipart_upload(2**20, 2**20))
+
+        with self.subTest("minimum part size"):
+            self.assertTrue(storage.supports_multipart_upload(20 * 2**20, 5 * 2**20))
+
+    def test_s3_maximum_parts(self):
+        self.assertFalse(
+            S3Storage().supports_multipart_upload(10_001 * 5 * 2**20, 5 * 2**20)
+        )
@@ -863,7 +863,7 @@ class ZaakAdmin(
 
     @admin.display(description="Status")
     def get_status(self, obj) -> str:
-        status = obj.current_status
+        status = obj.huidige_status
 
         if not status or not status._statustype:
             return ""
@@ -892,15 +892,6 @@ class ZaakAdmin(
         """
         queryset = super().get_queryset(request)
 
-        status_prefetch = Prefetch(
-            "status_set",
-            queryset=(
-                Status.objects.select_related("_statustype")
-                .filter(_statustype__isnull=False)
-                .order_by("-datum_status_gezet")
-            ),
-        )
-
         resultaat_prefetch = Prefetch(
             "resultaat",
             queryset=(
@@ -911,8 +902,8 @@ class ZaakAdmin(
         )
 
         return (
-            queryset.select_related("_zaaktype")
-            .prefetch_related(resultaat_prefetch, status_prefetch)
+            queryset.select_related("_zaaktype", "huidige_status___statustype")
+            .prefetch_related(resultaat_prefetch)
             .annotate(
                 zaaktype_url=Concat(
                     F("_zaaktype_base_url__api_root"),
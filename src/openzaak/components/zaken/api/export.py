@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from openzaak.export_data.exporters import Exporter
+
+from ..models import Zaak
+from .filters import ZaakFilter
+
+
+class ZaakExporter(Exporter):
+    model = Zaak
+    filterset_class = ZaakFilter
+
+    def get_base_queryset(self):
+        # same as the queryset of the zaken endpoint, filters on relations could
+        # otherwise return a zaak more than once
+        return super().get_base_queryset().distinct()
+
+    def get_columns(self):
+        return {
+            "url": self.get_url_expression("zaak-detail"),
+            "uuid": "uuid",
+            "identificatie": "identificatie",
+            "bronorganisatie": "bronorganisatie",
+            "omschrijving": "omschrijving",
+            "zaaktype": self.get_fk_or_url_expression("zaaktype-detail", "zaaktype"),
+            "registratiedatum": "registratiedatum",
+            "verantwoordelijkeOrganisatie": "verantwoordelijke_organisatie",
+            "startdatum": "startdatum",
+            "einddatum": "einddatum",
+            "einddatumGepland": "einddatum_gepland",
+            "uiterlijkeEinddatumAfdoening": "uiterlijke_einddatum_afdoening",
+            "publicatiedatum": "publicatiedatum",
+            "vertrouwelijkheidaanduiding": "vertrouwelijkheidaanduiding",
+            "betalingsindicatie": "betalingsindicatie",
+            "hoofdzaak": self.get_url_expression("zaak-detail", "hoofdzaak__uuid"),
+            "status": self.get_url_expression("status-detail", "huidige_status__uuid"),
+            "archiefnominatie": "archiefnominatie",
+            "archiefstatus": "archiefstatus",
+            "archiefactiedatum": "archiefactiedatum",
+        }
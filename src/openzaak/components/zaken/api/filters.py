@@ -5,7 +5,6 @@ from urllib.parse import urlparse
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.validators import URLValidator
 from django.db import models
-from django.db.models import OuterRef, Subquery
 from django.urls.exceptions import Resolver404
 from django.utils.translation import gettext_lazy as _
 
@@ -18,6 +17,7 @@ from vng_api_common.utils import get_field_attribute, get_help_text
 from openzaak.components.zaken.api.serializers.zaken import ZaakSerializer
 from openzaak.utils.filters import (
     ExpandFilter,
+    FullTextSearchFilter,
     KeyValueFilter,
     MaximaleVertrouwelijkheidaanduidingFilter,
 )
@@ -145,6 +145,14 @@ class ZaakFilter(FilterSetWithGroups):
         ),
         lookup_expr="icontains",
     )
+    zoekterm = FullTextSearchFilter(
+        search_fields=("omschrijving",),
+        help_text=mark_experimental(
+            "Zoekterm(en) waarop de omschrijving van de ZAAK doorzocht wordt. De "
+            "resultaten worden gesorteerd op relevantie, tenzij `ordering` opgegeven "
+            "is."
+        ),
+    )
     zaaktype__omschrijving = filters.CharFilter(
         field_name="_zaaktype__zaaktype_omschrijving",
         help_text=mark_experimental(
@@ -335,17 +343,7 @@ class ZaakFilter(FilterSetWithGroups):
         except (ObjectDoesNotExist, Resolver404):
             return queryset.none()
 
-        statustype_id = resource.id
-
-        latest_status_subquery = (
-            Status.objects.filter(zaak=OuterRef("pk"))
-            .order_by("-datum_status_gezet", "-pk")
-            .values("_statustype_id")[:1]
-        )
-
-        return queryset.annotate(
-            latest_statustype_id=Subquery(latest_status_subquery)
-        ).filter(latest_statustype_id=statustype_id)
+        return queryset.filter(huidige_status___statustype=resource)
 
     def filter_resultaattype_url(self, queryset, name, value):
         parsed = urlparse(value)
@@ -474,14 +472,10 @@ class StatusFilter(FilterSet):
 
     def filter_is_last_status(self, queryset, name, value):
         if value is True:
-            return queryset.filter(
-                datum_status_gezet=models.F("max_datum_status_gezet")
-            )
+            return queryset.filter(zaak__huidige_status=models.F("pk"))
 
         if value is False:
-            return queryset.exclude(
-                datum_status_gezet=models.F("max_datum_status_gezet")
-            )
+            return queryset.exclude(zaak__huidige_status=models.F("pk"))
 
         return queryset.none()
 
@@ -55,5 +55,6 @@ custom_settings = {
         {"name": "zaakverzoeken"},
         {"name": "zaaknotities"},
         {"name": "klantcontacten"},
+        {"name": "export"},
     ],
 }
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2022 Dimpact
+from collections import defaultdict
 from datetime import date
 from typing import Optional
 from uuid import UUID
@@ -7,6 +8,7 @@ from uuid import UUID
 from django.conf import settings
 from django.db import transaction
 from django.db.models import (
+    Case,
     CharField,
     DateField,
     DurationField,
@@ -15,11 +17,11 @@ from django.db.models import (
     OuterRef,
     Subquery,
     Value,
+    When,
 )
 from django.db.models.functions import Cast
 from django.utils.dateparse import parse_datetime
 from django.utils.encoding import force_str
-from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
 import structlog
@@ -57,6 +59,7 @@ from openzaak.components.documenten.api.fields import EnkelvoudigInformatieObjec
 from openzaak.components.zaken.archiving import calculate_archiving_data
 from openzaak.components.zaken.validators import CorrectZaaktypeValidator
 from openzaak.contrib.verzoeken.validators import verzoek_validator
+from openzaak.loaders import AuthorizedRequestsLoader
 from openzaak.utils.api import (
     create_remote_objectcontactmoment,
     create_remote_objectverzoek,
@@ -65,7 +68,7 @@ from openzaak.utils.api import (
 from openzaak.utils.auth import get_auth
 from openzaak.utils.exceptions import DetermineProcessEndDateException
 from openzaak.utils.help_text import mark_experimental
-from openzaak.utils.serializer_fields import FKOrServiceUrlField
+from openzaak.utils.serializer_fields import FKOrServiceUrlField, ResourceUUIDField
 from openzaak.utils.serializers import (
     ConvenienceSerializer,
     ReadOnlyMixin,
@@ -104,7 +107,10 @@ from ...models import (
     ZaakRelatie,
     ZaakVerzoek,
 )
-from ...models.identification_classes import get_base_identification_class
+from ...models.identification_classes import (
+    get_base_identification_class,
+    get_identification_generator_class,
+)
 from ..validators import (
     DateNotInFutureValidator,
     DeelzaakReopenValidator,
@@ -230,14 +236,7 @@ class GenerateZaakIdentificatieSerializer(serializers.ModelSerializer):
         fields = ("bronorganisatie", "startdatum")
 
     def create(self, validated_data):
-        identification_class = import_string(
-            settings.ZAAK_IDENTIFICATIE_GENERATOR_OPTIONS.get(
-                settings.ZAAK_IDENTIFICATIE_GENERATOR,
-                settings.ZAAK_IDENTIFICATIE_GENERATOR_OPTIONS.get(
-                    "use-start-datum-year"
-                ),
-            )
-        )
+        identification_class = get_identification_generator_class()
         return identification_class(**validated_data).generate()
 
     def update(self, instance, data):  # pragma:nocover
@@ -323,7 +322,8 @@ class ZaakSerializer(
         help_text=_("URL-referenties naar ROLLen."),
     )
     status = CachedHyperlinkedRelatedField(
-        source="current_status",
+        # ⚡️ the materialized current status can be prefetched for expansions
+        source="huidige_status",
         read_only=True,
         allow_null=True,
         view_name="status-detail",
@@ -653,26 +653,20 @@ class ZaakSerializer(
 
         return attrs
 
-    def create(self, validated_data: dict):
+    @staticmethod
+    def set_derived_values(validated_data: dict) -> None:
+        """
+        Set the values derived from the ZAAKTYPE that are not provided.
+        """
+        zaaktype = validated_data["zaaktype"]
+        startdatum = validated_data["startdatum"]
+
         # set the derived value from ZTC
         if "vertrouwelijkheidaanduiding" not in validated_data:
-            zaaktype = validated_data["zaaktype"]
             validated_data["vertrouwelijkheidaanduiding"] = (
                 zaaktype.vertrouwelijkheidaanduiding
             )
 
-        # set by the ZaakViewSet via create and get_serializer_context
-        if generated_identificatie := self.context["generated_identificatie"]:
-            validated_data.update(
-                {
-                    "identificatie_ptr": generated_identificatie,
-                    "identificatie": generated_identificatie.identificatie,
-                }
-            )
-
-        zaaktype = validated_data["zaaktype"]
-        startdatum = validated_data["startdatum"]
-
         if (
             not validated_data.get("einddatum_gepland")
             and zaaktype.servicenorm_behandeling
@@ -689,14 +683,24 @@ class ZaakSerializer(
                 startdatum + zaaktype.doorlooptijd_behandeling
             )
 
+    def create(self, validated_data: dict):
+        self.set_derived_values(validated_data)
+
+        # set by the ZaakViewSet via create and get_serializer_context
+        if generated_identificatie := self.context["generated_identificatie"]:
+            validated_data.update(
+                {
+                    "identificatie_ptr": generated_identificatie,
+                    "identificatie": generated_identificatie.identificatie,
+                }
+            )
+
         obj = super().create(validated_data)
         track_object_serializer(obj, self)
 
         # ⚡️ - a just created zaak cannot have a result, so we can avoid this DB query
         # by assigning the descriptor already
         obj.resultaat = None
-        # ⚡️ - avoid status query for just created zaak
-        obj.current_status_uuid = None
 
         # ⚡️ - on create, we _know_ that there are no existing relations yet (i.e.
         # objects that are related TO the zaak being created), so we can avoid doing
@@ -750,6 +754,148 @@ class ZaakVerlengingSubSerializer(SubSerializerMixin, ZaakVerlengingSerializer):
     pass
 
 
+class ZaakBulkCreateSerializer(serializers.Serializer):
+    zaken = ZaakSerializer(
+        many=True,
+        allow_empty=False,
+        help_text=_("De ZAAKen om aan te maken."),
+    )
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fields["zaken"].max_length = settings.ZAAK_BULK_CREATE_MAX_SIZE
+        return fields
+
+    def validate_zaken(self, zaken: list[dict]) -> list[dict]:
+        # the unique identificatie of every zaak is validated against the database,
+        # but the zaken in the request itself can also clash with each other
+        seen = set()
+        errors = [{} for _zaak in zaken]
+        for index, zaak in enumerate(zaken):
+            if not (identificatie := zaak.get("identificatie")):
+                continue
+
+            key = (zaak["bronorganisatie"], identificatie)
+            if key in seen:
+                errors[index] = {
+                    "identificatie": [
+                        ErrorDetail(
+                            _(
+                                "Deze identificatie ({identificatie}) komt meerdere "
+                                "keren voor voor deze bronorganisatie"
+                            ).format(identificatie=identificatie),
+                            code="identificatie-niet-uniek",
+                        )
+                    ]
+                }
+            seen.add(key)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return zaken
+
+    @transaction.atomic
+    def allocate_identificaties(self) -> None:
+        """
+        Link every zaak to its (reserved or generated) ``ZaakIdentificatie``.
+
+        Zaken with an identificatie use the reserved identificatie if it exists,
+        otherwise it is created. The other zaken get a generated identificatie,
+        which are generated in bulk per bronorganisatie and year so the lock for
+        the identificatie generation is only acquired a few times.
+        """
+        zaken = self.validated_data["zaken"]
+
+        provided = [zaak for zaak in zaken if zaak.get("identificatie")]
+        if provided:
+            reserved = {
+                (obj.bronorganisatie, obj.identificatie): obj
+                for obj in ZaakIdentificatie.objects.filter(
+                    identificatie__in={zaak["identificatie"] for zaak in provided}
+                )
+            }
+            missing = [
+                ZaakIdentificatie(
+                    identificatie=zaak["identificatie"],
+                    bronorganisatie=zaak["bronorganisatie"],
+                )
+                for zaak in provided
+                if (zaak["bronorganisatie"], zaak["identificatie"]) not in reserved
+            ]
+            for obj in ZaakIdentificatie.objects.bulk_create(missing):
+                reserved[(obj.bronorganisatie, obj.identificatie)] = obj
+
+            for zaak in provided:
+                key = (zaak["bronorganisatie"], zaak["identificatie"])
+                zaak["identificatie_ptr"] = reserved[key]
+
+        groups: dict[tuple[str, int], list[dict]] = {}
+        for zaak in zaken:
+            if zaak.get("identificatie"):
+                continue
+            key = (zaak["bronorganisatie"], zaak["startdatum"].year)
+            groups.setdefault(key, []).append(zaak)
+
+        identification_class = get_identification_generator_class()
+        for group in groups.values():
+            generator = identification_class(
+                bronorganisatie=group[0]["bronorganisatie"],
+                startdatum=group[0]["startdatum"],
+            )
+            generated = generator.generate_bulk(len(group))
+            for zaak, identificatie in zip(group, generated, strict=True):
+                zaak["identificatie_ptr"] = identificatie
+                zaak["identificatie"] = identificatie.identificatie
+
+    def create(self, validated_data: dict) -> list[Zaak]:
+        zaak_serializer = self.fields["zaken"].child
+
+        zaken, relations = [], []
+        for data in validated_data["zaken"]:
+            data = data.copy()
+            assert "identificatie_ptr" in data, "Call allocate_identificaties first"
+
+            # reverse relations can only be created once the zaak exists
+            relations.append(
+                (
+                    data.pop("zaakkenmerk_set", []),
+                    data.pop("relevante_andere_zaken", []),
+                    data.pop("gerelateerde_zaken", []),
+                )
+            )
+            gegevensgroepen = {
+                name: data.pop(name)
+                for name in list(data)
+                if zaak_serializer._is_gegevensgroep(name)
+            }
+            zaak_serializer.set_derived_values(data)
+
+            zaak = Zaak(**data)
+            for name, value in gegevensgroepen.items():
+                setattr(zaak, name, value)
+            zaak.normalize_fields()
+            zaken.append(zaak)
+
+        Zaak.objects.bulk_create(zaken)
+
+        kenmerken, relevante_zaken = [], []
+        for zaak, (_kenmerken, _relevante_zaken, gerelateerde_zaken) in zip(
+            zaken, relations, strict=True
+        ):
+            kenmerken += [ZaakKenmerk(zaak=zaak, **data) for data in _kenmerken]
+            relevante_zaken += [
+                RelevanteZaakRelatie(zaak=zaak, **data) for data in _relevante_zaken
+            ]
+            # the reverse relation of related local zaken is created by a signal
+            for data in gerelateerde_zaken:
+                GerelateerdeZaakSerializer().create({"zaak": zaak, **data})
+
+        ZaakKenmerk.objects.bulk_create(kenmerken)
+        RelevanteZaakRelatie.objects.bulk_create(relevante_zaken)
+
+        return zaken
+
+
 class GeoWithinSerializer(serializers.Serializer):
     within = GeometryField(required=False)
 
@@ -761,6 +907,11 @@ class ZaakZoekSerializer(serializers.Serializer):
         required=False,
         help_text=_("Array of unieke resource identifiers (UUID4)"),
     )
+    url__in = serializers.ListField(
+        child=ResourceUUIDField(view_name="zaak-detail"),
+        required=False,
+        help_text=mark_experimental("Array van URL-referenties naar ZAAKen."),
+    )
     zaaktype__in = serializers.ListField(
         child=FKOrServiceUrlField(),
         required=False,
@@ -1064,36 +1215,87 @@ class StatusSerializer(serializers.HyperlinkedModelSerializer):
             else None,
             archiefactiedatum=F("computed_archiefactiedatum") if brondatum else None,
             startdatum_bewaartermijn=brondatum,
+            # reset the ETag, like the post_save signal would
+            _etag="",
         )
 
     def _update_deelzaken_with_external_catalogi(
         self, hoofdzaak_closed: bool, qs, brondatum: date | None
     ):
-        for deelzaak in qs.iterator():
-            resultaattype = deelzaak.resultaat.resultaattype
+        resultaten = Resultaat.objects.filter(zaak__in=qs).select_related(
+            "_resultaattype_base_url"
+        )
 
-            if (
-                resultaattype.brondatum_archiefprocedure_afleidingswijze
-                == Afleidingswijze.hoofdzaak
-            ):
-                deelzaak.archiefactiedatum = (
-                    brondatum + resultaattype.archiefactietermijn
-                    if brondatum
-                    else brondatum
-                )
-                deelzaak.startdatum_bewaartermijn = brondatum
-                # If the hoofdzaak is closed with `blijvend_bewaren`, the brondatum will be
-                # empty, but the `archiefnominatie` still has to be set for deelzaken
-                deelzaak.archiefnominatie = (
-                    resultaattype.archiefnominatie if hoofdzaak_closed else None
-                )
-                deelzaak.save(
-                    update_fields=[
-                        "archiefnominatie",
-                        "archiefactiedatum",
-                        "startdatum_bewaartermijn",
-                    ]
-                )
+        # ⚡️ resolve every distinct resultaattype only once (concurrently), rather
+        # than once for every deelzaak
+        deelzaken_per_resultaattype = defaultdict(list)
+        resultaattypen = {}
+        for resultaat in resultaten:
+            url = resultaat._resultaattype_url
+            deelzaken_per_resultaattype[url].append(resultaat.zaak_id)
+            resultaattypen.setdefault(url, resultaat)
+
+        AuthorizedRequestsLoader().prefetch(resultaattypen)
+        resultaattypen = {
+            url: resultaat.resultaattype for url, resultaat in resultaattypen.items()
+        }
+
+        deelzaken_per_resultaattype = {
+            url: pks
+            for url, pks in deelzaken_per_resultaattype.items()
+            if resultaattypen[url].brondatum_archiefprocedure_afleidingswijze
+            == Afleidingswijze.hoofdzaak
+        }
+        if not deelzaken_per_resultaattype:
+            return
+
+        archiefnominatie = Case(
+            *(
+                When(pk__in=pks, then=Value(resultaattypen[url].archiefnominatie))
+                for url, pks in deelzaken_per_resultaattype.items()
+            ),
+            output_field=CharField(),
+        )
+        archiefactiedatum = (
+            Case(
+                *(
+                    When(
+                        pk__in=pks,
+                        then=Value(
+                            brondatum + resultaattypen[url].archiefactietermijn,
+                            DateField(),
+                        ),
+                    )
+                    for url, pks in deelzaken_per_resultaattype.items()
+                ),
+                output_field=DateField(),
+            )
+            if brondatum
+            else None
+        )
+
+        # set-based update, like for the deelzaken with internal catalogi
+        deelzaken = Zaak.objects.filter(
+            pk__in=[pk for pks in deelzaken_per_resultaattype.values() for pk in pks]
+        )
+        deelzaken.update(
+            # If the hoofdzaak is closed with `blijvend_bewaren`, the brondatum will be
+            # empty, but the `archiefnominatie` still has to be set for deelzaken
+            archiefnominatie=archiefnominatie if hoofdzaak_closed else None,
+            archiefactiedatum=archiefactiedatum,
+            startdatum_bewaartermijn=brondatum,
+            # reset the ETag, like the post_save signal would
+            _etag="",
+        )
+
+        # the update does not send the post_save signal, so the cloud events that
+        # were sent when the deelzaken were saved separately are scheduled here
+        if settings.ENABLE_CLOUD_EVENTS:
+            # imported here to avoid a circular import
+            from ...signals import schedule_zaak_gemuteerd
+
+            for deelzaak in deelzaken:
+                schedule_zaak_gemuteerd(deelzaak)
 
 
 class StatusSubSerializer(SubSerializerMixin, StatusSerializer):
@@ -1149,11 +1351,7 @@ class SubStatusSerializer(serializers.HyperlinkedModelSerializer):
         status = validated_data.get("status")
 
         if not status:
-            # FIXME for some reason, `zaak.status_set` is not ordered by
-            # `-datum_status_gezet` here
-            validated_data["status"] = zaak.status_set.order_by(
-                "-datum_status_gezet"
-            ).first()
+            validated_data["status"] = zaak.current_status
 
         obj = super().create(validated_data)
         return obj
@@ -27,6 +27,8 @@ from .viewsets import (
     ZaakBijwerkenViewset,
     ZaakContactMomentViewSet,
     ZaakEigenschapViewSet,
+    ZaakExportDownloadView,
+    ZaakExportStatusView,
     ZaakInformatieObjectViewSet,
     ZaakNotitieViewSet,
     ZaakObjectViewSet,
@@ -71,6 +73,18 @@ zaakafsluiten_view = ZaakAfsluitenViewSet.as_view({"post": "post"})
 zaakbijwerken_view = ZaakBijwerkenViewset.as_view({"post": "post"})
 zaakverlengen_view = ZaakVerlengenViewset.as_view({"post": "post"})
 
+export_patterns = [
+    path(
+        "<uuid:uuid>/status",
+        ZaakExportStatusView.as_view({"get": "retrieve"}, name="status"),
+        name="status",
+    ),
+    path(
+        "<uuid:uuid>/download",
+        ZaakExportDownloadView.as_view({"get": "retrieve"}, name="download"),
+        name="download",
+    ),
+]
 
 urlpatterns = [
     re_path(
@@ -115,6 +129,13 @@ urlpatterns = [
                 # actual API
                 path("", include(router.urls)),
                 path("", router.APIRootView.as_view(), name="api-root-zaken"),
+                path(
+                    "export/",
+                    include(
+                        (export_patterns, "openzaak.components.zaken"),
+                        namespace="zaken-export",
+                    ),
+                ),
                 path(
                     "zaak_opschorten/<uuid:uuid>",
                     zaakopschorten_view,
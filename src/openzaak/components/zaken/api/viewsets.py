@@ -5,7 +5,7 @@ from typing import Dict, List, Optional, Union
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models, transaction
-from django.db.models import Q
+from django.db.models import Q, prefetch_related_objects
 from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
 
@@ -22,10 +22,6 @@ from drf_spectacular.utils import (
 )
 from notifications_api_common.models import NotificationTypes
 from notifications_api_common.tasks import create_failed_notification, send_notification
-from notifications_api_common.viewsets import (
-    NotificationCreateMixin,
-    NotificationViewSetMixin,
-)
 from rest_framework import mixins, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
@@ -45,9 +41,10 @@ from vng_api_common.constants import CommonResourceAction
 from vng_api_common.filters_backend import Backend
 from vng_api_common.geo import GeoMixin
 from vng_api_common.notes.api.viewsets import NotitieViewSetMixin
+from vng_api_common.permissions import bypass_permissions, get_required_scopes
 from vng_api_common.search import SearchMixin
 from vng_api_common.utils import lookup_kwargs_to_filters
-from vng_api_common.viewsets import CheckQueryParamsMixin, NestedViewSetMixin
+from vng_api_common.viewsets import NestedViewSetMixin
 
 from openzaak.client import get_client
 from openzaak.components.zaken.metrics import (
@@ -55,7 +52,20 @@ from openzaak.components.zaken.metrics import (
     zaken_delete_counter,
     zaken_update_counter,
 )
-from openzaak.notifications.viewsets import MultipleNotificationMixin
+from openzaak.export_data.models import ExportTypeChoices
+from openzaak.export_data.serializers import ExportCreateSerializer, ExportSerializer
+from openzaak.export_data.views import (
+    ExportDownloadView,
+    ExportMixin,
+    ExportStatusView,
+)
+from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.notifications.viewsets import (
+    MultipleNotificationMixin,
+    NotificationCreateMixin,
+    NotificationViewSetMixin,
+    schedule_notifications,
+)
 from openzaak.utils import get_loose_fk_object_url
 from openzaak.utils.api import (
     delete_remote_objectcontactmoment,
@@ -67,16 +77,24 @@ from openzaak.utils.data_filtering import ListFilterByAuthorizationsMixin
 from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.mixins import (
     CacheQuerysetMixin,
+    CheckQueryParamsMixin,
     ExpandMixin,
+    SerializerMetricsMixin,
+    StreamingListMixin,
+)
+from openzaak.utils.pagination import (
+    CursorOnlyPagination,
+    CursorPagination,
+    ExactPagination,
 )
-from openzaak.utils.pagination import ExactPagination
 from openzaak.utils.permissions import AuthRequired
+from openzaak.utils.query import any_of
 from openzaak.utils.schema import (
     COMMON_ERROR_RESPONSES,
     PRECONDITION_ERROR_RESPONSES,
     VALIDATION_ERROR_RESPONSES,
 )
-from openzaak.utils.views import AuditTrailViewSet
+from openzaak.utils.views import AuditTrailViewSet, BulkAuditTrailMixin
 
 from ..models import (
     KlantContact,
@@ -145,6 +163,7 @@ from .serializers import (
     ZaakAfsluitenSerializer,
     ZaakBesluitSerializer,
     ZaakBijwerkenSerializer,
+    ZaakBulkCreateSerializer,
     ZaakContactMomentSerializer,
     ZaakEigenschapSerializer,
     ZaakInformatieObjectSerializer,
@@ -279,13 +298,17 @@ ZAAK_UUID_PARAMETER = OpenApiParameter(
 @conditional_retrieve(extra_depends_on={"status"})
 class ZaakViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     ExpandMixin,
     NotificationViewSetMixin,
+    BulkAuditTrailMixin,
     AuditTrailViewsetMixin,
     GeoMixin,
-    SearchMixin,
     CheckQueryParamsMixin,
     ListFilterByAuthorizationsMixin,
+    StreamingListMixin,
+    SearchMixin,
+    ExportMixin,
     viewsets.ModelViewSet,
 ):
     """
@@ -297,7 +320,10 @@ class ZaakViewSet(
     """
 
     queryset = (
-        Zaak.objects.prefetch_related(
+        # ⚡️ each zaak has at most one current status, so joining it does not
+        # duplicate any data
+        Zaak.objects.select_related("huidige_status")
+        .prefetch_related(
             # Prefetch _zaaktype instead of using `.select_related`, because using the latter
             # causes the main Zaak query to contain a lot of duplicate data, increasing overhead
             "_zaaktype",
@@ -313,14 +339,6 @@ class ZaakViewSet(
             "zaakkenmerk_set",
             "resultaat",
             "zaakeigenschap_set",
-            models.Prefetch(
-                "status_set",
-                queryset=Status.objects.order_by("-datum_status_gezet"),
-                # explicitly store result on this attribute, that way we can retrieve
-                # the first status by simple list indexing, which is faster than calling
-                # `.first()`, because the latter instantiates a new queryset
-                to_attr="prefetched_statuses",
-            ),
             "rol_set",
             "zaakinformatieobject_set",
             "zaakobject_set",
@@ -330,16 +348,20 @@ class ZaakViewSet(
     )
     serializer_class = ZaakSerializer
     search_input_serializer_class = ZaakZoekSerializer
+    export_type = ExportTypeChoices.zaken
     filter_backends = (Backend,)
     lookup_field = "uuid"
-    pagination_class = ExactPagination
+    pagination_class = CursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     required_scopes = {
         "list": SCOPE_ZAKEN_ALLES_LEZEN,
         "retrieve": SCOPE_ZAKEN_ALLES_LEZEN,
         "_zoek": SCOPE_ZAKEN_ALLES_LEZEN,
+        "_export": SCOPE_ZAKEN_ALLES_LEZEN,
+        "_export_async": SCOPE_ZAKEN_ALLES_LEZEN,
         "create": SCOPE_ZAKEN_CREATE,
+        "_bulk": SCOPE_ZAKEN_CREATE,
         "update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "partial_update": SCOPE_ZAKEN_BIJWERKEN | SCOPE_ZAKEN_GEFORCEERD_BIJWERKEN,
         "destroy": SCOPE_ZAKEN_ALLES_VERWIJDEREN,
@@ -405,6 +427,9 @@ class ZaakViewSet(
         for name, value in search_input.items():
             if name == "zaakgeometrie":
                 queryset = queryset.filter(zaakgeometrie__within=value["within"])
+            elif name in ("uuid__in", "url__in"):
+                # ⚡️ the UUIDs are sent as a single parameter, however many there are
+                queryset = queryset.filter(uuid=any_of(value, models.UUIDField()))
             else:
                 queryset = queryset.filter(**{name: value})
 
@@ -412,6 +437,59 @@ class ZaakViewSet(
 
     _zoek.is_search_action = True
 
+    @extend_schema(
+        "zaak__export",
+        summary="Exporteer alle ZAAKen.",
+        description=mark_experimental(
+            "Exporteer alle ZAAKen die voldoen aan de query-string parameters, "
+            "zonder paginering. Afhankelijk van de `Accept` header worden de ZAAKen "
+            "als NDJSON (één ZAAK per regel) of als CSV teruggegeven. Een export "
+            "bevat de attributen van de ZAAK zelf, zonder de gerelateerde "
+            "resources.\n"
+            "\n"
+            "**Opmerking**\n"
+            "- er worden enkel zaken geëxporteerd van de zaaktypes waar u toe "
+            "geautoriseerd bent."
+        ),
+        parameters=[OpenApiParameter("expand", exclude=True)],
+        responses={
+            (status.HTTP_200_OK, "application/x-ndjson"): OpenApiTypes.STR,
+            (status.HTTP_200_OK, "text/csv"): OpenApiTypes.STR,
+            **VALIDATION_ERROR_RESPONSES,
+            **COMMON_ERROR_RESPONSES,
+            **PRECONDITION_ERROR_RESPONSES,
+        },
+    )
+    @action(methods=("get",), detail=False, name="zaak__export")
+    def _export(self, request, *args, **kwargs):
+        return self.get_export_response(request)
+
+    @extend_schema(
+        "zaak__export_async",
+        summary="Start een export van alle ZAAKen op de achtergrond.",
+        description=mark_experimental(
+            "Start een export van alle ZAAKen die voldoen aan de query-string "
+            "parameters. De export wordt op de achtergrond aangemaakt, de status "
+            "ervan kan opgevraagd worden via de `statusUrl`. Zodra de export "
+            "voltooid is, kan het bestand gedownload worden via de `downloadUrl`.\n"
+            "\n"
+            "**Opmerking**\n"
+            "- er worden enkel zaken geëxporteerd van de zaaktypes waar u toe "
+            "geautoriseerd bent op het moment dat de export gestart wordt."
+        ),
+        parameters=[OpenApiParameter("expand", exclude=True)],
+        request=ExportCreateSerializer,
+        responses={
+            status.HTTP_202_ACCEPTED: ExportSerializer,
+            **VALIDATION_ERROR_RESPONSES,
+            **COMMON_ERROR_RESPONSES,
+            **PRECONDITION_ERROR_RESPONSES,
+        },
+    )
+    @_export.mapping.post
+    def _export_async(self, request, *args, **kwargs):
+        return self.create_export(request)
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         return {
@@ -451,6 +529,153 @@ class ZaakViewSet(
         serializer.is_valid(raise_exception=True)
         self._generated_identificatie = serializer.save()
 
+    @extend_schema(
+        "zaak__bulk",
+        summary="Maak meerdere ZAAKen in één keer aan.",
+        description=mark_experimental(
+            "Maak meerdere ZAAKen in één keer aan. Elke ZAAK wordt op dezelfde manier "
+            "gevalideerd als bij het aanmaken van een enkele ZAAK. Als één of meer "
+            "ZAAKen ongeldig zijn, wordt geen enkele ZAAK aangemaakt en worden de "
+            "fouten per ZAAK teruggegeven (bijvoorbeeld `zaken.1.zaaktype`).\n\n"
+            "De autorisaties moeten het aanmaken van elke ZAAK toestaan. Voor elke "
+            "aangemaakte ZAAK wordt een audittrail en een notificatie aangemaakt."
+        ),
+        request=ZaakBulkCreateSerializer,
+        responses={
+            status.HTTP_201_CREATED: ZaakSerializer(many=True),
+            **VALIDATION_ERROR_RESPONSES,
+            **COMMON_ERROR_RESPONSES,
+        },
+    )
+    @action(methods=("post",), detail=False, name="zaak__bulk")
+    def _bulk(self, request, *args, **kwargs):
+        serializer = ZaakBulkCreateSerializer(
+            data=request.data, context=self.get_serializer_context()
+        )
+
+        # ⚡️ fetch the distinct external zaaktypen concurrently instead of one by one
+        # during the validation of the zaken
+        if isinstance(request.data, dict) and isinstance(
+            items := request.data.get("zaken"), list
+        ):
+            AuthorizedRequestsLoader().prefetch(
+                item["zaaktype"]
+                for item in items
+                if isinstance(item, dict) and isinstance(item.get("zaaktype"), str)
+            )
+
+        serializer.is_valid(raise_exception=True)
+        self._check_bulk_create_permissions(request.data["zaken"])
+
+        # like single creates, the identificaties are generated in a separate
+        # transaction, to hold the lock on the identificatie generation briefly
+        serializer.allocate_identificaties()
+
+        with transaction.atomic():
+            zaken = serializer.save()
+            self._share_zaaktypen(zaken)
+
+            # ⚡️ the zaken are new, so the (mostly empty) relations can be fetched
+            # with one query per relation for all zaken
+            prefetch_related_objects(
+                zaken,
+                "zaakkenmerk_set",
+                "relevante_andere_zaken",
+                "gerelateerde_zaken",
+                "deelzaken",
+                "zaakeigenschap_set",
+                "rol_set",
+                "zaakinformatieobject_set",
+                "zaakobject_set",
+                "resultaat",
+            )
+            data = ZaakSerializer(
+                zaken, many=True, context=self.get_serializer_context()
+            ).data
+
+            self.create_bulk_audittrails(status.HTTP_201_CREATED, zip(zaken, data))
+            self.notify(status.HTTP_201_CREATED, data, instance=zaken)
+
+        zaken_create_counter.add(len(zaken))
+        for zaak in zaken:
+            logger.info(
+                "zaak_created",
+                uuid=str(zaak.uuid),
+                identificatie=zaak.identificatie,
+                vertrouwelijkheidaanduiding=zaak.vertrouwelijkheidaanduiding,
+                zaaktype=str(zaak.zaaktype),
+            )
+
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def _check_bulk_create_permissions(self, items: List[dict]) -> None:
+        """
+        Check that the client is allowed to create every zaak, like for a single
+        create.
+        """
+        if bypass_permissions(self.request):
+            return
+
+        permission = ZaakAuthRequired()
+        scopes_required = get_required_scopes(self.request, self)
+        component = permission.get_component(self)
+
+        allowed = {}
+        forbidden = []
+        for index, item in enumerate(items):
+            fields = permission.get_fields(item, permission.permission_fields)
+            # ⚡️ zaken with the same zaaktype and vertrouwelijkheidaanduiding share
+            # the permission check
+            key = tuple(fields.values())
+            if key not in allowed:
+                allowed[key] = self.request.jwt_auth.has_auth(
+                    scopes_required, component, **fields
+                )
+            if not allowed[key]:
+                forbidden.append(str(index))
+
+        if forbidden:
+            raise PermissionDenied(
+                _("Not allowed to create the zaken at index {indices}.").format(
+                    indices=", ".join(forbidden)
+                )
+            )
+
+    def _share_zaaktypen(self, zaken: List[Zaak]) -> None:
+        """
+        Use a single instance of every distinct zaaktype, so the catalogus (used for
+        the notifications) is looked up once per zaaktype.
+        """
+        zaaktypen = {}
+        for zaak in zaken:
+            zaaktype = zaak.zaaktype
+            if isinstance(zaaktype, ProxyMixin):
+                key = zaaktype._loose_fk_data["url"]
+            else:
+                key = zaaktype.pk
+            zaak.zaaktype = zaaktypen.setdefault(key, zaaktype)
+
+        prefetch_related_objects(
+            [
+                zaaktype
+                for zaaktype in zaaktypen.values()
+                if not isinstance(zaaktype, ProxyMixin)
+            ],
+            "catalogus",
+        )
+
+    def _message(self, data, instance=None):
+        if not isinstance(data, list):
+            return super()._message(data, instance=instance)
+
+        # ⚡️ the notifications of bulk created zaken are scheduled together
+        schedule_notifications(
+            [
+                self.construct_message(item, instance=zaak, action="create")
+                for item, zaak in zip(data, instance, strict=True)
+            ]
+        )
+
     def perform_update(self, serializer):
         """
         Perform the update of the Case.
@@ -551,6 +776,45 @@ class ZaakViewSet(
         return serializer.validated_data
 
 
+@extend_schema_view(
+    retrieve=extend_schema(
+        operation_id="zaak_export_status",
+        summary="De status van een export van ZAAKen opvragen.",
+        description=mark_experimental(
+            "Het opvragen van de status van een export van ZAAKen. Alleen de "
+            "APPLICATIE die de export gestart heeft kan de status opvragen."
+        ),
+    )
+)
+class ZaakExportStatusView(ExportStatusView):
+    export_type = ExportTypeChoices.zaken
+
+    required_scopes = {"retrieve": SCOPE_ZAKEN_ALLES_LEZEN}
+
+
+@extend_schema_view(
+    retrieve=extend_schema(
+        operation_id="zaak_export_download",
+        summary="Het bestand van een export van ZAAKen downloaden.",
+        description=mark_experimental(
+            "Het bestand van een export van ZAAKen downloaden. Het bestand is "
+            "beschikbaar zodra de export voltooid is, tot de export na "
+            "`EXPORT_RETENTION_DAYS` dagen verwijderd wordt. Alleen de APPLICATIE "
+            "die de export gestart heeft kan het bestand downloaden."
+        ),
+        responses={
+            (status.HTTP_200_OK, "application/x-ndjson"): OpenApiTypes.STR,
+            (status.HTTP_200_OK, "text/csv"): OpenApiTypes.STR,
+            **COMMON_ERROR_RESPONSES,
+        },
+    )
+)
+class ZaakExportDownloadView(ExportDownloadView):
+    export_type = ExportTypeChoices.zaken
+
+    required_scopes = {"retrieve": SCOPE_ZAKEN_ALLES_LEZEN}
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="Alle STATUSsen van ZAAKen opvragen.",
@@ -584,6 +848,7 @@ class ZaakViewSet(
 @conditional_retrieve()
 class StatusViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     NotificationCreateMixin,
     AuditTrailCreateMixin,
     CheckQueryParamsMixin,
@@ -598,13 +863,12 @@ class StatusViewSet(
     queryset = (
         Status.objects.select_related("_statustype", "zaak", "gezetdoor")
         .prefetch_related("zaakinformatieobjecten")
-        .annotate_with_max_datum_status_gezet()
         .order_by("-datum_status_gezet", "-pk")
     )
     serializer_class = StatusSerializer
     filterset_class = StatusFilter
     lookup_field = "uuid"
-    pagination_class = ExactPagination
+    pagination_class = CursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
@@ -697,6 +961,7 @@ class StatusViewSet(
     ),
 )
 class SubStatusViewSet(
+    SerializerMetricsMixin,
     NotificationCreateMixin,
     AuditTrailCreateMixin,
     CheckQueryParamsMixin,
@@ -794,6 +1059,7 @@ class SubStatusViewSet(
 )
 class ZaakObjectViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
     NotificationViewSetMixin,
     ListFilterByAuthorizationsMixin,
@@ -931,6 +1197,7 @@ class ZaakObjectViewSet(
 @conditional_retrieve()
 class ZaakInformatieObjectViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     NotificationCreateMixin,
     AuditTrailViewsetMixin,
     CheckQueryParamsMixin,
@@ -950,6 +1217,8 @@ class ZaakInformatieObjectViewSet(
     filterset_class = ZaakInformatieObjectFilter
     serializer_class = ZaakInformatieObjectSerializer
     lookup_field = "uuid"
+    # the standard prescribes an unpaginated list, cursor pagination is opt-in
+    pagination_class = CursorOnlyPagination
     notifications_kanaal = KANAAL_ZAKEN
     notifications_main_resource_key = "zaak"
     permission_classes = (ZaakAuthRequired,)
@@ -1083,6 +1352,7 @@ class ZaakInformatieObjectViewSet(
 @conditional_retrieve()
 class ZaakEigenschapViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     NotificationViewSetMixin,
     AuditTrailCreateMixin,
     NestedViewSetMixin,
@@ -1199,6 +1469,7 @@ class ZaakEigenschapViewSet(
     ),
 )
 class KlantContactViewSet(
+    SerializerMetricsMixin,
     CheckQueryParamsMixin,
     NotificationCreateMixin,
     ListFilterByAuthorizationsMixin,
@@ -1273,6 +1544,7 @@ class KlantContactViewSet(
 @conditional_retrieve()
 class RolViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     NotificationViewSetMixin,
     AuditTrailViewsetMixin,
     CheckQueryParamsMixin,
@@ -1302,7 +1574,7 @@ class RolViewSet(
     serializer_class = RolSerializer
     filterset_class = RolFilter
     lookup_field = "uuid"
-    pagination_class = ExactPagination
+    pagination_class = CursorPagination
 
     permission_classes = (ZaakAuthRequired,)
     permission_main_object = "zaak"
@@ -1396,6 +1668,7 @@ class RolViewSet(
 @conditional_retrieve()
 class ResultaatViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     NotificationViewSetMixin,
     AuditTrailViewsetMixin,
     CheckQueryParamsMixin,
@@ -1521,6 +1794,7 @@ class ZaakAuditTrailViewSet(AuditTrailViewSet):
 )
 class ZaakBesluitViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     NotificationCreateMixin,
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
@@ -1693,6 +1967,7 @@ class ZaakBesluitViewSet(
 )
 class ZaakContactMomentViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     NotificationCreateMixin,
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
@@ -1793,6 +2068,7 @@ class ZaakContactMomentViewSet(
 )
 class ZaakVerzoekViewSet(
     CacheQuerysetMixin,  # should be applied before other mixins
+    SerializerMetricsMixin,
     NotificationCreateMixin,
     AuditTrailCreateMixin,
     AuditTrailDestroyMixin,
@@ -2004,7 +2280,10 @@ class DeprecatedReserveerZaakNummerViewSet(ReserveerZaakNummerViewSet):
     ),
 )
 class ZaakNotitieViewSet(
-    NotitieViewSetMixin, ListFilterByAuthorizationsMixin, viewsets.ModelViewSet
+    SerializerMetricsMixin,
+    NotitieViewSetMixin,
+    ListFilterByAuthorizationsMixin,
+    viewsets.ModelViewSet,
 ):
     queryset = ZaakNotitie.objects.select_related("gerelateerd_aan").order_by("-pk")
 
@@ -2456,24 +2735,19 @@ class ZaakBijwerkenViewset(
             self._message_rollen(data["rollen"], rollen_version_before_edit)
 
     def _message_rollen(self, rollen, rollen_version_before_edit):
-        def send_rol_notification(rol, action):
-            message = self.construct_message(
-                rol,
-                kanaal=config["notifications_kanaal"],
-                model=config["model"],
-                action=action,
-            )
-
-            pk = create_failed_notification(message, NotificationTypes.notification)
-
-            transaction.on_commit(
-                lambda msg=message, notification_id=pk: send_notification.delay(
-                    msg, notification_id
+        config = self.notification_fields["rollen"]
+        messages = []
+
+        def add_rol_notification(rol, action):
+            messages.append(
+                self.construct_message(
+                    rol,
+                    kanaal=config["notifications_kanaal"],
+                    model=config["model"],
+                    action=action,
                 )
             )
 
-        config = self.notification_fields["rollen"]
-
         old_rollen = {rol["uuid"]: rol for rol in rollen_version_before_edit}
         new_rollen = {rol["uuid"]: rol for rol in rollen}
 
@@ -2482,15 +2756,28 @@ class ZaakBijwerkenViewset(
 
         # Deleted rollen
         for uuid in old_uuids - new_uuids:
-            send_rol_notification(old_rollen[uuid], "destroy")
+            add_rol_notification(old_rollen[uuid], "destroy")
 
         # Updated rollen
         for uuid in old_uuids & new_uuids:
-            send_rol_notification(new_rollen[uuid], "update")
+            add_rol_notification(new_rollen[uuid], "update")
 
         # Created rollen
         for uuid in new_uuids - old_uuids:
-            send_rol_notification(new_rollen[uuid], "create")
+            add_rol_notification(new_rollen[uuid], "create")
+
+        if settings.NOTIFICATIONS_BATCH_DELIVERY:
+            schedule_notifications(messages)
+            return
+
+        for message in messages:
+            pk = create_failed_notification(message, NotificationTypes.notification)
+
+            transaction.on_commit(
+                lambda msg=message, notification_id=pk: send_notification.delay(
+                    msg, notification_id
+                )
+            )
 
 
 @extend_schema_view(
@@ -1,10 +1,26 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from dataclasses import dataclass
 from datetime import date, datetime, time
+from typing import Callable
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+import structlog
+from django_loose_fk.loaders import FetchError, FetchJsonError
+from requests import RequestException
+from vng_api_common.client import ClientError
 
 from openzaak.components.zaken.models import Zaak
+from openzaak.loaders import remote_fetch_context
 from openzaak.utils.exceptions import DetermineProcessEndDateException
 
+logger = structlog.stdlib.get_logger(__name__)
+
+ARCHIVING_FIELDS = ("archiefnominatie", "archiefactiedatum", "startdatum_bewaartermijn")
+
 
 def calculate_archiving_data(
     zaak: Zaak,
@@ -52,3 +68,99 @@ def try_calculate_archiving(zaak, *, force=False):
         setattr(zaak, field, value)
 
     zaak.save(update_fields=list(data.keys()))
+
+
+@dataclass
+class ArchivingProgress:
+    processed: int = 0
+    updated: int = 0
+    failed: int = 0
+    last_pk: int | None = None
+
+
+def get_zaken_to_archive() -> QuerySet[Zaak]:
+    """
+    Return the zaken for which the archiving data can be calculated.
+    """
+    return Zaak.objects.filter(einddatum__isnull=False, resultaat__isnull=False)
+
+
+def recalculate_archiving(
+    zaken: QuerySet[Zaak],
+    *,
+    batch_size: int,
+    force: bool = False,
+    start_after: int | None = None,
+    progress_callback: Callable[[ArchivingProgress], None] | None = None,
+) -> ArchivingProgress:
+    """
+    Recalculate the archiving data of the zaken in batches, ordered by primary key.
+
+    For every batch the data needed by the :class:`BrondatumCalculator` is prefetched
+    and the changed zaken are saved with a single ``bulk_update``. The recalculation
+    can be resumed by passing the ``last_pk`` of the reported progress as
+    ``start_after``.
+    """
+    from openzaak.components.zaken.brondatum import BrondatumCalculator
+
+    progress = ArchivingProgress(last_pk=start_after)
+    zaken = zaken.select_related(
+        "hoofdzaak",
+        "resultaat___resultaattype",
+        "resultaat___resultaattype_base_url",
+    ).order_by("pk")
+
+    while True:
+        batch = zaken
+        if progress.last_pk is not None:
+            batch = batch.filter(pk__gt=progress.last_pk)
+        batch = list(batch[:batch_size])
+        if not batch:
+            break
+
+        with remote_fetch_context():
+            BrondatumCalculator.prefetch(batch)
+            changed = _recalculate_batch(batch, force=force, progress=progress)
+
+        # the ETags are calculated again when the zaken are requested
+        now = timezone.now()
+        for zaak in changed:
+            zaak.laatst_gemuteerd = now
+            zaak._etag = ""
+
+        with transaction.atomic():
+            Zaak.objects.bulk_update(
+                changed, fields=[*ARCHIVING_FIELDS, "laatst_gemuteerd", "_etag"]
+            )
+
+        progress.processed += len(batch)
+        progress.updated += len(changed)
+        progress.last_pk = batch[-1].pk
+        if progress_callback is not None:
+            progress_callback(progress)
+
+    return progress
+
+
+def _recalculate_batch(
+    batch: list[Zaak], *, force: bool, progress: ArchivingProgress
+) -> list[Zaak]:
+    changed = []
+    for zaak in batch:
+        try:
+            data = calculate_archiving_data(zaak, force=force)
+        except (FetchError, FetchJsonError, ClientError, RequestException) as exc:
+            logger.warning(
+                "archiving_recalculation_failed", zaak=str(zaak.uuid), exc_info=exc
+            )
+            progress.failed += 1
+            continue
+
+        if all(getattr(zaak, field) == value for field, value in data.items()):
+            continue
+
+        for field, value in data.items():
+            setattr(zaak, field, value)
+        changed.append(zaak)
+
+    return changed
@@ -1,19 +1,22 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from collections import defaultdict
 from datetime import date, datetime
-from typing import Union
+from typing import Sequence, Union
 
-from django.db.models import Max
+from django.db.models import Max, Prefetch, prefetch_related_objects
 from django.utils.translation import gettext_lazy as _
 
 from dateutil.relativedelta import relativedelta
+from django_loose_fk.loaders import FetchError, FetchJsonError
 from glom import Path, glom
 from vng_api_common.constants import BrondatumArchiefprocedureAfleidingswijze
 
+from openzaak.loaders import AuthorizedRequestsLoader
 from openzaak.utils import parse_isodatetime
 from openzaak.utils.exceptions import DetermineProcessEndDateException
 
-from .models import Zaak
+from .models import Zaak, ZaakEigenschap
 
 
 class BrondatumCalculator:
@@ -62,6 +65,66 @@ class BrondatumCalculator:
         resultaattype = self.zaak.resultaat.resultaattype
         return resultaattype.archiefnominatie
 
+    @staticmethod
+    def prefetch(zaken: Sequence[Zaak]) -> None:
+        """
+        Prefetch the data to calculate the brondatum for a batch of zaken.
+
+        The zaken must be selected together with their ``resultaat`` and
+        ``hoofdzaak``. The eigenschappen and zaakobjecten are only prefetched for the
+        zaken that need them, remote resultaattypen and objects are fetched
+        concurrently. Use this within a :func:`openzaak.loaders.remote_fetch_context`,
+        which holds the fetched remote resultaattypen.
+        """
+        loader = AuthorizedRequestsLoader()
+        loader.prefetch(zaak.resultaat._resultaattype_url for zaak in zaken)
+
+        zaken_per_afleidingswijze = defaultdict(list)
+        for zaak in zaken:
+            try:
+                resultaattype = zaak.resultaat.resultaattype
+            except (FetchError, FetchJsonError):
+                # raised again when the brondatum of the zaak is calculated
+                continue
+            afleidingswijze = resultaattype.brondatum_archiefprocedure[
+                "afleidingswijze"
+            ]
+            zaken_per_afleidingswijze[afleidingswijze].append(zaak)
+
+        prefetch_related_objects(
+            zaken_per_afleidingswijze[
+                BrondatumArchiefprocedureAfleidingswijze.eigenschap
+            ],
+            Prefetch(
+                "zaakeigenschap_set", queryset=ZaakEigenschap.objects.order_by("pk")
+            ),
+        )
+
+        zaken_with_zaakobjecten = zaken_per_afleidingswijze[
+            BrondatumArchiefprocedureAfleidingswijze.zaakobject
+        ]
+        prefetch_related_objects(zaken_with_zaakobjecten, "zaakobject_set")
+        remote_zaakobjecten = [
+            zaak_object
+            for zaak in zaken_with_zaakobjecten
+            for zaak_object in zaak.zaakobject_set.all()
+            if zaak_object.object
+        ]
+        loader.prefetch(zaak_object.object for zaak_object in remote_zaakobjecten)
+        for zaak_object in remote_zaakobjecten:
+            try:
+                # see ZaakObject._get_object
+                zaak_object._object = loader.fetch_object(
+                    zaak_object.object, do_underscoreize=False
+                )
+            except (FetchError, FetchJsonError):
+                # the object is fetched (and the error is raised) again when used
+                continue
+
+
+def _get_prefetched(zaak: Zaak, name: str) -> list | None:
+    return getattr(zaak, "_prefetched_objects_cache", {}).get(name)
+
 
 def get_brondatum(
     zaak: Zaak,
@@ -113,7 +176,12 @@ def get_brondatum(
                 )
             )
 
-        eigenschap = zaak.zaakeigenschap_set.filter(_naam=datum_kenmerk).first()
+        if (eigenschappen := _get_prefetched(zaak, "zaakeigenschap_set")) is not None:
+            eigenschap = next(
+                (e for e in eigenschappen if e._naam == datum_kenmerk), None
+            )
+        else:
+            eigenschap = zaak.zaakeigenschap_set.filter(_naam=datum_kenmerk).first()
 
         if not eigenschap or not eigenschap.waarde:
             return None
@@ -150,7 +218,12 @@ def get_brondatum(
         # Nested `datumkenmerk` can be specified with `/`
         datum_kenmerk_path = Path(*datum_kenmerk.split("/"))
         dates = []
-        for zaak_object in zaak.zaakobject_set.filter(object_type=objecttype):
+        if (zaakobjecten := _get_prefetched(zaak, "zaakobject_set")) is not None:
+            zaakobjecten = [zo for zo in zaakobjecten if zo.object_type == objecttype]
+        else:
+            zaakobjecten = zaak.zaakobject_set.filter(object_type=objecttype)
+
+        for zaak_object in zaakobjecten:
             if zaak_object.object:
                 remote_object = zaak_object._get_object()
                 value = glom(remote_object, datum_kenmerk_path, default=None)
@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from collections.abc import Callable
+
+from django.core.management import BaseCommand
+from django.db import models, transaction
+from django.db.models import F, Q
+
+from openzaak.components.zaken.models import Status, Zaak
+from openzaak.components.zaken.query import get_huidige_status_subquery
+
+
+def backfill_huidige_status(
+    zaak_model: type[models.Model],
+    status_model: type[models.Model],
+    batch_size: int,
+    log_func: Callable[[str], None],
+) -> int:
+    """
+    Set the materialized ``Zaak.huidige_status`` in batches of primary key ranges.
+
+    models are added as parameters to be able to use this function in the migrations
+    with apps.get_model
+    """
+    bounds = zaak_model.objects.aggregate(
+        min_pk=models.Min("pk"), max_pk=models.Max("pk")
+    )
+    if bounds["min_pk"] is None:
+        log_func("Found no zaken.")
+        return 0
+
+    subquery = get_huidige_status_subquery(status_model)
+    total = 0
+    for start in range(bounds["min_pk"], bounds["max_pk"] + 1, batch_size):
+        with transaction.atomic():
+            total += zaak_model.objects.filter(
+                pk__gte=start, pk__lt=start + batch_size
+            ).update(huidige_status=subquery)
+        log_func(f"Processed {total} zaken.")
+
+    return total
+
+
+def get_inconsistent_zaken(
+    zaak_model: type[models.Model], status_model: type[models.Model]
+) -> models.QuerySet:
+    """
+    Return the zaken for which ``huidige_status`` is not the most recent status.
+    """
+    return zaak_model.objects.annotate(
+        expected_huidige_status=get_huidige_status_subquery(status_model)
+    ).filter(
+        Q(huidige_status__isnull=True, expected_huidige_status__isnull=False)
+        | Q(huidige_status__isnull=False, expected_huidige_status__isnull=True)
+        | Q(huidige_status__lt=F("expected_huidige_status"))
+        | Q(huidige_status__gt=F("expected_huidige_status"))
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill the current status (huidige_status) of all zaken and verify that "
+        "it matches the most recent status"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only verify the current status of the zaken, without updating them.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of zaken updated per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["verify"]:
+            backfill_huidige_status(
+                zaak_model=Zaak,
+                status_model=Status,
+                batch_size=options["batch_size"],
+                log_func=self.stdout.write,
+            )
+
+        inconsistent = get_inconsistent_zaken(Zaak, Status)
+        count = inconsistent.count()
+        if not count:
+            self.stdout.write(
+                self.style.SUCCESS("All zaken have the correct current status")
+            )
+            return
+
+        for uuid in inconsistent.values_list("uuid", flat=True)[:100]:
+            self.stdout.write(f"Zaak {uuid} does not have the correct current status")
+        self.stdout.write(
+            self.style.WARNING(
+                f"There are {count} zaken with an incorrect current status"
+            )
+        )
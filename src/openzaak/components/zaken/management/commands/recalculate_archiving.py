@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from openzaak.components.zaken.archiving import (
+    ArchivingProgress,
+    get_zaken_to_archive,
+    recalculate_archiving,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalculate the archiving data (archiefnominatie, archiefactiedatum and "
+        "startdatum_bewaartermijn) of the closed zaken, for example after the "
+        "archiefactietermijn of a resultaattype changed"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--resultaattype",
+            help="Only recalculate the zaken with a resultaat of this (local) "
+            "resultaattype UUID.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Also recalculate the brondatum if startdatum_bewaartermijn is "
+            "already set.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.ARCHIVING_RECALCULATION_BATCH_SIZE,
+            help="The number of zaken recalculated and updated per batch.",
+        )
+        parser.add_argument(
+            "--start-after",
+            type=int,
+            help="Resume the recalculation after the zaak with this primary key, as "
+            "reported by an earlier run.",
+        )
+
+    def handle(self, *args, **options):
+        zaken = get_zaken_to_archive()
+        if options["resultaattype"]:
+            zaken = zaken.filter(
+                resultaat___resultaattype__uuid=options["resultaattype"]
+            )
+
+        progress = recalculate_archiving(
+            zaken,
+            batch_size=options["batch_size"],
+            force=options["force"],
+            start_after=options["start_after"],
+            progress_callback=self.report_progress,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recalculated {progress.processed} zaken, updated "
+                f"{progress.updated} zaken."
+            )
+        )
+        if progress.failed:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"The archiving data of {progress.failed} zaken could not be "
+                    "recalculated, see the logs for details."
+                )
+            )
+
+    def report_progress(self, progress: ArchivingProgress) -> None:
+        self.stdout.write(
+            f"Processed {progress.processed} zaken ({progress.updated} updated, "
+            f"{progress.failed} failed), last primary key: {progress.last_pk}"
+        )
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.12 on 2026-10-17 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import structlog
+
+logger = structlog.stdlib.get_logger(__name__)
+
+BATCH_SIZE = 10_000
+
+
+def forward(apps, schema_editor):
+    Zaak = apps.get_model("zaken", "Zaak")
+    Status = apps.get_model("zaken", "Status")
+
+    bounds = Zaak.objects.aggregate(min_pk=models.Min("pk"), max_pk=models.Max("pk"))
+    if bounds["min_pk"] is None:
+        return
+
+    huidige_status = models.Subquery(
+        Status.objects.filter(zaak=models.OuterRef("pk"))
+        .order_by("-datum_status_gezet", "-pk")
+        .values("pk")[:1]
+    )
+    total = 0
+    for start in range(bounds["min_pk"], bounds["max_pk"] + 1, BATCH_SIZE):
+        total += Zaak.objects.filter(pk__gte=start, pk__lt=start + BATCH_SIZE).update(
+            huidige_status=huidige_status
+        )
+        logger.info("huidige_status_backfilled", processed=total)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("zaken", "0049_alter_zaak_laatst_gemuteerd"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaak",
+            name="huidige_status",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="De meest recent gezette STATUS van de ZAAK. Dit wordt bijgehouden bij het aanmaken, wijzigen en verwijderen van STATUSsen.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="zaken.status",
+            ),
+        ),
+        migrations.RunPython(forward, migrations.RunPython.noop),
+    ]
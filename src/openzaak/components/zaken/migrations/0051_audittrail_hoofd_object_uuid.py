@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.db import migrations, models
+from django.db.models.functions import Right
+
+# The audit trails of all components are looked up by the UUID at the end of the URL
+# of their main object, see ``openzaak.utils.audittrails``. ``AuditTrail`` is provided
+# by vng-api-common, so the index can't be declared on the model itself and
+# ``AddIndexConcurrently`` (which only targets models of this app) can't be used. The
+# index is created concurrently in the same way to avoid locking the table.
+INDEX = models.Index(Right("hoofd_object", 36), name="audittrail_hoofd_object_uuid")
+
+
+def add_index(apps, schema_editor):
+    AuditTrail = apps.get_model("audittrails", "AuditTrail")
+    schema_editor.add_index(AuditTrail, INDEX, concurrently=True)
+
+
+def remove_index(apps, schema_editor):
+    AuditTrail = apps.get_model("audittrails", "AuditTrail")
+    schema_editor.remove_index(AuditTrail, INDEX, concurrently=True)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("zaken", "0050_zaak_huidige_status"),
+        ("audittrails", "0019_alter_audittrail_options"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_index, remove_index),
+    ]
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.12 on 2026-10-17 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zaken", "0051_audittrail_hoofd_object_uuid"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ZaakIdentificatieCounter",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sequence",
+                    models.CharField(
+                        help_text="The sequence of identifications, e.g. the prefix with the year.",
+                        max_length=40,
+                        unique=True,
+                        verbose_name="sequence",
+                    ),
+                ),
+                (
+                    "last_identificatie",
+                    models.CharField(
+                        help_text="The last identification that was leased from the sequence.",
+                        max_length=40,
+                        verbose_name="last identification",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "zaak identification counter",
+                "verbose_name_plural": "zaak identification counters",
+            },
+        ),
+    ]
@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("zaken", "0052_zaakidentificatiecounter"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaak",
+            name="_vertrouwelijkheidaanduiding_order",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        vertrouwelijkheidaanduiding="openbaar", then=models.Value(0)
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="beperkt_openbaar",
+                        then=models.Value(1),
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="intern", then=models.Value(2)
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="zaakvertrouwelijk",
+                        then=models.Value(3),
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="vertrouwelijk",
+                        then=models.Value(4),
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="confidentieel",
+                        then=models.Value(5),
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="geheim", then=models.Value(6)
+                    ),
+                    models.When(
+                        vertrouwelijkheidaanduiding="zeer_geheim", then=models.Value(7)
+                    ),
+                    output_field=models.IntegerField(),
+                ),
+                output_field=models.SmallIntegerField(),
+                verbose_name="vertrouwelijkheidaanduiding volgorde",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="zaak",
+            index=models.Index(
+                fields=["_zaaktype", "_vertrouwelijkheidaanduiding_order"],
+                name="zaken_zaak__zaakty_d288f0_idx",
+            ),
+        ),
+    ]
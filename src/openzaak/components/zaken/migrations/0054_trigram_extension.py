@@ -0,0 +1,15 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("zaken", "0053_zaak__vertrouwelijkheidaanduiding_order"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+    ]
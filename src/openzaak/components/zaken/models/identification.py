@@ -6,6 +6,8 @@ from django.utils.translation import gettext_lazy as _
 
 from vng_api_common.fields import RSINField
 
+from openzaak.utils.search import trigram_index
+
 
 class ZaakIdentificatie(models.Model):
     """
@@ -45,9 +47,38 @@ class ZaakIdentificatie(models.Model):
                 check=~models.Q(identificatie=""), name="identificatie_not_empty"
             ),
         ]
+        indexes = [trigram_index("identificatie", name="zaakidentificatie_trgm_idx")]
 
     def __str__(self):
         return _("{identification} ({organisation})").format(
             identification=self.identificatie,
             organisation=self.bronorganisatie,
         )
+
+
+class ZaakIdentificatieCounter(models.Model):
+    """
+    Track the last identification leased from a sequence of generated identifications.
+
+    Worker processes lease blocks of identifications, so they don't have to lock the
+    generation for every single zaak.
+    """
+
+    sequence = models.CharField(
+        _("sequence"),
+        max_length=40,
+        unique=True,
+        help_text=_("The sequence of identifications, e.g. the prefix with the year."),
+    )
+    last_identificatie = models.CharField(
+        _("last identification"),
+        max_length=40,
+        help_text=_("The last identification that was leased from the sequence."),
+    )
+
+    class Meta:
+        verbose_name = _("zaak identification counter")
+        verbose_name_plural = _("zaak identification counters")
+
+    def __str__(self):
+        return f"{self.sequence}: {self.last_identificatie}"
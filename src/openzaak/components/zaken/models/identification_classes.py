@@ -1,29 +1,74 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2026 Open Zaak maintainers
 
+import threading
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
 from datetime import date
+from functools import partial
 from itertools import chain, count, islice, starmap
 from operator import mul
-from typing import Generator
+from typing import Generator, Iterable
 
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Max
 from django.db.models.functions import Length
+from django.utils.module_loading import import_string
 
 from openzaak.utils.db import pg_advisory_lock
 
-from .identification import ZaakIdentificatie
+from .identification import ZaakIdentificatie, ZaakIdentificatieCounter
 
 LOCK_ID_IDENTIFICATION_GENERATION = "generate-zaak-identification"
 
 
+class IdentificatiePool:
+    """
+    Process local pool of the identifications leased from the sequences.
+
+    The identifications of a leased block that are not handed out when the process
+    stops are never used, which leaves a gap in the sequence.
+    """
+
+    def __init__(self):
+        self._identificaties: dict[str, deque[str]] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def take(self, sequence: str, amount: int) -> list[str]:
+        with self._lock:
+            available = self._identificaties[sequence]
+            return [available.popleft() for _ in range(min(amount, len(available)))]
+
+    def add(self, sequence: str, identificaties: Iterable[str]) -> None:
+        with self._lock:
+            self._identificaties[sequence].extend(identificaties)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._identificaties.clear()
+
+
+identificatie_pool = IdentificatiePool()
+
+
+def _sort_key(identificatie: str) -> tuple[int, str]:
+    return len(identificatie), identificatie
+
+
 class BaseZaakIdentificatie(ABC):
     model = ZaakIdentificatie
 
     def __init__(self, bronorganisatie: str, **kwargs):
         self.bronorganisatie = bronorganisatie
 
+    @property
+    def sequence(self) -> str:
+        """
+        The name of the sequence the identifications are leased from.
+        """
+        return type(self).__name__
+
     @abstractmethod
     def current(self) -> str:
         pass
@@ -50,6 +95,12 @@ class BaseZaakIdentificatie(ABC):
         of the data inside by generate_unique_identification could be stale due to new
         inserts).
         """
+        if settings.ZAAK_IDENTIFICATIE_BLOCK_SIZE > 1:
+            return self.model.objects.create(
+                identificatie=self.allocate(1)[0],
+                bronorganisatie=self.bronorganisatie,
+            )
+
         with pg_advisory_lock(LOCK_ID_IDENTIFICATION_GENERATION):
             return self.model.objects.create(
                 identificatie=next(self._sequence(self.current())),
@@ -68,12 +119,90 @@ class BaseZaakIdentificatie(ABC):
         :param amount: How many identificaties to generate.
         :return: List of created ZaakIdentificatie instances.
         """
+        if settings.ZAAK_IDENTIFICATIE_BLOCK_SIZE > 1:
+            return self.model.objects.bulk_create(
+                self.model(identificatie=id, bronorganisatie=self.bronorganisatie)
+                for id in self.allocate(amount)
+            )
+
         with pg_advisory_lock(LOCK_ID_IDENTIFICATION_GENERATION):
             return self.model.objects.bulk_create(
                 self.model(identificatie=id, bronorganisatie=self.bronorganisatie)
                 for id in islice(self._sequence(self.current()), amount)
             )
 
+    def allocate(self, amount: int) -> list[str]:
+        """
+        Allocate identifications from the process local pool.
+
+        If the pool runs out, a block of ``ZAAK_IDENTIFICATIE_BLOCK_SIZE``
+        identifications is leased from the sequence. The rest of the block is only
+        added to the pool once the lease is committed, if the transaction is rolled
+        back the block can be leased again by another process.
+
+        Identifications that were created explicitly by clients after they were
+        leased are skipped.
+        """
+        identificaties = []
+        while missing := amount - len(identificaties):
+            candidates = identificatie_pool.take(self.sequence, missing)
+            if shortage := missing - len(candidates):
+                leased = self.lease(
+                    max(shortage, settings.ZAAK_IDENTIFICATIE_BLOCK_SIZE)
+                )
+                transaction.on_commit(
+                    partial(identificatie_pool.add, self.sequence, leased[shortage:])
+                )
+                candidates += leased[:shortage]
+
+            identificaties += self.exclude_existing(candidates)
+        return identificaties
+
+    def exclude_existing(self, identificaties: list[str]) -> list[str]:
+        existing = set(
+            self.model.objects.filter(
+                identificatie__in=identificaties, bronorganisatie=self.bronorganisatie
+            ).values_list("identificatie", flat=True)
+        )
+        return [
+            identificatie
+            for identificatie in identificaties
+            if identificatie not in existing
+        ]
+
+    def lease(self, amount: int) -> list[str]:
+        """
+        Lease a block of identifications from the sequence.
+
+        Only the counter of the sequence is locked, rather than the generation of all
+        identifications.
+        """
+        with transaction.atomic():
+            counter = (
+                ZaakIdentificatieCounter.objects.select_for_update()
+                .filter(sequence=self.sequence)
+                .first()
+            )
+            if counter is None:
+                with pg_advisory_lock(LOCK_ID_IDENTIFICATION_GENERATION):
+                    ZaakIdentificatieCounter.objects.get_or_create(
+                        sequence=self.sequence,
+                        defaults={"last_identificatie": self.current()},
+                    )
+                counter = ZaakIdentificatieCounter.objects.select_for_update().get(
+                    sequence=self.sequence
+                )
+
+            # identifications can also be created without a lease, e.g. explicitly
+            # by clients or before leasing was enabled
+            current = max(counter.last_identificatie, self.current(), key=_sort_key)
+            leased = list(islice(self._sequence(current), amount))
+
+            counter.last_identificatie = leased[-1]
+            counter.save(update_fields=["last_identificatie"])
+
+        return leased
+
 
 class YearIdentification(BaseZaakIdentificatie):
     def __init__(self, bronorganisatie: str, date: date, **kwargs):
@@ -81,6 +210,10 @@ class YearIdentification(BaseZaakIdentificatie):
 
         self.prefix = f"ZAAK-{date.year}"
 
+    @property
+    def sequence(self) -> str:
+        return self.prefix
+
     def current(self) -> str:
         pattern = self.prefix + r"-\d{10}"
 
@@ -217,3 +350,16 @@ def get_base_identification_class():
             identification_class = YearIdentification
 
     return identification_class
+
+
+def get_identification_generator_class() -> type[BaseZaakIdentificatie]:
+    """
+    Return the class generating the identificatie of zaken created without one.
+    """
+    options = settings.ZAAK_IDENTIFICATIE_GENERATOR_OPTIONS
+    return import_string(
+        options.get(
+            settings.ZAAK_IDENTIFICATIE_GENERATOR,
+            options.get("use-start-datum-year"),
+        )
+    )
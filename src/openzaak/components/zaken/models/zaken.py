@@ -2,8 +2,6 @@
 # Copyright (C) 2019 - 2022 Dimpact
 import uuid
 from datetime import date
-from typing import Optional
-from uuid import UUID
 
 from django.contrib.gis.db.models import GeometryField
 from django.contrib.postgres.fields import ArrayField
@@ -25,6 +23,7 @@ from vng_api_common.constants import (
     RelatieAarden,
     RolOmschrijving,
     RolTypes,
+    VertrouwelijkheidsAanduiding,
     ZaakobjectTypes,
 )
 from vng_api_common.descriptors import GegevensGroepType
@@ -44,6 +43,7 @@ from openzaak.utils.fields import (
 )
 from openzaak.utils.help_text import mark_experimental
 from openzaak.utils.mixins import APIMixin, AuditTrailMixin
+from openzaak.utils.search import search_vector_index, trigram_index
 
 from ..constants import (
     AardZaakRelatie,
@@ -259,6 +259,15 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
             "Aanduiding van de mate waarin het zaakdossier van de ZAAK voor de openbaarheid bestemd is."
         ),
     )
+    # stored, so the authorizations can be checked using an index
+    _vertrouwelijkheidaanduiding_order = models.GeneratedField(
+        expression=VertrouwelijkheidsAanduiding.get_order_expression(
+            "vertrouwelijkheidaanduiding"
+        ),
+        output_field=models.SmallIntegerField(),
+        db_persist=True,
+        verbose_name=_("vertrouwelijkheidaanduiding volgorde"),
+    )
 
     betalingsindicatie = models.CharField(
         _("betalingsindicatie"),
@@ -490,14 +499,29 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
         null=True,
         blank=True,
     )
+    huidige_status = models.ForeignKey(
+        "zaken.Status",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        help_text=_(
+            "De meest recent gezette STATUS van de ZAAK. Dit wordt bijgehouden bij "
+            "het aanmaken, wijzigen en verwijderen van STATUSsen."
+        ),
+    )
 
     objects = ZaakQuerySet.as_manager()
 
-    _current_status_uuid: Optional[UUID]
-
     class Meta:
         verbose_name = "zaak"
         verbose_name_plural = "zaken"
+        indexes = [
+            models.Index(fields=["_zaaktype", "_vertrouwelijkheidaanduiding_order"]),
+            trigram_index("omschrijving", name="zaak_omschrijving_trgm_idx"),
+            search_vector_index("omschrijving", name="zaak_search_idx"),
+        ]
 
     def __str__(self):
         return self.identificatie
@@ -512,6 +536,19 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
             f.attname: getattr(self, f.attname) for f in self._meta.concrete_fields
         }
 
+    def normalize_fields(self) -> None:
+        """
+        Derive the values of fields that depend on other fields of the zaak.
+        """
+        if (
+            self.betalingsindicatie == BetalingsIndicatie.nvt
+            and self.laatste_betaaldatum
+        ):
+            self.laatste_betaaldatum = None
+
+        if self.opschorting_indicatie:
+            self.opschorting_eerdere_opschorting = True
+
     def save(self, *args, **kwargs):
         update_fields = kwargs.get("update_fields")
 
@@ -533,14 +570,7 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
                 self.identificatie_ptr = reserved_identificatie.first()
             # else create one the normal way
 
-        if (
-            self.betalingsindicatie == BetalingsIndicatie.nvt
-            and self.laatste_betaaldatum
-        ):
-            self.laatste_betaaldatum = None
-
-        if self.opschorting_indicatie:
-            self.opschorting_eerdere_opschorting = True
+        self.normalize_fields()
 
         if not self._state.adding:
             changed = False
@@ -557,6 +587,16 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
             if changed:
                 self.laatst_gemuteerd = timezone.now()
 
+            if not update_fields:
+                # the current status is set by ``Status.save`` with a queryset update,
+                # so a zaak that was loaded before a status was created would write
+                # back a stale value
+                kwargs["update_fields"] = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key and field.name != "huidige_status"
+                ]
+
         old_einddatum = None
 
         if self.pk:
@@ -569,7 +609,7 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
 
         super().save(*args, **kwargs)
 
-        if kwargs.get("update_fields"):
+        if update_fields:
             return
 
         einddatum_changed = self.einddatum != old_einddatum
@@ -610,37 +650,10 @@ class Zaak(ETagMixin, AuditTrailMixin, APIMixin, ZaakIdentificatie):
             if afleidingswijze == BrondatumArchiefprocedureAfleidingswijze.hoofdzaak:
                 try_calculate_archiving(subzaak, force=True)
 
-    @property
-    def current_status_uuid(self):
-        # .first() is used instead of .last because:
-        #
-        # * the viewset prefetches the statuses for each zaak and orders them
-        #   descending on datum_status_gezet
-        # * using .last() calls .reverse, which invalidates the prefetch cache.
-        #
-        # The Status.Meta is also set to order by descending datum_status_gezet so that
-        # this code works correctly even when not doing prefetches.
-        if hasattr(self, "_current_status_uuid"):
-            return self._current_status_uuid
-        status = self.status_set.first()
-        return status.uuid if status else None
-
-    @current_status_uuid.setter
-    def current_status_uuid(self, value: Optional[UUID]):
-        self._current_status_uuid = value
-
     @property
     def current_status(self):
-        # The viewset prefetches the statuses and stores them on the instances,
-        # for performance reasons we simply grab the first status from there if possible
-        # instead of using `.first()`, because the latter constructs a queryset
-        # (which causes more overhead)
-        if hasattr(self, "prefetched_statuses"):
-            # Statuses were prefetched, but Zaak has no statuses yet
-            if not self.prefetched_statuses:
-                return None
-            return self.prefetched_statuses[0]
-        return self.status_set.first()
+        # ⚡️ the most recent status is materialized on the zaak, see ``Status.save``
+        return self.huidige_status
 
     @property
     def is_closed(self) -> bool:
@@ -868,6 +881,39 @@ class Status(ETagMixin, APIMixin, models.Model):
     def __str__(self):
         return "Status op {}".format(self.datum_status_gezet)
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+
+        zaken = Zaak.objects.filter(pk=self.zaak_id)
+        if not adding:
+            # the datum_status_gezet may have changed, so a different status can be
+            # the most recent one now
+            zaken.update_huidige_status()
+            huidige_status_id = zaken.values_list("huidige_status", flat=True).get()
+        else:
+            # ⚡️ a new status only becomes the current status if no status with a
+            # more recent datum_status_gezet exists, which is checked in the same query
+            newer_statussen = Status.objects.filter(
+                zaak=models.OuterRef("pk"),
+                datum_status_gezet__gt=self.datum_status_gezet,
+            )
+            updated = zaken.exclude(models.Exists(newer_statussen)).update(
+                huidige_status=self
+            )
+            if not updated:
+                return
+            huidige_status_id = self.pk
+
+        # keep an already loaded zaak in sync
+        if self._meta.get_field("zaak").is_cached(self):
+            if huidige_status_id == self.pk:
+                self.zaak.huidige_status = self
+            else:
+                self.zaak.huidige_status_id = huidige_status_id
+            # not a change that requires updating `laatst_gemuteerd` on the next save
+            self.zaak._original_values["huidige_status_id"] = huidige_status_id
+
     def unique_representation(self):
         return f"({self.zaak.unique_representation()}) - {self.datum_status_gezet}"
 
@@ -882,11 +928,7 @@ class Status(ETagMixin, APIMixin, models.Model):
 
     @property
     def indicatie_laatst_gezette_status(self) -> bool:
-        """⚡️ use annotated field when possible"""
-        if hasattr(self, "max_datum_status_gezet"):
-            return self.max_datum_status_gezet == self.datum_status_gezet
-
-        return self.zaak.current_status_uuid == self.uuid
+        return self.zaak.huidige_status_id == self.pk
 
 
 class SubStatus(models.Model):
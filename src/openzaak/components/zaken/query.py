@@ -2,7 +2,8 @@
 # Copyright (C) 2019 - 2020 Dimpact
 from typing import Dict, Tuple
 
-from django.db import models
+from django.apps import apps
+from django.db import models, transaction
 
 from django_loose_fk.virtual_models import ProxyMixin
 
@@ -40,8 +41,61 @@ class ZaakAuthorizationsFilterMixin(LooseFkAuthorizationsFilterMixin):
     loose_fk_field = "zaaktype"
 
 
+def get_huidige_status_subquery(status_model: type[models.Model]) -> models.Subquery:
+    """
+    Select the most recent status of the zaak in the outer query.
+
+    The model is a parameter to be able to use this in migrations with
+    ``apps.get_model``.
+    """
+    return models.Subquery(
+        status_model.objects.filter(zaak=models.OuterRef("pk"))
+        .order_by("-datum_status_gezet", "-pk")
+        .values("pk")[:1]
+    )
+
+
 class ZaakQuerySet(ZaakAuthorizationsFilterMixin, models.QuerySet):
-    pass
+    def update_huidige_status(self) -> int:
+        """
+        Recalculate the materialized ``huidige_status`` of the zaken.
+        """
+        status_model = apps.get_model("zaken", "Status")
+        return self.update(huidige_status=get_huidige_status_subquery(status_model))
+
+    def bulk_create(self, objs, batch_size=None):
+        """
+        Insert zaken of which the ``ZaakIdentificatie`` parent rows already exist.
+
+        Django does not support bulk creating multi-table inherited models, since
+        the parent rows need to be inserted first. The identificatie (and thus the
+        primary key) of a zaak is allocated up front, so only the zaak table itself
+        needs to be inserted into. Like the regular ``bulk_create``, ``save`` is not
+        called and no signals are sent.
+        """
+        objs = list(objs)
+        if not objs:
+            return objs
+
+        if not all(obj.identificatie_ptr_id for obj in objs):
+            raise ValueError(
+                "Zaken can only be bulk created with an allocated identificatie."
+            )
+
+        self._for_write = True
+        fields = [
+            field
+            for field in self.model._meta.local_concrete_fields
+            if not field.generated
+        ]
+        self._prepare_for_bulk_create(objs)
+        with transaction.atomic(using=self.db, savepoint=False):
+            self._batched_insert(objs, fields, batch_size)
+
+        for obj in objs:
+            obj._state.adding = False
+            obj._state.db = self.db
+        return objs
 
 
 class ZaakRelatedQuerySet(ZaakAuthorizationsFilterMixin, models.QuerySet):
@@ -53,18 +107,7 @@ class ZaakNotitieQuerySet(ZaakRelatedQuerySet):
 
 
 class StatusQuerySet(ZaakRelatedQuerySet):
-    def annotate_with_max_datum_status_gezet(self):
-        """
-        add `max_datum_status_gezet` of all statuses grouped by zaak
-        """
-        grouped_statussen = (
-            self.filter(zaak=models.OuterRef("zaak"))
-            .order_by()
-            .values("zaak")
-            .annotate(max_datum_status_gezet=models.Max("datum_status_gezet"))
-            .values("max_datum_status_gezet")
-        )
-        return self.annotate(max_datum_status_gezet=models.Subquery(grouped_statussen))
+    pass
 
 
 class ZaakInformatieObjectQuerySet(BlockChangeMixin, ZaakRelatedQuerySet):
@@ -2,7 +2,8 @@
 # Copyright (C) 2019 - 2022 Dimpact
 import threading
 
-from django.db import transaction
+from django.conf import settings
+from django.db import models, transaction
 from django.db.models.base import ModelBase
 from django.db.models.signals import ModelSignal, post_delete, post_save, pre_delete
 from django.dispatch import receiver
@@ -37,6 +38,11 @@ _signal_local = threading.local()
 
 
 def schedule_zaak_gemuteerd(instance: Zaak):
+    if settings.CLOUD_EVENTS_OUTBOX:
+        # duplicates within the transaction are replaced in the outbox
+        send_zaak_cloudevent(ZAAK_GEMUTEERD, instance, build_fake_request())
+        return
+
     registry = get_scheduled_event_registry()
 
     registry.setdefault(ZAAK_GEMUTEERD, set())
@@ -55,6 +61,10 @@ def schedule_zaak_gemuteerd(instance: Zaak):
 
 
 def schedule_zaak_verwijderd(instance: Zaak):
+    if settings.CLOUD_EVENTS_OUTBOX:
+        send_zaak_cloudevent(ZAAK_VERWIJDEREN, instance, build_fake_request())
+        return
+
     registry = get_scheduled_event_registry()
 
     registry.setdefault(ZAAK_VERWIJDEREN, set())
@@ -168,6 +178,18 @@ def delete_reverse_zaakrelatie(sender, instance, **kwargs):
             _signal_local.skip_reverse_delete = False
 
 
+@receiver(post_delete, sender=Status, dispatch_uid="zaken.status.update_huidige_status")
+def update_huidige_status(sender, instance: Status, origin=None, **kwargs):
+    """Determine the new current status when a status is removed."""
+    # nothing to maintain if the zaak itself is being deleted
+    if isinstance(origin, Zaak) or (
+        isinstance(origin, models.QuerySet) and origin.model is Zaak
+    ):
+        return
+
+    Zaak.objects.filter(pk=instance.zaak_id).update_huidige_status()
+
+
 @receiver(post_save, sender=Zaak, dispatch_uid="zaken.zaak.send_zaak_gemuteerd_event")
 def send_zaak_gemuteerd_event(sender, instance, created, **kwargs):
     if created:
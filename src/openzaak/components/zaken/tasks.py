@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from dataclasses import asdict
+from uuid import UUID
+
+from django.conf import settings
+
+import structlog
+
+from openzaak import celery_app
+
+from .archiving import ArchivingProgress, get_zaken_to_archive, recalculate_archiving
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@celery_app.task(bind=True)
+def recalculate_zaken_archiving(
+    self,
+    resultaattype_uuid: str | UUID | None = None,
+    force: bool = False,
+    start_after: int | None = None,
+) -> dict:
+    """
+    Recalculate the archiving data of the closed zaken in the background.
+
+    The progress is reported as task state ``PROGRESS``, an interrupted task can be
+    resumed with the ``last_pk`` of the reported progress as ``start_after``.
+    """
+    zaken = get_zaken_to_archive()
+    if resultaattype_uuid:
+        zaken = zaken.filter(resultaat___resultaattype__uuid=resultaattype_uuid)
+
+    def report_progress(progress: ArchivingProgress) -> None:
+        logger.info("archiving_recalculation_progress", **asdict(progress))
+        self.update_state(state="PROGRESS", meta=asdict(progress))
+
+    progress = recalculate_archiving(
+        zaken,
+        batch_size=settings.ARCHIVING_RECALCULATION_BATCH_SIZE,
+        force=force,
+        start_after=start_after,
+        progress_callback=report_progress,
+    )
+    logger.info("archiving_recalculation_finished", **asdict(progress))
+    return asdict(progress)
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from datetime import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ...models import Zaak
+from ..factories import StatusFactory, ZaakFactory
+
+
+def make_datetime(*args) -> datetime:
+    return timezone.make_aware(datetime(*args))
+
+
+class HuidigeStatusTests(TestCase):
+    def test_new_status_becomes_huidige_status(self):
+        zaak = ZaakFactory.create()
+        status1 = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=make_datetime(2022, 7, 18, 8)
+        )
+        self.assertEqual(zaak.huidige_status, status1)
+
+        status2 = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=make_datetime(2022, 7, 18, 10)
+        )
+
+        self.assertEqual(zaak.huidige_status, status2)
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.huidige_status, status2)
+
+    def test_zaak_update_keeps_huidige_status_of_other_instance(self):
+        zaak = ZaakFactory.create()
+        # e.g. a zaak that is updated while a status is created in another request
+        stale_zaak = Zaak.objects.get(pk=zaak.pk)
+        status = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=make_datetime(2022, 7, 18, 8)
+        )
+
+        stale_zaak.omschrijving = "changed"
+        stale_zaak.save()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.omschrijving, "changed")
+        self.assertEqual(zaak.huidige_status, status)
+
+    def test_older_status_does_not_become_huidige_status(self):
+        zaak = ZaakFactory.create()
+        status1 = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=make_datetime(2022, 7, 18, 10)
+        )
+
+        StatusFactory.create(
+            zaak=zaak, datum_status_gezet=make_datetime(2022, 7, 18, 8)
+        )
+
+        self.assertEqual(zaak.huidige_status, status1)
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.huidige_status, status1)
+
+    def test_changed_datum_status_gezet(self):
+        zaak = ZaakFactory.create()
+        status1 = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=make_datetime(2022, 7, 18, 8)
+        )
+        status2 = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=make_datetime(2022, 7, 18, 10)
+        )
+
+        status2.datum_status_gezet = make_datetime(2022, 7, 18, 6)
+        status2.save()
+
+        self.assertEqual(zaak.huidige_status, status1)
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.huidige_status, status1)
+
+    def test_deleted_status(self):
+        zaak = ZaakFactory.create()
+        status1 = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=make_datetime(2022, 7, 18, 8)
+        )
+        status2 = StatusFactory.create(
+            zaak=zaak, datum_status_gezet=make_datetime(2022, 7, 18, 10)
+        )
+
+        status2.delete()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.huidige_status, status1)
+
+        status1.delete()
+
+        zaak.refresh_from_db()
+        self.assertIsNone(zaak.huidige_status)
+
+    def test_delete_zaak_with_statussen(self):
+        zaak = ZaakFactory.create()
+        StatusFactory.create_batch(2, zaak=zaak)
+
+        zaak.delete()
+
+        self.assertFalse(Zaak.objects.exists())
+
+
+class BackfillHuidigeStatusCommandTests(TestCase):
+    def test_backfill(self):
+        zaak1, zaak2 = ZaakFactory.create_batch(2)
+        StatusFactory.create(
+            zaak=zaak1, datum_status_gezet=make_datetime(2022, 7, 18, 8)
+        )
+        status2 = StatusFactory.create(
+            zaak=zaak1, datum_status_gezet=make_datetime(2022, 7, 18, 10)
+        )
+        # simulate data from before the column was maintained
+        Zaak.objects.update(huidige_status=None)
+
+        stdout = StringIO()
+        call_command("backfill_huidige_status", batch_size=1, stdout=stdout)
+
+        zaak1.refresh_from_db()
+        zaak2.refresh_from_db()
+        self.assertEqual(zaak1.huidige_status, status2)
+        self.assertIsNone(zaak2.huidige_status)
+        self.assertIn("All zaken have the correct current status", stdout.getvalue())
+
+    def test_verify(self):
+        zaak = ZaakFactory.create()
+        StatusFactory.create(zaak=zaak)
+        Zaak.objects.update(huidige_status=None)
+
+        stdout = StringIO()
+        call_command("backfill_huidige_status", verify=True, stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn(
+            f"Zaak {zaak.uuid} does not have the correct current status", output
+        )
+        self.assertIn("There are 1 zaken with an incorrect current status", output)
+        zaak.refresh_from_db()
+        self.assertIsNone(zaak.huidige_status)
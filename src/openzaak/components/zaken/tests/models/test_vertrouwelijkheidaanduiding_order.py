@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.test import TestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from ...models import Zaak
+from ..factories import ZaakFactory
+
+
+class VertrouwelijkheidaanduidingOrderTests(TestCase):
+    def test_order_is_stored(self):
+        zaak = ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        self.assertEqual(zaak._vertrouwelijkheidaanduiding_order, 0)
+
+        zaak.vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.geheim
+        zaak.save()
+
+        zaak.refresh_from_db()
+        self.assertEqual(zaak._vertrouwelijkheidaanduiding_order, 6)
+
+    def test_order_matches_choice_order(self):
+        for value in VertrouwelijkheidsAanduiding.values:
+            with self.subTest(value):
+                zaak = ZaakFactory.create(vertrouwelijkheidaanduiding=value)
+
+                self.assertEqual(
+                    Zaak.objects.values_list(
+                        "_vertrouwelijkheidaanduiding_order", flat=True
+                    ).get(pk=zaak.pk),
+                    VertrouwelijkheidsAanduiding.get_choice_order(value),
+                )
@@ -759,6 +759,28 @@ class AuditTrailTests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response_audittrails.status_code, status.HTTP_200_OK)
 
+    def test_list_audittrails_of_zaak(self):
+        zaak_data = self._create_zaak()
+        self._create_zaak()
+        zaak = Zaak.objects.get(uuid=get_uuid_from_path(zaak_data["url"]))
+
+        response = self.client.get(
+            reverse("audittrail-list", kwargs={"zaak_uuid": zaak.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["hoofd_object"], zaak_data["url"])
+
+    def test_list_audittrails_of_zaak_without_audittrails(self):
+        zaak = ZaakFactory.create()
+
+        response = self.client.get(
+            reverse("audittrail-list", kwargs={"zaak_uuid": zaak.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_audittrail_resource_weergave(self):
         zaak_response = self._create_zaak()
 
@@ -4,7 +4,9 @@
 Guarantee that the proper authorization machinery is in place.
 """
 
+from django.db import connection
 from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import gettext as _
 
 from privates.test import temp_private_root
@@ -14,10 +16,14 @@ from vng_api_common.authorizations.models import Autorisatie
 from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.tests import AuthCheckMixin, get_validation_errors, reverse
 
+from openzaak.components.autorisaties.models import CatalogusAutorisatie
 from openzaak.components.autorisaties.tests.factories import (
     AutorisatieFactory,
     CatalogusAutorisatieFactory,
 )
+from openzaak.components.autorisaties.utils import (
+    send_applicatie_changed_notification,
+)
 from openzaak.components.besluiten.tests.factories import BesluitFactory
 from openzaak.components.catalogi.models import ZaakType
 from openzaak.components.catalogi.tests.factories import (
@@ -880,7 +886,7 @@ class ZaakListPerformanceTests(JWTAuthMixin, APITestCase):
         # queries because of the permission checks
         PERMISSION_CHECK_NUM_QUERIES = 10
         # queries because of the list endpoint itself
-        ENDPOINT_NUM_QUERIES = 13
+        ENDPOINT_NUM_QUERIES = 12
         TOTAL_EXPECTED_QUERIES = (
             BASE_NUM_QUERIES + PERMISSION_CHECK_NUM_QUERIES + ENDPOINT_NUM_QUERIES
         )
@@ -927,6 +933,228 @@ class ZaakListPerformanceTests(JWTAuthMixin, APITestCase):
                 self.assertEqual(response.data["count"], 1)
 
 
+class ZaakListAuthorizationsCacheTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+        ZaakFactory.create(
+            zaaktype=cls.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ZaakFactory.create(
+            zaaktype=cls.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+
+    def test_compiled_authorizations_are_cached(self):
+        url = reverse("zaak-list")
+
+        with CaptureQueriesContext(connection) as first_request:
+            response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.data["count"], 1)
+
+        with CaptureQueriesContext(connection) as second_request:
+            response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.data["count"], 1)
+
+        self.assertLess(len(second_request), len(first_request))
+
+    def test_cache_invalidated_when_autorisatie_changes(self):
+        url = reverse("zaak-list")
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.data["count"], 1)
+
+        self.autorisatie.max_vertrouwelijkheidaanduiding = (
+            VertrouwelijkheidsAanduiding.zeer_geheim
+        )
+        self.autorisatie.save()
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_cache_invalidated_when_zaaktype_is_added_to_catalogus(self):
+        self.applicatie.autorisaties.all().delete()
+        CatalogusAutorisatieFactory.create(
+            catalogus=self.zaaktype.catalogus,
+            applicatie=self.applicatie,
+            component=self.component,
+            scopes=self.scopes,
+            max_vertrouwelijkheidaanduiding=self.max_vertrouwelijkheidaanduiding,
+        )
+        url = reverse("zaak-list")
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.data["count"], 1)
+
+        ZaakFactory.create(
+            zaaktype__catalogus=self.zaaktype.catalogus,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_one_condition_per_confidentiality_level(self):
+        self.applicatie.autorisaties.all().delete()
+        zaaktypen = ZaakTypeFactory.create_batch(3, catalogus=self.zaaktype.catalogus)
+        for zaaktype, max_va in zip(
+            [self.zaaktype, *zaaktypen],
+            [
+                VertrouwelijkheidsAanduiding.openbaar,
+                VertrouwelijkheidsAanduiding.openbaar,
+                VertrouwelijkheidsAanduiding.geheim,
+                VertrouwelijkheidsAanduiding.geheim,
+            ],
+        ):
+            AutorisatieFactory.create(
+                applicatie=self.applicatie,
+                component=self.component,
+                scopes=self.scopes,
+                zaaktype=f"http://testserver{reverse(zaaktype)}",
+                max_vertrouwelijkheidaanduiding=max_va,
+            )
+
+        ZaakFactory.create(
+            zaaktype=zaaktypen[1],
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+
+        queryset = Zaak.objects.filter_for_authorizations(
+            SCOPE_ZAKEN_ALLES_LEZEN,
+            self.applicatie.autorisaties.filter(component=self.component),
+            self.applicatie.catalogusautorisatie_set.none(),
+        )
+
+        self.assertEqual(str(queryset.query).count("= ANY("), 2)
+        # the stored confidentiality order is used
+        self.assertNotIn("CASE", str(queryset.query))
+        self.assertEqual(queryset.count(), 2)
+
+    def test_catalogus_autorisatie_without_zaaktypen(self):
+        self.applicatie.autorisaties.all().delete()
+        CatalogusAutorisatieFactory.create(
+            catalogus=CatalogusFactory.create(),
+            applicatie=self.applicatie,
+            component=self.component,
+            scopes=self.scopes,
+            max_vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+
+        response = self.client.get(reverse("zaak-list"), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+
+
+class ZaakRetrieveAuthorizationsCacheTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+        cls.zaak = ZaakFactory.create(
+            zaaktype=cls.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+    def test_autorisaties_are_cached(self):
+        url = reverse(self.zaak)
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with CaptureQueriesContext(connection) as second_request:
+            response = self.client.get(url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tables = (
+            Autorisatie._meta.db_table,
+            self.applicatie._meta.db_table,
+            CatalogusAutorisatie._meta.db_table,
+        )
+        self.assertFalse(
+            [
+                query["sql"]
+                for query in second_request.captured_queries
+                if any(f'"{table}"' in query["sql"] for table in tables)
+            ]
+        )
+
+    @override_settings(AUTHORIZATIONS_CONTEXT_CACHE_TIMEOUT=0)
+    def test_autorisaties_are_not_cached(self):
+        url = reverse(self.zaak)
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        Autorisatie.objects.filter(pk=self.autorisatie.pk).update(scopes=[])
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_cache_invalidated_when_autorisatie_changes(self):
+        url = reverse(self.zaak)
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.autorisatie.scopes = [SCOPE_ZAKEN_CREATE]
+        self.autorisatie.save()
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_cache_invalidated_when_applicatie_changed_notification_is_sent(self):
+        url = reverse(self.zaak)
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # bypasses the signals
+        Autorisatie.objects.filter(pk=self.autorisatie.pk).update(scopes=[])
+        send_applicatie_changed_notification(self.applicatie)
+
+        response = self.client.get(url, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_cache_invalidated_when_zaaktype_is_added_to_catalogus(self):
+        self.applicatie.autorisaties.all().delete()
+        CatalogusAutorisatieFactory.create(
+            catalogus=self.zaaktype.catalogus,
+            applicatie=self.applicatie,
+            component=self.component,
+            scopes=self.scopes,
+            max_vertrouwelijkheidaanduiding=self.max_vertrouwelijkheidaanduiding,
+        )
+        response = self.client.get(reverse(self.zaak), **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        zaak = ZaakFactory.create(
+            zaaktype__catalogus=self.zaaktype.catalogus,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        response = self.client.get(reverse(zaak), **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_vertrouwelijkheidaanduiding_is_checked(self):
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        response = self.client.get(reverse(self.zaak), **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse(zaak), **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
 class StatusTests(JWTAuthMixin, APITestCase):
     scopes = [SCOPE_ZAKEN_ALLES_LEZEN, SCOPE_ZAKEN_CREATE]
     max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.beperkt_openbaar
@@ -2,8 +2,11 @@
 # Copyright (C) 2025 Dimpact
 
 from datetime import date
+from unittest.mock import patch
 
+from django.db import connection
 from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import gettext as _
 
 import requests_mock
@@ -487,6 +490,32 @@ class HoofdzaakAfsluitingTests(JWTAuthMixin, APITestCase):
             self.zaak.startdatum_bewaartermijn + relativedelta(years=5),
         )
 
+    @override_settings(ENABLE_CLOUD_EVENTS=True)
+    @patch("openzaak.components.zaken.signals.schedule_zaak_gemuteerd")
+    def test_close_hoofdzaak_resets_etag_of_external_deelzaken(
+        self, mock_schedule_zaak_gemuteerd
+    ):
+        deelzaak = ZaakFactory.create(zaaktype=self.ext_zaaktype, hoofdzaak=self.zaak)
+        StatusFactory.create(
+            zaak=deelzaak,
+            statustype=self.ext_statustype2,
+            datum_status_gezet=utcdatetime(2024, 4, 5),
+        )
+        ResultaatFactory.create(zaak=deelzaak, resultaattype=self.ext_resultaattype1)
+        deelzaak.calculate_etag_value()
+        etag = deelzaak._etag
+
+        self._close_hoofdzaak(self.zaak)
+
+        deelzaak.refresh_from_db()
+        self.assertEqual(deelzaak._etag, "")
+        deelzaak.calculate_etag_value()
+        self.assertNotEqual(deelzaak._etag, etag)
+        self.assertIn(
+            deelzaak.pk,
+            [call.args[0].pk for call in mock_schedule_zaak_gemuteerd.call_args_list],
+        )
+
     def test_reopen_deelzaak_with_internal_catalogi(self):
         deelzaak = ZaakFactory.create(zaaktype=self.int_zaaktype, hoofdzaak=self.zaak)
         StatusFactory.create(
@@ -576,11 +605,40 @@ class HoofdzaakAfsluitingTests(JWTAuthMixin, APITestCase):
                 response.data["invalid_params"][0]["code"], "hoofdzaak-closed"
             )
 
-    def _generate_deelzaken(self, n: int, internal=True):
+    def _create_hoofdzaak(self):
+        hoofdzaak = ZaakFactory.create(zaaktype=self.int_zaaktype)
+        StatusFactory.create(
+            zaak=hoofdzaak,
+            statustype=self.int_statustype1,
+            datum_status_gezet=utcdatetime(2024, 4, 4),
+        )
+        ResultaatFactory.create(zaak=hoofdzaak, resultaattype=self.int_resultaattype)
+        return hoofdzaak
+
+    def _close_hoofdzaak(self, hoofdzaak) -> int:
+        """
+        Set the eindstatus of the hoofdzaak and return the number of queries.
+        """
+        OutgoingRequestsLogConfig.clear_cache()
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(
+                self.status_list_url,
+                {
+                    "zaak": reverse(hoofdzaak),
+                    "statustype": f"http://testserver{self.int_statustype2_url}",
+                    "datumStatusGezet": utcdatetime(2024, 4, 5).isoformat(),
+                },
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        return len(context.captured_queries)
+
+    def _generate_deelzaken(self, n: int, internal=True, hoofdzaak=None):
         for i in range(n):
             deelzaak = ZaakFactory.create(
                 zaaktype=self.int_zaaktype if internal else self.ext_zaaktype,
-                hoofdzaak=self.zaak,
+                hoofdzaak=hoofdzaak or self.zaak,
             )
             StatusFactory.create(
                 zaak=deelzaak,
@@ -638,34 +696,6 @@ class HoofdzaakAfsluitingTests(JWTAuthMixin, APITestCase):
             )
             self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-    @tag("external-urls")
-    @override_settings(ALLOWED_HOSTS=["testserver"])
-    def test_queries_with_one_deelzaak_with_external_catalogi(self):
-        """
-        An Deelzaak with an external catalogi has 12 extra queries compared to a deelzaak with an internal catalogi.
-
-        (1) 42: Lookup the current status
-        (2-3) 43-44: select from zgw_consumers_service
-        (4) 57-58: savepoints transaction management
-        (8) 75: lookup the deelzaak resultaat
-        (9-10) 76-77: select from zgw_consumers_service
-        (11) 78: update the deelzaak
-        (12) 84-85: savepoints transaction management
-        (13-17) 85-86 select related zaak data
-        (17) 87-91: archiving recalculation query
-        """
-        self._generate_deelzaken(1, False)
-        with self.assertNumQueries(91):
-            response = self.client.post(
-                self.status_list_url,
-                {
-                    "zaak": self.zaak_url,
-                    "statustype": f"http://testserver{self.int_statustype2_url}",
-                    "datumStatusGezet": utcdatetime(2024, 4, 5).isoformat(),
-                },
-            )
-            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-
     def test_queries_with_many_deelzaken_with_internal_catalogi(self):
         """
         An Deelzaak with an external catalogi has 5 extra queries compared to no deelzaken.
@@ -696,37 +726,76 @@ class HoofdzaakAfsluitingTests(JWTAuthMixin, APITestCase):
     @override_settings(ALLOWED_HOSTS=["testserver"])
     def test_queries_with_many_deelzaken_with_external_catalogi(self):
         """
-        A single deelzaak with external catalogi has 13 extra queries over an internal catalogi.
-        78 + (10*13) = 208
+        The number of queries does not depend on the number of deelzaken with an
+        external catalogi: the resultaten are looked up and the deelzaken are
+        updated with a single query.
         """
-        self._generate_deelzaken(10, False)
-        with self.assertNumQueries(208):
-            response = self.client.post(
-                self.status_list_url,
-                {
-                    "zaak": self.zaak_url,
-                    "statustype": f"http://testserver{self.int_statustype2_url}",
-                    "datumStatusGezet": utcdatetime(2024, 4, 5).isoformat(),
-                },
-            )
-            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        # warm up the caches (services, remote objects)
+        warm_up_hoofdzaak = self._create_hoofdzaak()
+        self._generate_deelzaken(1, False, hoofdzaak=warm_up_hoofdzaak)
+        self._close_hoofdzaak(warm_up_hoofdzaak)
+
+        self._generate_deelzaken(1, False)
+        num_queries = self._close_hoofdzaak(self.zaak)
+
+        hoofdzaak = self._create_hoofdzaak()
+        self._generate_deelzaken(10, False, hoofdzaak=hoofdzaak)
+        self.assertEqual(self._close_hoofdzaak(hoofdzaak), num_queries)
 
     @tag("external-urls")
     @override_settings(ALLOWED_HOSTS=["testserver"])
     def test_queries_with_many_deelzaken(self):
-        self._generate_deelzaken(10, True)
-        self._generate_deelzaken(10, False)
+        warm_up_hoofdzaak = self._create_hoofdzaak()
+        self._generate_deelzaken(1, False, hoofdzaak=warm_up_hoofdzaak)
+        self._close_hoofdzaak(warm_up_hoofdzaak)
 
-        with self.assertNumQueries(208):
-            response = self.client.post(
-                self.status_list_url,
-                {
-                    "zaak": self.zaak_url,
-                    "statustype": f"http://testserver{self.int_statustype2_url}",
-                    "datumStatusGezet": utcdatetime(2024, 4, 5).isoformat(),
-                },
+        self._generate_deelzaken(1, True)
+        self._generate_deelzaken(1, False)
+        num_queries = self._close_hoofdzaak(self.zaak)
+
+        hoofdzaak = self._create_hoofdzaak()
+        self._generate_deelzaken(10, True, hoofdzaak=hoofdzaak)
+        self._generate_deelzaken(10, False, hoofdzaak=hoofdzaak)
+        self.assertEqual(self._close_hoofdzaak(hoofdzaak), num_queries)
+
+    @tag("external-urls")
+    @override_settings(ALLOWED_HOSTS=["testserver"])
+    def test_close_hoofdzaak_with_deelzaken_with_different_external_resultaattypen(
+        self,
+    ):
+        deelzaak1, deelzaak2 = ZaakFactory.create_batch(
+            2, zaaktype=self.ext_zaaktype, hoofdzaak=self.zaak
+        )
+        deelzaak3 = ZaakFactory.create(zaaktype=self.ext_zaaktype, hoofdzaak=self.zaak)
+        for deelzaak in (deelzaak1, deelzaak2, deelzaak3):
+            StatusFactory.create(
+                zaak=deelzaak,
+                statustype=self.ext_statustype2,
+                datum_status_gezet=utcdatetime(2024, 4, 5),
             )
-            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        ResultaatFactory.create(zaak=deelzaak1, resultaattype=self.ext_resultaattype1)
+        ResultaatFactory.create(zaak=deelzaak2, resultaattype=self.ext_resultaattype1)
+        ResultaatFactory.create(zaak=deelzaak3, resultaattype=self.ext_resultaattype2)
+
+        self._close_hoofdzaak(self.zaak)
+
+        self.zaak.refresh_from_db()
+        brondatum = self.zaak.startdatum_bewaartermijn
+        self.assertIsNotNone(brondatum)
+        for deelzaak in (deelzaak1, deelzaak2, deelzaak3):
+            deelzaak.refresh_from_db()
+            self.assertEqual(deelzaak.startdatum_bewaartermijn, brondatum)
+            self.assertEqual(deelzaak.archiefnominatie, Archiefnominatie.vernietigen)
+
+        self.assertEqual(
+            deelzaak1.archiefactiedatum, brondatum + relativedelta(years=10)
+        )
+        self.assertEqual(
+            deelzaak2.archiefactiedatum, brondatum + relativedelta(years=10)
+        )
+        self.assertEqual(
+            deelzaak3.archiefactiedatum, brondatum + relativedelta(years=5)
+        )
 
     @tag("external-urls")
     @override_settings(ALLOWED_HOSTS=["testserver"])
@@ -3,17 +3,21 @@
 
 from datetime import date
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from freezegun.api import freeze_time
 from hypothesis import given, strategies as st
 from hypothesis.extra.django import TestCase as HypothesisTestCase
 
-from openzaak.components.zaken.models import ZaakIdentificatie
+from openzaak.components.zaken.models import (
+    ZaakIdentificatie,
+    ZaakIdentificatieCounter,
+)
 from openzaak.components.zaken.models.identification_classes import (
     CreationYearIdentification,
     StartDatumYearIdentification,
     UWVIdentification,
+    identificatie_pool,
 )
 
 
@@ -229,3 +233,136 @@ class StartDatumYearIdentificationTests(TestCase):
 
         self.assertEqual(iden.identificatie, "ZAAK-2025-0000000001")
         self.assertEqual(iden.bronorganisatie, "111222333")
+
+
+@override_settings(ZAAK_IDENTIFICATIE_BLOCK_SIZE=10)
+class IdentificationBlockLeaseTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        identificatie_pool.clear()
+        self.addCleanup(identificatie_pool.clear)
+
+    def test_generate(self):
+        generator = StartDatumYearIdentification("111222333", date(2025, 1, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first = generator.generate()
+
+        # the rest of the block is handed out without touching the counter, only
+        # checking that the identificatie wasn't created explicitly in the meantime
+        with self.assertNumQueries(2):
+            second = generator.generate()
+
+        self.assertEqual(first.identificatie, "ZAAK-2025-0000000001")
+        self.assertEqual(second.identificatie, "ZAAK-2025-0000000002")
+        self.assertEqual(
+            ZaakIdentificatieCounter.objects.get(
+                sequence="ZAAK-2025"
+            ).last_identificatie,
+            "ZAAK-2025-0000000010",
+        )
+
+    def test_generate_after_restart(self):
+        generator = StartDatumYearIdentification("111222333", date(2025, 1, 1))
+        with self.captureOnCommitCallbacks(execute=True):
+            generator.generate()
+
+        # the unused identificaties of the block are lost
+        identificatie_pool.clear()
+        identificatie = generator.generate()
+
+        self.assertEqual(identificatie.identificatie, "ZAAK-2025-0000000011")
+
+    def test_generate_rolled_back_lease(self):
+        generator = StartDatumYearIdentification("111222333", date(2025, 1, 1))
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            generator.generate()
+
+        # the block is only added to the pool once the lease is committed
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(identificatie_pool.take("ZAAK-2025", 10), [])
+
+    def test_generate_year_rollover(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            StartDatumYearIdentification("111222333", date(2025, 12, 31)).generate()
+        identificatie = StartDatumYearIdentification(
+            "111222333", date(2026, 1, 1)
+        ).generate()
+
+        self.assertEqual(identificatie.identificatie, "ZAAK-2026-0000000001")
+        self.assertEqual(
+            set(ZaakIdentificatieCounter.objects.values_list("sequence", flat=True)),
+            {"ZAAK-2025", "ZAAK-2026"},
+        )
+
+    def test_generate_continues_after_existing_identificaties(self):
+        ZaakIdentificatie.objects.create(
+            identificatie="ZAAK-2025-0000000041", bronorganisatie="111222333"
+        )
+        generator = StartDatumYearIdentification("111222333", date(2025, 1, 1))
+        with self.captureOnCommitCallbacks(execute=True):
+            generator.generate()
+
+        # created explicitly, after the counter was initialized
+        ZaakIdentificatie.objects.create(
+            identificatie="ZAAK-2025-0000000100", bronorganisatie="111222333"
+        )
+        identificatie_pool.clear()
+        identificatie = generator.generate()
+
+        self.assertEqual(identificatie.identificatie, "ZAAK-2025-0000000101")
+
+    def test_generate_skips_explicitly_created_identificaties(self):
+        generator = StartDatumYearIdentification("111222333", date(2025, 1, 1))
+        with self.captureOnCommitCallbacks(execute=True):
+            generator.generate()
+
+        # created explicitly by a client, while it's still in the pool
+        ZaakIdentificatie.objects.create(
+            identificatie="ZAAK-2025-0000000002", bronorganisatie="111222333"
+        )
+        identificatie = generator.generate()
+
+        self.assertEqual(identificatie.identificatie, "ZAAK-2025-0000000003")
+
+    def test_generate_bulk_skips_explicitly_created_identificaties(self):
+        generator = StartDatumYearIdentification("111222333", date(2025, 1, 1))
+        with self.captureOnCommitCallbacks(execute=True):
+            generator.generate()
+
+        ZaakIdentificatie.objects.create(
+            identificatie="ZAAK-2025-0000000010", bronorganisatie="111222333"
+        )
+        identificaties = generator.generate_bulk(9)
+
+        self.assertEqual(
+            [identificatie.identificatie for identificatie in identificaties],
+            [f"ZAAK-2025-{number:010}" for number in [*range(2, 10), 11]],
+        )
+
+    def test_generate_bulk(self):
+        generator = StartDatumYearIdentification("111222333", date(2025, 1, 1))
+        with self.captureOnCommitCallbacks(execute=True):
+            generator.generate()
+
+        identificaties = generator.generate_bulk(12)
+
+        self.assertEqual(
+            [identificatie.identificatie for identificatie in identificaties],
+            [f"ZAAK-2025-{number:010}" for number in range(2, 14)],
+        )
+        self.assertEqual(
+            ZaakIdentificatieCounter.objects.get().last_identificatie,
+            "ZAAK-2025-0000000020",
+        )
+
+    def test_generate_uwv(self):
+        generator = UWVIdentification("111222333")
+        with self.captureOnCommitCallbacks(execute=True):
+            first = generator.generate()
+        second = generator.generate()
+
+        self.assertEqual(first.identificatie, "A00000006")
+        self.assertEqual(second.identificatie, "A00000023")
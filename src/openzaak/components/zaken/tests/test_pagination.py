@@ -6,7 +6,7 @@ from vng_api_common.tests import reverse_lazy
 
 from openzaak.tests.utils import JWTAuthMixin
 
-from .factories import ZaakFactory
+from .factories import StatusFactory, ZaakFactory, ZaakInformatieObjectFactory
 from .utils import ZAAK_READ_KWARGS
 
 
@@ -53,3 +53,161 @@ class ZaakPaginationTests(JWTAuthMixin, APITestCase):
         self.assertEqual(
             data["next"], f"http://testserver{self.list_url}?page=2&pageSize=5"
         )
+
+
+class ZaakCursorPaginationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    list_url = reverse_lazy("zaak-list")
+
+    def test_first_page(self):
+        zaak1, zaak2, zaak3 = ZaakFactory.create_batch(3)
+
+        response = self.client.get(
+            self.list_url, {"cursor": "", "pageSize": 2}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertIsNone(data["count"])
+        self.assertIsNone(data["previous"])
+        self.assertIsNotNone(data["next"])
+        self.assertIn("cursor=", data["next"])
+        self.assertEqual(
+            [zaak["uuid"] for zaak in data["results"]],
+            [str(zaak3.uuid), str(zaak2.uuid)],
+        )
+
+    def test_approximate_count(self):
+        ZaakFactory.create_batch(3)
+
+        response = self.client.get(
+            self.list_url,
+            {"cursor": "", "pageSize": 2, "count": "true"},
+            **ZAAK_READ_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertIsInstance(data["count"], int)
+        self.assertIn("count=true", data["next"])
+
+    def test_walk_forwards_and_backwards(self):
+        zaken = ZaakFactory.create_batch(5)
+        expected = [str(zaak.uuid) for zaak in reversed(zaken)]
+
+        response = self.client.get(
+            self.list_url, {"cursor": "", "pageSize": 2}, **ZAAK_READ_KWARGS
+        )
+        page1 = response.json()
+        response = self.client.get(page1["next"], **ZAAK_READ_KWARGS)
+        page2 = response.json()
+        response = self.client.get(page2["next"], **ZAAK_READ_KWARGS)
+        page3 = response.json()
+
+        self.assertEqual([z["uuid"] for z in page1["results"]], expected[0:2])
+        self.assertEqual([z["uuid"] for z in page2["results"]], expected[2:4])
+        self.assertEqual([z["uuid"] for z in page3["results"]], expected[4:])
+        self.assertIsNone(page3["next"])
+
+        with self.subTest("previous page"):
+            response = self.client.get(page3["previous"], **ZAAK_READ_KWARGS)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            self.assertEqual([z["uuid"] for z in data["results"]], expected[2:4])
+            self.assertIsNotNone(data["next"])
+            self.assertIsNotNone(data["previous"])
+
+        with self.subTest("back to the first page"):
+            response = self.client.get(page2["previous"], **ZAAK_READ_KWARGS)
+
+            data = response.json()
+            self.assertEqual([z["uuid"] for z in data["results"]], expected[0:2])
+            self.assertIsNone(data["previous"])
+
+    def test_cursor_ignores_page_param(self):
+        ZaakFactory.create_batch(3)
+
+        response = self.client.get(
+            self.list_url, {"cursor": "", "page": 2, "pageSize": 2}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertEqual(len(data["results"]), 2)
+        self.assertNotIn("page=", data["next"])
+
+    def test_cursor_with_filters(self):
+        ZaakFactory.create_batch(2, bronorganisatie="517439943")
+        ZaakFactory.create(bronorganisatie="000000000")
+
+        response = self.client.get(
+            self.list_url,
+            {"cursor": "", "pageSize": 1, "bronorganisatie": "517439943"},
+            **ZAAK_READ_KWARGS,
+        )
+        page1 = response.json()
+        response = self.client.get(page1["next"], **ZAAK_READ_KWARGS)
+        page2 = response.json()
+
+        self.assertIn("bronorganisatie=517439943", page1["next"])
+        self.assertEqual(page2["results"][0]["bronorganisatie"], "517439943")
+        self.assertIsNone(page2["next"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(
+            self.list_url, {"cursor": "not-a-cursor"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["invalidParams"][0]["code"], "invalid-cursor")
+
+
+class StatusCursorPaginationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    list_url = reverse_lazy("status-list")
+
+    def test_same_datum_status_gezet(self):
+        # the pk is used as tie-breaker for statussen with the same timestamp
+        zaak = ZaakFactory.create()
+        statussen = StatusFactory.create_batch(
+            3, zaak=zaak, datum_status_gezet="2024-01-01T12:00:00Z"
+        )
+
+        response = self.client.get(self.list_url, {"cursor": "", "pageSize": 2})
+        page1 = response.json()
+        response = self.client.get(page1["next"])
+        page2 = response.json()
+
+        self.assertEqual(
+            [s["uuid"] for s in page1["results"] + page2["results"]],
+            [str(status_.uuid) for status_ in reversed(statussen)],
+        )
+
+
+class ZaakInformatieObjectCursorPaginationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    list_url = reverse_lazy("zaakinformatieobject-list")
+
+    def test_unpaginated_without_cursor(self):
+        ZaakInformatieObjectFactory.create_batch(2)
+
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.json(), list)
+        self.assertEqual(len(response.json()), 2)
+
+    def test_paginated_with_cursor(self):
+        ZaakInformatieObjectFactory.create_batch(3)
+
+        response = self.client.get(self.list_url, {"cursor": "", "pageSize": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertEqual(len(data["results"]), 2)
+        self.assertIsNotNone(data["next"])
@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from datetime import date
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from dateutil.relativedelta import relativedelta
+from vng_api_common.constants import BrondatumArchiefprocedureAfleidingswijze
+
+from openzaak.components.catalogi.models import ResultaatType
+from openzaak.components.catalogi.tests.factories import ResultaatTypeFactory
+
+from ..archiving import get_zaken_to_archive, recalculate_archiving
+from ..models import Zaak
+from ..tasks import recalculate_zaken_archiving
+from .factories import ResultaatFactory, ZaakEigenschapFactory, ZaakFactory
+
+
+class RecalculateArchivingTests(TestCase):
+    def _create_zaak(self, resultaattype, einddatum=date(2024, 1, 1)) -> Zaak:
+        zaak = ZaakFactory.create(closed=True, einddatum=einddatum)
+        ResultaatFactory.create(zaak=zaak, resultaattype=resultaattype)
+        zaak.refresh_from_db()
+        return zaak
+
+    def test_recalculate_after_archiefactietermijn_changed(self):
+        resultaattype = ResultaatTypeFactory.create(
+            archiefactietermijn=relativedelta(years=5),
+            archiefnominatie="blijvend_bewaren",
+            brondatum_archiefprocedure_afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.afgehandeld,
+        )
+        zaak1 = self._create_zaak(resultaattype)
+        zaak2 = self._create_zaak(resultaattype, einddatum=date(2023, 6, 1))
+        zaak3 = self._create_zaak(resultaattype)
+        other_zaak = self._create_zaak(
+            ResultaatTypeFactory.create(
+                archiefactietermijn=relativedelta(years=5),
+                brondatum_archiefprocedure_afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.afgehandeld,
+            )
+        )
+        self.assertEqual(zaak1.archiefactiedatum, date(2029, 1, 1))
+        ResultaatType.objects.filter(pk=resultaattype.pk).update(
+            archiefactietermijn=relativedelta(years=10)
+        )
+        out = StringIO()
+
+        call_command(
+            "recalculate_archiving",
+            resultaattype=str(resultaattype.uuid),
+            batch_size=2,
+            stdout=out,
+        )
+
+        for zaak in (zaak1, zaak2, zaak3, other_zaak):
+            zaak.refresh_from_db()
+        self.assertEqual(zaak1.archiefactiedatum, date(2034, 1, 1))
+        self.assertEqual(zaak2.archiefactiedatum, date(2033, 6, 1))
+        self.assertEqual(zaak3.archiefactiedatum, date(2034, 1, 1))
+        self.assertEqual(zaak1.startdatum_bewaartermijn, date(2024, 1, 1))
+        self.assertEqual(zaak1.archiefnominatie, "blijvend_bewaren")
+        self.assertEqual(zaak1._etag, "")
+        self.assertEqual(other_zaak.archiefactiedatum, date(2029, 1, 1))
+        self.assertIn(f"last primary key: {zaak3.pk}", out.getvalue())
+        self.assertIn("Recalculated 3 zaken, updated 3 zaken.", out.getvalue())
+
+    def test_recalculate_resumes_after_primary_key(self):
+        resultaattype = ResultaatTypeFactory.create(
+            archiefactietermijn=relativedelta(years=5),
+            brondatum_archiefprocedure_afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.afgehandeld,
+        )
+        zaak1 = self._create_zaak(resultaattype)
+        zaak2 = self._create_zaak(resultaattype)
+        ResultaatType.objects.filter(pk=resultaattype.pk).update(
+            archiefactietermijn=relativedelta(years=10)
+        )
+
+        progress = recalculate_archiving(
+            get_zaken_to_archive(), batch_size=10, start_after=zaak1.pk
+        )
+
+        self.assertEqual(progress.processed, 1)
+        self.assertEqual(progress.last_pk, zaak2.pk)
+        zaak1.refresh_from_db()
+        zaak2.refresh_from_db()
+        self.assertEqual(zaak1.archiefactiedatum, date(2029, 1, 1))
+        self.assertEqual(zaak2.archiefactiedatum, date(2034, 1, 1))
+
+    def test_recalculate_with_prefetched_eigenschappen(self):
+        resultaattype = ResultaatTypeFactory.create(
+            archiefactietermijn=relativedelta(years=5),
+            brondatum_archiefprocedure_afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.eigenschap,
+            brondatum_archiefprocedure_datumkenmerk="expiryDate",
+        )
+        zaken = [self._create_zaak(resultaattype) for _ in range(3)]
+        for index, zaak in enumerate(zaken, start=1):
+            ZaakEigenschapFactory.create(
+                zaak=zaak, _naam="expiryDate", waarde=f"2024-02-0{index}T00:00:00Z"
+            )
+            ZaakEigenschapFactory.create(
+                zaak=zaak, _naam="expiryDate", waarde="2025-01-01T00:00:00Z"
+            )
+        Zaak.objects.update(archiefactiedatum=None, startdatum_bewaartermijn=None)
+
+        # resultaat and hoofdzaak are selected, eigenschappen are prefetched
+        with self.assertNumQueries(2 + 1 + 3):
+            progress = recalculate_archiving(
+                get_zaken_to_archive(), batch_size=10, force=True
+            )
+
+        self.assertEqual(progress.updated, 3)
+        self.assertEqual(
+            list(
+                Zaak.objects.order_by("pk").values_list("archiefactiedatum", flat=True)
+            ),
+            [date(2029, 2, 1), date(2029, 2, 2), date(2029, 2, 3)],
+        )
+
+    def test_unchanged_zaken_are_not_updated(self):
+        resultaattype = ResultaatTypeFactory.create(
+            archiefactietermijn=relativedelta(years=5),
+            brondatum_archiefprocedure_afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.afgehandeld,
+        )
+        zaak = self._create_zaak(resultaattype)
+
+        progress = recalculate_archiving(get_zaken_to_archive(), batch_size=10)
+
+        self.assertEqual(progress.processed, 1)
+        self.assertEqual(progress.updated, 0)
+        laatst_gemuteerd = zaak.laatst_gemuteerd
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.laatst_gemuteerd, laatst_gemuteerd)
+
+    @patch.object(recalculate_zaken_archiving, "update_state")
+    def test_task_reports_progress(self, mock_update_state):
+        resultaattype = ResultaatTypeFactory.create(
+            archiefactietermijn=relativedelta(years=5),
+            brondatum_archiefprocedure_afleidingswijze=BrondatumArchiefprocedureAfleidingswijze.afgehandeld,
+        )
+        zaak = self._create_zaak(resultaattype)
+        ResultaatType.objects.filter(pk=resultaattype.pk).update(
+            archiefactietermijn=relativedelta(years=10)
+        )
+
+        result = recalculate_zaken_archiving(resultaattype_uuid=resultaattype.uuid)
+
+        expected = {"processed": 1, "updated": 1, "failed": 0, "last_pk": zaak.pk}
+        self.assertEqual(result, expected)
+        mock_update_state.assert_called_once_with(state="PROGRESS", meta=expected)
+        zaak.refresh_from_db()
+        self.assertEqual(zaak.archiefactiedatum, date(2034, 1, 1))
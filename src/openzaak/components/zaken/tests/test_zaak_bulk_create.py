@@ -0,0 +1,246 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from unittest.mock import patch
+
+from django.test import override_settings, tag
+
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import get_validation_errors, reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.notifications.tests.mixins import NotificationsConfigMixin
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_CREATE
+from ..models import Zaak, ZaakIdentificatie
+from .factories import ZaakFactory
+from .utils import ZAAK_WRITE_KWARGS, get_operation_url
+
+BRONORGANISATIE = "517439943"
+
+
+def get_zaak_data(zaaktype, **overrides) -> dict:
+    return {
+        "zaaktype": f"http://testserver{reverse(zaaktype)}",
+        "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+        "bronorganisatie": BRONORGANISATIE,
+        "verantwoordelijkeOrganisatie": BRONORGANISATIE,
+        "startdatum": "2024-03-01",
+        **overrides,
+    }
+
+
+@freeze_time("2024-03-02")
+class ZaakBulkCreateTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = get_operation_url("zaak__bulk")
+
+    def test_bulk_create(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        ZaakIdentificatie.objects.create(
+            identificatie="reserved-0001", bronorganisatie=BRONORGANISATIE
+        )
+        data = {
+            "zaken": [
+                get_zaak_data(zaaktype, identificatie="reserved-0001"),
+                get_zaak_data(
+                    zaaktype,
+                    kenmerken=[{"kenmerk": "kenmerk", "bron": "bron"}],
+                ),
+                get_zaak_data(zaaktype, identificatie="zaak-0001"),
+                get_zaak_data(zaaktype, startdatum="2023-12-31"),
+            ]
+        }
+
+        response = self.client.post(self.url, data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(
+            [zaak["identificatie"] for zaak in response.json()],
+            [
+                "reserved-0001",
+                "ZAAK-2024-0000000001",
+                "zaak-0001",
+                "ZAAK-2023-0000000001",
+            ],
+        )
+        self.assertEqual(Zaak.objects.count(), 4)
+        self.assertEqual(ZaakIdentificatie.objects.count(), 4)
+
+        zaak = Zaak.objects.get(identificatie="ZAAK-2024-0000000001")
+        self.assertEqual(zaak.zaaktype, zaaktype)
+        self.assertEqual(
+            list(zaak.zaakkenmerk_set.values_list("kenmerk", "bron")),
+            [("kenmerk", "bron")],
+        )
+        self.assertEqual(response.json()[1]["url"], f"http://testserver{reverse(zaak)}")
+        self.assertEqual(
+            response.json()[1]["kenmerken"], [{"kenmerk": "kenmerk", "bron": "bron"}]
+        )
+
+        audittrails = AuditTrail.objects.order_by("pk")
+        self.assertEqual(audittrails.count(), 4)
+        self.assertEqual(
+            [audittrail.hoofd_object for audittrail in audittrails],
+            [zaak["url"] for zaak in response.json()],
+        )
+        self.assertEqual(audittrails[0].actie, "create")
+        self.assertEqual(audittrails[0].resource, "zaak")
+        self.assertEqual(audittrails[0].nieuw, response.json()[0])
+        self.assertEqual(
+            audittrails[0].resource_weergave, f"{BRONORGANISATIE} - reserved-0001"
+        )
+
+    def test_bulk_create_errors_per_zaak(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        data = {
+            "zaken": [
+                get_zaak_data(zaaktype),
+                get_zaak_data(zaaktype, zaaktype="http://testserver/invalid"),
+            ]
+        }
+
+        response = self.client.post(self.url, data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNone(get_validation_errors(response, "zaken.0.zaaktype"))
+        self.assertIsNotNone(get_validation_errors(response, "zaken.1.zaaktype"))
+        self.assertFalse(Zaak.objects.exists())
+        self.assertFalse(ZaakIdentificatie.objects.exists())
+
+    def test_bulk_create_existing_identificatie(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        ZaakFactory.create(identificatie="zaak-0001", bronorganisatie=BRONORGANISATIE)
+        data = {
+            "zaken": [
+                get_zaak_data(zaaktype, identificatie="zaak-0002"),
+                get_zaak_data(zaaktype, identificatie="zaak-0001"),
+            ]
+        }
+
+        response = self.client.post(self.url, data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "zaken.1.identificatie")
+        self.assertEqual(error["code"], "identificatie-niet-uniek")
+        self.assertEqual(Zaak.objects.count(), 1)
+
+    def test_bulk_create_duplicate_identificatie(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        data = {
+            "zaken": [
+                get_zaak_data(zaaktype, identificatie="zaak-0001"),
+                get_zaak_data(zaaktype, identificatie="zaak-0002"),
+                get_zaak_data(zaaktype, identificatie="zaak-0001"),
+            ]
+        }
+
+        response = self.client.post(self.url, data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNone(get_validation_errors(response, "zaken.0.identificatie"))
+        self.assertIsNone(get_validation_errors(response, "zaken.1.identificatie"))
+        error = get_validation_errors(response, "zaken.2.identificatie")
+        self.assertEqual(error["code"], "identificatie-niet-uniek")
+        self.assertFalse(Zaak.objects.exists())
+
+    def test_bulk_create_empty(self):
+        response = self.client.post(self.url, {"zaken": []}, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "zaken.nonFieldErrors")
+        self.assertEqual(error["code"], "empty")
+
+    @override_settings(ZAAK_BULK_CREATE_MAX_SIZE=1)
+    def test_bulk_create_too_many(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        data = {"zaken": [get_zaak_data(zaaktype), get_zaak_data(zaaktype)]}
+
+        response = self.client.post(self.url, data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "zaken.nonFieldErrors")
+        self.assertEqual(error["code"], "max_length")
+        self.assertFalse(Zaak.objects.exists())
+
+
+class ZaakBulkCreateAuthTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_CREATE]
+    component = ComponentTypes.zrc
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    url = get_operation_url("zaak__bulk")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create(concept=False)
+        super().setUpTestData()
+
+    def test_bulk_create_allowed(self):
+        data = {"zaken": [get_zaak_data(self.zaaktype), get_zaak_data(self.zaaktype)]}
+
+        response = self.client.post(self.url, data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(Zaak.objects.count(), 2)
+
+    def test_bulk_create_other_zaaktype_forbidden(self):
+        other_zaaktype = ZaakTypeFactory.create(concept=False)
+        data = {"zaken": [get_zaak_data(self.zaaktype), get_zaak_data(other_zaaktype)]}
+
+        response = self.client.post(self.url, data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Zaak.objects.exists())
+
+    def test_bulk_create_vertrouwelijkheidaanduiding_forbidden(self):
+        data = {
+            "zaken": [
+                get_zaak_data(
+                    self.zaaktype,
+                    vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+                )
+            ]
+        }
+
+        response = self.client.post(self.url, data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Zaak.objects.exists())
+
+
+@tag("notifications")
+@override_settings(NOTIFICATIONS_DISABLED=False, LOG_NOTIFICATIONS_IN_DB=True)
+@patch("notifications_api_common.viewsets.send_notification.delay")
+class ZaakBulkCreateNotificationTests(
+    NotificationsConfigMixin, JWTAuthMixin, APITestCase
+):
+    heeft_alle_autorisaties = True
+    url = get_operation_url("zaak__bulk")
+
+    def test_send_notifications(self, mock_notif):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+        data = {"zaken": [get_zaak_data(zaaktype), get_zaak_data(zaaktype)]}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, data, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(mock_notif.call_count, 2)
+
+        for zaak, (args, _kwargs) in zip(
+            response.json(), mock_notif.call_args_list, strict=True
+        ):
+            message, notification_id = args
+            self.assertEqual(message["kanaal"], "zaken")
+            self.assertEqual(message["hoofdObject"], zaak["url"])
+            self.assertEqual(message["resourceUrl"], zaak["url"])
+            self.assertEqual(message["actie"], "create")
+            self.assertEqual(
+                message["kenmerken"]["zaaktype.catalogus"],
+                f"http://testserver{reverse(zaaktype.catalogus)}",
+            )
+            self.assertIsNotNone(notification_id)
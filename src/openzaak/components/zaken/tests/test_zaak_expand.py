@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2022 Dimpact
 from django.contrib.gis.geos import Point
+from django.db import connection
 from django.test import override_settings, tag
+from django.test.utils import CaptureQueriesContext
 
 import requests_mock
 from rest_framework import status
@@ -282,6 +284,47 @@ class ZakenIncludeTests(JWTAuthMixin, APITestCase):
         ]
         self.assertEqual(data, expected_results)
 
+    def test_zaak_list_include_num_queries(self):
+        """
+        Test that the number of queries doesn't depend on the number of zaken
+        """
+        expand = "zaaktype,status,status.statustype,resultaat,resultaat.resultaattype"
+        resultaattype = ResultaatFactory.create(
+            zaak__zaaktype=self.zaaktype, resultaattype__zaaktype=self.zaaktype
+        ).resultaattype
+
+        def create_zaken(amount: int):
+            for zaak in ZaakFactory.create_batch(amount, zaaktype=self.zaaktype):
+                StatusFactory.create(zaak=zaak, statustype=self.statustype)
+                ResultaatFactory.create(zaak=zaak, resultaattype=resultaattype)
+
+        create_zaken(1)
+        # warm up the caches that are used regardless of the expansion
+        self.client.get(self.url, **ZAAK_READ_KWARGS)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, {"expand": expand}, **ZAAK_READ_KWARGS)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        create_zaken(10)
+        with self.assertNumQueries(len(context)):
+            response = self.client.get(self.url, {"expand": expand}, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()["results"]
+        self.assertEqual(len(data), 12)
+        for zaak_data in data[:11]:
+            with self.subTest(zaak=zaak_data["url"]):
+                self.assertEqual(
+                    zaak_data["_expand"]["status"]["_expand"]["statustype"]["url"],
+                    f"http://testserver{self.statustype_url}",
+                )
+                self.assertEqual(
+                    zaak_data["_expand"]["resultaat"]["_expand"]["resultaattype"][
+                        "url"
+                    ],
+                    f"http://testserver{reverse(resultaattype)}",
+                )
+
     def test_zaak_retrieve_include(self):
         """
         Test for detail view
@@ -0,0 +1,318 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import csv
+import io
+import json
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import override_settings, tag
+
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+from vng_api_common.tests import get_validation_errors, reverse, reverse_lazy
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.export_data.models import (
+    Export,
+    ExportFormatChoices,
+    ExportStatusChoices,
+    ExportTypeChoices,
+)
+from openzaak.export_data.tasks import export_data
+from openzaak.export_data.tests.factories import ExportFactory
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..api.scopes import SCOPE_ZAKEN_ALLES_LEZEN
+from .factories import StatusFactory, ZaakFactory
+from .utils import ZAAK_READ_KWARGS, ZAAK_WRITE_KWARGS
+
+
+@tag("export")
+class ZaakExportTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse_lazy("zaak--export")
+
+    def test_export_ndjson(self):
+        zaak = ZaakFactory.create(identificatie="ZAAK-1")
+        status_ = StatusFactory.create(zaak=zaak)
+        deelzaak = ZaakFactory.create(identificatie="ZAAK-2", hoofdzaak=zaak)
+
+        response = self.client.get(self.url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="zaken.ndjson"'
+        )
+
+        lines = response.getvalue().decode(settings.DEFAULT_CHARSET).splitlines()
+        records = {record["identificatie"]: record for record in map(json.loads, lines)}
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(
+            records["ZAAK-1"],
+            {
+                "url": f"http://testserver{reverse(zaak)}",
+                "uuid": str(zaak.uuid),
+                "identificatie": "ZAAK-1",
+                "bronorganisatie": zaak.bronorganisatie,
+                "omschrijving": "",
+                "zaaktype": f"http://testserver{reverse(zaak.zaaktype)}",
+                "registratiedatum": zaak.registratiedatum.isoformat(),
+                "verantwoordelijkeOrganisatie": zaak.verantwoordelijke_organisatie,
+                "startdatum": zaak.startdatum.isoformat(),
+                "einddatum": None,
+                "einddatumGepland": None,
+                "uiterlijkeEinddatumAfdoening": None,
+                "publicatiedatum": None,
+                "vertrouwelijkheidaanduiding": zaak.vertrouwelijkheidaanduiding,
+                "betalingsindicatie": "",
+                "hoofdzaak": None,
+                "status": f"http://testserver{reverse(status_)}",
+                "archiefnominatie": None,
+                "archiefstatus": "nog_te_archiveren",
+                "archiefactiedatum": None,
+            },
+        )
+        self.assertEqual(
+            records["ZAAK-2"]["hoofdzaak"], f"http://testserver{reverse(zaak)}"
+        )
+        self.assertEqual(records["ZAAK-2"]["uuid"], str(deelzaak.uuid))
+        self.assertIsNone(records["ZAAK-2"]["status"])
+
+    def test_export_csv(self):
+        zaak = ZaakFactory.create(identificatie="ZAAK-1")
+
+        response = self.client.get(self.url, HTTP_ACCEPT="text/csv", **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+
+        content = response.getvalue().decode(settings.DEFAULT_CHARSET)
+        rows = list(csv.DictReader(io.StringIO(content)))
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["url"], f"http://testserver{reverse(zaak)}")
+        self.assertEqual(rows[0]["identificatie"], "ZAAK-1")
+        self.assertEqual(rows[0]["startdatum"], zaak.startdatum.isoformat())
+        # empty values are exported as empty cells
+        self.assertEqual(rows[0]["einddatum"], "")
+
+    def test_export_filters(self):
+        ZaakFactory.create(identificatie="ZAAK-1")
+        ZaakFactory.create(identificatie="ZAAK-2")
+
+        response = self.client.get(
+            self.url, {"identificatie": "ZAAK-2"}, **ZAAK_READ_KWARGS
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        lines = response.getvalue().decode(settings.DEFAULT_CHARSET).splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["identificatie"], "ZAAK-2")
+
+    def test_export_unknown_query_params(self):
+        response = self.client.get(self.url, {"foo": "bar"}, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "unknown-parameters")
+
+    @override_settings(EXPORT_CHUNK_SIZE=2)
+    def test_export_multiple_chunks(self):
+        ZaakFactory.create_batch(5)
+
+        response = self.client.get(self.url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        chunks = list(response.streaming_content)
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(len(b"".join(chunks).splitlines()), 5)
+
+
+@tag("export")
+class ZaakExportAuthTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_ZAKEN_ALLES_LEZEN]
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+    component = ComponentTypes.zrc
+    url = reverse_lazy("zaak--export")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zaaktype = ZaakTypeFactory.create()
+        super().setUpTestData()
+
+    def test_export_only_authorized_zaken(self):
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+        ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.zeer_geheim,
+        )
+
+        response = self.client.get(self.url, **ZAAK_READ_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        lines = response.getvalue().decode(settings.DEFAULT_CHARSET).splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["uuid"], str(zaak.uuid))
+
+    @patch("openzaak.export_data.views.export_data")
+    def test_export_async_only_authorized_zaken(self, export_data_mock):
+        zaak = ZaakFactory.create(
+            zaaktype=self.zaaktype,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        ZaakFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar
+        )
+
+        response = self.client.post(self.url, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        export = Export.objects.get()
+
+        self.assertEqual(
+            export.authorizations,
+            {
+                "local": [
+                    [
+                        self.zaaktype.pk,
+                        VertrouwelijkheidsAanduiding.get_choice_order(
+                            VertrouwelijkheidsAanduiding.openbaar
+                        ),
+                    ]
+                ],
+                "external": [],
+            },
+        )
+
+        # the authorizations of the moment the export was started are used
+        self.autorisatie.delete()
+
+        self.assertEqual(list(export.get_queryset()), [zaak])
+
+
+@tag("export")
+@temp_private_root()
+class ZaakExportAsyncTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+    url = reverse_lazy("zaak--export")
+
+    @patch("openzaak.export_data.views.export_data")
+    def test_create_export(self, export_data_mock):
+        ZaakFactory.create(identificatie="ZAAK-1")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f"{self.url}?identificatie=ZAAK-1",
+                {"formaat": "csv"},
+                **ZAAK_WRITE_KWARGS,
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED, response.data)
+
+        export = Export.objects.get()
+
+        self.assertEqual(export.query_params, {"identificatie": ["ZAAK-1"]})
+        self.assertIsNone(export.authorizations)
+        self.assertEqual(export.export_type, ExportTypeChoices.zaken)
+        self.assertEqual(export.export_format, ExportFormatChoices.csv)
+        self.assertEqual(export.status, ExportStatusChoices.pending)
+        self.assertEqual(export.client_id, self.client_id)
+        self.assertEqual(
+            response.json(),
+            {
+                "status": "pending",
+                "formaat": "csv",
+                "total": 0,
+                "statusUrl": "http://testserver"
+                + reverse("zaken-export:status", kwargs={"uuid": export.uuid}),
+                "downloadUrl": "http://testserver"
+                + reverse("zaken-export:download", kwargs={"uuid": export.uuid}),
+            },
+        )
+        export_data_mock.delay.assert_called_once_with(export.pk)
+
+    def test_create_export_invalid_format(self):
+        response = self.client.post(self.url, {"formaat": "xml"}, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        error = get_validation_errors(response, "formaat")
+        self.assertEqual(error["code"], "invalid_choice")
+        self.assertFalse(Export.objects.exists())
+
+    @patch("openzaak.export_data.views.export_data")
+    def test_status_and_download(self, export_data_mock):
+        zaak = ZaakFactory.create()
+
+        response = self.client.post(self.url, **ZAAK_WRITE_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+        export_data(Export.objects.get().pk)
+
+        response = self.client.get(response.json()["statusUrl"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], "finished")
+        self.assertEqual(response.json()["total"], 1)
+
+        response = self.client.get(response.json()["downloadUrl"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        lines = response.getvalue().decode(settings.DEFAULT_CHARSET).splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])["uuid"], str(zaak.uuid))
+
+    def test_download_unfinished_export(self):
+        export = ExportFactory.create(
+            export_type=ExportTypeChoices.zaken, status=ExportStatusChoices.active
+        )
+
+        response = self.client.get(
+            reverse("zaken-export:download", kwargs={"uuid": export.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_export_of_other_client(self):
+        export = ExportFactory.create(
+            export_type=ExportTypeChoices.zaken,
+            status=ExportStatusChoices.finished,
+            client_id="other-client",
+        )
+
+        for name in ("zaken-export:status", "zaken-export:download"):
+            with self.subTest(name=name):
+                response = self.client.get(reverse(name, kwargs={"uuid": export.uuid}))
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_export_of_other_type(self):
+        export = ExportFactory.create(export_type=ExportTypeChoices.documenten)
+
+        response = self.client.get(
+            reverse("zaken-export:status", kwargs={"uuid": export.uuid})
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
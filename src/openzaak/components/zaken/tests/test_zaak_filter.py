@@ -289,6 +289,26 @@ class ZaakFilterTests(JWTAuthMixin, APITestCase):
             response.json()["results"][0]["url"], f"http://testserver{reverse(zaak)}"
         )
 
+    def test_filter_zoekterm(self):
+        zaak1 = ZaakFactory.create(omschrijving="Melding overlast")
+        zaak2 = ZaakFactory.create(omschrijving="Overlast door overlast van bouwwerk")
+        ZaakFactory.create(omschrijving="Aanvraag vergunning")
+
+        response = self.client.get(
+            self.url,
+            {"zoekterm": "overlast"},
+            **ZAAK_WRITE_KWARGS,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            [result["url"] for result in response.json()["results"]],
+            [
+                f"http://testserver{reverse(zaak2)}",
+                f"http://testserver{reverse(zaak1)}",
+            ],
+        )
+
     def test_filter_zaaktype_omschrijving(self):
         zaak = ZaakFactory.create(zaaktype__zaaktype_omschrijving="Old case type")
         ZaakFactory.create(zaaktype__zaaktype_omschrijving="New case type")
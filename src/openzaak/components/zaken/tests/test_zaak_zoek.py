@@ -113,6 +113,27 @@ class ZaakZoekTests(JWTAuthMixin, TypeCheckMixin, APITestCase):
         self.assertEqual(data[0]["url"], f"http://testserver{reverse(zaak1)}")
         self.assertEqual(data[1]["url"], f"http://testserver{reverse(zaak2)}")
 
+    def test_zoek_url_in(self):
+        zaak1, zaak2, zaak3 = ZaakFactory.create_batch(3)
+        url = get_operation_url("zaak__zoek")
+        data = {
+            "url__in": [
+                f"http://testserver{reverse(zaak1)}",
+                f"http://testserver{reverse(zaak2)}",
+            ]
+        }
+
+        response = self.client.post(url, data, **POST_KWARGS)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()["results"]
+        data = sorted(data, key=lambda zaak: zaak["identificatie"])
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(zaak1)}")
+        self.assertEqual(data[1]["url"], f"http://testserver{reverse(zaak2)}")
+
     def test_zoek_without_params(self):
         url = get_operation_url("zaak__zoek")
 
@@ -106,6 +106,34 @@ class ZaakInformatieObjectAPITests(JWTAuthMixin, APITestCase):
 
         self.assertEqual(response.json(), expected_response)
 
+    def test_create_for_informatieobject_with_multiple_versions(self):
+        zaak = ZaakFactory.create()
+        io = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype__concept=False
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=io.canonical,
+            uuid=io.uuid,
+            informatieobjecttype=io.informatieobjecttype,
+            versie=2,
+        )
+        ZaakTypeInformatieObjectTypeFactory.create(
+            informatieobjecttype=io.informatieobjecttype, zaaktype=zaak.zaaktype
+        )
+
+        response = self.client.post(
+            self.list_url,
+            {
+                "informatieobject": f"http://testserver{reverse(io)}",
+                "zaak": f"http://testserver{reverse(zaak)}",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(
+            ZaakInformatieObject.objects.get()._informatieobject, io.canonical
+        )
+
     def test_create_invalid_informatieobject(self):
         zaak = ZaakFactory.create()
         zaak_url = reverse(zaak)
@@ -1795,7 +1795,7 @@ class ZaakListPerformanceTests(JWTAuthMixin, APITestCase):
         # queries not directly involved with this endpoint in particular
         BASE_NUM_QUERIES = 3
         # queries because of the list endpoint itself
-        ENDPOINT_NUM_QUERIES = 13
+        ENDPOINT_NUM_QUERIES = 12
         TOTAL_EXPECTED_QUERIES = BASE_NUM_QUERIES + ENDPOINT_NUM_QUERIES
 
         zaaktype = ZaakTypeFactory.create()
@@ -17,6 +17,9 @@ os.environ.setdefault("ENVIRONMENT", "CI")
 os.environ.setdefault("SENDFILE_BACKEND", "django_sendfile.backends.simple")
 os.environ.setdefault("OTEL_SDK_DISABLED", "true")
 os.environ.setdefault("OTEL_SERVICE_NAME", "openzaak-ci")
+# cached responses outlive the (rolled back) test data, tests enable them explicitly
+os.environ.setdefault("LOOSE_FK_CACHE_TIMEOUT", "0")
+os.environ.setdefault("CATALOGI_RESPONSE_CACHE_TIMEOUT", "0")
 
 # S3 Storage
 os.environ.setdefault("S3_USE_SSL", "no")
@@ -45,6 +48,10 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "import_requests",
     },
+    "autorisaties": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "autorisaties",
+    },
 }
 
 LOGGING = LOGGING_SETTINGS  # Minimally required logging is nice
@@ -95,6 +95,10 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": "import_requests",
     },
+    "autorisaties": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "autorisaties",
+    },
 }
 
 REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] += (
@@ -16,9 +16,10 @@ REST_FRAMEWORK["EXCEPTION_HANDLER"] = (
     "vng_api_common.exception_handling.exception_handler"
 )
 
-REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = REST_FRAMEWORK[
-    "DEFAULT_RENDERER_CLASSES"
-] + ("openzaak.utils.renderers.ProblemJSONRenderer",)
+REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+    "openzaak.utils.renderers.CamelCaseJSONRenderer",
+    "openzaak.utils.renderers.ProblemJSONRenderer",
+)
 
 REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"] = "openzaak.utils.schema.AutoSchema"
 
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2022 Dimpact
+import json
 import os
 
 import sentry_sdk
@@ -13,7 +14,10 @@ from open_api_framework.conf.base import *  # noqa
 from open_api_framework.conf.utils import get_sentry_integrations
 from maykin_common.config import config, DocumentationParams
 
-from openzaak.components.documenten.constants import DocumentenBackendTypes
+from openzaak.components.documenten.constants import (
+    DocumentenBackendTypes,
+    DocumentenDownloadModes,
+)
 from openzaak.utils.monitoring import filter_sensitive_data
 
 from maykin_common.health_checks import default_health_check_apps
@@ -113,6 +117,7 @@ INSTALLED_APPS = (
         # Project applications.
         "openzaak.accounts",
         "openzaak.import_data",
+        "openzaak.export_data",
         "openzaak.utils",
         "openzaak.components.autorisaties",
         "openzaak.components.zaken",
@@ -132,6 +137,8 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "sessionprofile.middleware.SessionProfileMiddleware",
     "openzaak.utils.middleware.LogHeadersMiddleware",
+    "openzaak.utils.middleware.RemoteFetchMiddleware",
+    "openzaak.utils.middleware.RequestMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     # 'django.middleware.locale.LocaleMiddleware',
     "openzaak.utils.cloudevents.CloudEventSchedulingMiddleware",
@@ -234,6 +241,20 @@ DOCUMENTEN_UPLOAD_READ_CHUNK = config(
         auto_display_default=False,
     ),
 )  # 6 MB default
+DOCUMENTEN_NATIVE_MULTIPART_UPLOAD = config(
+    "DOCUMENTEN_NATIVE_MULTIPART_UPLOAD",
+    default=False,
+    documentation=DocumentationParams(
+        help_text=(
+            "upload the chunks of large file uploads directly to the S3 or Azure Blob "
+            "Storage backend, as a native multipart upload (S3) or as staged blocks "
+            "(Azure). Completing the upload then commits the chunks as the file, "
+            "instead of merging them and uploading the file again. For S3, this "
+            "requires a ``DOCUMENTEN_UPLOAD_CHUNK_SIZE`` of at least 5 MiB. Has no "
+            "effect for the filesystem backend."
+        )
+    ),
+)
 DOCUMENTEN_UPLOAD_DEFAULT_EXTENSION = "bin"
 # Change the User-Agent value for the outgoing requests
 USER_AGENT = "Open Zaak"
@@ -317,6 +338,40 @@ LOOSE_FK_LOCAL_BASE_URLS = config(
     ),
 )
 
+LOOSE_FK_CACHE_TIMEOUT = config(
+    "LOOSE_FK_CACHE_TIMEOUT",
+    default=60,
+    documentation=DocumentationParams(
+        help_text=(
+            "Default time in seconds that external API objects (e.g. zaaktypen in an "
+            "external Catalogi API) are cached, if the external API doesn't specify "
+            "a ``max-age`` in the ``Cache-Control`` header. Cached objects with an "
+            "``ETag`` are revalidated with a conditional request once they expire. "
+            "Set to ``0`` to disable caching."
+        )
+    ),
+)
+LOOSE_FK_MAX_WORKERS = config(
+    "LOOSE_FK_MAX_WORKERS",
+    default=8,
+    documentation=DocumentationParams(
+        help_text=(
+            "Maximum number of external API objects that are fetched concurrently "
+            "while handling a single request, e.g. when expanding a list of zaken."
+        )
+    ),
+)
+LOOSE_FK_POOL_SIZE = config(
+    "LOOSE_FK_POOL_SIZE",
+    default=10,
+    documentation=DocumentationParams(
+        help_text=(
+            "Number of connections per host that are kept open to fetch external "
+            "API objects."
+        )
+    ),
+)
+
 #
 # MAYKIN-2FA
 #
@@ -379,6 +434,14 @@ CELERY_BEAT_SCHEDULE = {
         "task": "openzaak.import_data.tasks.remove_imports",
         "schedule": crontab(hour="9"),
     },
+    "daily-remove-exports": {
+        "task": "openzaak.export_data.tasks.remove_exports",
+        "schedule": crontab(hour="9"),
+    },
+    "publish-cloudevents-outbox": {
+        "task": "openzaak.notifications.tasks.publish_cloudevents",
+        "schedule": crontab(minute="*"),
+    },
 }
 CELERY_RESULT_EXPIRES = config(
     "CELERY_RESULT_EXPIRES",
@@ -509,6 +572,58 @@ ZAAK_IDENTIFICATIE_GENERATOR = config(
     ),
 )
 
+ZAAK_IDENTIFICATIE_BLOCK_SIZE = config(
+    "ZAAK_IDENTIFICATIE_BLOCK_SIZE",
+    default=1,
+    documentation=DocumentationParams(
+        help_text=(
+            "The number of **Zaak.identificatie** values a worker process reserves at "
+            "once. With the default of ``1``, the generation of every identificatie "
+            "is locked for all processes. With a larger value, the processes lease "
+            "blocks of identificaties and hand them out without locking, which "
+            "allows creating zaken concurrently. The identificaties are then no "
+            "longer handed out in chronological order and the unused identificaties "
+            "of a block are skipped when a process stops."
+        )
+    ),
+)
+
+ZAAK_BULK_CREATE_MAX_SIZE = config(
+    "ZAAK_BULK_CREATE_MAX_SIZE",
+    default=500,
+    documentation=DocumentationParams(
+        help_text=(
+            "The maximum number of zaken that can be created with a single "
+            "request to the (experimental) ``POST /zaken/_bulk`` endpoint."
+        )
+    ),
+)
+
+STREAM_LIST_RESPONSES = config(
+    "STREAM_LIST_RESPONSES",
+    default=False,
+    documentation=DocumentationParams(
+        help_text=(
+            "Stream the results of the zaken and enkelvoudiginformatieobjecten "
+            "list and ``_zoek`` endpoints to the client in chunks, rather than "
+            "rendering the complete page in memory first. Responses with "
+            "``expand`` are never streamed."
+        )
+    ),
+)
+
+ARCHIVING_RECALCULATION_BATCH_SIZE = config(
+    "ARCHIVING_RECALCULATION_BATCH_SIZE",
+    default=500,
+    documentation=DocumentationParams(
+        help_text=(
+            "The number of zaken of which the archiving data is recalculated and "
+            "saved at once by the ``recalculate_archiving`` management command and "
+            "background task."
+        )
+    ),
+)
+
 STORE_FAILED_NOTIFS = True
 # silence using upper case in enums
 SILENCED_SYSTEM_CHECKS = SILENCED_SYSTEM_CHECKS + ["vng_api_common.enums.W001"]
@@ -552,6 +667,111 @@ TIME_LEEWAY = config(
     ),
 )
 
+AUTHORIZATIONS_CONTEXT_CACHE_TIMEOUT = config(
+    "AUTHORIZATIONS_CONTEXT_CACHE_TIMEOUT",
+    default=60,
+    documentation=DocumentationParams(
+        help_text=(
+            "Time in seconds the applicaties and autorisaties of a client are cached, "
+            "both in the process and in the shared cache. The cache is invalidated "
+            "when applicaties, autorisaties or catalogus types change. Set to ``0`` "
+            "to disable caching."
+        )
+    ),
+)
+
+AUTHORIZATIONS_CONTEXT_CACHE_MAX_ENTRIES = config(
+    "AUTHORIZATIONS_CONTEXT_CACHE_MAX_ENTRIES",
+    default=1000,
+    documentation=DocumentationParams(
+        help_text=(
+            "The maximum number of clients of which the applicaties and autorisaties "
+            "are cached in every process."
+        )
+    ),
+)
+
+CACHES["autorisaties"] = {
+    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    "LOCATION": "autorisaties",
+    "OPTIONS": {"MAX_ENTRIES": AUTHORIZATIONS_CONTEXT_CACHE_MAX_ENTRIES},
+}
+
+AUTHORIZATIONS_FILTER_CACHE_TIMEOUT = config(
+    "AUTHORIZATIONS_FILTER_CACHE_TIMEOUT",
+    default=300,
+    documentation=DocumentationParams(
+        help_text=(
+            "Time in seconds the allowed types derived from the autorisaties of an "
+            "application are cached when filtering list endpoints. The cache is "
+            "invalidated when autorisaties or catalogus types change. Set to ``0`` "
+            "to disable caching."
+        )
+    ),
+)
+
+CATALOGI_RESPONSE_CACHE_TIMEOUT = config(
+    "CATALOGI_RESPONSE_CACHE_TIMEOUT",
+    default=300,
+    documentation=DocumentationParams(
+        help_text=(
+            "Time in seconds the responses for published zaaktypen, "
+            "informatieobjecttypen, besluittypen, statustypen, roltypen and "
+            "resultaattypen are cached. The cache is invalidated when catalogi data "
+            "changes. Set to ``0`` to disable caching."
+        )
+    ),
+)
+
+API_METRICS_SAMPLE_RATE = config(
+    "API_METRICS_SAMPLE_RATE",
+    default=0.0,
+    cast=float,
+    documentation=DocumentationParams(
+        help_text=(
+            "Fraction (between ``0`` and ``1``) of the API requests for which the "
+            "number of SQL queries, the database time, the number of remote "
+            "fetches and the serializer time are recorded as OpenTelemetry metrics. "
+            "Defaults to ``0``, which disables recording these metrics."
+        )
+    ),
+)
+
+API_METRICS_QUERY_BUDGET = config(
+    "API_METRICS_QUERY_BUDGET",
+    default=50,
+    documentation=DocumentationParams(
+        help_text=(
+            "Maximum number of SQL queries for a sampled API request. A warning is "
+            "logged for requests exceeding this budget. Set to ``0`` to disable."
+        )
+    ),
+)
+
+API_METRICS_DURATION_BUDGET = config(
+    "API_METRICS_DURATION_BUDGET",
+    default=1000,
+    documentation=DocumentationParams(
+        help_text=(
+            "Maximum duration in milliseconds of a sampled API request. A warning is "
+            "logged for requests exceeding this budget. Set to ``0`` to disable."
+        )
+    ),
+)
+
+API_METRICS_ENDPOINT_BUDGETS = config(
+    "API_METRICS_ENDPOINT_BUDGETS",
+    default="{}",
+    cast=json.loads,
+    documentation=DocumentationParams(
+        help_text=(
+            "JSON object with budgets per endpoint, overriding "
+            "``API_METRICS_QUERY_BUDGET`` and ``API_METRICS_DURATION_BUDGET``, e.g. "
+            '``{"zaak.list": {"queries": 20, "duration": 500}}``.'
+        )
+    ),
+)
+
 ZAAK_EIGENSCHAP_WAARDE_VALIDATION = config(
     "ZAAK_EIGENSCHAP_WAARDE_VALIDATION",
     default=False,
@@ -612,6 +832,54 @@ IMPORT_DOCUMENTEN_BATCH_SIZE = config(
         group="Documenten import",
     ),
 )
+IMPORT_DOCUMENTEN_CHUNK_SIZE = config(
+    "IMPORT_DOCUMENTEN_CHUNK_SIZE",
+    default=10_000,
+    documentation=DocumentationParams(
+        help_text=(
+            "is the number of rows of the import metadata file that are processed by "
+            "a single background task. The chunks of an import are processed in "
+            "parallel by the available Celery workers."
+        ),
+        group="Documenten import",
+    ),
+)
+IMPORT_DOCUMENTEN_COPY_WORKERS = config(
+    "IMPORT_DOCUMENTEN_COPY_WORKERS",
+    default=4,
+    documentation=DocumentationParams(
+        help_text=(
+            "is the number of threads a background task uses to copy the files of "
+            "a batch to the storage backend."
+        ),
+        group="Documenten import",
+    ),
+)
+
+# Export settings
+EXPORT_RETENTION_DAYS = config(
+    "EXPORT_RETENTION_DAYS",
+    default=7,
+    documentation=DocumentationParams(
+        help_text=(
+            "an integer which specifies the number of days after which finished "
+            "``Export`` instances and their files will be deleted."
+        ),
+        group="Export",
+    ),
+)
+EXPORT_CHUNK_SIZE = config(
+    "EXPORT_CHUNK_SIZE",
+    default=2000,
+    documentation=DocumentationParams(
+        help_text=(
+            "is the number of records that are fetched from the database and "
+            "written at a time by the (experimental) ``_export`` endpoints of the "
+            "zaken and enkelvoudiginformatieobjecten."
+        ),
+        group="Export",
+    ),
+)
 
 NOTIFICATIONS_API_GET_DOMAIN = "openzaak.utils.get_openzaak_domain"
 
@@ -624,6 +892,39 @@ ENABLE_CLOUD_EVENTS = config(
     ),
 )
 
+CLOUD_EVENTS_OUTBOX = config(
+    "CLOUD_EVENTS_OUTBOX",
+    default=False,
+    documentation=DocumentationParams(
+        help_text=(
+            "**EXPERIMENTAL**: indicates whether cloud events are stored in an outbox "
+            "table in the same transaction as the change they describe, and "
+            "published by a background task. Without the outbox the cloud events "
+            "are lost if the process stops right after the change is committed."
+        )
+    ),
+)
+
+CLOUD_EVENTS_OUTBOX_BATCH_SIZE = config(
+    "CLOUD_EVENTS_OUTBOX_BATCH_SIZE",
+    default=100,
+    documentation=DocumentationParams(
+        help_text="is the number of cloud events published from the outbox per batch."
+    ),
+)
+
+CLOUD_EVENTS_OUTBOX_LEASE_DURATION = config(
+    "CLOUD_EVENTS_OUTBOX_LEASE_DURATION",
+    default=300,
+    documentation=DocumentationParams(
+        help_text=(
+            "is the number of seconds a worker reserves a batch of cloud events "
+            "from the outbox for publishing. If the worker stops, the events are "
+            "published by another worker after this duration."
+        )
+    ),
+)
+
 NOTIFICATIONS_SOURCE = config(
     "NOTIFICATIONS_SOURCE",
     default="",
@@ -648,6 +949,29 @@ NOTIFICATION_NUMBER_OF_DAYS_RETAINED = config(
     ),
 )
 
+NOTIFICATIONS_BATCH_DELIVERY = config(
+    "NOTIFICATIONS_BATCH_DELIVERY",
+    default=False,
+    documentation=DocumentationParams(
+        help_text=(
+            "indicates whether the notifications of a transaction are collected and "
+            "sent in batches per kanaal, by a single background task per batch, "
+            "instead of by a background task per notification."
+        )
+    ),
+)
+
+NOTIFICATIONS_BATCH_SIZE = config(
+    "NOTIFICATIONS_BATCH_SIZE",
+    default=100,
+    documentation=DocumentationParams(
+        help_text=(
+            "is the maximum number of notifications sent by a single background "
+            "task if ``NOTIFICATIONS_BATCH_DELIVERY`` is enabled."
+        )
+    ),
+)
+
 
 #
 # SECURITY settings
@@ -677,6 +1001,36 @@ DOCUMENTEN_API_BACKEND = config(
     ),
 )
 
+DOCUMENTEN_API_DOWNLOAD_MODE = config(
+    "DOCUMENTEN_API_DOWNLOAD_MODE",
+    default=DocumentenDownloadModes.proxy,
+    documentation=DocumentationParams(
+        help_text=(
+            "How the contents of documents are downloaded when the ``azure_blob_storage`` "
+            "or ``s3_storage`` backend is used. ``proxy`` streams the file through Open "
+            "Zaak (supporting ``Range`` requests), ``redirect`` redirects the client to a "
+            "short-lived presigned URL and ``offload`` lets the reverse proxy fetch the "
+            "presigned URL via the ``X-Accel-Redirect`` header (see "
+            "``DOCUMENTEN_API_DOWNLOAD_OFFLOAD_LOCATION``). "
+            f"Possible options: {', '.join(f'``{v}``' for v in DocumentenDownloadModes.values)}"
+        ),
+        group="Documenten API",
+    ),
+)
+DOCUMENTEN_API_DOWNLOAD_OFFLOAD_LOCATION = config(
+    "DOCUMENTEN_API_DOWNLOAD_OFFLOAD_LOCATION",
+    default="/_documenten_download/",
+    documentation=DocumentationParams(
+        help_text=(
+            "Internal location of the reverse proxy that proxies presigned URLs, if "
+            "``DOCUMENTEN_API_DOWNLOAD_MODE`` is ``offload``. The scheme, host and path "
+            "of the presigned URL are appended, e.g. "
+            "``/_documenten_download/https/bucket.example.com/path/to/file?signature``."
+        ),
+        group="Documenten API",
+    ),
+)
+
 #
 # DOCUMENTEN API AZURE BLOB STORAGE INTEGRATION
 #
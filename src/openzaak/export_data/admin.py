@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.contrib import admin
+
+from privates.admin import PrivateMediaMixin
+
+from openzaak.export_data.models import Export
+
+
+@admin.register(Export)
+class ExportAdmin(PrivateMediaMixin, admin.ModelAdmin):
+    model = Export
+
+    list_display = (
+        "uuid",
+        "status",
+        "export_type",
+        "export_format",
+        "client_id",
+        "started_on",
+        "finished_on",
+    )
+
+    list_filter = (
+        "status",
+        "export_type",
+        "export_format",
+    )
+
+    readonly_fields = ("query_params", "authorizations")
+
+    ordering = ("-created_on", "-finished_on")
@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Flat exports of the records of a resource.
+
+The value of every column of an export is computed by the database, including the
+URLs of the resource and its relations. The records are read with a server-side
+cursor and written as they come in, without model instances or serializers, so
+the memory usage doesn't depend on the size of the export.
+"""
+
+import csv
+import json
+import uuid
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Iterable, Iterator
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models.functions import Cast, Coalesce, Concat
+from django.http import HttpRequest, QueryDict
+from django.urls import reverse
+
+from vng_api_common.filtersets import FilterSet
+
+from openzaak.utils import build_absolute_url
+from openzaak.utils.query import CompiledAuthorizations
+
+from .models import ExportFormatChoices
+
+_encoder = DjangoJSONEncoder()
+
+
+def _to_csv_value(value):
+    if value is None or isinstance(value, str):
+        return value
+    # same representation as in the NDJSON export
+    if isinstance(value, (bool, int, float)):
+        return json.dumps(value)
+    return _encoder.default(value)
+
+
+class _Echo:
+    """
+    File-like object that returns the written value, to stream a CSV writer.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def render_csv(columns: list[str], rows: Iterable[tuple]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow([_to_csv_value(value) for value in row])
+
+
+def render_ndjson(columns: list[str], rows: Iterable[tuple]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(dict(zip(columns, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+RENDERERS = {
+    ExportFormatChoices.csv: render_csv,
+    ExportFormatChoices.ndjson: render_ndjson,
+}
+
+
+class Exporter(ABC):
+    model: type[models.Model]
+    filterset_class: type[FilterSet]
+
+    def __init__(self, request: HttpRequest | None = None):
+        self.request = request
+        self.columns = self.get_columns()
+        self.count = 0
+
+    @abstractmethod
+    def get_columns(self) -> dict[str, str | models.Expression]:
+        """
+        Return the field lookup or expression of every column of the export.
+        """
+        ...
+
+    def get_base_queryset(self) -> models.QuerySet:
+        return self.model._default_manager.all()
+
+    def get_queryset(
+        self,
+        query_params: QueryDict,
+        authorizations: CompiledAuthorizations | None = None,
+    ) -> models.QuerySet:
+        """
+        Rebuild the queryset of an export that was started in the background.
+
+        The query parameters were already validated when the export was started, see
+        :class:`openzaak.export_data.views.ExportMixin`.
+        """
+        queryset = self.get_base_queryset()
+        if authorizations is not None:
+            queryset = queryset.filter_for_compiled_authorizations(authorizations)
+
+        filterset = self.filterset_class(
+            data=query_params, queryset=queryset, request=self.request
+        )
+        if not filterset.is_valid():
+            raise ValueError(f"Invalid query parameters: {filterset.errors.as_json()}")
+        return filterset.qs
+
+    def get_url_expression(
+        self, view_name: str, uuid_field: str = "uuid"
+    ) -> models.Expression:
+        """
+        Build the URL of a local resource from its UUID.
+
+        The URL is only reversed once, for a placeholder UUID.
+        """
+        placeholder = str(uuid.UUID(int=0))
+        path = reverse(
+            view_name,
+            kwargs={
+                "version": settings.REST_FRAMEWORK["DEFAULT_VERSION"],
+                "uuid": placeholder,
+            },
+        )
+        prefix = build_absolute_url(path, request=self.request).removesuffix(
+            placeholder
+        )
+        return models.Case(
+            models.When(
+                **{f"{uuid_field}__isnull": False},
+                then=Concat(
+                    models.Value(prefix),
+                    Cast(uuid_field, models.TextField()),
+                    output_field=models.TextField(),
+                ),
+            ),
+            output_field=models.TextField(),
+        )
+
+    def get_fk_or_url_expression(
+        self, view_name: str, field_name: str
+    ) -> models.Expression:
+        """
+        Build the URL of a relation to either a local resource or a resource in
+        another API, see :class:`openzaak.utils.fields.FkOrServiceUrlField`.
+        """
+        relative_url = f"_{field_name}_relative_url"
+        return Coalesce(
+            self.get_url_expression(view_name, f"_{field_name}__uuid"),
+            models.Case(
+                models.When(
+                    **{f"{relative_url}__isnull": False},
+                    then=Concat(
+                        f"_{field_name}_base_url__api_root",
+                        relative_url,
+                        output_field=models.TextField(),
+                    ),
+                ),
+                output_field=models.TextField(),
+            ),
+        )
+
+    def get_rows(self, queryset: models.QuerySet) -> Iterator[tuple]:
+        if not queryset.query.order_by:
+            # a stable order, without sorting on any of the exported columns
+            queryset = queryset.order_by("pk")
+
+        rows = (
+            queryset.prefetch_related(None)
+            .values_list(*self.columns.values())
+            .iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+        )
+        for row in rows:
+            self.count += 1
+            yield row
+
+    def render(self, queryset: models.QuerySet, export_format: str) -> Iterator[bytes]:
+        """
+        Render the records of the queryset in chunks of ``EXPORT_CHUNK_SIZE`` lines.
+        """
+        lines = RENDERERS[export_format](list(self.columns), self.get_rows(queryset))
+        while chunk := "".join(islice(lines, settings.EXPORT_CHUNK_SIZE)):
+            yield chunk.encode("utf-8")
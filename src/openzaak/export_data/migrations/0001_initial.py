@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.17 on 2026-10-17 10:12
+
+import uuid
+
+from django.db import migrations, models
+
+import privates.fields
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Export",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("uuid", models.UUIDField(default=uuid.uuid4, unique=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Openstaand"),
+                            ("active", "Actief"),
+                            ("finished", "Voltooid"),
+                            ("error", "Onderbroken"),
+                        ],
+                        default="pending",
+                        max_length=30,
+                    ),
+                ),
+                (
+                    "export_type",
+                    models.CharField(
+                        choices=[
+                            ("zaken", "Zaken"),
+                            ("documenten", "Enkelvoudige informatie objecten"),
+                        ],
+                        max_length=30,
+                        verbose_name="Type export",
+                    ),
+                ),
+                (
+                    "export_format",
+                    models.CharField(
+                        choices=[("ndjson", "NDJSON"), ("csv", "CSV")],
+                        max_length=30,
+                        verbose_name="Formaat",
+                    ),
+                ),
+                (
+                    "client_id",
+                    models.CharField(
+                        blank=True,
+                        help_text="De client ID van de applicatie die de export heeft gestart.",
+                        max_length=255,
+                        verbose_name="Client ID",
+                    ),
+                ),
+                (
+                    "query",
+                    models.BinaryField(
+                        help_text="De (gepickelde) query van de te exporteren gegevens, inclusief de filters en autorisaties van het moment waarop de export is gestart.",
+                        verbose_name="Query",
+                    ),
+                ),
+                (
+                    "export_file",
+                    privates.fields.PrivateMediaFileField(
+                        blank=True,
+                        null=True,
+                        upload_to="export/",
+                        verbose_name="Export bestand",
+                    ),
+                ),
+                ("comment", models.TextField(blank=True, verbose_name="Opmerking")),
+                (
+                    "created_on",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Aangemaakt op"
+                    ),
+                ),
+                (
+                    "started_on",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Gestart op"
+                    ),
+                ),
+                (
+                    "finished_on",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Voltooid op"
+                    ),
+                ),
+                (
+                    "total",
+                    models.PositiveIntegerField(default=0, verbose_name="Totaal"),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("export_data", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="export",
+            name="query",
+        ),
+        migrations.AddField(
+            model_name="export",
+            name="query_params",
+            field=models.JSONField(
+                default=dict,
+                help_text="De (gevalideerde) filters van de te exporteren gegevens.",
+                verbose_name="Query parameters",
+            ),
+        ),
+        migrations.AddField(
+            model_name="export",
+            name="authorizations",
+            field=models.JSONField(
+                blank=True,
+                help_text="De typen waartoe de client geautoriseerd was op het moment waarop de export is gestart, met hun maximale vertrouwelijkheidaanduiding. Leeg als de gegevens niet op autorisaties gefilterd worden.",
+                null=True,
+                verbose_name="Autorisaties",
+            ),
+        ),
+    ]
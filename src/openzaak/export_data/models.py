@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import uuid
+
+from django.conf import settings
+from django.db import models
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils.functional import classproperty
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+
+from privates.fields import PrivateMediaFileField
+from vng_api_common.constants import ComponentTypes
+
+from openzaak.utils import build_absolute_url
+from openzaak.utils.query import CompiledAuthorizations
+
+
+class ExportStatusChoices(models.TextChoices):
+    pending = "pending", _("Openstaand")
+    active = "active", _("Actief")
+    finished = "finished", _("Voltooid")
+    error = "error", _("Onderbroken")
+
+    @classproperty
+    def deletion_choices(cls):
+        return {cls.finished, cls.error}
+
+
+class ExportFormatChoices(models.TextChoices):
+    ndjson = "ndjson", _("NDJSON")
+    csv = "csv", _("CSV")
+
+    @classproperty
+    def media_type_mapping(cls):
+        return {
+            cls.ndjson: "application/x-ndjson",
+            cls.csv: "text/csv",
+        }
+
+    @classmethod
+    def get_media_type(cls, choice) -> str:
+        return cls.media_type_mapping[choice]
+
+
+class ExportTypeChoices(models.TextChoices):
+    zaken = "zaken", _("Zaken")
+    documenten = "documenten", _("Enkelvoudige informatie objecten")
+
+    @classproperty
+    def component_mapping(cls):
+        return {
+            cls.zaken: ComponentTypes.zrc,
+            cls.documenten: ComponentTypes.drc,
+        }
+
+    @classproperty
+    def exporter_mapping(cls):
+        return {
+            cls.zaken: "openzaak.components.zaken.api.export.ZaakExporter",
+            cls.documenten: (
+                "openzaak.components.documenten.api.export."
+                "EnkelvoudigInformatieObjectExporter"
+            ),
+        }
+
+    @classmethod
+    def get_component_from_choice(cls, choice):
+        return cls.component_mapping[choice]
+
+    @classmethod
+    def get_exporter_class(cls, choice) -> type:
+        return import_string(cls.exporter_mapping[choice])
+
+
+class Export(models.Model):
+    uuid = models.UUIDField(default=uuid.uuid4, unique=True)
+    status = models.CharField(
+        choices=ExportStatusChoices.choices,
+        max_length=30,
+        default=ExportStatusChoices.pending,
+    )
+    export_type = models.CharField(
+        verbose_name=_("Type export"), choices=ExportTypeChoices.choices, max_length=30
+    )
+    export_format = models.CharField(
+        verbose_name=_("Formaat"), choices=ExportFormatChoices.choices, max_length=30
+    )
+    client_id = models.CharField(
+        verbose_name=_("Client ID"),
+        max_length=255,
+        blank=True,
+        help_text=_("De client ID van de applicatie die de export heeft gestart."),
+    )
+    query_params = models.JSONField(
+        verbose_name=_("Query parameters"),
+        default=dict,
+        help_text=_("De (gevalideerde) filters van de te exporteren gegevens."),
+    )
+    authorizations = models.JSONField(
+        verbose_name=_("Autorisaties"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "De typen waartoe de client geautoriseerd was op het moment waarop de "
+            "export is gestart, met hun maximale vertrouwelijkheidaanduiding. Leeg "
+            "als de gegevens niet op autorisaties gefilterd worden."
+        ),
+    )
+
+    export_file = PrivateMediaFileField(
+        verbose_name=_("Export bestand"),
+        upload_to="export/",
+        blank=True,
+        null=True,
+    )
+
+    comment = models.TextField(verbose_name=_("Opmerking"), blank=True)
+
+    # date related fields
+    created_on = models.DateTimeField(
+        verbose_name=_("Aangemaakt op"), auto_now_add=True
+    )
+    started_on = models.DateTimeField(
+        verbose_name=_("Gestart op"), blank=True, null=True
+    )
+    finished_on = models.DateTimeField(
+        verbose_name=_("Voltooid op"), blank=True, null=True
+    )
+
+    # statistics
+    total = models.PositiveIntegerField(verbose_name=_("Totaal"), default=0)
+
+    def __str__(self):
+        return str(self.uuid)
+
+    def _get_url(self, name: str, request=None) -> str:
+        relative_url = reverse(
+            f"{self.export_type}-export:{name}",
+            kwargs=dict(
+                uuid=self.uuid, version=settings.REST_FRAMEWORK["DEFAULT_VERSION"]
+            ),
+        )
+        return build_absolute_url(relative_url, request=request)
+
+    def get_status_url(self, request=None):
+        return self._get_url("status", request=request)
+
+    def get_download_url(self, request=None):
+        return self._get_url("download", request=request)
+
+    def get_exporter_class(self) -> type:
+        return ExportTypeChoices.get_exporter_class(self.export_type)
+
+    def set_query(
+        self, query_params: QueryDict, authorizations: CompiledAuthorizations | None
+    ) -> None:
+        # the authorizations are stored as well, so that the export contains the
+        # records the client was authorized for when it was started
+        self.query_params = dict(query_params.lists())
+        self.authorizations = (
+            authorizations.to_json() if authorizations is not None else None
+        )
+
+    def get_authorizations(self) -> CompiledAuthorizations | None:
+        if self.authorizations is None:
+            return None
+        return CompiledAuthorizations.from_json(self.authorizations)
+
+    def get_queryset(self) -> models.QuerySet:
+        query_params = QueryDict(mutable=True)
+        for name, values in self.query_params.items():
+            query_params.setlist(name, values)
+
+        exporter = self.get_exporter_class()()
+        return exporter.get_queryset(query_params, self.get_authorizations())
@@ -0,0 +1,9 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from openzaak.export_data.models import ExportTypeChoices
+from openzaak.utils.permissions import AuthRequired
+
+
+class ExportAuthRequired(AuthRequired):
+    def get_component(self, view) -> str:
+        return ExportTypeChoices.get_component_from_choice(view.export_type)
@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from openzaak.utils.renderers import CamelCaseJSONRenderer
+
+from .models import ExportFormatChoices
+
+
+class NDJSONRenderer(CamelCaseJSONRenderer):
+    """
+    Negotiate the NDJSON format of an export.
+
+    The export itself is streamed, the renderer only renders error responses.
+    """
+
+    media_type = ExportFormatChoices.get_media_type(ExportFormatChoices.ndjson)
+    format = ExportFormatChoices.ndjson.value
+
+
+class CSVRenderer(CamelCaseJSONRenderer):
+    """
+    Negotiate the CSV format of an export.
+
+    The export itself is streamed, the renderer only renders error responses (as
+    JSON).
+    """
+
+    media_type = ExportFormatChoices.get_media_type(ExportFormatChoices.csv)
+    format = ExportFormatChoices.csv.value
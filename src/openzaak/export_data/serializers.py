@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.utils.translation import gettext_lazy as _
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+from openzaak.export_data.models import Export, ExportFormatChoices, ExportStatusChoices
+
+
+class ExportCreateSerializer(serializers.Serializer):
+    formaat = serializers.ChoiceField(
+        choices=ExportFormatChoices.choices,
+        default=ExportFormatChoices.ndjson,
+        source="export_format",
+        help_text=_("Het formaat van het export bestand."),
+    )
+
+
+class ExportSerializer(serializers.HyperlinkedModelSerializer):
+    status = serializers.SerializerMethodField()
+    formaat = serializers.CharField(
+        source="export_format",
+        read_only=True,
+        help_text=_("Het formaat van het export bestand."),
+    )
+    status_url = serializers.SerializerMethodField(
+        help_text=_("De URL waar de status van de EXPORT opgevraagd kan worden.")
+    )
+    download_url = serializers.SerializerMethodField(
+        help_text=_(
+            "De URL waar het export bestand gedownload kan worden wanneer de EXPORT "
+            "is voltooid."
+        )
+    )
+
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_status(self, instance):
+        return ExportStatusChoices(instance.status).value
+
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_status_url(self, instance):
+        return instance.get_status_url(request=self.context.get("request"))
+
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_download_url(self, instance):
+        return instance.get_download_url(request=self.context.get("request"))
+
+    class Meta:
+        model = Export
+        fields = (
+            "status",
+            "formaat",
+            "total",
+            "status_url",
+            "download_url",
+        )
+        read_only_fields = fields
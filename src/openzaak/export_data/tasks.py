@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import tempfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.utils import timezone
+
+import structlog
+from structlog.contextvars import bind_contextvars
+
+from openzaak import celery_app
+from openzaak.export_data.models import Export, ExportStatusChoices
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@celery_app.task()
+def export_data(export_pk: int) -> None:
+    """
+    Write the records of the export to the export file.
+    """
+    export = Export.objects.get(pk=export_pk)
+
+    bind_contextvars(export_id=export_pk)
+
+    export.started_on = timezone.now()
+    export.status = ExportStatusChoices.active
+    export.save(update_fields=["started_on", "status"])
+
+    exporter = export.get_exporter_class()()
+    try:
+        with tempfile.TemporaryFile() as export_file:
+            for chunk in exporter.render(export.get_queryset(), export.export_format):
+                export_file.write(chunk)
+
+            export_file.seek(0)
+            export.export_file.save(
+                f"{export.uuid}.{export.export_format}", File(export_file), save=False
+            )
+    except Exception as e:
+        logger.exception("export_failed", error=str(e))
+        export.status = ExportStatusChoices.error
+        export.comment = str(e)
+    else:
+        logger.info("export_finished", total=exporter.count)
+        export.status = ExportStatusChoices.finished
+
+    export.total = exporter.count
+    export.finished_on = timezone.now()
+    export.save()
+
+
+@celery_app.task()
+def remove_exports():
+    now = timezone.now()
+
+    exports = Export.objects.filter(
+        finished_on__lt=now - timedelta(days=settings.EXPORT_RETENTION_DAYS),
+        status__in=ExportStatusChoices.deletion_choices,
+    )
+
+    logger.info(
+        "removing_exports",
+        export_ids=[str(export) for export in exports],
+    )
+
+    # the exported records should not outlive the export
+    for export in exports:
+        if export.export_file:
+            export.export_file.delete(save=False)
+
+    exports.delete()
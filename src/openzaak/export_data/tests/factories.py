@@ -0,0 +1,21 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import factory
+import factory.fuzzy
+
+from openzaak.export_data.models import (
+    Export,
+    ExportFormatChoices,
+    ExportStatusChoices,
+    ExportTypeChoices,
+)
+
+
+class ExportFactory(factory.django.DjangoModelFactory):
+    export_type = factory.fuzzy.FuzzyChoice(ExportTypeChoices.values)
+    export_format = factory.fuzzy.FuzzyChoice(ExportFormatChoices.values)
+    status = ExportStatusChoices.pending
+    client_id = "testsuite"
+
+    class Meta:
+        model = Export
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+from django.http import QueryDict
+from django.test import TestCase
+
+import pytz
+from freezegun import freeze_time
+from privates.test import temp_private_root
+
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.export_data.models import (
+    Export,
+    ExportFormatChoices,
+    ExportStatusChoices,
+    ExportTypeChoices,
+)
+from openzaak.export_data.tasks import export_data, remove_exports
+from openzaak.export_data.tests.factories import ExportFactory
+
+
+@temp_private_root()
+@freeze_time("2024-01-01 08:00")
+class ExportDataTests(TestCase):
+    def test_simple(self):
+        zaak = ZaakFactory.create(identificatie="ZAAK-1")
+        ZaakFactory.create(identificatie="ZAAK-2")
+
+        export = ExportFactory.build(
+            export_type=ExportTypeChoices.zaken,
+            export_format=ExportFormatChoices.ndjson,
+        )
+        export.set_query(QueryDict("identificatie=ZAAK-1"), None)
+        export.save()
+
+        export_data(export.pk)
+
+        export.refresh_from_db()
+
+        self.assertEqual(export.status, ExportStatusChoices.finished)
+        self.assertEqual(export.total, 1)
+        self.assertEqual(export.started_on, datetime(2024, 1, 1, 8, tzinfo=pytz.utc))
+        self.assertEqual(export.finished_on, datetime(2024, 1, 1, 8, tzinfo=pytz.utc))
+
+        with export.export_file.open("r") as export_file:
+            records = [json.loads(line) for line in export_file]
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["uuid"], str(zaak.uuid))
+        self.assertEqual(records[0]["identificatie"], "ZAAK-1")
+
+    def test_query_params_are_stored(self):
+        ZaakFactory.create(identificatie="ZAAK-1")
+
+        export = ExportFactory.build(
+            export_type=ExportTypeChoices.zaken,
+            export_format=ExportFormatChoices.csv,
+        )
+        export.set_query(QueryDict("identificatie=ZAAK-1"), None)
+        export.save()
+
+        # records created after the export was started match the query as well
+        ZaakFactory.create(identificatie="ZAAK-1")
+
+        export_data(export.pk)
+
+        export.refresh_from_db()
+
+        self.assertEqual(export.status, ExportStatusChoices.finished)
+        self.assertEqual(export.total, 2)
+
+        with export.export_file.open("r") as export_file:
+            lines = export_file.read().splitlines()
+
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("url,uuid,identificatie,"))
+
+    @patch(
+        "openzaak.components.zaken.api.export.ZaakExporter.get_rows",
+        side_effect=Exception("Something went wrong"),
+    )
+    def test_error(self, _mock):
+        export = ExportFactory.build(
+            export_type=ExportTypeChoices.zaken,
+            export_format=ExportFormatChoices.ndjson,
+        )
+        export.set_query(QueryDict(), None)
+        export.save()
+
+        export_data(export.pk)
+
+        export.refresh_from_db()
+
+        self.assertEqual(export.status, ExportStatusChoices.error)
+        self.assertEqual(export.comment, "Something went wrong")
+        self.assertFalse(export.export_file)
+        self.assertEqual(export.finished_on, datetime(2024, 1, 1, 8, tzinfo=pytz.utc))
+
+
+@freeze_time("2024-01-01 08:00")
+class RemoveExportsTests(TestCase):
+    def test_simple(self):
+        marked_for_removal = (
+            ExportFactory(
+                status=ExportStatusChoices.finished,
+                finished_on=datetime(2023, 12, 24, 23, tzinfo=pytz.utc),
+            ),
+            ExportFactory(
+                status=ExportStatusChoices.error,
+                finished_on=datetime(2023, 12, 25, 5, tzinfo=pytz.utc),
+            ),
+        )
+
+        active_export = ExportFactory(
+            status=ExportStatusChoices.active,
+            finished_on=datetime(2023, 12, 25, 6, tzinfo=pytz.utc),
+        )
+
+        recent_exports = (
+            ExportFactory(
+                status=ExportStatusChoices.error,
+                finished_on=datetime(2023, 12, 25, 10, tzinfo=pytz.utc),
+            ),
+            ExportFactory(
+                status=ExportStatusChoices.finished,
+                finished_on=datetime(2023, 12, 25, 11, tzinfo=pytz.utc),
+            ),
+        )
+
+        remove_exports()
+
+        for export in marked_for_removal:
+            with self.subTest(export=export):
+                with self.assertRaises(Export.DoesNotExist):
+                    Export.objects.get(pk=export.pk)
+
+        for export in (*recent_exports, active_export):
+            with self.subTest(export=export):
+                self.assertTrue(Export.objects.get(pk=export.pk))
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.db import models, transaction
+from django.http import StreamingHttpResponse
+
+from django_sendfile import sendfile
+from rest_framework import status, viewsets
+from rest_framework.generics import mixins
+from rest_framework.response import Response
+
+from openzaak.export_data.models import (
+    Export,
+    ExportFormatChoices,
+    ExportStatusChoices,
+    ExportTypeChoices,
+)
+from openzaak.export_data.permissions import ExportAuthRequired
+from openzaak.export_data.renderers import CSVRenderer, NDJSONRenderer
+from openzaak.export_data.serializers import ExportCreateSerializer, ExportSerializer
+from openzaak.export_data.tasks import export_data
+
+
+class ExportMixin:
+    """
+    Export the records matching the filters and authorizations of the list action.
+
+    The ``_export`` action streams the records as NDJSON or CSV, depending on the
+    ``Accept`` header. The ``_export_async`` action writes the records to a file in
+    the background instead, which can be downloaded once the export is finished.
+
+    NOTE: the actions themselves are defined on the viewsets, like ``_zoek``. The
+    viewsets must also use
+    :class:`openzaak.utils.data_filtering.ListFilterByAuthorizationsMixin`.
+    """
+
+    export_type: ExportTypeChoices
+
+    def get_renderers(self):
+        if self.action == "_export":
+            return [NDJSONRenderer(), CSVRenderer()]
+        return super().get_renderers()
+
+    def get_export_queryset(self, request) -> models.QuerySet:
+        self._check_query_params(request)
+        return self.filter_queryset(self.get_queryset())
+
+    def get_exporter(self, request=None):
+        exporter_class = ExportTypeChoices.get_exporter_class(self.export_type)
+        return exporter_class(request=request)
+
+    def get_export_response(self, request) -> StreamingHttpResponse:
+        queryset = self.get_export_queryset(request)
+        export_format = request.accepted_renderer.format
+
+        response = StreamingHttpResponse(
+            self.get_exporter(request=request).render(queryset, export_format),
+            content_type=request.accepted_renderer.media_type,
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.export_type}.{export_format}"'
+        )
+        return response
+
+    def create_export(self, request) -> Response:
+        serializer = ExportCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        export = Export(
+            export_type=self.export_type,
+            export_format=serializer.validated_data["export_format"],
+            client_id=request.jwt_auth.client_id or "",
+        )
+        # validates the query parameters, the queryset itself is rebuilt by the task
+        queryset = self.get_export_queryset(request)
+        export.set_query(
+            request.query_params, self.get_compiled_authorizations(queryset)
+        )
+        export.save()
+
+        transaction.on_commit(lambda: export_data.delay(export.pk))
+
+        return Response(
+            ExportSerializer(export, context={"request": request}).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class ExportStatusView(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    export_type: ExportTypeChoices
+    serializer_class = ExportSerializer
+    permission_classes = (ExportAuthRequired,)
+    lookup_field = "uuid"
+
+    def get_queryset(self):
+        # an export only contains the records the client is authorized for
+        return Export.objects.filter(
+            export_type=self.export_type, client_id=self.request.jwt_auth.client_id
+        )
+
+
+class ExportDownloadView(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    export_type: ExportTypeChoices
+    permission_classes = (ExportAuthRequired,)
+    lookup_field = "uuid"
+
+    def get_queryset(self):
+        return Export.objects.filter(
+            export_type=self.export_type,
+            client_id=self.request.jwt_auth.client_id,
+            status=ExportStatusChoices.finished,
+            export_file__isnull=False,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+
+        return sendfile(
+            request,
+            instance.export_file.path,
+            attachment=True,
+            attachment_filename=f"{self.export_type}.{instance.export_format}",
+            mimetype=ExportFormatChoices.get_media_type(instance.export_format),
+        )
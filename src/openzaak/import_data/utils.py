@@ -2,14 +2,16 @@
 # Copyright (C) 2019 - 2024 Dimpact
 import csv
 import functools
-from contextlib import contextmanager
+import itertools
+from contextlib import contextmanager, suppress
 from datetime import datetime
 from pathlib import Path
 from time import monotonic
-from typing import Generator, Optional
+from typing import Generator, Iterable, Optional
 
 from django.core.cache import cache
 from django.db import DatabaseError
+from django.db.models import F
 from django.utils import timezone
 
 import structlog
@@ -44,6 +46,77 @@ def get_total_count(filename: str, include_header: bool = False) -> int:
         return total - 1 if total > 0 else 0
 
 
+def write_csv_file(file_path: str, rows: Iterable[Iterable]) -> None:
+    """
+    Write the rows to the given file, appending them if the file already exists.
+    """
+    mode = "a" if private_media_storage.exists(file_path) else "w"
+
+    with private_media_storage.open(file_path, mode) as csv_file:
+        if mode == "a":
+            # see `write_to_file`
+            csv_file.seek(0, 2)
+
+        csv_writer = csv.writer(csv_file, delimiter=",", quotechar='"')
+        csv_writer.writerows(rows)
+
+
+def get_chunk_dir(instance: Import) -> Path:
+    return get_default_path(Import.import_file.field) / f"chunks-{instance.pk}"
+
+
+def split_import_file(
+    instance: Import, chunk_size: int
+) -> tuple[int, list[tuple[str, int]]]:
+    """
+    Split the import file into chunk files of (at most) `chunk_size` rows, excluding
+    the header row, which can be processed independently of each other.
+
+    The import file is only read once, the total row count is determined while
+    splitting it.
+
+    :return: the total row count and, for each chunk, the path to the chunk file and
+        the row index of its first row in the import file
+    """
+    chunk_dir = get_chunk_dir(instance)
+
+    if not chunk_dir.exists():
+        chunk_dir.mkdir(parents=True)
+
+    total = 0
+    chunks = []
+
+    rows = get_csv_generator(instance.import_file.path)
+    next(rows, None)  # skip the header row
+
+    for chunk in itertools.batched(rows, chunk_size):
+        first_row_index, _row = chunk[0]
+        file_path = f"{chunk_dir}/import-{len(chunks) + 1}.csv"
+
+        write_csv_file(file_path, (row for _row_index, row in chunk))
+
+        chunks.append((file_path, first_row_index))
+        total += len(chunk)
+
+    logger.info(
+        "split_import_file",
+        total=total,
+        chunk_count=len(chunks),
+    )
+
+    return total, chunks
+
+
+def remove_chunk_files(instance: Import, file_paths: Iterable[str]) -> None:
+    for file_path in file_paths:
+        if private_media_storage.exists(file_path):
+            private_media_storage.delete(file_path)
+
+    # only removes the directory if all files are gone
+    with suppress(OSError):
+        get_chunk_dir(instance).rmdir()
+
+
 def get_batch_statistics(batch: list) -> tuple[int, int, int]:
     success_count = 0
     failure_count = 0
@@ -93,19 +166,31 @@ def finish_import(
         )
 
 
-def finish_batch(import_instance: Import, batch: list, headers: list) -> None:
+def finish_batch(
+    import_instance: Import,
+    batch: list,
+    headers: list,
+    report_path: Optional[str] = None,
+) -> None:
+    """
+    Update the statistics of the import and write the batch to the report file.
+
+    If `report_path` is given, the batch is written to that (partial) report file
+    instead, see `merge_report_files`.
+    """
     batch_number = import_instance.get_batch_number(len(batch))
     _processed, _fail_count, _success_count = get_batch_statistics(batch)
 
-    import_instance.processed = import_instance.processed + _processed
-    import_instance.processed_successfully = (
-        import_instance.processed_successfully + _success_count
-    )
-    import_instance.processed_invalid = import_instance.processed_invalid + _fail_count
-
+    # multiple chunks of the same import can finish a batch at the same time, so the
+    # statistics are incremented in the database
     try:
-        import_instance.save(
-            update_fields=["processed", "processed_successfully", "processed_invalid"]
+        Import.objects.filter(pk=import_instance.pk).update(
+            processed=F("processed") + _processed,
+            processed_successfully=F("processed_successfully") + _success_count,
+            processed_invalid=F("processed_invalid") + _fail_count,
+        )
+        import_instance.refresh_from_db(
+            fields=["processed", "processed_successfully", "processed_invalid"]
         )
     except DatabaseError as e:
         logger.critical(
@@ -118,7 +203,10 @@ def finish_batch(import_instance: Import, batch: list, headers: list) -> None:
         "writing_batch_to_report_file",
         batch_number=batch_number,
     )
-    write_to_file(import_instance, batch, headers)
+    if report_path:
+        write_csv_file(report_path, (row.as_export_data().values() for row in batch))
+    else:
+        write_to_file(import_instance, batch, headers)
 
     logger.info(
         "removing_files_for_unimported_rows",
@@ -207,6 +295,40 @@ def write_to_file(instance: Import, batch: list, headers: list) -> None:
         )
 
 
+def merge_report_files(instance: Import, headers: list, file_paths: list[str]) -> None:
+    """
+    Combine the partial report files of the chunks, in the given order, into the
+    report file of the import.
+    """
+    default_dir = get_default_path(Import.report_file.field)
+    default_name = f"report-{instance.pk}.csv"
+
+    if not default_dir.exists():
+        default_dir.mkdir(parents=True)
+
+    with private_media_storage.open(f"{default_dir}/{default_name}", "w+") as _file:
+        csv_writer = csv.writer(_file, delimiter=",", quotechar='"')
+        csv_writer.writerow(headers)
+
+        for file_path in file_paths:
+            if not private_media_storage.exists(file_path):
+                continue
+
+            csv_writer.writerows(row for _index, row in get_csv_generator(file_path))
+
+    relative_path = Path(instance.report_file.field.upload_to) / default_name
+
+    instance.report_file.name = str(relative_path)
+
+    try:
+        instance.save(update_fields=["report_file"])
+    except DatabaseError as e:
+        logger.critical(
+            "unable_to_save_new_report_file_due_to_database_error",
+            error=str(e),
+        )
+
+
 LOCK_EXPIRE = 60 * (60 * 24)  # 24 hours
 
 
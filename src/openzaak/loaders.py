@@ -1,52 +1,260 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import copy
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from hashlib import sha256
 from inspect import getmembers
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, Optional
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.db.models.base import ModelBase
 
 import requests
+import structlog
 from django_loose_fk.loaders import BaseLoader, FetchError, FetchJsonError
 from django_loose_fk.virtual_models import virtual_model_factory
 from djangorestframework_camel_case.util import underscoreize
+from requests.adapters import HTTPAdapter
 from vng_api_common.descriptors import GegevensGroepType
 
 from openzaak.utils.auth import get_auth
 
+logger = structlog.stdlib.get_logger(__name__)
 
-class AuthorizedRequestsLoader(BaseLoader):
+CACHE_KEY_PREFIX = "loose_fk:remote"
+
+
+@dataclass
+class RemoteFetchContext:
     """
-    Fetch external API objects with Authorization header.
+    Request scoped administration of the fetched remote objects.
+
+    Every remote URL is fetched at most once within the context, the (raw) response
+    data or the error is kept around for subsequent lookups.
     """
 
-    @staticmethod
-    def fetch_object(url: str, do_underscoreize=True) -> dict:
-        # TODO should we replace it with Service.get_client() and use it instead of requests?
-        # but in this case we couldn't catch separate FetchJsonError
-        headers = get_auth(url)
+    results: Dict[str, dict | FetchError | FetchJsonError] = field(default_factory=dict)
+    num_fetches: int = 0
+    num_cache_hits: int = 0
 
-        try:
-            response = requests.get(url, headers=headers)
-        except requests.exceptions.RequestException as exc:
-            raise FetchError(exc.args[0]) from exc
 
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as exc:
-            raise FetchError(exc.args[0]) from exc
+_remote_fetch_context: ContextVar[Optional[RemoteFetchContext]] = ContextVar(
+    "remote_fetch_context", default=None
+)
+
+
+@contextmanager
+def remote_fetch_context() -> Iterator[RemoteFetchContext]:
+    context = RemoteFetchContext()
+    token = _remote_fetch_context.set(context)
+    try:
+        yield context
+    finally:
+        _remote_fetch_context.reset(token)
+
+
+def get_remote_fetch_context() -> Optional[RemoteFetchContext]:
+    return _remote_fetch_context.get()
+
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the (process wide) session, so connections to remote APIs are reused.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=settings.LOOSE_FK_POOL_SIZE,
+                    pool_maxsize=settings.LOOSE_FK_POOL_SIZE,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def _get_cache_key(url: str) -> str:
+    return f"{CACHE_KEY_PREFIX}:{sha256(url.encode('utf-8')).hexdigest()}"
+
+
+def _get_cache_entry(url: str) -> Optional[dict]:
+    if not settings.LOOSE_FK_CACHE_TIMEOUT:
+        return None
+    return cache.get(_get_cache_key(url))
+
+
+def _is_fresh(entry: Optional[dict]) -> bool:
+    return entry is not None and entry["expires"] > time.time()
+
+
+def _get_max_age(response: requests.Response) -> Optional[int]:
+    """
+    Determine how long the response may be cached, ``None`` if it may not be stored.
+    """
+    directives = {}
+    for directive in response.headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives or "private" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    try:
+        return int(directives.get("s-maxage") or directives["max-age"])
+    except (KeyError, ValueError):
+        return settings.LOOSE_FK_CACHE_TIMEOUT
 
+
+def _request(url: str, headers: dict, entry: Optional[dict]) -> requests.Response:
+    if entry and entry["etag"]:
+        headers = {**headers, "If-None-Match": entry["etag"]}
+
+    try:
+        response = get_session().get(url, headers=headers)
+    except requests.exceptions.RequestException as exc:
+        raise FetchError(exc.args[0]) from exc
+
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as exc:
+        raise FetchError(exc.args[0]) from exc
+
+    return response
+
+
+def _process_response(
+    url: str, response: requests.Response, entry: Optional[dict]
+) -> dict:
+    if response.status_code == 304 and entry:
+        data = entry["data"]
+    else:
         try:
             data = response.json()
         except json.JSONDecodeError as exc:
             raise FetchJsonError(exc.args[0]) from exc
 
+    max_age = _get_max_age(response)
+    etag = response.headers.get("ETag") or (entry["etag"] if entry else "")
+    if settings.LOOSE_FK_CACHE_TIMEOUT and max_age is not None and (max_age or etag):
+        # stale entries with an ETag are kept a little longer, so they can be
+        # revalidated with a conditional request
+        timeout = max_age + settings.LOOSE_FK_CACHE_TIMEOUT if etag else max_age
+        cache.set(
+            _get_cache_key(url),
+            {"data": data, "etag": etag, "expires": time.time() + max_age},
+            timeout=timeout,
+        )
+    return data
+
+
+def _fetch(url: str, context: Optional[RemoteFetchContext]) -> dict:
+    entry = _get_cache_entry(url)
+    if _is_fresh(entry):
+        if context is not None:
+            context.num_cache_hits += 1
+        return entry["data"]
+
+    if context is not None:
+        context.num_fetches += 1
+    response = _request(url, get_auth(url), entry)
+    return _process_response(url, response, entry)
+
+
+class AuthorizedRequestsLoader(BaseLoader):
+    """
+    Fetch external API objects with Authorization header.
+
+    Responses are cached in the shared cache honouring the ``Cache-Control`` and
+    ``ETag`` headers of the remote API, and within a :func:`remote_fetch_context`
+    (set up for every request by :class:`openzaak.utils.middleware.RemoteFetchMiddleware`)
+    every URL is fetched at most once.
+    """
+
+    @staticmethod
+    def fetch_object(url: str, do_underscoreize=True) -> dict:
+        context = get_remote_fetch_context()
+
+        if context is not None and url in context.results:
+            result = context.results[url]
+            if isinstance(result, Exception):
+                raise type(result)(*result.args)
+            context.num_cache_hits += 1
+            data = result
+        else:
+            try:
+                data = _fetch(url, context)
+            except (FetchError, FetchJsonError) as exc:
+                if context is not None:
+                    context.results[url] = exc
+                raise
+            if context is not None:
+                context.results[url] = data
+
         if not do_underscoreize:
-            return data
+            return copy.deepcopy(data)
 
         return underscoreize(data)
 
+    def prefetch(self, urls: Iterable[str]) -> None:
+        """
+        Fetch the (deduplicated) remote URLs concurrently.
+
+        The results are kept in the current :func:`remote_fetch_context`, so subsequent
+        loads of these URLs don't perform any network calls. Errors are raised when
+        the object is actually loaded.
+        """
+        context = get_remote_fetch_context()
+        if context is None:
+            return
+
+        pending = {}
+        for url in dict.fromkeys(urls):
+            if not url or url in context.results or self.is_local_url(url):
+                continue
+
+            entry = _get_cache_entry(url)
+            if _is_fresh(entry):
+                context.num_cache_hits += 1
+                context.results[url] = entry["data"]
+                continue
+
+            # resolve the credentials up front, the worker threads only do HTTP calls
+            pending[url] = (get_auth(url), entry)
+
+        if not pending:
+            return
+
+        context.num_fetches += len(pending)
+        max_workers = min(settings.LOOSE_FK_MAX_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                url: executor.submit(_request, url, headers, entry)
+                for url, (headers, entry) in pending.items()
+            }
+
+        for url, future in futures.items():
+            entry = pending[url][1]
+            try:
+                context.results[url] = _process_response(url, future.result(), entry)
+            except (FetchError, FetchJsonError) as exc:
+                context.results[url] = exc
+
     def load(self, url: str, model: ModelBase) -> models.Model:
         if self.is_local_url(url):
             # print(url)
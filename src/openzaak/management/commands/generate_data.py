@@ -13,6 +13,7 @@ from django.utils import timezone
 import factory.fuzzy
 from requests.exceptions import RequestException
 from rest_framework.test import APIRequestFactory
+from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.client import Client, ClientError, to_internal_data
 from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
 from vng_api_common.models import JWTSecret
@@ -285,6 +286,14 @@ class Command(BaseCommand):
             ),
         )
 
+        parser.add_argument(
+            "--audittrails",
+            dest="audittrails_amount",
+            type=int,
+            default=0,
+            help="Number of audit trails to generate for each zaak.",
+        )
+
         parser.add_argument(
             "--resources",
             dest="resources",
@@ -304,6 +313,7 @@ class Command(BaseCommand):
             "generate_non_superuser_credentials"
         ]
         self.without_zaakgeometrie = options["without_zaakgeometrie"]
+        self.audittrails_amount = options["audittrails_amount"]
 
         resources = options["resources"]
         generate_zaken = "zaken" in resources
@@ -321,6 +331,8 @@ class Command(BaseCommand):
         self.generate_catalogi()
         if generate_zaken:
             self.generate_zaken()
+            if self.audittrails_amount:
+                self.generate_audittrails()
         if generate_besluiten:
             self.generate_besluiten()
         if generate_documenten:
@@ -501,6 +513,8 @@ class Command(BaseCommand):
             ]
         )
         self.bulk_create(Status, statussen_generator)
+        # bulk_create bypasses Status.save, which maintains the current status
+        Zaak.objects.update_huidige_status()
 
         # 1 mln resultaten
         resultaattypen = ResultaatType.objects.order_by("zaaktype", "id")
@@ -560,6 +574,29 @@ class Command(BaseCommand):
 
         self.stdout.write("Finished creating zaken")
 
+    def generate_audittrails(self):
+        request = APIRequestFactory().get(
+            "/", HTTP_HOST=get_openzaak_domain(), secure=settings.IS_HTTPS
+        )
+        zaken = Zaak.objects.order_by("id").all()
+
+        def generate_audittrails():
+            for zaak in zaken.iterator():
+                zaak_url = zaak.get_absolute_api_url(request=request)
+                for i in range(self.audittrails_amount):
+                    yield AuditTrail(
+                        bron=ComponentTypes.zrc,
+                        actie="create" if i == 0 else "partial_update",
+                        resultaat=201 if i == 0 else 200,
+                        hoofd_object=zaak_url,
+                        resource="zaak",
+                        resource_url=zaak_url,
+                        resource_weergave=zaak.identificatie,
+                        applicatie_weergave="generate_data",
+                    )
+
+        self.bulk_create(AuditTrail, generate_audittrails())
+
     def generate_besluiten(self):
         besluiten_per_besluittype = self.zaken_amount // self.zaaktypen_amount
         besluittypen = BesluitType.objects.order_by("id").all()
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from openzaak.notifications.outbox import publish_outbox
+
+
+class Command(BaseCommand):
+    help = (
+        "Publish the cloud events from the outbox. Runs until interrupted, "
+        "unless --once is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Stop once the outbox is drained or publishing fails.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.CLOUD_EVENTS_OUTBOX_BATCH_SIZE,
+            help="Number of cloud events published per batch.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the outbox is empty.",
+        )
+        parser.add_argument(
+            "--max-backoff",
+            type=float,
+            default=60.0,
+            help="Maximum seconds to wait when the receiver can't keep up.",
+        )
+
+    def handle(self, **options):
+        if not settings.CLOUD_EVENTS_OUTBOX:
+            raise CommandError("The cloud events outbox is not enabled.")
+
+        backoff = options["interval"]
+        while True:
+            result = publish_outbox(batch_size=options["batch_size"])
+            if result.published or result.failed:
+                self.stdout.write(
+                    f"Published {result.published} cloud event(s), "
+                    f"{result.failed} failed."
+                )
+
+            if result.throttled or result.failed:
+                # back off while the receiver is unavailable or can't keep up
+                backoff = min(backoff * 2, options["max_backoff"])
+            elif result.published:
+                backoff = options["interval"]
+                continue
+            else:
+                backoff = options["interval"]
+
+            if options["once"]:
+                return
+
+            time.sleep(backoff)
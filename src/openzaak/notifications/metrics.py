@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from opentelemetry import metrics
+
+meter = metrics.get_meter("openzaak.notifications")
+
+notifications_sent_counter = meter.create_counter(
+    "openzaak.notifications.sent",
+    description="Amount of notifications delivered to the Notificaties API in batches.",
+    unit="1",
+)
+notifications_failed_counter = meter.create_counter(
+    "openzaak.notifications.failed",
+    description="Amount of batched notifications that could not be delivered.",
+    unit="1",
+)
+notifications_batch_size_histogram = meter.create_histogram(
+    "openzaak.notifications.batch.size",
+    description="Amount of notifications in a delivered batch.",
+    unit="{notification}",
+)
+notifications_batch_duration_histogram = meter.create_histogram(
+    "openzaak.notifications.batch.duration",
+    description="Duration of delivering a batch of notifications.",
+    unit="s",
+)
+
+cloudevents_published_counter = meter.create_counter(
+    "openzaak.cloudevents.published",
+    description="Amount of cloud events published from the outbox.",
+    unit="1",
+)
+cloudevents_publishing_failed_counter = meter.create_counter(
+    "openzaak.cloudevents.publishing_failed",
+    description="Amount of failed attempts to publish a cloud event from the outbox.",
+    unit="1",
+)
+cloudevents_outbox_lag_histogram = meter.create_histogram(
+    "openzaak.cloudevents.outbox.lag",
+    description="Time between storing a cloud event in the outbox and publishing it.",
+    unit="s",
+)
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.17 on 2026-10-17 12:00
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+import openzaak.notifications.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications_log", "0006_delete_failednotification"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxCloudEvent",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event",
+                    models.JSONField(
+                        help_text="The cloud event to publish.", verbose_name="event"
+                    ),
+                ),
+                ("type", models.CharField(max_length=255, verbose_name="type")),
+                (
+                    "subject",
+                    models.CharField(
+                        blank=True, max_length=255, null=True, verbose_name="subject"
+                    ),
+                ),
+                (
+                    "transaction_id",
+                    models.BigIntegerField(
+                        db_default=openzaak.notifications.models.TransactionId(),
+                        editable=False,
+                        help_text="The database transaction the event was created in.",
+                        verbose_name="transaction id",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(
+                        db_default=django.db.models.functions.datetime.Now(),
+                        editable=False,
+                        verbose_name="created",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="attempts"),
+                ),
+                (
+                    "next_attempt",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="The event is not published before this moment.",
+                        null=True,
+                        verbose_name="next attempt",
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, verbose_name="last error"),
+                ),
+            ],
+            options={
+                "verbose_name": "outbox cloud event",
+                "verbose_name_plural": "outbox cloud events",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("transaction_id", "type", "subject"),
+                        name="unique_cloudevent_per_transaction",
+                    )
+                ],
+            },
+        ),
+    ]
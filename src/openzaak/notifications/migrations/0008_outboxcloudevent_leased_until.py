@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+# Generated by Django 5.2.17 on 2026-10-17 16:00
+
+from django.db import migrations, models
+
+
+def fill_empty_subject(apps, schema_editor):
+    OutboxCloudEvent = apps.get_model("notifications_log", "OutboxCloudEvent")
+    OutboxCloudEvent.objects.filter(subject__isnull=True).update(subject="")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications_log", "0007_outboxcloudevent"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="outboxcloudevent",
+            name="leased_until",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="The event is being published by a worker, other workers skip it until this moment.",
+                null=True,
+                verbose_name="leased until",
+            ),
+        ),
+        migrations.RunPython(fill_empty_subject, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="outboxcloudevent",
+            name="subject",
+            field=models.CharField(
+                blank=True, default="", max_length=255, verbose_name="subject"
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.db import models
+from django.db.models.functions import Now
+from django.utils.translation import gettext_lazy as _
+
+
+class TransactionId(models.Func):
+    """
+    The id of the current PostgreSQL transaction.
+    """
+
+    function = "txid_current"
+    template = "%(function)s()"
+    output_field = models.BigIntegerField()
+
+
+class OutboxCloudEvent(models.Model):
+    """
+    A cloud event waiting to be published.
+
+    Cloud events are written to the outbox in the same transaction as the change
+    they describe, and removed once they are published.
+    """
+
+    event = models.JSONField(_("event"), help_text=_("The cloud event to publish."))
+    type = models.CharField(_("type"), max_length=255)
+    # not nullable, so events without subject are deduplicated by the constraint
+    subject = models.CharField(_("subject"), max_length=255, blank=True, default="")
+    transaction_id = models.BigIntegerField(
+        _("transaction id"),
+        db_default=TransactionId(),
+        editable=False,
+        help_text=_("The database transaction the event was created in."),
+    )
+    created = models.DateTimeField(_("created"), db_default=Now(), editable=False)
+    attempts = models.PositiveIntegerField(_("attempts"), default=0)
+    next_attempt = models.DateTimeField(
+        _("next attempt"),
+        null=True,
+        blank=True,
+        help_text=_("The event is not published before this moment."),
+    )
+    leased_until = models.DateTimeField(
+        _("leased until"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "The event is being published by a worker, other workers skip it until "
+            "this moment."
+        ),
+    )
+    last_error = models.TextField(_("last error"), blank=True)
+
+    class Meta:
+        verbose_name = _("outbox cloud event")
+        verbose_name_plural = _("outbox cloud events")
+        constraints = [
+            # the same event for the same subject is only published once per
+            # transaction
+            models.UniqueConstraint(
+                fields=["transaction_id", "type", "subject"],
+                name="unique_cloudevent_per_transaction",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.type} ({self.subject})"
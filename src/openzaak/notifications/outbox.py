@@ -0,0 +1,238 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Transactional outbox for cloud events.
+
+Cloud events are stored in the database in the same transaction as the change they
+describe, so they are never lost when the process dies after committing. The events
+are published by a separate worker, see :func:`publish_outbox`.
+"""
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+import requests
+import structlog
+from notifications_api_common.exponential_backoff import (
+    get_exponential_backoff_interval,
+)
+from notifications_api_common.models import (
+    FailedNotification,
+    NotificationsConfig,
+    NotificationTypes,
+)
+
+from openzaak.utils.db import OnCommitBatch
+
+from .metrics import (
+    cloudevents_outbox_lag_histogram,
+    cloudevents_published_counter,
+    cloudevents_publishing_failed_counter,
+)
+from .models import OutboxCloudEvent
+
+logger = structlog.stdlib.get_logger(__name__)
+
+CLOUDEVENT_HEADERS = {"Content-Type": "application/cloudevents+json"}
+
+# responses indicating the receiver can't keep up, publishing is paused
+BACK_PRESSURE_STATUS_CODES = (429, 502, 503, 504)
+
+
+def add_to_outbox(cloudevent: dict) -> None:
+    """
+    Store the cloud event in the outbox, as part of the current transaction.
+
+    If the same event type was already stored for the same subject in the current
+    transaction, the stored event is replaced.
+    """
+    OutboxCloudEvent.objects.bulk_create(
+        [
+            OutboxCloudEvent(
+                event=cloudevent,
+                type=cloudevent["type"],
+                # events without subject are deduplicated as well
+                subject=cloudevent.get("subject") or "",
+            )
+        ],
+        update_conflicts=True,
+        unique_fields=["transaction_id", "type", "subject"],
+        update_fields=["event"],
+    )
+
+    # publish the events as soon as possible (once per transaction), the periodic
+    # task picks up the events in case this fails
+    _publishing.add([cloudevent["type"]])
+
+
+def _schedule_publishing(_types: list[str]) -> None:
+    from .tasks import publish_cloudevents
+
+    try:
+        publish_cloudevents.delay()
+    except Exception:
+        logger.warning("cloudevent_publishing_not_scheduled", exc_info=True)
+
+
+_publishing = OnCommitBatch(_schedule_publishing)
+
+
+@dataclass
+class PublishResult:
+    published: int = 0
+    failed: int = 0
+    # the receiver asked to slow down, the remaining events are published later
+    throttled: bool = False
+    errors: list[str] = field(default_factory=list)
+
+
+def _get_retry_delay(config: NotificationsConfig, attempts: int) -> timedelta:
+    return timedelta(
+        seconds=get_exponential_backoff_interval(
+            factor=config.notification_delivery_retry_backoff,
+            retries=attempts - 1,
+            maximum=config.notification_delivery_retry_backoff_max,
+            base=config.notification_delivery_base_factor,
+        )
+    )
+
+
+def _claim_events(batch_size: int) -> list[OutboxCloudEvent]:
+    """
+    Lease a batch of the pending events, so other workers skip them while they are
+    being published.
+
+    Events of which the lease expired (e.g. because the worker stopped) are claimed
+    again.
+    """
+    with transaction.atomic():
+        now = timezone.now()
+        events = list(
+            OutboxCloudEvent.objects.select_for_update(skip_locked=True)
+            .exclude(next_attempt__gt=now)
+            .exclude(leased_until__gt=now)
+            .order_by("pk")[:batch_size]
+        )
+        OutboxCloudEvent.objects.filter(
+            pk__in=[outbox_event.pk for outbox_event in events]
+        ).update(
+            leased_until=now
+            + timedelta(seconds=settings.CLOUD_EVENTS_OUTBOX_LEASE_DURATION)
+        )
+    return events
+
+
+def publish_outbox(batch_size: int | None = None) -> PublishResult:
+    """
+    Publish a batch of the pending cloud events, in the order they were created.
+
+    The events are leased before they are published, so multiple workers can
+    publish concurrently without keeping a transaction open during the requests.
+    Published events are removed from the outbox, events that could not be
+    published are retried with the configured backoff. After the maximum number of
+    retries they are moved to the failed notifications.
+
+    Publishing stops when the receiver responds that it can't keep up.
+    """
+    batch_size = batch_size or settings.CLOUD_EVENTS_OUTBOX_BATCH_SIZE
+    result = PublishResult()
+
+    config = NotificationsConfig.get_solo()
+    client = NotificationsConfig.get_client()
+    if client is None:
+        logger.warning("notifications_client_unavailable")
+        return result
+
+    events = _claim_events(batch_size)
+
+    published, failed = [], []
+    for outbox_event in events:
+        try:
+            response = client.post(
+                "cloudevents", json=outbox_event.event, headers=CLOUDEVENT_HEADERS
+            )
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            outbox_event.attempts += 1
+            outbox_event.last_error = (
+                exc.response.text[:1000] if exc.response is not None else str(exc)
+            )
+            failed.append(outbox_event)
+            logger.warning(
+                "cloudevent_delivery_failed",
+                base_url=client.base_url,
+                cloudevent_msg=outbox_event.event,
+                current_try=outbox_event.attempts,
+                exc_info=exc,
+            )
+
+            if (
+                exc.response is None
+                or exc.response.status_code in BACK_PRESSURE_STATUS_CODES
+            ):
+                result.throttled = True
+                break
+        else:
+            published.append(outbox_event)
+
+    with transaction.atomic():
+        now = timezone.now()
+        OutboxCloudEvent.objects.filter(
+            pk__in=[outbox_event.pk for outbox_event in published]
+        ).delete()
+
+        given_up = [
+            outbox_event
+            for outbox_event in failed
+            if outbox_event.attempts > config.notification_delivery_max_retries
+        ]
+        if given_up:
+            FailedNotification.objects.bulk_create(
+                FailedNotification(
+                    message=outbox_event.event, type=NotificationTypes.cloudevent
+                )
+                for outbox_event in given_up
+            )
+            OutboxCloudEvent.objects.filter(
+                pk__in=[outbox_event.pk for outbox_event in given_up]
+            ).delete()
+
+        retried = [
+            outbox_event for outbox_event in failed if outbox_event not in given_up
+        ]
+        for outbox_event in retried:
+            outbox_event.next_attempt = now + _get_retry_delay(
+                config, outbox_event.attempts
+            )
+            outbox_event.leased_until = None
+        OutboxCloudEvent.objects.bulk_update(
+            retried, ["attempts", "next_attempt", "last_error", "leased_until"]
+        )
+
+        # publishing was paused, the rest of the batch can be claimed again
+        attempted = published + failed
+        OutboxCloudEvent.objects.filter(
+            pk__in=[
+                outbox_event.pk
+                for outbox_event in events
+                if outbox_event not in attempted
+            ]
+        ).update(leased_until=None)
+
+    published_at = timezone.now()
+    for outbox_event in published:
+        cloudevents_outbox_lag_histogram.record(
+            (published_at - outbox_event.created).total_seconds(),
+            {"openzaak.cloudevents.type": outbox_event.type},
+        )
+    cloudevents_published_counter.add(len(published))
+    cloudevents_publishing_failed_counter.add(len(failed))
+
+    result.published = len(published)
+    result.failed = len(failed)
+    result.errors = [outbox_event.last_error for outbox_event in failed]
+    return result
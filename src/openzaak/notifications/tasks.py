@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import time
+
+from django.conf import settings
+
+import requests
+import structlog
+from notifications_api_common.exponential_backoff import (
+    get_exponential_backoff_interval,
+)
+from notifications_api_common.models import (
+    FailedNotification,
+    NotificationResponse,
+    NotificationsConfig,
+)
+from notifications_api_common.settings import get_setting
+from notifications_api_common.tasks import send_notification
+
+from openzaak import celery_app
+
+from .metrics import (
+    notifications_batch_duration_histogram,
+    notifications_batch_size_histogram,
+    notifications_failed_counter,
+    notifications_sent_counter,
+)
+from .outbox import publish_outbox
+
+logger = structlog.stdlib.get_logger(__name__)
+
+
+@celery_app.task()
+def send_notifications(
+    messages: list[dict], notification_ids: list[int | None]
+) -> dict[str, int]:
+    """
+    Send a batch of notifications of the same kanaal to the Notificaties API.
+
+    The notifications are posted one after another using the same client, so the
+    connection to the Notificaties API is reused. The delivery is logged with a
+    single query for the whole batch.
+
+    Notifications that could not be delivered are retried separately by the
+    ``send_notification`` task, with the configured backoff.
+    """
+    config = NotificationsConfig.get_solo()
+    client = NotificationsConfig.get_client()
+    if client is None:
+        logger.warning("notifications_client_unavailable")
+        return {"sent": 0, "failed": 0}
+
+    kanaal = messages[0]["kanaal"] if messages else ""
+    delivered: list[int] = []
+    failed: list[tuple[dict, int | None]] = []
+    responses: list[NotificationResponse] = []
+
+    start = time.perf_counter()
+    for message, notification_id in zip(messages, notification_ids, strict=True):
+        response_kwargs = {}
+        try:
+            response = client.post("notificaties", json=message)
+            response_kwargs["response_status"] = response.status_code
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            logger.warning(
+                "notification_delivery_failed",
+                base_url=client.base_url,
+                notification_msg=message,
+                current_try=1,
+                exc_info=exc,
+            )
+            response_kwargs["exception"] = response.text[:1000]
+        except requests.RequestException as exc:
+            logger.warning(
+                "notification_delivery_failed",
+                base_url=client.base_url,
+                notification_msg=message,
+                current_try=1,
+                exc_info=exc,
+            )
+            response_kwargs = {"exception": str(exc)}
+        else:
+            if notification_id is not None:
+                delivered.append(notification_id)
+            continue
+
+        failed.append((message, notification_id))
+        if notification_id is not None:
+            responses.append(
+                NotificationResponse(
+                    failed_notification_id=notification_id,
+                    attempt=1,
+                    **response_kwargs,
+                )
+            )
+
+    duration = time.perf_counter() - start
+    attributes = {"openzaak.notifications.kanaal": kanaal}
+    notifications_sent_counter.add(len(messages) - len(failed), attributes)
+    notifications_failed_counter.add(len(failed), attributes)
+    notifications_batch_size_histogram.record(len(messages), attributes)
+    notifications_batch_duration_histogram.record(duration, attributes)
+
+    if get_setting("LOG_NOTIFICATIONS_IN_DB"):
+        if delivered:
+            FailedNotification.objects.filter(pk__in=delivered).delete()
+        if responses:
+            NotificationResponse.objects.bulk_create(responses)
+
+    if failed and config.notification_delivery_max_retries:
+        countdown = get_exponential_backoff_interval(
+            factor=config.notification_delivery_retry_backoff,
+            retries=0,
+            maximum=config.notification_delivery_retry_backoff_max,
+            base=config.notification_delivery_base_factor,
+        )
+        for message, notification_id in failed:
+            send_notification.apply_async(
+                (message, notification_id), countdown=countdown, retries=1
+            )
+
+    logger.info(
+        "notification_batch_delivered",
+        kanaal=kanaal,
+        sent=len(messages) - len(failed),
+        failed=len(failed),
+        duration=round(duration, 3),
+    )
+    return {"sent": len(messages) - len(failed), "failed": len(failed)}
+
+
+@celery_app.task()
+def publish_cloudevents() -> dict[str, int]:
+    """
+    Publish the pending cloud events from the outbox, batch after batch.
+
+    Publishing stops when the outbox is drained, when a batch could not be
+    published completely or when the receiver can't keep up. The remaining events
+    are published by the next run.
+    """
+    published = failed = 0
+    if not settings.CLOUD_EVENTS_OUTBOX:
+        return {"published": published, "failed": failed}
+
+    while True:
+        result = publish_outbox()
+        published += result.published
+        failed += result.failed
+
+        if result.throttled or result.failed or not result.published:
+            break
+
+    return {"published": published, "failed": failed}
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubReceiverHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.received.append((self.path, json.loads(body)))
+            self.server.connections.add(self.client_address)
+
+        content = b"{}"
+        self.send_response(self.server.status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubReceiver(ThreadingHTTPServer):
+    """
+    Local stub of the Notificaties API, recording the received notifications and
+    cloud events.
+    """
+
+    def __init__(self, status_code: int = 201):
+        super().__init__(("127.0.0.1", 0), StubReceiverHandler)
+        self.status_code = status_code
+        self.lock = threading.Lock()
+        self.received: list[tuple[str, dict]] = []
+        self.connections: set[tuple[str, int]] = set()
+
+    @property
+    def api_root(self) -> str:
+        host, port = self.server_address
+        return f"http://{host}:{port}/api/v1/"
+
+    def start(self, test_case) -> None:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        test_case.addCleanup(self.server_close)
+        test_case.addCleanup(self.shutdown)
@@ -0,0 +1,212 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+import requests
+import requests_mock
+from notifications_api_common.models import (
+    FailedNotification,
+    NotificationsConfig,
+    NotificationTypes,
+)
+
+from openzaak.utils.cloudevents import process_cloudevent
+
+from ..models import OutboxCloudEvent
+from ..outbox import publish_outbox
+from ..tasks import publish_cloudevents
+from .mixins import NotificationsConfigMixin
+from .stub import StubReceiver
+
+SOURCE = "urn:nld:oin:00000001823288444000:zakensysteem"
+
+
+@override_settings(
+    ENABLE_CLOUD_EVENTS=True,
+    CLOUD_EVENTS_OUTBOX=True,
+    NOTIFICATIONS_SOURCE=SOURCE,
+)
+@patch.object(publish_cloudevents, "delay")
+class OutboxTests(TestCase):
+    def test_cloudevent_is_stored_in_transaction(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                process_cloudevent("nl.overheid.zaken.zaak-geopend", "1", "/zaak/1")
+                process_cloudevent("nl.overheid.zaken.zaak-gemuteerd", "1", "/zaak/1")
+
+        self.assertEqual(
+            list(
+                OutboxCloudEvent.objects.order_by("pk").values_list("type", flat=True)
+            ),
+            ["nl.overheid.zaken.zaak-geopend", "nl.overheid.zaken.zaak-gemuteerd"],
+        )
+        event = OutboxCloudEvent.objects.first().event
+        self.assertEqual(event["source"], SOURCE)
+        self.assertEqual(event["subject"], "1")
+        self.assertEqual(event["dataref"], "/zaak/1")
+        # publishing is scheduled once per transaction
+        mock_delay.assert_called_once_with()
+
+    def test_duplicate_cloudevent_in_transaction_is_replaced(self, mock_delay):
+        with transaction.atomic():
+            process_cloudevent("nl.overheid.zaken.zaak-gemuteerd", "1", data={"a": 1})
+            process_cloudevent("nl.overheid.zaken.zaak-gemuteerd", "1", data={"a": 2})
+            process_cloudevent("nl.overheid.zaken.zaak-gemuteerd", "2", data={"a": 3})
+
+        self.assertEqual(
+            list(
+                OutboxCloudEvent.objects.order_by("pk").values_list(
+                    "subject", "event__data"
+                )
+            ),
+            [("1", {"a": 2}), ("2", {"a": 3})],
+        )
+
+    def test_duplicate_cloudevent_without_subject_is_replaced(self, mock_delay):
+        with transaction.atomic():
+            process_cloudevent("nl.overheid.zaken.zaak-gemuteerd", data={"a": 1})
+            process_cloudevent("nl.overheid.zaken.zaak-gemuteerd", data={"a": 2})
+
+        self.assertEqual(
+            list(OutboxCloudEvent.objects.values_list("subject", "event__data")),
+            [("", {"a": 2})],
+        )
+
+    def test_rolled_back_cloudevent_is_not_stored(self, mock_delay):
+        try:
+            with transaction.atomic():
+                process_cloudevent("nl.overheid.zaken.zaak-gemuteerd", "1")
+                raise ValueError
+        except ValueError:
+            pass
+
+        self.assertFalse(OutboxCloudEvent.objects.exists())
+
+
+def _add_event(subject: str, **kwargs) -> OutboxCloudEvent:
+    return OutboxCloudEvent.objects.create(
+        event={"id": subject, "type": "nl.overheid.zaken.zaak-gemuteerd"},
+        type="nl.overheid.zaken.zaak-gemuteerd",
+        subject=subject,
+        **kwargs,
+    )
+
+
+@override_settings(CLOUD_EVENTS_OUTBOX=True, CLOUD_EVENTS_OUTBOX_BATCH_SIZE=2)
+class PublishOutboxTests(NotificationsConfigMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.server = StubReceiver()
+        self.server.start(self)
+        self._configure_notifications(api_root=self.server.api_root)
+
+    def test_publish_in_order(self):
+        for subject in ("1", "2", "3"):
+            _add_event(subject)
+        _add_event("4", next_attempt=timezone.now() + timedelta(hours=1))
+
+        result = publish_cloudevents()
+
+        self.assertEqual(result, {"published": 3, "failed": 0})
+        self.assertEqual(
+            [(path, event["id"]) for path, event in self.server.received],
+            [
+                ("/api/v1/cloudevents", "1"),
+                ("/api/v1/cloudevents", "2"),
+                ("/api/v1/cloudevents", "3"),
+            ],
+        )
+        self.assertEqual(
+            list(OutboxCloudEvent.objects.values_list("subject", flat=True)), ["4"]
+        )
+
+    def test_leased_events_are_skipped(self):
+        now = timezone.now()
+        _add_event("1", leased_until=now + timedelta(minutes=5))
+        _add_event("2", leased_until=now - timedelta(minutes=5))
+        _add_event("3")
+
+        result = publish_outbox()
+
+        self.assertEqual(result.published, 2)
+        self.assertEqual(
+            [event["id"] for _path, event in self.server.received], ["2", "3"]
+        )
+        self.assertEqual(
+            list(OutboxCloudEvent.objects.values_list("subject", flat=True)), ["1"]
+        )
+
+    def test_failed_events_are_retried_later(self):
+        config = NotificationsConfig.get_solo()
+        config.notification_delivery_max_retries = 1
+        config.save()
+        self.server.status_code = 400
+        event = _add_event("1")
+
+        result = publish_outbox()
+
+        self.assertEqual((result.published, result.failed), (0, 1))
+        self.assertFalse(result.throttled)
+        event.refresh_from_db()
+        self.assertEqual(event.attempts, 1)
+        self.assertGreater(event.next_attempt, timezone.now())
+
+        # the next attempt exceeds the maximum number of retries
+        OutboxCloudEvent.objects.update(next_attempt=None)
+        publish_outbox()
+
+        self.assertFalse(OutboxCloudEvent.objects.exists())
+        failed_notification = FailedNotification.objects.get()
+        self.assertEqual(failed_notification.type, NotificationTypes.cloudevent)
+        self.assertEqual(failed_notification.message, event.event)
+
+    def test_publishing_stops_when_receiver_cannot_keep_up(self):
+        self.server.status_code = 503
+        _add_event("1")
+        _add_event("2")
+
+        result = publish_outbox()
+
+        self.assertTrue(result.throttled)
+        self.assertEqual(len(self.server.received), 1)
+        self.assertEqual(
+            list(
+                OutboxCloudEvent.objects.order_by("pk").values_list(
+                    "attempts", flat=True
+                )
+            ),
+            [1, 0],
+        )
+        # the lease of the unpublished events is released
+        self.assertFalse(OutboxCloudEvent.objects.filter(leased_until__isnull=False))
+
+    def test_management_command(self):
+        _add_event("1")
+        out = StringIO()
+
+        call_command("publish_cloudevents", once=True, stdout=out)
+
+        self.assertIn("Published 1 cloud event(s), 0 failed.", out.getvalue())
+        self.assertFalse(OutboxCloudEvent.objects.exists())
+
+    @requests_mock.Mocker()
+    def test_connection_error_is_back_pressure(self, m):
+        self._configure_notifications(api_root="http://notificaties.local/api/v1/")
+        m.post(
+            "http://notificaties.local/api/v1/cloudevents",
+            exc=requests.ConnectionError("refused"),
+        )
+        _add_event("1")
+
+        result = publish_outbox()
+
+        self.assertTrue(result.throttled)
+        self.assertEqual(OutboxCloudEvent.objects.get().attempts, 1)
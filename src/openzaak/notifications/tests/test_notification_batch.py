@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase, override_settings, tag
+
+import requests_mock
+from notifications_api_common.models import (
+    FailedNotification,
+    NotificationResponse,
+    NotificationsConfig,
+    NotificationTypes,
+)
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import reverse
+
+from openzaak.components.catalogi.tests.factories import ZaakTypeFactory
+from openzaak.components.zaken.tests.utils import ZAAK_WRITE_KWARGS, get_operation_url
+from openzaak.tests.utils import JWTAuthMixin
+
+from ..tasks import send_notifications
+from ..viewsets import queue_notifications
+from . import mock_notification_send
+from .mixins import NotificationsConfigMixin
+from .stub import StubReceiver
+
+
+def _message(kanaal: str, index: int) -> dict:
+    return {
+        "kanaal": kanaal,
+        "hoofdObject": f"http://testserver/{kanaal}/{index}",
+        "resource": kanaal,
+        "resourceUrl": f"http://testserver/{kanaal}/{index}",
+        "actie": "create",
+        "aanmaakdatum": "2026-01-01T00:00:00Z",
+        "kenmerken": {},
+    }
+
+
+@override_settings(NOTIFICATIONS_BATCH_DELIVERY=True, NOTIFICATIONS_BATCH_SIZE=2)
+@patch.object(send_notifications, "delay")
+class QueueNotificationsTests(TestCase):
+    def test_notifications_are_coalesced_per_kanaal(self, mock_delay):
+        messages = [
+            _message("zaken", 1),
+            _message("documenten", 1),
+            _message("zaken", 2),
+            _message("zaken", 3),
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                queue_notifications(messages[:2])
+                queue_notifications(messages[2:])
+
+        # the notifications are dispatched together, by the last callback
+        self.assertEqual(len(callbacks), 2)
+        ids = dict(
+            zip(
+                (message["resourceUrl"] for message in messages),
+                FailedNotification.objects.order_by("pk").values_list("pk", flat=True),
+            )
+        )
+        self.assertEqual(
+            [call.args for call in mock_delay.call_args_list],
+            [
+                (
+                    [messages[0], messages[2]],
+                    [ids[messages[0]["resourceUrl"]], ids[messages[2]["resourceUrl"]]],
+                ),
+                ([messages[3]], [ids[messages[3]["resourceUrl"]]]),
+                ([messages[1]], [ids[messages[1]["resourceUrl"]]]),
+            ],
+        )
+
+    def test_notifications_are_logged_before_the_commit(self, mock_delay):
+        messages = [_message("zaken", 1), _message("documenten", 1)]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                queue_notifications(messages)
+
+                # the notifications can be retried if they are never dispatched
+                self.assertEqual(
+                    list(
+                        FailedNotification.objects.order_by("pk").values_list(
+                            "message", flat=True
+                        )
+                    ),
+                    messages,
+                )
+                mock_delay.assert_not_called()
+
+        self.assertEqual(mock_delay.call_count, 2)
+
+    def test_notifications_of_savepoints_are_coalesced(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_notifications([_message("zaken", 1)])
+            with transaction.atomic():
+                queue_notifications([_message("zaken", 2)])
+            try:
+                with transaction.atomic():
+                    queue_notifications([_message("zaken", 3)])
+                    raise ValueError
+            except ValueError:
+                pass
+
+        mock_delay.assert_called_once()
+        self.assertEqual(
+            mock_delay.call_args.args[0], [_message("zaken", 1), _message("zaken", 2)]
+        )
+
+    def test_rolled_back_notifications_are_not_sent(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_notifications([_message("zaken", 1)])
+            try:
+                with transaction.atomic():
+                    queue_notifications([_message("zaken", 2)])
+                    raise ValueError
+            except ValueError:
+                pass
+
+        mock_delay.assert_called_once()
+        self.assertEqual(mock_delay.call_args.args[0], [_message("zaken", 1)])
+        self.assertEqual(FailedNotification.objects.count(), 1)
+
+
+@tag("notifications")
+@override_settings(
+    NOTIFICATIONS_DISABLED=False,
+    NOTIFICATIONS_BATCH_DELIVERY=True,
+    CELERY_TASK_ALWAYS_EAGER=True,
+)
+@requests_mock.Mocker()
+class SendNotificationsTests(NotificationsConfigMixin, JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_create_zaak_sends_batched_notification(self, m):
+        mock_notification_send(m)
+        zaaktype = ZaakTypeFactory.create(concept=False)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                get_operation_url("zaak_create"),
+                {
+                    "zaaktype": f"http://testserver{reverse(zaaktype)}",
+                    "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+                    "bronorganisatie": "517439943",
+                    "verantwoordelijkeOrganisatie": "517439943",
+                    "registratiedatum": "2012-01-13",
+                    "startdatum": "2012-01-13",
+                },
+                **ZAAK_WRITE_KWARGS,
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        notifications = [
+            request.json() for request in m.request_history if request.method == "POST"
+        ]
+        self.assertEqual(len(notifications), 1)
+        self.assertEqual(notifications[0]["resourceUrl"], response.data["url"])
+        self.assertFalse(FailedNotification.objects.exists())
+
+    @patch("openzaak.notifications.tasks.send_notification.apply_async")
+    def test_failed_notifications_are_retried_separately(self, m, mock_retry):
+        config = NotificationsConfig.get_solo()
+        config.notification_delivery_max_retries = 3
+        config.save()
+        mock_notification_send(m, status_code=500)
+        messages = [_message("zaken", 1), _message("zaken", 2)]
+        failed_notifications = FailedNotification.objects.bulk_create(
+            FailedNotification(message=message, type=NotificationTypes.notification)
+            for message in messages
+        )
+
+        result = send_notifications(
+            messages, [notification.pk for notification in failed_notifications]
+        )
+
+        self.assertEqual(result, {"sent": 0, "failed": 2})
+        self.assertEqual(FailedNotification.objects.count(), 2)
+        self.assertEqual(
+            NotificationResponse.objects.filter(attempt=1, response_status=500).count(),
+            2,
+        )
+        self.assertEqual(mock_retry.call_count, 2)
+        self.assertEqual(
+            mock_retry.call_args.args[0], (messages[1], failed_notifications[1].pk)
+        )
+        self.assertEqual(mock_retry.call_args.kwargs["retries"], 1)
+
+
+@tag("notifications", "performance")
+@override_settings(NOTIFICATIONS_BATCH_DELIVERY=True, NOTIFICATIONS_BATCH_SIZE=50)
+class NotificationsLoadTests(NotificationsConfigMixin, TestCase):
+    """
+    Deliver a burst of notifications to a local stub of the Notificaties API.
+    """
+
+    amount = 300
+
+    def setUp(self):
+        super().setUp()
+
+        self.server = StubReceiver()
+        self.server.start(self)
+        self._configure_notifications(api_root=self.server.api_root)
+
+    def test_burst_of_notifications(self):
+        messages = [
+            _message(kanaal, index)
+            for index in range(self.amount // 3)
+            for kanaal in ("zaken", "documenten", "besluiten")
+        ]
+
+        with (
+            override_settings(CELERY_TASK_ALWAYS_EAGER=True),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            queue_notifications(messages)
+
+        self.assertEqual(len(self.server.received), self.amount)
+        # a connection is used for (at least) a whole batch
+        self.assertLessEqual(len(self.server.connections), self.amount // 50)
+        self.assertFalse(FailedNotification.objects.exists())
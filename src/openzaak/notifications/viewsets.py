@@ -1,15 +1,24 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
+from collections import defaultdict
+from itertools import batched
 from typing import Callable, Dict, List, Union
 
+from django.conf import settings
 from django.db import models, transaction
 
 import structlog
 from cloudevents.exceptions import GenericException
 from cloudevents.http import CloudEvent, from_http
-from notifications_api_common.models import NotificationTypes
+from notifications_api_common.models import FailedNotification, NotificationTypes
+from notifications_api_common.settings import get_setting
 from notifications_api_common.tasks import create_failed_notification, send_notification
-from notifications_api_common.viewsets import NotificationMixin
+from notifications_api_common.viewsets import (
+    NotificationCreateMixin as _NotificationCreateMixin,
+    NotificationDestroyMixin as _NotificationDestroyMixin,
+    NotificationMixin as _NotificationMixin,
+    NotificationViewSetMixin as _NotificationViewSetMixin,
+)
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
@@ -18,13 +27,35 @@ from rest_framework.views import APIView
 from structlog.contextvars import bind_contextvars, bound_contextvars
 from vng_api_common.constants import ComponentTypes
 
+from openzaak.utils.db import OnCommitBatch
 from openzaak.utils.permissions import AuthScopesRequired
 
 from .scopes import SCOPE_CLOUDEVENTS_BEZORGEN
+from .tasks import send_notifications
 
 logger = structlog.stdlib.get_logger(__name__)
 
 
+class NotificationMixin(_NotificationMixin):
+    def _message(self, data, instance=None):
+        if not settings.NOTIFICATIONS_BATCH_DELIVERY:
+            return super()._message(data, instance=instance)
+
+        schedule_notifications([self.construct_message(data, instance=instance)])
+
+
+class NotificationCreateMixin(NotificationMixin, _NotificationCreateMixin):
+    pass
+
+
+class NotificationDestroyMixin(NotificationMixin, _NotificationDestroyMixin):
+    pass
+
+
+class NotificationViewSetMixin(NotificationMixin, _NotificationViewSetMixin):
+    pass
+
+
 class MultipleNotificationMixin(NotificationMixin):
     notification_fields: dict[str, dict[str, str]]
 
@@ -38,26 +69,108 @@ class MultipleNotificationMixin(NotificationMixin):
         super().notify(status_code, data, instance)
 
     def _message(self, data, instance=None):
+        messages = []
         for field, config in self.notification_fields.items():
             field_data = data[field]
             notifications = field_data if isinstance(field_data, list) else [field_data]
 
             for notif in notifications:
                 # build the content of the notification
-                message = self.construct_message(
-                    notif,
-                    instance=instance,
-                    kanaal=config["notifications_kanaal"],
-                    model=config["model"],
-                    action=config.get("action"),
+                messages.append(
+                    self.construct_message(
+                        notif,
+                        instance=instance,
+                        kanaal=config["notifications_kanaal"],
+                        model=config["model"],
+                        action=config.get("action"),
+                    )
                 )
 
-                pk = create_failed_notification(message, NotificationTypes.notification)
-                transaction.on_commit(
-                    lambda msg=message, notification_id=pk: send_notification.delay(
-                        msg, notification_id
-                    )
+        if settings.NOTIFICATIONS_BATCH_DELIVERY:
+            schedule_notifications(messages)
+            return
+
+        for message in messages:
+            pk = create_failed_notification(message, NotificationTypes.notification)
+            transaction.on_commit(
+                lambda msg=message, notification_id=pk: send_notification.delay(
+                    msg, notification_id
                 )
+            )
+
+
+def _log_notifications(messages: list[dict]) -> list[int | None]:
+    """
+    Log the notifications with a single query, so they can be retried if sending
+    them fails.
+    """
+    if not get_setting("LOG_NOTIFICATIONS_IN_DB"):
+        return [None] * len(messages)
+
+    return [
+        failed_notification.pk
+        for failed_notification in FailedNotification.objects.bulk_create(
+            FailedNotification(message=message, type=NotificationTypes.notification)
+            for message in messages
+        )
+    ]
+
+
+def schedule_notifications(messages: list[dict]) -> None:
+    """
+    Schedule sending the notifications once the transaction is committed.
+
+    Equivalent to scheduling every notification separately, but the notifications
+    are logged with a single query and the tasks are queued by a single callback.
+
+    With ``NOTIFICATIONS_BATCH_DELIVERY`` the notifications of the transaction are
+    collected and sent in batches per kanaal instead, see
+    :func:`dispatch_notifications`.
+    """
+    if not messages:
+        return
+
+    if settings.NOTIFICATIONS_BATCH_DELIVERY:
+        queue_notifications(messages)
+        return
+
+    notification_ids = _log_notifications(messages)
+
+    def _send():
+        for message, notification_id in zip(messages, notification_ids):
+            send_notification.delay(message, notification_id)
+
+    transaction.on_commit(_send)
+
+
+def queue_notifications(messages: list[dict]) -> None:
+    """
+    Log the notifications and add them to the batch of the current transaction.
+
+    The notifications are logged as part of the transaction, like notifications
+    that are scheduled separately, so they are not lost if dispatching them fails.
+    """
+    notification_ids = _log_notifications(messages)
+    notification_batch.add(list(zip(messages, notification_ids)))
+
+
+def dispatch_notifications(notifications: list[tuple[dict, int | None]]) -> None:
+    """
+    Queue a task per batch of ``NOTIFICATIONS_BATCH_SIZE`` notifications of the
+    same kanaal.
+    """
+    by_kanaal: dict[str, list[tuple[dict, int | None]]] = defaultdict(list)
+    for message, notification_id in notifications:
+        by_kanaal[message["kanaal"]].append((message, notification_id))
+
+    for kanaal_notifications in by_kanaal.values():
+        for batch in batched(kanaal_notifications, settings.NOTIFICATIONS_BATCH_SIZE):
+            batch_messages, batch_ids = zip(*batch)
+            send_notifications.delay(list(batch_messages), list(batch_ids))
+
+
+# the notifications of a transaction, dispatched once it is committed
+notification_batch = OnCommitBatch(dispatch_notifications)
 
 
 type CloudEventHandler = Callable[[CloudEvent], None]
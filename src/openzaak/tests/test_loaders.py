@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+import requests_mock
+from django_loose_fk.loaders import FetchError
+
+from openzaak.loaders import AuthorizedRequestsLoader, remote_fetch_context
+
+ZAAKTYPE = "https://externe.catalogus.nl/api/v1/zaaktypen/1"
+OTHER_ZAAKTYPE = "https://externe.catalogus.nl/api/v1/zaaktypen/2"
+
+
+@requests_mock.Mocker()
+class RemoteFetchContextTests(TestCase):
+    def test_fetch_object_is_deduplicated(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE, "omschrijvingGeneriek": "test"})
+
+        with remote_fetch_context() as context:
+            data1 = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+            data2 = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(data1, {"url": ZAAKTYPE, "omschrijving_generiek": "test"})
+        self.assertEqual(data1, data2)
+        self.assertEqual(context.num_fetches, 1)
+        self.assertEqual(context.num_cache_hits, 1)
+
+    def test_fetch_object_without_context(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_prefetch(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+        m.get(OTHER_ZAAKTYPE, json={"url": OTHER_ZAAKTYPE})
+        loader = AuthorizedRequestsLoader()
+
+        with remote_fetch_context() as context:
+            loader.prefetch([ZAAKTYPE, OTHER_ZAAKTYPE, ZAAKTYPE])
+
+            self.assertEqual(m.call_count, 2)
+
+            data = loader.fetch_object(OTHER_ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(data, {"url": OTHER_ZAAKTYPE})
+        self.assertEqual(context.num_fetches, 2)
+
+    def test_prefetch_error_is_raised_on_load(self, m):
+        m.get(ZAAKTYPE, status_code=404)
+
+        with remote_fetch_context():
+            AuthorizedRequestsLoader().prefetch([ZAAKTYPE])
+
+            with self.assertRaises(FetchError):
+                AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 1)
+
+    def test_prefetch_skips_local_urls(self, m):
+        with remote_fetch_context() as context:
+            AuthorizedRequestsLoader().prefetch(
+                ["http://testserver/catalogi/api/v1/zaaktypen/1"]
+            )
+
+        self.assertEqual(m.call_count, 0)
+        self.assertEqual(context.results, {})
+
+
+@override_settings(LOOSE_FK_CACHE_TIMEOUT=60)
+@requests_mock.Mocker()
+class SharedCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_cached_with_default_timeout(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        data = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(data, {"url": ZAAKTYPE})
+
+    def test_no_store_is_honoured(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE}, headers={"Cache-Control": "no-store"})
+
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_stale_entry_is_revalidated(self, m):
+        m.get(
+            ZAAKTYPE,
+            [
+                {
+                    "json": {"url": ZAAKTYPE},
+                    "headers": {"Cache-Control": "max-age=0", "ETag": '"abc"'},
+                },
+                {"status_code": 304, "headers": {"Cache-Control": "max-age=0"}},
+            ],
+        )
+
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+        data = AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+        self.assertEqual(data, {"url": ZAAKTYPE})
+
+    def test_prefetch_uses_shared_cache(self, m):
+        m.get(ZAAKTYPE, json={"url": ZAAKTYPE})
+        AuthorizedRequestsLoader.fetch_object(ZAAKTYPE)
+
+        with remote_fetch_context() as context:
+            AuthorizedRequestsLoader().prefetch([ZAAKTYPE])
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(context.num_fetches, 0)
+        self.assertEqual(context.num_cache_hits, 1)
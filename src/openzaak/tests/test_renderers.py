@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from collections import OrderedDict
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.http import StreamingHttpResponse
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy as _
+
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as LibraryCamelCaseJSONRenderer,
+)
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import reverse
+
+from openzaak.components.documenten.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+)
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.tests.utils import JWTAuthMixin
+from openzaak.utils.mixins import StreamingListMixin
+from openzaak.utils.renderers import CamelCaseJSONRenderer
+
+
+class CamelCaseJSONRendererTests(SimpleTestCase):
+    def test_output_identical_to_library(self):
+        data = OrderedDict(
+            [
+                ("count", 2),
+                ("next", None),
+                (
+                    "results",
+                    [
+                        {
+                            "url": "http://testserver/zaken/api/v1/zaken/1",
+                            "zaak_identificatie": "ZAAK-2024-0000000001",
+                            "omschrijving": "Straatverlichting   kapot – ‘café’\u2028",
+                            "startdatum": date(2024, 3, 1),
+                            "zaakgeometrie": {
+                                "type": "Point",
+                                "coordinates": [4.1, 52.2],
+                            },
+                            "kenmerken": [{"kenmerk": "k", "bron_organisatie": "b"}],
+                            "betalingsindicatie_weergave": _("Nog niet"),
+                            "bedrag_2": Decimal("1.50"),
+                            "_expand": {},
+                            1: "non string key",
+                            "leeg": (),
+                        },
+                        {"hoofdzaak": None, "deelzaken": ["a", "b"], "is_valid": True},
+                    ],
+                ),
+            ]
+        )
+
+        for media_type in ("application/json", "application/json; indent=4"):
+            with self.subTest(media_type=media_type):
+                self.assertEqual(
+                    CamelCaseJSONRenderer().render(data, media_type),
+                    LibraryCamelCaseJSONRenderer().render(data, media_type),
+                )
+
+
+@override_settings(STREAM_LIST_RESPONSES=True)
+class StreamingListResponseTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def assertStreamedResponseEqual(self, url, method="get", **kwargs):
+        do_request = getattr(self.client, method)
+        with override_settings(STREAM_LIST_RESPONSES=False):
+            expected = do_request(url, **kwargs)
+
+        response = do_request(url, **kwargs)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(b"".join(response.streaming_content), expected.content)
+        self.assertEqual(response["Content-Type"], expected["Content-Type"])
+        self.assertEqual(response["API-version"], expected["API-version"])
+        return response
+
+    def test_zaken_list(self):
+        ZaakFactory.create_batch(3)
+
+        with self.subTest("multiple chunks"):
+            with patch.object(StreamingListMixin, "stream_chunk_size", 2):
+                self.assertStreamedResponseEqual(reverse("zaak-list"))
+
+        response = self.assertStreamedResponseEqual(reverse("zaak-list"))
+        self.assertEqual(response["Content-Crs"], "EPSG:4326")
+
+    def test_zaken_list_empty(self):
+        self.assertStreamedResponseEqual(reverse("zaak-list"))
+
+    def test_enkelvoudiginformatieobjecten_list(self):
+        EnkelvoudigInformatieObjectFactory.create_batch(3)
+
+        self.assertStreamedResponseEqual(reverse("enkelvoudiginformatieobject-list"))
+
+    def test_enkelvoudiginformatieobjecten_zoek(self):
+        eio1, eio2, _ = EnkelvoudigInformatieObjectFactory.create_batch(3)
+        data = {
+            "url__in": [
+                f"http://testserver{reverse(eio1)}",
+                f"http://testserver{reverse(eio2)}",
+            ]
+        }
+
+        with patch.object(StreamingListMixin, "stream_chunk_size", 1):
+            self.assertStreamedResponseEqual(
+                reverse("enkelvoudiginformatieobject--zoek"),
+                method="post",
+                data=data,
+            )
+
+    def test_zaken_zoek(self):
+        zaak1, zaak2, _ = ZaakFactory.create_batch(3)
+
+        self.assertStreamedResponseEqual(
+            reverse("zaak--zoek"),
+            method="post",
+            data={"uuid__in": [zaak1.uuid, zaak2.uuid]},
+            HTTP_ACCEPT_CRS="EPSG:4326",
+            HTTP_CONTENT_CRS="EPSG:4326",
+        )
+
+    def test_expand_is_not_streamed(self):
+        ZaakFactory.create()
+
+        response = self.client.get(reverse("zaak-list"), {"expand": "zaaktype"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIsInstance(response, StreamingHttpResponse)
+
+    def test_expand_in_search_body_is_not_streamed(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        response = self.client.post(
+            reverse("enkelvoudiginformatieobject--zoek"),
+            {"uuid__in": [eio.uuid], "expand": ["informatieobjecttype"]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIsInstance(response, StreamingHttpResponse)
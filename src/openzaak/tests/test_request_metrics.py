@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from unittest.mock import MagicMock, patch
+
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from structlog.testing import capture_logs
+from vng_api_common.tests import reverse
+
+from openzaak.components.zaken.tests.factories import ZaakFactory
+from openzaak.tests.utils import JWTAuthMixin
+from openzaak.utils.metrics import (
+    request_db_queries_histogram,
+    request_serializer_duration_histogram,
+)
+
+
+@override_settings(API_METRICS_SAMPLE_RATE=1.0, API_METRICS_DURATION_BUDGET=0)
+class RequestMetricsMiddlewareTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    @patch.object(
+        request_db_queries_histogram,
+        "record",
+        wraps=request_db_queries_histogram.record,
+    )
+    @patch.object(
+        request_serializer_duration_histogram,
+        "record",
+        wraps=request_serializer_duration_histogram.record,
+    )
+    def test_metrics_are_recorded(
+        self, mock_serializer_record: MagicMock, mock_queries_record: MagicMock
+    ):
+        ZaakFactory.create_batch(2)
+
+        response = self.client.get(reverse("zaak-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_queries_record.assert_called_once()
+        num_queries, attributes = mock_queries_record.call_args.args
+        self.assertGreater(num_queries, 0)
+        self.assertEqual(
+            attributes,
+            {
+                "openzaak.endpoint": "zaak.list",
+                "http.request.method": "GET",
+                "http.response.status_code": 200,
+            },
+        )
+        mock_serializer_record.assert_called_once()
+        serializer_duration, _ = mock_serializer_record.call_args.args
+        self.assertGreater(serializer_duration, 0)
+
+    @override_settings(API_METRICS_SAMPLE_RATE=0.0)
+    @patch.object(request_db_queries_histogram, "record")
+    def test_metrics_are_not_recorded_if_not_sampled(self, mock_record: MagicMock):
+        response = self.client.get(reverse("zaak-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_record.assert_not_called()
+
+    @patch.object(request_db_queries_histogram, "record")
+    def test_metrics_are_not_recorded_for_non_api_requests(
+        self, mock_record: MagicMock
+    ):
+        self.client.get("/")
+
+        mock_record.assert_not_called()
+
+    @override_settings(API_METRICS_ENDPOINT_BUDGETS={"zaak.list": {"queries": 1}})
+    def test_exceeding_endpoint_budget_is_logged(self):
+        with capture_logs() as cap_logs:
+            response = self.client.get(reverse("zaak-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        log = next(
+            log for log in cap_logs if log["event"] == "api_request_budget_exceeded"
+        )
+        self.assertEqual(log["log_level"], "warning")
+        self.assertEqual(log["endpoint"], "zaak.list")
+        self.assertEqual(log["query_budget"], 1)
+        self.assertGreater(log["num_queries"], 1)
+
+    def test_within_budget_is_not_logged(self):
+        with capture_logs() as cap_logs:
+            response = self.client.get(reverse("zaak-list"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(
+            any(log["event"] == "api_request_budget_exceeded" for log in cap_logs)
+        )
@@ -11,6 +11,8 @@ from vng_api_common.models import JWTSecret
 from vng_api_common.scopes import Scope
 from vng_api_common.tests import reverse
 
+from openzaak.components.autorisaties.caching import invalidate_authorizations_cache
+
 
 class JWTAuthMixin:
     """
@@ -79,6 +81,9 @@ class JWTAuthMixin:
     def setUp(self):
         super().setUp()
 
+        # the database is rolled back after each test, but the cache is not
+        invalidate_authorizations_cache()
+
         token = generate_jwt(
             self.client_id,
             self.secret,
@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+from uuid import UUID
+
+from django.db.models import QuerySet
+from django.db.models.functions import Right
+
+# The URL of the main object (``AuditTrail.hoofd_object``) ends with its UUID. This
+# expression is indexed, see ``zaken/migrations/0051_audittrail_hoofd_object_uuid``
+HOOFD_OBJECT_UUID = Right("hoofd_object", 36)
+
+
+def filter_hoofd_object_uuid(queryset: QuerySet, uuid: UUID | str) -> QuerySet:
+    """
+    Filter the audit trails on the UUID of their main object.
+
+    Unlike ``hoofd_object__contains``, which has to recheck every match of the
+    trigram index, this is a plain B-tree index lookup.
+    """
+    return queryset.alias(hoofd_object_uuid=HOOFD_OBJECT_UUID).filter(
+        hoofd_object_uuid=str(UUID(str(uuid)))
+    )
@@ -5,11 +5,17 @@ import contextvars
 from django.conf import settings
 from django.db import transaction
 
+import structlog
 from notifications_api_common.cloudevents import (
+    construct_cloudevent,
     process_cloudevent as _process_cloudevent,
 )
 from vng_api_common.tests import reverse
 
+from openzaak.notifications.outbox import add_to_outbox
+
+logger = structlog.stdlib.get_logger(__name__)
+
 """
 Because cloud events are triggered via model signals, endpoints that affect multiple
 resources could trigger the same cloud event twice. To avoid duplicate cloud events
@@ -39,8 +45,19 @@ def process_cloudevent(
     dataref: str | None = None,
     data: dict | None = None,
 ):
-    if settings.ENABLE_CLOUD_EVENTS:
+    if not settings.ENABLE_CLOUD_EVENTS:
+        return
+
+    if not settings.CLOUD_EVENTS_OUTBOX:
         transaction.on_commit(lambda: _process_cloudevent(type, subject, dataref, data))
+        return
+
+    if not settings.NOTIFICATIONS_SOURCE:
+        logger.warning("no_notification_source_set")
+        return
+
+    # stored as part of the current transaction, published by a separate worker
+    add_to_outbox(construct_cloudevent(type, subject, dataref, data))
 
 
 def get_url(obj, request):
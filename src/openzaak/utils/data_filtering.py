@@ -1,5 +1,10 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from django.db.models import QuerySet
+
+from openzaak.utils.query import CompiledAuthorizations
+
+
 class ListFilterByAuthorizationsMixin:
     """
     Filter list-action data by the authorizations configured.
@@ -9,24 +14,28 @@ class ListFilterByAuthorizationsMixin:
     implementation facilitates it in a conventional way.
 
     For this to be effective, the underlying model must have a queryset
-    method ``filter_for_authorizations``, which is provided by
+    method ``filter_for_compiled_authorizations``, which is provided by
     :class:`openzaak.utils.query.LooseFkAuthorizationsFilterMixin`
     """
 
-    def get_queryset(self):
-        base = super().get_queryset()
-
+    def get_compiled_authorizations(
+        self, queryset: QuerySet
+    ) -> CompiledAuthorizations | None:
+        """
+        Return the compiled authorizations the records of ``queryset`` are filtered
+        by, or ``None`` if they are not filtered for the current request.
+        """
         # django-loose-fk calls get_queryset on viewsets to resolve URLs to resources
         # and in this case the request has no jwt_auth set
         if not hasattr(self.request, "jwt_auth"):
-            return base
+            return None
 
         if self.action in ["retrieve", "create", "destroy", "update", "partial_update"]:
             # Permission for these actions on singular items is checked in AuthRequired
             # and AuthScopesRequired (src/openzaak/utils/permissions.py)
             # and should 403 if the resource exists, not 404 (which happens if we return
             # an empty filtered queryset here)
-            return base
+            return None
 
         # get the auth apps that are relevant for this particular request
         apps = self.request.jwt_auth.applicaties
@@ -34,14 +43,22 @@ class ListFilterByAuthorizationsMixin:
         # as soon as there's one matching app that gives you all permissions,
         # you're good - no further detailed data filtering is applied
         if any(app.heeft_alle_autorisaties for app in apps):
-            return base
+            return None
 
         scope_needed = self.required_scopes[self.action]
-        component = base.model._meta.app_label
+        component = queryset.model._meta.app_label
         authorizations = self.request.jwt_auth.get_autorisaties(component)
         catalogus_authorizations = self.request.jwt_auth.get_catalogus_autorisaties(
             component
         )
-        return base.filter_for_authorizations(
-            scope_needed, authorizations, catalogus_authorizations
+        return queryset.get_compiled_authorizations(
+            scope_needed, authorizations, catalogus_authorizations, applicaties=apps
         )
+
+    def get_queryset(self):
+        base = super().get_queryset()
+
+        compiled = self.get_compiled_authorizations(base)
+        if compiled is None:
+            return base
+        return base.filter_for_compiled_authorizations(compiled)
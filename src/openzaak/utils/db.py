@@ -2,6 +2,8 @@
 # Copyright (C) 2022 Open Zaak maintainers
 import zlib
 from contextlib import contextmanager
+from typing import Callable
+from weakref import WeakKeyDictionary, WeakSet
 
 from django.db import connections, transaction
 
@@ -15,3 +17,64 @@ def pg_advisory_lock(lock_id: str, using="default"):
             sql = f"SELECT pg_advisory_xact_lock({_lock_id})"
             cursor.execute(sql)
             yield
+
+
+class _PendingItems:
+    """
+    The items added to an :class:`OnCommitBatch` by a single call, registered as
+    ``on_commit`` callback.
+    """
+
+    def __init__(self, state: "_BatchState", items: list):
+        self.state = state
+        self.items = items
+
+    def __call__(self) -> None:
+        self.state.commit(self)
+
+
+class _BatchState:
+    def __init__(self, callback: Callable[[list], None]):
+        self.callback = callback
+        # the callbacks are only referenced by the connection, the ones discarded by
+        # a rollback are removed from this set
+        self.pending: WeakSet[_PendingItems] = WeakSet()
+        self.committed: list = []
+
+    def commit(self, pending_items: _PendingItems) -> None:
+        self.pending.discard(pending_items)
+        self.committed.extend(pending_items.items)
+        if self.pending:
+            return
+
+        items, self.committed = self.committed, []
+        self.callback(items)
+
+
+class OnCommitBatch:
+    """
+    Collect items during a transaction and process them together once it is
+    committed.
+
+    Every call to :meth:`add` registers its own ``on_commit`` callback, so the items
+    added in a savepoint that is rolled back are discarded with it. The callback is
+    called once with all committed items, by the last of these callbacks to run.
+    """
+
+    def __init__(self, callback: Callable[[list], None]):
+        self.callback = callback
+        self._states: WeakKeyDictionary = WeakKeyDictionary()
+
+    def add(self, items: list, using=None) -> None:
+        connection = transaction.get_connection(using)
+        if not connection.in_atomic_block:
+            self.callback(list(items))
+            return
+
+        state = self._states.get(connection)
+        if state is None:
+            state = self._states[connection] = _BatchState(self.callback)
+
+        pending_items = _PendingItems(state, list(items))
+        state.pending.add(pending_items)
+        transaction.on_commit(pending_items, using=using)
@@ -1,23 +1,31 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
-from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
+from collections import deque
+from typing import Dict, Hashable, List, Optional, Tuple, Type
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.db.models import prefetch_related_objects
+from django.db.models.query import get_prefetcher
 from django.utils.module_loading import import_string
 
 import structlog
+from django_loose_fk.fields import FkOrURLField
 from django_loose_fk.loaders import FetchError
 from django_loose_fk.virtual_models import ProxyMixin
-from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from rest_framework.fields import Field, SkipField
+from rest_framework.relations import ManyRelatedField, PKOnlyObject, RelatedField
 from rest_framework.request import Request
-from rest_framework.serializers import BaseSerializer, Field, Serializer
-from rest_framework_inclusions.core import InclusionLoader
+from rest_framework.serializers import Serializer
+from rest_framework_inclusions.core import Error
 from rest_framework_inclusions.renderer import (
     InclusionJSONRenderer,
     get_allowed_paths,
     should_skip_inclusions,
 )
 
+from openzaak.loaders import AuthorizedRequestsLoader
+from openzaak.utils.renderers import CamelCaseJSONRenderer
 from openzaak.utils.serializer_fields import FKOrServiceUrlField
 
 logger = structlog.stdlib.get_logger(__name__)
@@ -44,7 +52,7 @@ class InclusionNode:
         self.label = label
         self.many = many
         self.parent = parent
-        self._children = []
+        self._children: Dict[str, "InclusionNode"] = {}
 
         if self.parent:
             self.parent.add_child(self)
@@ -53,14 +61,14 @@ class InclusionNode:
         return f"{self.label}: {self.id}"
 
     def add_child(self, node: "InclusionNode"):
-        self._children.append(node)
+        self._children[node.id] = node
 
     def display_children(self) -> dict:
         """
         return dict where children are grouped by their label
         """
         results = {}
-        for child in self._children:
+        for child in self._children.values():
             child_result = child.display()
             if child.many:
                 results.setdefault(child.label, []).append(child_result)
@@ -75,56 +83,61 @@ class InclusionNode:
         return data
 
     def has_child(self, id) -> bool:
-        return any(child.id == id for child in self._children)
+        return id in self._children
 
 
 class InclusionTree:
     """
-    strictly speaking it's not a tree but a collection of nodes
+    strictly speaking it's not a tree but a collection of nodes, indexed by their id
     It's a little helper class to display nested inclusions
     """
 
     def __init__(self):
-        self._nodes = []
+        self._roots: List[InclusionNode] = []
+        # the same resource can be included in multiple places
+        self._nodes: Dict[str, List[InclusionNode]] = {}
 
     def add_node(
         self, id: str, value: dict, label: str, many: bool, parent_id: str = None
     ) -> None:
         if not parent_id:
             node = InclusionNode(id, value, label, many)
-            self._nodes.append(node)
+            self._roots.append(node)
+            self._nodes.setdefault(id, []).append(node)
             return
 
-        parent_nodes = [
-            n for n in self._nodes if n.id == parent_id and not n.has_child(id)
+        nodes = [
+            InclusionNode(id, value, label, many, parent=parent_node)
+            for parent_node in self._nodes.get(parent_id, [])
+            if not parent_node.has_child(id)
         ]
-        for parent_node in parent_nodes:
-            node = InclusionNode(id, value, label, many, parent=parent_node)
-            self._nodes.append(node)
+        self._nodes.setdefault(id, []).extend(nodes)
 
     def display_tree(self) -> dict:
-        result = {}
-        root_nodes = [n for n in self._nodes if n.parent is None]
+        return {node.id: node.display_children() for node in self._roots}
 
-        for node in root_nodes:
-            result[node.id] = node.display_children()
-        return result
 
-
-class ExpandLoader(InclusionLoader):
+class ExpandLoader:
     """
-    ExpandLoader is hugely inspired by 'InclusionLoader' from 'djangorestframework-inclusions'
-
-    Unlike InclusionLoader ExpandLoader keeps track of the parent object of the inclusion
-    and the path to this inclusion.
-    It helps to back track each inclusion to the root objects.
-    Since this change affects most of the methods, some copy-pasting is involved here
+    Load the expanded resources of the instances of a serializer.
+
+    The expansion paths are processed level by level rather than instance by
+    instance:
+
+    * the related objects of all the parents on a path are loaded at once, with a
+      single ``prefetch_related_objects`` query for local objects and concurrently
+      for the external (loose-fk) objects
+    * every distinct resource is serialized once per request, no matter how many
+      parents include it
+    * the nested expansions of a resource are loaded once, and linked to every node
+      of that resource in the :class:`InclusionTree`
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self._seen_external: Dict[str, ProxyMixin] = {}
+    def __init__(self, allowed_paths: Optional[List[Tuple[str, ...]]]):
+        # ``None`` means all paths are allowed
+        self.allowed_paths = None if allowed_paths is None else set(allowed_paths)
+        self._data: Dict[Tuple[Type[Serializer], Hashable], dict] = {}
+        self._seen_external: Dict[str, Optional[ProxyMixin]] = {}
 
     def inclusions_dict(self, serializer: Serializer) -> dict:
         """
@@ -146,9 +159,10 @@ class ExpandLoader(InclusionLoader):
           }
         }
         """
-
         tree = InclusionTree()
         request = serializer.context["request"]
+        root_serializer = getattr(serializer, "child", serializer)
+        inclusion_serializers = getattr(root_serializer, "inclusion_serializers", {})
 
         # add parent nodes to the tree
         instances = (
@@ -156,166 +170,182 @@ class ExpandLoader(InclusionLoader):
             if isinstance(serializer.instance, (list, models.QuerySet))
             else [serializer.instance]
         )
+        parents = []
         for instance in instances:
-            tree.add_node(
-                id=instance.get_absolute_api_url(request=request),
-                label="",
-                value={},
-                many=False,
-            )
-
-        entries = self._inclusions((), serializer, serializer.instance)
-
-        for obj, inclusion_serializer, parent, path, many in entries:
-            data = (
-                obj._initial_data
-                if isinstance(obj, ProxyMixin)
-                else inclusion_serializer(instance=obj, context=serializer.context).data
-            )
-            tree.add_node(
-                id=data["url"],
-                value=data,
-                label=path[-1],
-                many=many,
-                parent_id=parent.get_absolute_api_url(request=request),
-            )
-
-        result = tree.display_tree()
-        return result
-
-    def _instance_inclusions(
-        self,
-        path: Tuple[str, ...],
-        serializer: Serializer,
-        instance: models.Model,
-        inclusion_serializers: Optional[dict] = None,
-    ):
+            url = instance.get_absolute_api_url(request=request)
+            tree.add_node(id=url, label="", value={}, many=False)
+            parents.append((url, instance))
+
+        # every level is a path with the serializer and the (url, instance) pairs of
+        # the distinct parent objects on that path
+        levels = deque([((), root_serializer, parents)])
+        while levels:
+            path, parent_serializer, parents = levels.popleft()
+
+            for name, field in parent_serializer.fields.items():
+                new_path = path + (name,)
+                dotted_path = ".".join(new_path)
+                inclusion_serializer = inclusion_serializers.get(dotted_path)
+                if inclusion_serializer is None or not self._is_allowed(new_path):
+                    continue
+                if isinstance(inclusion_serializer, str):
+                    inclusion_serializer = import_string(inclusion_serializer)
+
+                related = self._load_related(field, [obj for _, obj in parents])
+                children = {self._get_key(obj): obj for objs in related for obj in objs}
+                child_serializer = inclusion_serializer(context=serializer.context)
+                self._serialize(child_serializer, children)
+
+                many = isinstance(field, ManyRelatedField)
+                for (parent_url, _), objs in zip(parents, related):
+                    for obj in objs:
+                        data = self._data[(inclusion_serializer, self._get_key(obj))]
+                        tree.add_node(
+                            id=data["url"],
+                            value=data,
+                            label=name,
+                            many=many,
+                            parent_id=parent_url,
+                        )
+
+                has_nested_paths = any(
+                    key.startswith(f"{dotted_path}.") for key in inclusion_serializers
+                )
+                if children and has_nested_paths:
+                    levels.append(
+                        (
+                            new_path,
+                            child_serializer,
+                            [
+                                (self._data[(inclusion_serializer, key)]["url"], obj)
+                                for key, obj in children.items()
+                            ],
+                        )
+                    )
+
+        return tree.display_tree()
+
+    def _is_allowed(self, path: Tuple[str, ...]) -> bool:
+        return self.allowed_paths is None or path in self.allowed_paths
+
+    @staticmethod
+    def _get_key(obj: models.Model) -> Hashable:
+        if isinstance(obj, ProxyMixin):
+            return obj._loose_fk_data["url"]
+        return (obj._meta.label, obj.pk)
+
+    def _load_related(
+        self, field: Field, instances: List[models.Model]
+    ) -> List[List[models.Model]]:
         """
-        add parameter 'inclusion_serializers'
+        Return the related objects of the field for every instance.
+
+        The local objects are fetched with one query for all instances, and the
+        external objects are fetched concurrently.
         """
-        inclusion_serializers = inclusion_serializers or getattr(
-            serializer, "inclusion_serializers", {}
+        local_instances = [
+            instance for instance in instances if not isinstance(instance, ProxyMixin)
+        ]
+        lookup = (
+            self._get_prefetch_lookup(local_instances[0], field)
+            if local_instances
+            else None
         )
-        for name, field in serializer.fields.items():
-            yield from self._field_inclusions(
-                path, field, instance, name, inclusion_serializers
-            )
+        if lookup:
+            prefetch_related_objects(local_instances, lookup)
 
-    def _field_inclusions(
-        self,
-        path: Tuple[str, ...],
-        field: Field,
-        instance: models.Model,
-        name: str,
-        inclusion_serializers: Dict[str, Union[str, Type[Serializer]]],
-    ) -> Iterator[
-        Tuple[models.Model, Type[Serializer], models.Model, Tuple[str, ...], bool]
-    ]:
-        """
-        change return of this generator from (obj, serializer_class) to
-        (obj, serializer_class, parent_obj, path, many)
-        """
-        # if this turns out to be None, we don't want to do a thing
-        if instance is None:
-            return
-        new_path = path + (name,)
-        if isinstance(field, BaseSerializer):
-            yield from self._sub_serializer_inclusions(new_path, field, instance)
-            return
-        inclusion_serializer = inclusion_serializers.get(".".join(new_path))
-        if inclusion_serializer is None:
-            return
-        if isinstance(inclusion_serializer, str):
-            inclusion_serializer = import_string(inclusion_serializer)
+        if isinstance(field, FKOrServiceUrlField):
+            urls = [field.get_attribute(instance) for instance in instances]
+            AuthorizedRequestsLoader().prefetch(
+                [url for url in urls if isinstance(url, str)]
+            )
 
-        many = hasattr(field, "child_relation")
+        return [self._get_related(field, instance) for instance in instances]
 
-        for obj in self._some_related_field_inclusions(
-            new_path, field, instance, inclusion_serializer
-        ):
-            yield obj, inclusion_serializer, instance, new_path, many
-            # when we do inclusions in inclusions, we base path off our
-            # parent object path, not the sub-field
-            yield from self._instance_inclusions(
-                new_path,
-                inclusion_serializer(instance=object),
-                obj,
-                inclusion_serializers,
-            )
+    @staticmethod
+    def _get_prefetch_lookup(instance: models.Model, field: Field) -> Optional[str]:
+        source = field.source
+        if not source or source == "*" or "." in source:
+            return None
 
-    def _some_related_field_inclusions(
-        self,
-        path: Tuple[str, ...],
-        field: Field,
-        instance: models.Model,
-        inclusion_serializer: Type[Serializer],
-    ) -> Iterator[models.Model]:
-        """
-        add handler for FKOrServiceUrlField fields
-        """
+        # prefetch the local FK of loose-fk fields
+        try:
+            model_field = instance._meta.get_field(source)
+        except FieldDoesNotExist:
+            pass
+        else:
+            if isinstance(model_field, FkOrURLField):
+                source = model_field.fk_field
 
-        if self.allowed_paths is not None and path not in self.allowed_paths:
-            return []
+        # properties and other attributes can't be prefetched
+        prefetcher, *_ = get_prefetcher(instance, source, source)
+        return source if prefetcher is not None else None
 
+    def _get_related(self, field: Field, instance: models.Model) -> List[models.Model]:
         if isinstance(field, FKOrServiceUrlField):
-            return self._loose_fk_field_inclusions(
-                path, field, instance, inclusion_serializer
-            )
+            obj = field.get_attribute(instance)
+            # external
+            if isinstance(obj, str):
+                url = obj
+                if url not in self._seen_external:
+                    try:
+                        # model field descriptor uses loader for external urls
+                        self._seen_external[url] = getattr(instance, field.source)
+                    except FetchError:
+                        self._seen_external[url] = None
+                obj = self._seen_external[url]
+            return [obj] if obj is not None else []
+
+        try:
+            obj = field.get_attribute(instance)
+        except SkipField:
+            return []
 
-        return super()._some_related_field_inclusions(
-            path, field, instance, inclusion_serializer
-        )
+        if isinstance(field, ManyRelatedField):
+            return list(obj)
 
-    def _loose_fk_field_inclusions(
-        self,
-        path: Tuple[str, ...],
-        field: Field,
-        instance: models.Model,
-        inclusion_serializer: Type[Serializer],
-    ) -> Iterator[models.Model]:
-        """
-        handler for loose-fk-field
-        """
-        obj = field.get_attribute(instance)
+        if isinstance(field, RelatedField):
+            if isinstance(obj, PKOnlyObject):
+                obj = super(RelatedField, field).get_attribute(instance)
+            return [obj] if obj is not None and obj.pk is not None else []
 
-        if obj is None:
-            return
+        raise Error(f"Trying to include unknown field type: {field!r}")
 
-        # external
-        if isinstance(obj, str):
-            # check in cache
-            if obj in self._seen_external:
-                yield self._seen_external[obj]
+    def _serialize(
+        self, serializer: Serializer, objects: Dict[Hashable, models.Model]
+    ) -> None:
+        """
+        Serialize the objects that were not serialized before in this request.
 
+        The relations used by the serializer are prefetched for all the objects at
+        once, to avoid a query per object while serializing.
+        """
+        serializer_class = type(serializer)
+        local = []
+        for key, obj in objects.items():
+            if (serializer_class, key) in self._data:
+                continue
+            if isinstance(obj, ProxyMixin):
+                self._data[(serializer_class, key)] = obj._initial_data
             else:
-                try:
-                    # model field descriptor uses loader for external urls
-                    instance = getattr(instance, field.field_name)
-                except FetchError:
-                    return
-                else:
-                    self._seen_external[obj] = instance
-                    yield instance
-
-        # local
-        else:
-            yield obj
+                local.append((key, obj))
 
-    def _has_been_seen(self, obj: models.Model) -> bool:
-        """
-        we don't deduplicate objects here
-        """
-        return False
+        if not local:
+            return
 
-    def _sub_serializer_inclusions(self, path, field, instance):
-        """
-        added condition for loose-fk chained instances (like zaaktype.gerelateerde_zaaktypen):
-        stop and don't do chained requests for now
-        """
-        if isinstance(instance, ProxyMixin):
-            return []
+        instances = [obj for _, obj in local]
+        lookups = {
+            self._get_prefetch_lookup(instances[0], field)
+            for field in serializer.fields.values()
+            if isinstance(field, (RelatedField, ManyRelatedField, FKOrServiceUrlField))
+        }
+        prefetch_related_objects(instances, *(lookups - {None}))
 
-        return super()._sub_serializer_inclusions(path, field, instance)
+        data = serializer_class(
+            instance=instances, many=True, context=serializer.context
+        ).data
+        for (key, _), item in zip(local, data):
+            self._data[(serializer_class, key)] = item
 
 
 class ExpandJSONRenderer(InclusionJSONRenderer, CamelCaseJSONRenderer):
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2020 Dimpact
+from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
 
@@ -8,6 +9,7 @@ from rest_framework.exceptions import ParseError
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 
 from .expansion import get_expand_options_for_serializer
+from .search import FULL_TEXT_SEARCH_CONFIG, get_search_vector
 
 
 class CharArrayFilter(filters.BaseInFilter, filters.CharFilter):
@@ -27,14 +29,46 @@ class MaximaleVertrouwelijkheidaanduidingFilter(filters.ChoiceFilter):
     def filter(self, qs, value):
         if value in filters.EMPTY_VALUES:
             return qs
-        order_expression = VertrouwelijkheidsAanduiding.get_order_expression(
-            self._field_name
-        )
-        qs = qs.annotate(**{self.field_name: order_expression})
+        # use the stored order if the model has it, so an index can be used
+        if not any(
+            field.name == self.field_name for field in qs.model._meta.concrete_fields
+        ):
+            order_expression = VertrouwelijkheidsAanduiding.get_order_expression(
+                self._field_name
+            )
+            qs = qs.annotate(**{self.field_name: order_expression})
         numeric_value = VertrouwelijkheidsAanduiding.get_choice_order(value)
         return super().filter(qs, numeric_value)
 
 
+class FullTextSearchFilter(filters.CharFilter):
+    """
+    Search the fields with the PostgreSQL full-text search, most relevant first.
+
+    The fields should be indexed with :func:`openzaak.utils.search.search_vector_index`
+    for the same fields, in the same order.
+    """
+
+    def __init__(self, *args, search_fields: tuple[str, ...], **kwargs):
+        self.search_fields = search_fields
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if value in filters.EMPTY_VALUES:
+            return qs
+
+        query = SearchQuery(
+            value, config=FULL_TEXT_SEARCH_CONFIG, search_type="websearch"
+        )
+        vector = get_search_vector(*self.search_fields)
+        return (
+            qs.alias(_search_vector=vector)
+            .filter(_search_vector=query)
+            .annotate(_search_rank=SearchRank(vector, query))
+            .order_by("-_search_rank", "-pk")
+        )
+
+
 class ExpandFilter(filters.BaseInFilter, filters.ChoiceFilter):
     def __init__(self, *args, **kwargs):
         serializer_class = kwargs.pop("serializer_class")
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import cache
+from typing import Iterator, Optional
+
+from opentelemetry import metrics
+from rest_framework.serializers import BaseSerializer
+
+meter = metrics.get_meter("openzaak.utils")
+
+request_duration_histogram = meter.create_histogram(
+    "openzaak.api.request.duration",
+    description="Duration of handling an API request.",
+    unit="s",
+)
+request_db_queries_histogram = meter.create_histogram(
+    "openzaak.api.request.db_queries",
+    description="Amount of SQL queries executed while handling an API request.",
+    unit="{query}",
+)
+request_db_duration_histogram = meter.create_histogram(
+    "openzaak.api.request.db_duration",
+    description="Total duration of the SQL queries executed for an API request.",
+    unit="s",
+)
+request_remote_fetches_histogram = meter.create_histogram(
+    "openzaak.api.request.remote_fetches",
+    description="Amount of remote (loose-fk) objects fetched for an API request.",
+    unit="{fetch}",
+)
+request_serializer_duration_histogram = meter.create_histogram(
+    "openzaak.api.request.serializer_duration",
+    description="Time spent serializing the data of an API request.",
+    unit="s",
+)
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Request scoped administration of the work done to handle an API request.
+    """
+
+    num_queries: int = 0
+    db_duration: float = 0.0
+    serializer_duration: float = 0.0
+    _serializer_depth: int = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        """
+        Database execute wrapper, see :meth:`django.db.backends.base.base.BaseDatabaseWrapper.execute_wrapper`.
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.num_queries += 1
+            self.db_duration += time.perf_counter() - start
+
+
+_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+@contextmanager
+def request_metrics() -> Iterator[RequestMetrics]:
+    context = RequestMetrics()
+    token = _request_metrics.set(context)
+    try:
+        yield context
+    finally:
+        _request_metrics.reset(token)
+
+
+def get_request_metrics() -> Optional[RequestMetrics]:
+    return _request_metrics.get()
+
+
+@cache
+def get_measured_serializer_class(
+    serializer_class: type[BaseSerializer],
+) -> type[BaseSerializer]:
+    """
+    Return a subclass of the serializer class that measures the time spent in
+    ``serializer.data`` while request metrics are recorded.
+
+    Serializers that are nested in a measured serializer are part of its
+    representation, so they are not measured separately.
+    """
+
+    class MeasuredSerializer(serializer_class):
+        @property
+        def data(self):
+            context = get_request_metrics()
+            if context is None or context._serializer_depth:
+                return super().data
+
+            context._serializer_depth += 1
+            start = time.perf_counter()
+            try:
+                return super().data
+            finally:
+                context.serializer_duration += time.perf_counter() - start
+                context._serializer_depth -= 1
+
+    MeasuredSerializer.__name__ = serializer_class.__name__
+    MeasuredSerializer.__qualname__ = serializer_class.__qualname__
+    MeasuredSerializer.__module__ = serializer_class.__module__
+    return MeasuredSerializer
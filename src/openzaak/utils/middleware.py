@@ -1,10 +1,14 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
 import os
+import random
+import time
+from contextlib import ExitStack
 from dataclasses import dataclass
 from typing import Dict, Optional
 
 from django.conf import settings
+from django.db import connections
 from django.http import HttpRequest, HttpResponse, HttpResponseNotFound
 
 import structlog
@@ -16,8 +20,18 @@ from vng_api_common.middleware import (
 )
 
 from openzaak.config.models import InternalService
+from openzaak.loaders import get_remote_fetch_context, remote_fetch_context
 
 from .constants import COMPONENT_MAPPING
+from .metrics import (
+    request_db_duration_histogram,
+    request_db_queries_histogram,
+    request_duration_histogram,
+    request_metrics,
+    request_remote_fetches_histogram,
+    request_serializer_duration_histogram,
+)
+from .renderers import StreamingJSONResponse
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -87,6 +101,125 @@ class LogHeadersMiddleware:
         )
 
 
+class RemoteFetchMiddleware:
+    """
+    Deduplicate the remote (loose-fk) objects fetched while handling a request.
+
+    The number of remote fetches and cache hits is logged for every request that
+    needed remote objects.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with remote_fetch_context() as context:
+            response = self.get_response(request)
+
+        if context.num_fetches or context.num_cache_hits:
+            logger.info(
+                "remote_objects_fetched",
+                path=request.path,
+                num_fetches=context.num_fetches,
+                num_cache_hits=context.num_cache_hits,
+            )
+        return response
+
+
+class RequestMetricsMiddleware:
+    """
+    Record the work done for a (sampled) API request as OpenTelemetry histograms.
+
+    The number of SQL queries, the total duration of those queries, the number of
+    remote (loose-fk) fetches and the time spent in the serializers are recorded
+    per endpoint. A warning is logged when the request exceeds the budget of the
+    endpoint, see ``API_METRICS_ENDPOINT_BUDGETS``.
+
+    This middleware must be placed after the :class:`RemoteFetchMiddleware`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        sample_rate = settings.API_METRICS_SAMPLE_RATE
+        if not (
+            sample_rate and is_api_request(request) and random.random() < sample_rate
+        ):
+            return self.get_response(request)
+
+        with ExitStack() as stack:
+            metrics = stack.enter_context(request_metrics())
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics))
+
+            start = time.perf_counter()
+            response = self.get_response(request)
+            duration = time.perf_counter() - start
+
+        endpoint = getattr(request, "_metrics_endpoint", None)
+        if endpoint is None:
+            return response
+
+        remote_fetch_context = get_remote_fetch_context()
+        num_remote_fetches = (
+            remote_fetch_context.num_fetches if remote_fetch_context else 0
+        )
+
+        attributes = {
+            "openzaak.endpoint": endpoint,
+            "http.request.method": request.method,
+            "http.response.status_code": response.status_code,
+        }
+        request_duration_histogram.record(duration, attributes)
+        request_db_queries_histogram.record(metrics.num_queries, attributes)
+        request_db_duration_histogram.record(metrics.db_duration, attributes)
+        request_remote_fetches_histogram.record(num_remote_fetches, attributes)
+        request_serializer_duration_histogram.record(
+            metrics.serializer_duration, attributes
+        )
+
+        budget = {
+            "queries": settings.API_METRICS_QUERY_BUDGET,
+            "duration": settings.API_METRICS_DURATION_BUDGET,
+            **settings.API_METRICS_ENDPOINT_BUDGETS.get(endpoint, {}),
+        }
+        # the duration budget is configured in milliseconds
+        if (budget["queries"] and metrics.num_queries > budget["queries"]) or (
+            budget["duration"] and duration * 1000 > budget["duration"]
+        ):
+            logger.warning(
+                "api_request_budget_exceeded",
+                endpoint=endpoint,
+                method=request.method,
+                path=request.path,
+                status_code=response.status_code,
+                num_queries=metrics.num_queries,
+                db_duration=round(metrics.db_duration * 1000, 2),
+                num_remote_fetches=num_remote_fetches,
+                serializer_duration=round(metrics.serializer_duration * 1000, 2),
+                duration=round(duration * 1000, 2),
+                query_budget=budget["queries"],
+                duration_budget=budget["duration"],
+            )
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "cls", None)
+        if view_class is None:
+            return None
+
+        # viewsets map the HTTP methods to their actions
+        actions = getattr(view_func, "actions", None) or {}
+        basename = getattr(view_func, "initkwargs", {}).get("basename")
+        action = actions.get(request.method.lower())
+        request._metrics_endpoint = (
+            f"{basename}.{action}" if basename and action else view_class.__name__
+        )
+        return None
+
+
 def get_version_mapping() -> Dict[str, str]:
     apis = ("autorisaties", "besluiten", "catalogi", "documenten", "zaken")
     version = settings.REST_FRAMEWORK["DEFAULT_VERSION"]
@@ -112,7 +245,7 @@ class APIVersionHeaderMiddleware(_APIVersionHeaderMiddleware):
         response = self.get_response(request)
 
         # not an API response, exit early
-        if not isinstance(response, Response):
+        if not isinstance(response, (Response, StreamingJSONResponse)):
             return response
 
         # set the header
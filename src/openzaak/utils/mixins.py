@@ -1,6 +1,9 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from types import SimpleNamespace
 
+from django.conf import settings
+from django.utils.functional import cached_property
 from django.utils.module_loading import import_string
 
 from dictdiffer import diff
@@ -9,9 +12,13 @@ from rest_framework_inclusions.renderer import (
 )
 from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.models import APIMixin as _APIMixin
+from vng_api_common.viewsets import CheckQueryParamsMixin as _CheckQueryParamsMixin
 
-from .expansion import EXPAND_QUERY_PARAM, ExpandJSONRenderer
+from .audittrails import filter_hoofd_object_uuid
+from .expansion import EXPAND_KEY, EXPAND_QUERY_PARAM, ExpandJSONRenderer
+from .metrics import get_measured_serializer_class, get_request_metrics
 from .permissions import ExpandAuthRequired
+from .renderers import CamelCaseJSONRenderer, StreamingJSONResponse
 
 
 def format_dict_diff(changes):
@@ -26,11 +33,11 @@ def format_dict_diff(changes):
 
 
 class AuditTrailMixin:
-    @property
+    @cached_property
     def audittrail(self):
-        qs = AuditTrail.objects.filter(
-            hoofd_object__contains=self.get_absolute_api_url(version=1)
-        ).order_by("-aanmaakdatum")
+        qs = filter_hoofd_object_uuid(AuditTrail.objects.all(), self.uuid).order_by(
+            "-aanmaakdatum"
+        )
         res = []
         for audit in qs:
             oud = audit.oud or {}
@@ -86,6 +93,19 @@ class ExpandMixin:
         return permissions
 
 
+class SerializerMetricsMixin:
+    """
+    Measure the time spent serializing the data of a (sampled) API request, see
+    :class:`openzaak.utils.middleware.RequestMetricsMiddleware`.
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        if get_request_metrics() is not None:
+            serializer.__class__ = get_measured_serializer_class(type(serializer))
+        return serializer
+
+
 class CacheQuerysetMixin:
     """
     Mixin for ViewSets to avoid doing redundant calls to `ViewSet.get_queryset()`
@@ -110,3 +130,105 @@ class CacheQuerysetMixin:
         if self._cached_queryset is None:
             self._cached_queryset = super().get_queryset()
         return self._cached_queryset
+
+
+class CheckQueryParamsMixin(_CheckQueryParamsMixin):
+    """
+    Take query parameters of the paginator into account that are not known to
+    the upstream implementation, which only knows about page number pagination (see
+    :class:`openzaak.utils.pagination.CursorPagination`)
+    """
+
+    def _check_query_params(self, request):
+        extra_params = getattr(self.paginator, "extra_query_params", set())
+        if not extra_params.intersection(request.query_params):
+            return super()._check_query_params(request)
+
+        query_params = request.query_params.copy()
+        for param in extra_params:
+            query_params.pop(param, None)
+        return super()._check_query_params(SimpleNamespace(query_params=query_params))
+
+
+class StreamingListMixin:
+    """
+    Stream the results of list responses if ``STREAM_LIST_RESPONSES`` is enabled.
+
+    The pagination envelope is rendered up front, the results are serialized and
+    rendered in chunks of ``stream_chunk_size`` while they are sent to the client.
+    This way the serialized data of the complete page is never kept in memory. The
+    output is identical to the output of the regular list response.
+
+    The results of search (``_zoek``) actions are streamed in the same way.
+
+    NOTE: make sure that this mixin is applied after any other mixins that override
+    `list`, so that their checks are still performed, and before
+    :class:`vng_api_common.search.SearchMixin`
+    """
+
+    stream_chunk_size = 100
+
+    def should_stream(self, request) -> bool:
+        if not settings.STREAM_LIST_RESPONSES or self.paginator is None:
+            return False
+
+        # the browsable API, problem+json and indented JSON are rendered as usual
+        renderer = request.accepted_renderer
+        if (
+            not isinstance(renderer, CamelCaseJSONRenderer)
+            or renderer.media_type != CamelCaseJSONRenderer.media_type
+            or "indent" in request.accepted_media_type
+        ):
+            return False
+
+        # the inclusions are resolved for the page as a whole
+        if EXPAND_QUERY_PARAM in request.query_params:
+            return False
+        # search actions also accept the inclusions in the request body
+        return not (
+            request.method == "POST"
+            and isinstance(request.data, dict)
+            and request.data.get(EXPAND_QUERY_PARAM)
+        )
+
+    def list(self, request, *args, **kwargs):
+        if not self.should_stream(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        return self._get_streaming_response(page)
+
+    def get_search_output(self, queryset):
+        if not self.should_stream(self.request):
+            return super().get_search_output(queryset)
+
+        page = self.paginate_queryset(queryset)
+        return self._get_streaming_response(page)
+
+    def _get_streaming_response(self, page: list) -> StreamingJSONResponse:
+        # render the envelope without results, the results are always the last key
+        envelope = self.get_paginated_response([]).data
+        assert list(envelope)[-1] == "results"
+        rendered_envelope = CamelCaseJSONRenderer().render(envelope)
+        assert rendered_envelope.endswith(b"[]}")
+
+        return StreamingJSONResponse(
+            self._stream_results(page, prefix=rendered_envelope[:-2], suffix=b"]}")
+        )
+
+    def _stream_results(self, objects: list, prefix: bytes, suffix: bytes):
+        renderer = CamelCaseJSONRenderer()
+        # see ExpandJSONRenderer, the empty `_expand` attribute is always included
+        include_expand = isinstance(self.request.accepted_renderer, ExpandJSONRenderer)
+
+        yield prefix
+        for start in range(0, len(objects), self.stream_chunk_size):
+            chunk = objects[start : start + self.stream_chunk_size]
+            serializer = self.get_serializer(chunk, many=True)
+            for index, record in enumerate(serializer.data):
+                if include_expand:
+                    record[EXPAND_KEY] = {}
+                separator = b"," if start or index else b""
+                yield separator + renderer.render(record)
+        yield suffix
@@ -1,11 +1,29 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2023 Dimpact
+import binascii
+import datetime
+import decimal
+import json
+import uuid
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist
 from django.core.paginator import Paginator as DjangoPaginator
+from django.db import models
+from django.db.models import Q
 from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
 
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from vng_api_common.pagination import DynamicPageSizeMixin
 
+from .help_text import mark_experimental
+
 
 class ExactPaginator(DjangoPaginator):
     @cached_property
@@ -18,3 +36,370 @@ class ExactPaginator(DjangoPaginator):
 
 class ExactPagination(DynamicPageSizeMixin, PageNumberPagination):
     django_paginator_class = ExactPaginator
+
+
+class InvalidCursor(ValidationError):
+    default_detail = _("Invalid cursor.")
+    default_code = "invalid-cursor"
+
+
+def _resolve_field(model: type[models.Model], path: str) -> models.Field:
+    """
+    Resolve a (possibly related) ordering path to the concrete model field.
+    """
+    field = None
+    for part in path.split("__"):
+        if field is not None:
+            model = field.related_model
+        field = model._meta.pk if part == "pk" else model._meta.get_field(part)
+    return field
+
+
+def _serialize_value(value: Any) -> Any:
+    # unlike the ``DjangoJSONEncoder``, keep the full precision of datetimes, otherwise
+    # records could be skipped or repeated
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _get_value(obj: models.Model, path: str) -> Any:
+    for part in path.split("__"):
+        if obj is None:
+            return None
+        obj = getattr(obj, part)
+    return obj
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by filtering on the (unique) ordering of the last seen record.
+
+    Unlike :class:`ExactPaginator`, no ``COUNT`` or ``OFFSET`` queries are performed,
+    so the cost of fetching a page does not depend on how deep a client pages into
+    the result set. The ordering of the queryset is made deterministic by appending
+    the primary key if it's not already part of it.
+    """
+
+    def __init__(self, queryset: models.QuerySet, page_size: int):
+        self.queryset = queryset
+        self.page_size = page_size
+        self.ordering = self._get_ordering(queryset)
+
+    @staticmethod
+    def _get_ordering(queryset: models.QuerySet) -> list[tuple[str, bool]]:
+        """
+        Return the ordering as a list of ``(field path, descending)`` tuples.
+        """
+        model = queryset.model
+        raw_ordering = queryset.query.order_by or model._meta.ordering or ()
+
+        ordering = []
+        for item in raw_ordering:
+            if not isinstance(item, str) or item == "?":
+                raise InvalidCursor(
+                    _("Cursor pagination is not supported for this ordering.")
+                )
+            descending = item.startswith("-")
+            path = item.lstrip("-+")
+            try:
+                field = _resolve_field(model, path)
+            except (FieldDoesNotExist, AttributeError):
+                raise InvalidCursor(
+                    _("Cursor pagination is not supported for this ordering.")
+                )
+            if field.is_relation:
+                # ordering on a foreign key orders on its column (e.g. the default
+                # ordering of documents on their canonical), unless the related model
+                # has a default ordering of its own
+                if not field.concrete or field.related_model._meta.ordering:
+                    raise InvalidCursor(
+                        _("Cursor pagination is not supported for this ordering.")
+                    )
+                path = "__".join([*path.split("__")[:-1], field.attname])
+            ordering.append((path, descending))
+            if field.primary_key and "__" not in path:
+                # the pk is unique, anything after it can never change the ordering
+                return ordering
+
+        # make the ordering unique by adding the pk as tie-breaker, in the same
+        # direction as the last ordering field
+        ordering.append(("pk", ordering[-1][1] if ordering else True))
+        return ordering
+
+    def encode_cursor(self, obj: models.Model, reverse: bool) -> str:
+        payload = {
+            "o": [f"{'-' if desc else ''}{path}" for path, desc in self.ordering],
+            "v": [_get_value(obj, path) for path, _desc in self.ordering],
+            "r": reverse,
+        }
+        data = json.dumps(payload, default=_serialize_value, separators=(",", ":"))
+        return urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> tuple[list[Any], bool]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(urlsafe_b64decode(padded.encode("ascii")))
+            ordering = payload["o"]
+            raw_values = payload["v"]
+            reverse = bool(payload["r"])
+        except (
+            binascii.Error,
+            UnicodeError,
+            ValueError,
+            TypeError,
+            KeyError,
+        ):
+            raise InvalidCursor()
+
+        expected = [f"{'-' if desc else ''}{path}" for path, desc in self.ordering]
+        if ordering != expected or len(raw_values) != len(self.ordering):
+            # the cursor was issued for a different ordering
+            raise InvalidCursor()
+
+        values = []
+        model = self.queryset.model
+        for (path, _desc), raw_value in zip(self.ordering, raw_values):
+            if raw_value is None:
+                values.append(None)
+                continue
+            try:
+                values.append(_resolve_field(model, path).to_python(raw_value))
+            except Exception:
+                raise InvalidCursor()
+        return values, reverse
+
+    @staticmethod
+    def _compare(path: str, value: Any, descending: bool) -> tuple[Q, Q]:
+        """
+        Build the ``(strictly after, equal)`` conditions for a single ordering field.
+
+        Postgres sorts ``NULL`` values last in ascending order and first in
+        descending order, which is taken into account.
+        """
+        if descending:
+            if value is None:
+                return Q(**{f"{path}__isnull": False}), Q(**{f"{path}__isnull": True})
+            return Q(**{f"{path}__lt": value}), Q(**{path: value})
+
+        if value is None:
+            return Q(pk__in=[]), Q(**{f"{path}__isnull": True})
+        strictly_after = Q(**{f"{path}__gt": value}) | Q(**{f"{path}__isnull": True})
+        return strictly_after, Q(**{path: value})
+
+    def _keyset_filter(self, values: list[Any], reverse: bool) -> Q:
+        filters = Q()
+        equal_so_far = Q()
+        for (path, descending), value in zip(self.ordering, values):
+            strictly_after, equal = self._compare(path, value, descending ^ reverse)
+            filters |= equal_so_far & strictly_after
+            equal_so_far &= equal
+        return filters
+
+    def _order_by(self, reverse: bool) -> list[str]:
+        return [
+            f"{'-' if descending ^ reverse else ''}{path}"
+            for path, descending in self.ordering
+        ]
+
+    def page(self, cursor: str) -> "KeysetPage":
+        reverse = False
+        queryset = self.queryset
+        if cursor:
+            values, reverse = self.decode_cursor(cursor)
+            queryset = queryset.filter(self._keyset_filter(values, reverse))
+
+        # fetch one extra record to find out if there is a next page
+        records = list(
+            queryset.order_by(*self._order_by(reverse))[: self.page_size + 1]
+        )
+        has_more = len(records) > self.page_size
+        records = records[: self.page_size]
+        if reverse:
+            records.reverse()
+
+        return KeysetPage(
+            paginator=self,
+            object_list=records,
+            has_next=has_more if not reverse else True,
+            has_previous=bool(cursor) and (has_more if reverse else True),
+        )
+
+    @cached_property
+    def approximate_count(self) -> int:
+        """
+        Use the estimate of the query planner, which does not scan the table.
+        """
+        plan = json.loads(self.queryset.order_by().explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetPage:
+    def __init__(self, paginator, object_list, has_next, has_previous):
+        self.paginator = paginator
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self._has_next and bool(self.object_list)
+
+    def has_previous(self) -> bool:
+        return self._has_previous and bool(self.object_list)
+
+    def next_cursor(self) -> str:
+        return self.paginator.encode_cursor(self.object_list[-1], reverse=False)
+
+    def previous_cursor(self) -> str:
+        return self.paginator.encode_cursor(self.object_list[0], reverse=True)
+
+
+class CursorPagination(ExactPagination):
+    """
+    Opt-in keyset (cursor) pagination on top of the regular page number pagination.
+
+    Clients that pass the ``cursor`` query parameter (an empty value for the first
+    page) receive opaque ``next``/``previous`` cursors instead of page numbers. The
+    ``count`` is only included if it's requested with the ``count`` query parameter,
+    as an approximation based on the estimate of the query planner. Without the
+    ``cursor`` parameter, the regular :class:`ExactPagination` is used.
+    """
+
+    keyset_paginator_class = KeysetPaginator
+    cursor_query_param = "cursor"
+    cursor_query_description = mark_experimental(
+        "Cursor voor keyset paginering. Geef een lege waarde mee om de eerste pagina "
+        "op te vragen en gebruik daarna de `next` en `previous` links. De `count` in "
+        "het antwoord is dan leeg, tenzij deze met de `count` parameter opgevraagd "
+        "wordt."
+    )
+    count_query_param = "count"
+    count_query_description = mark_experimental(
+        "Geef bij keyset paginering het (geschatte) totaal aantal resultaten terug "
+        "in de `count`."
+    )
+    # page number based pagination is used if no cursor is provided
+    page_number_fallback = True
+
+    page = None
+    keyset_page = None
+
+    @property
+    def extra_query_params(self) -> set[str]:
+        return {self.cursor_query_param, self.count_query_param}
+
+    def use_cursor(self, request) -> bool:
+        return self.cursor_query_param in request.query_params
+
+    def include_count(self, request) -> bool:
+        # ⚡️ estimating the count requires an additional query for every page
+        value = request.query_params.get(self.count_query_param, "")
+        return value.lower() in ("true", "1")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.keyset_page = None
+
+        if not self.use_cursor(request):
+            if not self.page_number_fallback:
+                return None
+            return super().paginate_queryset(queryset, request, view=view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.keyset_paginator_class(queryset, page_size)
+        self.keyset_page = paginator.page(request.query_params[self.cursor_query_param])
+        return list(self.keyset_page)
+
+    def get_paginated_response(self, data):
+        if self.keyset_page is None:
+            return super().get_paginated_response(data)
+
+        return Response(
+            OrderedDict(
+                [
+                    (
+                        "count",
+                        self.keyset_page.paginator.approximate_count
+                        if self.include_count(self.request)
+                        else None,
+                    ),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def _get_cursor_link(self, cursor: str) -> str:
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        if self.keyset_page is None:
+            return super().get_next_link()
+        if not self.keyset_page.has_next():
+            return None
+        return self._get_cursor_link(self.keyset_page.next_cursor())
+
+    def get_previous_link(self):
+        if self.keyset_page is None:
+            return super().get_previous_link()
+        if not self.keyset_page.has_previous():
+            return None
+        return self._get_cursor_link(self.keyset_page.previous_cursor())
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        if getattr(view, "action", None) != "list":
+            return parameters
+
+        return parameters + [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.cursor_query_description),
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.count_query_description),
+                "schema": {"type": "boolean"},
+            },
+        ]
+
+
+class CursorOnlyPagination(CursorPagination):
+    """
+    Keyset pagination for list endpoints that are not paginated by default.
+
+    Without the ``cursor`` query parameter the complete (unpaginated) list is returned,
+    as required by the API standard.
+    """
+
+    page_number_fallback = False
+
+    def get_paginated_response_schema(self, schema):
+        # the paginated envelope is only returned if the cursor is provided
+        return {"oneOf": [schema, super().get_paginated_response_schema(schema)]}
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            parameter
+            for parameter in super().get_schema_operation_parameters(view)
+            if parameter["name"] != self.page_query_param
+        ]
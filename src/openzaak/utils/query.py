@@ -1,17 +1,27 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import hashlib
 from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
 from urllib.parse import urlparse
 
 from django.conf import settings
+from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
 from django.db import models
-from django.db.models import Q
+from django.db.models import Func, Q, Value
 from django.http.request import validate_host
 
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
 from vng_api_common.utils import get_resources_for_paths
 
+from openzaak.components.autorisaties.caching import get_authorizations_version
+
+if TYPE_CHECKING:
+    from vng_api_common.authorizations.models import Applicatie
+
 
 class QueryBlocked(Exception):
     pass
@@ -40,6 +50,54 @@ class BlockChangeMixin:
     delete.queryset_only = True
 
 
+def any_of(values: Iterable, base_field: models.Field | None = None) -> Func:
+    """
+    Compare against all ``values`` as a single array parameter (``= ANY(%s)``).
+
+    Unlike ``__in``, the size of the generated SQL does not grow with the number of
+    values, and Postgres can still use an index on the compared column.
+    """
+    base_field = base_field or models.IntegerField()
+    return Func(
+        Value(list(values), output_field=ArrayField(base_field)),
+        function="ANY",
+        output_field=base_field,
+    )
+
+
+def _max_va_order(current: int | None, new: int | None) -> int | None:
+    if current is None:
+        return new
+    if new is None:
+        return current
+    return max(current, new)
+
+
+@dataclass
+class CompiledAuthorizations:
+    """
+    The allowed loose-fk types for a set of authorizations.
+
+    Both mappings map the type (primary key for local types, URL for external types)
+    to the highest ``max_vertrouwelijkheidaanduiding`` order that was granted for it,
+    or ``None`` if none was specified.
+    """
+
+    local: dict[int, int | None] = field(default_factory=dict)
+    external: dict[str, int | None] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, list]:
+        # JSON object keys are always strings, so the mappings are stored as pairs
+        return {
+            "local": list(self.local.items()),
+            "external": list(self.external.items()),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, list]) -> "CompiledAuthorizations":
+        return cls(local=dict(data["local"]), external=dict(data["external"]))
+
+
 class LooseFkAuthorizationsFilterMixin:
     auth_fields = []
     loose_fk_field = None
@@ -53,103 +111,47 @@ class LooseFkAuthorizationsFilterMixin:
         )
 
     def build_queryset(self, local_filters, external_filters) -> models.QuerySet:
-        if self.vertrouwelijkheidaanduiding_use:
-            # annotate the queryset so we can map a string value to a logical number
-            order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-                f"{self.prefix}vertrouwelijkheidaanduiding"
-            )
-            annotations = {"_va_order": order_case}
-            # bring it all together now to build the resulting queryset
-            queryset = self.annotate(**annotations).filter(
-                local_filters | external_filters
-            )
-
-        else:
-            queryset = self.filter(local_filters | external_filters)
-        return queryset
+        return self.filter(local_filters | external_filters)
 
     def get_filters(
         self,
-        scope,
-        authorizations,
-        catalogus_authorizations=None,
+        type_va_orders: dict[int, int | None] | dict[str, int | None],
         local=True,
         use_va=True,
     ) -> Q:
-        prefix = self.prefix
-        loose_fk_field = (
-            f"_{self.loose_fk_field}" if local else f"_{self.loose_fk_field}_url"
-        )
-
-        # resource URLs to either use as-is or resolve to database records
-        resource_urls = [
-            getattr(authorization, self.loose_fk_field)
-            for authorization in authorizations
-        ]
-
-        # keep a list of allowed loose-fk objects
-        loose_fk_objecten = []
-        # build the case/when to map the max_vertrouwelijkheidaanduiding based
-        # on the ``zaaktype``
-        va_mapping = defaultdict(list)
+        """
+        Build the filter for the compiled authorizations of either local or
+        external types.
 
-        if not local:
-            loose_fk_object_map = dict(zip(resource_urls, resource_urls))
-        else:
-            # prepare to get the loose_fk_objects in bulk from the DB
-            loose_fk_object_paths = [urlparse(url).path for url in resource_urls]
-            loose_fk_objects = get_resources_for_paths(loose_fk_object_paths)
-            # nothing to resolve
-            if loose_fk_objects is None:
-                loose_fk_object_map = {}
-            else:
-                # keep the sorting so we can zip them correctly
-                sorted_objects = sorted(
-                    loose_fk_objects, key=lambda o: o.get_absolute_api_url()
-                )
-                loose_fk_object_map = dict(zip(sorted(resource_urls), sorted_objects))
-
-        for authorization in authorizations:
-            resource_url = getattr(authorization, self.loose_fk_field)
-            loose_fk_object = loose_fk_object_map[resource_url]
-            loose_fk_objecten.append(loose_fk_object)
+        Types are grouped by their maximum confidentiality level, so at most one
+        condition per level is generated.
+        """
+        prefix = self.prefix
+        # an empty ``Q()`` matches everything, so use a filter that matches nothing
+        # when no types are allowed
+        nothing = Q(pk__in=[])
 
-            # extract the order and map it to the database value
-            if authorization.max_vertrouwelijkheidaanduiding:
-                choice_item_order = VertrouwelijkheidsAanduiding.get_choice_order(
-                    authorization.max_vertrouwelijkheidaanduiding
-                )
-                va_mapping[choice_item_order].append(loose_fk_object)
-
-        if catalogus_authorizations:
-            for catalogus_authorisation in catalogus_authorizations:
-                resources = getattr(
-                    catalogus_authorisation.catalogus, f"{self.loose_fk_field}_set"
-                ).all()
-
-                for instance in resources:
-                    loose_fk_objecten.append(instance)
-
-                    # extract the order and map it to the database value
-                    if catalogus_authorisation.max_vertrouwelijkheidaanduiding:
-                        choice_item_order = (
-                            VertrouwelijkheidsAanduiding.get_choice_order(
-                                catalogus_authorisation.max_vertrouwelijkheidaanduiding
-                            )
-                        )
-                        va_mapping[choice_item_order].append(instance)
+        def type_filter(types: list) -> Q:
+            if local:
+                return Q(**{f"{prefix}_{self.loose_fk_field}": any_of(types)})
+            return Q(**{f"{prefix}_{self.loose_fk_field}_url__in": types})
 
         if not use_va:
-            return Q(**{f"{prefix}{loose_fk_field}__in": loose_fk_objecten})
+            return type_filter(sorted(type_va_orders)) if type_va_orders else nothing
+
+        va_mapping = defaultdict(list)
+        for loose_fk_type, max_va in type_va_orders.items():
+            if max_va is not None:
+                va_mapping[max_va].append(loose_fk_type)
 
         # Combine the filters: group the minimum required confidentiality with
-        # the instances (zaaktypen/informatieobjecttypen) for which this constraint
+        # the types (zaaktypen/informatieobjecttypen) for which this constraint
         # applies
-        filters = Q()
-        for max_va, instances in va_mapping.items():
-            filters |= Q(_va_order__lte=max_va) & Q(
-                **{f"{prefix}{loose_fk_field}__in": instances}
-            )
+        filters = nothing
+        for max_va, types in sorted(va_mapping.items()):
+            filters |= Q(
+                **{f"{prefix}_vertrouwelijkheidaanduiding_order__lte": max_va}
+            ) & type_filter(sorted(types))
         return filters
 
     def get_authorizations(self, scope: Scope, authorizations: models.QuerySet):
@@ -175,33 +177,150 @@ class LooseFkAuthorizationsFilterMixin:
     ):
         return catalogus_authorizations.filter(scopes__contains=[scope])
 
-    def filter_for_authorizations(
+    def compile_authorizations(
         self,
         scope: Scope,
         authorizations: models.QuerySet,
         catalogus_authorizations: models.QuerySet,
-    ) -> models.QuerySet:
-        # todo implement error if no loose-fk field
+    ) -> CompiledAuthorizations:
+        """
+        Reduce the authorizations to the allowed types and their maximum
+        confidentiality level.
+        """
+        compiled = CompiledAuthorizations()
 
         authorizations_local, authorizations_external = self.get_authorizations(
             scope, authorizations
         )
 
-        catalogus_authorizations = self.get_catalogus_authorizations(
+        def add(mapping: dict, loose_fk_type, max_vertrouwelijkheidaanduiding: str):
+            max_va = (
+                VertrouwelijkheidsAanduiding.get_choice_order(
+                    max_vertrouwelijkheidaanduiding
+                )
+                if max_vertrouwelijkheidaanduiding
+                else None
+            )
+            mapping[loose_fk_type] = _max_va_order(mapping.get(loose_fk_type), max_va)
+
+        for authorization in authorizations_external:
+            add(
+                compiled.external,
+                getattr(authorization, self.loose_fk_field),
+                authorization.max_vertrouwelijkheidaanduiding,
+            )
+
+        # resolve the local resource URLs to database records in bulk
+        resource_urls = sorted(
+            {
+                getattr(authorization, self.loose_fk_field)
+                for authorization in authorizations_local
+            }
+        )
+        loose_fk_objects = get_resources_for_paths(
+            [urlparse(url).path for url in resource_urls]
+        )
+        if loose_fk_objects is not None:
+            # keep the sorting so we can zip them correctly
+            sorted_objects = sorted(
+                loose_fk_objects, key=lambda o: o.get_absolute_api_url()
+            )
+            loose_fk_pks = {
+                url: obj.pk for url, obj in zip(resource_urls, sorted_objects)
+            }
+            for authorization in authorizations_local:
+                add(
+                    compiled.local,
+                    loose_fk_pks[getattr(authorization, self.loose_fk_field)],
+                    authorization.max_vertrouwelijkheidaanduiding,
+                )
+
+        for catalogus_authorisation in self.get_catalogus_authorizations(
             scope, catalogus_authorizations
+        ):
+            resources = getattr(
+                catalogus_authorisation.catalogus, f"{self.loose_fk_field}_set"
+            ).all()
+            for instance in resources:
+                add(
+                    compiled.local,
+                    instance.pk,
+                    catalogus_authorisation.max_vertrouwelijkheidaanduiding,
+                )
+
+        return compiled
+
+    def get_compiled_authorizations_cache_key(
+        self, scope: Scope, applicaties: Iterable["Applicatie"]
+    ) -> str:
+        component = self.model._meta.app_label
+        app_ids = sorted(app.pk for app in applicaties)
+        digest = hashlib.sha256(f"{scope}|{app_ids}".encode()).hexdigest()
+        return (
+            f"autorisaties:{get_authorizations_version()}:compiled:"
+            f"{component}:{self.loose_fk_field}:{digest}"
+        )
+
+    def get_compiled_authorizations(
+        self,
+        scope: Scope,
+        authorizations: models.QuerySet,
+        catalogus_authorizations: models.QuerySet,
+        applicaties: Iterable["Applicatie"] | None = None,
+    ) -> CompiledAuthorizations:
+        """
+        Compile the authorizations, see :meth:`compile_authorizations`.
+
+        If the ``applicaties`` that the authorizations belong to are provided, the
+        compiled authorizations are cached. The cache is invalidated whenever the
+        (catalogus) autorisaties or catalogus types are changed.
+        """
+
+        def compile_authorizations():
+            return self.compile_authorizations(
+                scope, authorizations, catalogus_authorizations
+            )
+
+        if applicaties is None:
+            return compile_authorizations()
+
+        return cache.get_or_set(
+            self.get_compiled_authorizations_cache_key(scope, applicaties),
+            compile_authorizations,
+            timeout=settings.AUTHORIZATIONS_FILTER_CACHE_TIMEOUT,
         )
 
+    def filter_for_compiled_authorizations(
+        self, compiled: CompiledAuthorizations
+    ) -> models.QuerySet:
+        """
+        Filter the queryset to the records the compiled authorizations grant access
+        to.
+        """
+        # todo implement error if no loose-fk field
         local_filters = self.get_filters(
-            scope,
-            authorizations_local,
-            catalogus_authorizations=catalogus_authorizations,
+            compiled.local,
             local=True,
             use_va=self.vertrouwelijkheidaanduiding_use,
         )
         external_filters = self.get_filters(
-            scope,
-            authorizations_external,
+            compiled.external,
             local=False,
             use_va=self.vertrouwelijkheidaanduiding_use,
         )
         return self.build_queryset(local_filters, external_filters)
+
+    def filter_for_authorizations(
+        self,
+        scope: Scope,
+        authorizations: models.QuerySet,
+        catalogus_authorizations: models.QuerySet,
+        applicaties: Iterable["Applicatie"] | None = None,
+    ) -> models.QuerySet:
+        """
+        Filter the queryset to the records the authorizations grant access to.
+        """
+        compiled = self.get_compiled_authorizations(
+            scope, authorizations, catalogus_authorizations, applicaties=applicaties
+        )
+        return self.filter_for_compiled_authorizations(compiled)
@@ -1,8 +1,78 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2021 Dimpact
-from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from functools import lru_cache
+
+from django.http import StreamingHttpResponse
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+
+from djangorestframework_camel_case import util
+from djangorestframework_camel_case.render import (
+    CamelCaseJSONRenderer as _CamelCaseJSONRenderer,
+)
 from vng_api_common.exception_handling import ERROR_CONTENT_TYPE
 
 
+@lru_cache(maxsize=10_000)
+def camelize_key(key: str) -> str:
+    # look up the regex and replacement at call time, they are patched in
+    # ``openzaak.setup.monkeypatch_drf_camel_case``
+    return util.camelize_re.sub(util.underscore_to_camel, key)
+
+
+def camelize(data):
+    """
+    Camelize the keys of the data, like :func:`djangorestframework_camel_case.util.camelize`.
+
+    The camelized keys are cached, since the same (field) names occur over and over
+    again in API responses. ``ignore_fields`` and ``ignore_keys`` are not supported.
+    """
+    if isinstance(data, Promise):
+        data = force_str(data)
+    if isinstance(data, dict):
+        new_dict = {}
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+            if isinstance(key, str) and "_" in key:
+                key = camelize_key(key)
+            new_dict[key] = camelize(value)
+        return new_dict
+    if isinstance(data, list):
+        return [camelize(item) for item in data]
+    if util.is_iterable(data) and not isinstance(data, str):
+        return [camelize(item) for item in data]
+    return data
+
+
+class CamelCaseJSONRenderer(_CamelCaseJSONRenderer):
+    """
+    Render camelCase JSON, with the keys camelized only once per distinct key.
+
+    The output is identical to the output of the ``djangorestframework-camel-case``
+    renderer.
+    """
+
+    def render(self, data, *args, **kwargs):
+        if self.json_underscoreize.get("ignore_fields") or self.json_underscoreize.get(
+            "ignore_keys"
+        ):
+            return super().render(data, *args, **kwargs)
+
+        return super(_CamelCaseJSONRenderer, self).render(
+            camelize(data), *args, **kwargs
+        )
+
+
 class ProblemJSONRenderer(CamelCaseJSONRenderer):
     media_type = ERROR_CONTENT_TYPE
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    JSON response of which the content is rendered while it is sent to the client.
+    """
+
+    def __init__(self, streaming_content, *args, **kwargs):
+        kwargs.setdefault("content_type", CamelCaseJSONRenderer.media_type)
+        super().__init__(streaming_content, *args, **kwargs)
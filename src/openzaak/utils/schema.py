@@ -557,9 +557,12 @@ class AutoSchema(_AutoSchema):
         return super().get_description()
 
     def get_filter_backends(self):
-        """support expand for detail views"""
+        """support expand for detail views and the filters of export actions"""
         include_allowed = getattr(self.view, "include_allowed", lambda: False)()
         if self.method == "GET" and include_allowed:
             return getattr(self.view, "filter_backends", [])
 
+        if getattr(self.view, "action", None) in ("_export", "_export_async"):
+            return getattr(self.view, "filter_backends", [])
+
         return super().get_filter_backends()
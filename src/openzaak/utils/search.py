@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: EUPL-1.2
+# Copyright (C) 2026 Dimpact
+"""
+Indexes for substring and full-text search.
+
+Case-insensitive substring lookups (``icontains``) compile to
+``UPPER("column"::text) LIKE UPPER('%value%')`` on PostgreSQL. The trigram indexes
+index exactly this expression, so the existing lookups can use them without being
+rewritten. The ``pg_trgm`` extension is created by the migrations adding the
+indexes.
+"""
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector
+from django.db import models
+from django.db.models.functions import Cast, Upper
+
+FULL_TEXT_SEARCH_CONFIG = "dutch"
+
+
+def trigram_index(field_name: str, name: str) -> GinIndex:
+    """
+    Index the field for ``icontains`` lookups.
+    """
+    return GinIndex(
+        OpClass(Upper(Cast(field_name, models.TextField())), name="gin_trgm_ops"),
+        name=name,
+    )
+
+
+def get_search_vector(*field_names: str) -> SearchVector:
+    return SearchVector(*field_names, config=FULL_TEXT_SEARCH_CONFIG)
+
+
+def search_vector_index(*field_names: str, name: str) -> GinIndex:
+    """
+    Index the fields for :class:`openzaak.utils.filters.FullTextSearchFilter`.
+    """
+    return GinIndex(get_search_vector(*field_names), name=name)
@@ -1,10 +1,15 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+import uuid
+from urllib.parse import urlparse
+
+from django.core.exceptions import ObjectDoesNotExist
 from django.utils.translation import gettext_lazy as _
 
 from django_loose_fk.drf import FKOrURLField, FKOrURLValidator
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from vng_api_common.utils import resolve_path
 from vng_api_common.validators import URLValidator
 
 
@@ -116,3 +121,36 @@ class FKOrServiceUrlField(FKOrURLField):
         source = source.split("__")[0]
         model_field = model_class._meta.get_field(source)
         return model_class, model_field
+
+
+class ResourceUUIDField(serializers.URLField):
+    """
+    Resolve the URL of a local resource to its UUID.
+
+    Unlike :class:`rest_framework.serializers.HyperlinkedRelatedField` the resource
+    itself is not fetched, which makes it suitable to look up a large number of
+    resources in a single query.
+    """
+
+    default_error_messages = {
+        "invalid-resource": _("Please provide a valid URL of a {view_name} resource."),
+    }
+
+    def __init__(self, view_name: str, **kwargs):
+        self.view_name = view_name
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data) -> uuid.UUID:
+        url = super().to_internal_value(data)
+        try:
+            match = resolve_path(urlparse(url).path)
+        except ObjectDoesNotExist:
+            self.fail("invalid-resource", view_name=self.view_name)
+
+        if match.url_name != self.view_name or "uuid" not in match.kwargs:
+            self.fail("invalid-resource", view_name=self.view_name)
+
+        try:
+            return uuid.UUID(str(match.kwargs["uuid"]))
+        except ValueError:
+            self.fail("invalid-resource", view_name=self.view_name)
@@ -1,17 +1,30 @@
 # SPDX-License-Identifier: EUPL-1.2
 # Copyright (C) 2019 - 2020 Dimpact
+from typing import Iterable
+
+from django.db import models
+from django.http import Http404
+
 import structlog
 from rest_framework import exceptions, status, viewsets
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.audittrails.viewsets import (
+    AuditTrailMixin,
     AuditTrailViewSet as _AuditTrailViewSet,
 )
+from vng_api_common.compat import get_header
+from vng_api_common.constants import CommonResourceAction
 from vng_api_common.views import (
     ViewConfigView as _ViewConfigView,
     _test_nrc_config,
     _test_sites_config,
 )
+from vng_api_common.viewsets import NestedViewSetMixin
+
+from .audittrails import filter_hoofd_object_uuid
+from .mixins import SerializerMetricsMixin
 
 logger = structlog.stdlib.get_logger(__name__)
 
@@ -40,13 +53,36 @@ class ErrorDocumentView(APIView):
         raise self.exception_cls()
 
 
-class AuditTrailViewSet(_AuditTrailViewSet):
+class AuditTrailViewSet(SerializerMetricsMixin, _AuditTrailViewSet):
     def initialize_request(self, request, *args, **kwargs):
         # workaround for drf-nested-viewset injecting the URL kwarg into request.data
         return super(viewsets.GenericViewSet, self).initialize_request(
             request, *args, **kwargs
         )
 
+    def get_queryset(self):
+        # skip the ``hoofd_object__contains`` filters of the parent classes
+        qs = super(NestedViewSetMixin, self).get_queryset()
+
+        if not self.kwargs:  # this happens during schema generation
+            return qs
+
+        if not self.main_resource_lookup_field:
+            raise ValueError("main_resource_lookup_field must be set in subclasses")
+
+        identifier = self.kwargs.get(self.main_resource_lookup_field)
+        if not identifier:
+            return qs
+
+        try:
+            filtered = filter_hoofd_object_uuid(qs, identifier)
+        except ValueError:
+            raise Http404
+
+        if not filtered.exists():
+            raise Http404
+        return filtered
+
 
 def azure_error_handler(exc, context):
     error_message = "Error occurred while connecting with Azure"
@@ -58,3 +94,66 @@ def azure_error_handler(exc, context):
         {"detail": error_message},
         status=status.HTTP_502_BAD_GATEWAY,
     )
+
+
+class BulkAuditTrailMixin(AuditTrailMixin):
+    """
+    Create the audit trails of multiple created resources in a single query.
+    """
+
+    def create_bulk_audittrails(
+        self,
+        status_code: int,
+        items: Iterable[tuple[models.Model, dict]],
+    ) -> list[AuditTrail]:
+        """
+        Create the audit trails of the created resources.
+
+        :param items: pairs of the created instance and its serialized data.
+        """
+        jwt_auth = self.request.jwt_auth
+        applications = jwt_auth.applicaties
+        if len(applications) > 1:
+            logger.warning(
+                "unexpected_application_count",
+                application_count=len(applications),
+            )
+
+        if applications:
+            application = applications[0]
+            app_id, app_presentation = str(application.uuid), application.label
+        else:
+            app_id = get_header(self.request, "X-NLX-Request-Application-Id")
+            app_presentation = app_id
+
+        action = CommonResourceAction.create
+        action_labels = dict(
+            zip(CommonResourceAction.names, CommonResourceAction.labels)
+        )
+        common = {
+            "bron": self.audit.component_name,
+            "logrecord_id": get_header(self.request, "X-NLX-Logrecord-ID") or "",
+            "applicatie_id": app_id,
+            "applicatie_weergave": app_presentation,
+            "actie": action,
+            "actie_weergave": action_labels.get(action, ""),
+            "gebruikers_id": jwt_auth.payload.get("user_id") or "",
+            "gebruikers_weergave": jwt_auth.payload.get("user_representation") or "",
+            "resultaat": status_code,
+            "resource": self.basename,
+            "toelichting": get_header(self.request, "X-Audit-Toelichting") or "",
+        }
+
+        return AuditTrail.objects.bulk_create(
+            AuditTrail(
+                **common,
+                hoofd_object=self.get_audittrail_main_object_url(
+                    data, self.audit.main_resource
+                ),
+                resource_url=data["url"],
+                resource_weergave=instance.unique_representation(),
+                oud=None,
+                nieuw=data,
+            )
+            for instance, data in items
+        )